@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
 from app.api.routes.admin import router as admin_router
+from app.api.routes.audio import router as audio_router
 from app.api.routes.evaluations import router as evaluations_router
 from app.api.routes.history import router as history_router
+from app.api.routes.metrics import router as metrics_router
 from app.api.routes.scenarios import router as scenarios_router
 from app.api.routes.sessions import router as sessions_router
 from app.api.routes.turns import router as turns_router
@@ -10,8 +12,10 @@ from app.api.routes.users import router as users_router
 
 api_router = APIRouter()
 api_router.include_router(admin_router)
+api_router.include_router(audio_router)
 api_router.include_router(evaluations_router)
 api_router.include_router(history_router)
+api_router.include_router(metrics_router)
 api_router.include_router(scenarios_router)
 api_router.include_router(sessions_router)
 api_router.include_router(turns_router)
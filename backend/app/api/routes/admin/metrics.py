@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.deps.admin_auth import AdminAuth
+from app.services.admin.metrics_service import AdminMetricsService
+
+router = APIRouter(prefix="/metrics", tags=["admin-metrics"], dependencies=[AdminAuth])
+
+
+def _service() -> AdminMetricsService:
+    return AdminMetricsService()
+
+
+@router.get("")
+async def get_metrics(
+    start: date | None = Query(None, alias="from"),
+    end: date | None = Query(None, alias="to"),
+    service: AdminMetricsService = Depends(_service),
+):
+    """Per-scenario and per-skill rollups for the UTC days ``from``..``to``."""
+    return await service.summary(start, end)
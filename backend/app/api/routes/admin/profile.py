@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.deps.admin_auth import AdminAuth
+from app.telemetry.profiling import render_collapsed, sample_stacks
+
+router = APIRouter(prefix="/profile", tags=["admin-profile"], dependencies=[AdminAuth])
+
+_running = asyncio.Lock()
+
+
+@router.get("", response_class=PlainTextResponse)
+async def profile(
+    seconds: float = Query(10.0, gt=0, le=60),
+    interval_ms: float = Query(5.0, ge=1, le=1000),
+    threads: Literal["loop", "all"] = Query("loop"),
+):
+    """Sample the live process and return its stacks in collapsed format."""
+    if _running.locked():
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="A profile is already running",
+        )
+    async with _running:
+        # Handlers run on the event loop thread.
+        thread_ids = {threading.get_ident()} if threads == "loop" else None
+        counts = await asyncio.to_thread(
+            sample_stacks, seconds, interval_ms / 1000, thread_ids=thread_ids
+        )
+    return PlainTextResponse(
+        render_collapsed(counts),
+        headers={"Content-Disposition": 'attachment; filename="profile.collapsed"'},
+    )
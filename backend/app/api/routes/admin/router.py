@@ -5,6 +5,9 @@ from app.api.routes.admin.skills import router as skills_router
 from app.api.routes.admin.scenarios import router as scenarios_router
 from app.api.routes.admin.sessions import router as sessions_router
 from app.api.routes.admin.audit_log import router as audit_log_router
+from app.api.routes.admin.spans import router as spans_router
+from app.api.routes.admin.profile import router as profile_router
+from app.api.routes.admin.metrics import router as metrics_router
 
 router = APIRouter(prefix="/admin", tags=["admin"], dependencies=[Depends(require_admin_token)])
 
@@ -12,3 +15,6 @@ router.include_router(skills_router)
 router.include_router(scenarios_router)
 router.include_router(sessions_router)
 router.include_router(audit_log_router)
+router.include_router(spans_router)
+router.include_router(profile_router)
+router.include_router(metrics_router)
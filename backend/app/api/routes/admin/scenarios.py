@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
 from app.api.deps.admin_auth import AdminAuth
 from app.services.admin.scenarios_service import AdminScenariosService
@@ -50,6 +50,15 @@ async def get_scenario(scenario_id: str, service: AdminScenariosService = Depend
     return _response(record)
 
 
+@router.get("/{scenario_id}/latency")
+async def get_scenario_latency(
+    scenario_id: str,
+    limit: int = Query(1000, ge=1, le=10000),
+    service: AdminScenariosService = Depends(_service),
+):
+    return await service.latency_summary(scenario_id, limit=limit)
+
+
 @router.post("", status_code=status.HTTP_201_CREATED)
 async def create_scenario(
     payload: dict[str, Any],
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Header, status
+from pydantic import BaseModel, Field
 
 from app.api.deps.admin_auth import AdminAuth
 from app.services.admin.sessions_service import AdminSessionsService
@@ -8,6 +9,10 @@ from app.services.admin.sessions_service import AdminSessionsService
 router = APIRouter(prefix="/sessions", tags=["admin-sessions"], dependencies=[AdminAuth])
 
 
+class BulkDeletePayload(BaseModel):
+    sessionIds: list[str] = Field(..., min_length=1, max_length=500)
+
+
 def _service() -> AdminSessionsService:
     return AdminSessionsService()
 
@@ -17,6 +22,20 @@ async def list_sessions(service: AdminSessionsService = Depends(_service)):
     return {"sessions": await service.list_sessions()}
 
 
+@router.post("/cleanup-jobs", status_code=status.HTTP_202_ACCEPTED)
+async def start_cleanup_job(
+    payload: BulkDeletePayload,
+    service: AdminSessionsService = Depends(_service),
+    x_admin_token: str | None = Header(None, convert_underscores=False),
+):
+    return await service.start_bulk_delete(payload.sessionIds, admin_token=x_admin_token)
+
+
+@router.get("/cleanup-jobs/{job_id}")
+async def get_cleanup_job(job_id: str, service: AdminSessionsService = Depends(_service)):
+    return service.get_cleanup_job(job_id)
+
+
 @router.get("/{session_id}")
 async def get_session(session_id: str, service: AdminSessionsService = Depends(_service)):
     return await service.get_session(session_id)
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Query
+
+from app.api.deps.admin_auth import AdminAuth
+from app.telemetry.otel import recorder
+
+router = APIRouter(prefix="/spans", tags=["admin-spans"], dependencies=[AdminAuth])
+
+
+@router.get("")
+async def list_recent_spans(
+    name: str | None = Query(None),
+    limit: int = Query(100, ge=1, le=1000),
+):
+    return {"spans": [span.as_dict() for span in recorder.recent(name, limit)]}
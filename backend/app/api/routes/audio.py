@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import RedirectResponse
+
+from app.clients.mongodb import MongoDBClient
+from app.config import load_settings
+from app.dependencies import get_mongodb_client, get_signed_url_service
+from app.repositories.session_repository import SessionRepository
+from app.services.signed_urls import SignedUrlService
+from app.telemetry.otel import start_span
+
+router = APIRouter()
+
+
+def _session_repo(mongodb: MongoDBClient = Depends(get_mongodb_client)) -> SessionRepository:
+    return SessionRepository(mongodb)
+
+
+def _signing_client(
+    service: SignedUrlService | None = Depends(get_signed_url_service),
+) -> SignedUrlService | None:
+    return service
+
+
+def _redirect(signing_client: SignedUrlService, name: str) -> RedirectResponse:
+    signed = signing_client.sign(name)
+    # Let the browser reuse the redirect while the target URL stays valid.
+    max_age = max(0, signed.remaining_seconds() - 60)
+    return RedirectResponse(
+        signed.url,
+        status_code=status.HTTP_302_FOUND,
+        headers={"Cache-Control": f"private, max-age={max_age}"},
+    )
+
+
+@router.get("/audio/{turn_id}")
+async def redirect_to_turn_audio(
+    turn_id: str,
+    repo: SessionRepository = Depends(_session_repo),
+    signing_client: SignedUrlService | None = Depends(_signing_client),
+):
+    with start_span("audio.redirect", {"turnId": turn_id}):
+        turn = await repo.get_turn(turn_id)
+        if not turn or not turn.audio_file_id or turn.audio_file_id in {"pending", "missing"}:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        session = await repo.get_session(turn.session_id)
+        if not session or session.stub_user_id != load_settings().stub_user_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        if signing_client is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Audio storage is unavailable.",
+            )
+        return _redirect(signing_client, turn.audio_file_id)
+
+
+@router.get("/audio/sessions/{session_id}/replay")
+async def redirect_to_session_replay(
+    session_id: str,
+    repo: SessionRepository = Depends(_session_repo),
+    signing_client: SignedUrlService | None = Depends(_signing_client),
+):
+    with start_span("audio.redirect", {"sessionId": session_id, "replay": True}):
+        session = await repo.get_session(session_id)
+        if not session or session.stub_user_id != load_settings().stub_user_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        audio_file_id = (session.replay or {}).get("audioFileId")
+        if not audio_file_id:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        if signing_client is None:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Audio storage is unavailable.",
+            )
+        return _redirect(signing_client, audio_file_id)
@@ -4,13 +4,13 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Query, status
 
-from app.clients.minio import MinioClient
 from app.clients.mongodb import MongoDBClient
 from app.config import load_settings
-from app.dependencies import get_mongodb_client, get_minio_client
+from app.dependencies import get_mongodb_client, get_signed_url_service
 from app.repositories.evaluation_repository import EvaluationRecord, EvaluationRepository
 from app.repositories.scenario_repository import ScenarioRepository
 from app.repositories.session_repository import PracticeSessionRecord, SessionRepository, TurnRecord
+from app.services.signed_urls import SignedUrlService
 from app.telemetry.otel import start_span
 from app.telemetry.tracing import emit_metric
 
@@ -29,8 +29,14 @@ def _evaluation_repo(mongodb: MongoDBClient = Depends(get_mongodb_client)) -> Ev
     return EvaluationRepository(mongodb)
 
 
-def _signing_client(minio: MinioClient | None = Depends(get_minio_client)) -> MinioClient | None:
-    return minio
+def _signing_client(
+    service: SignedUrlService | None = Depends(get_signed_url_service),
+) -> SignedUrlService | None:
+    return service
+
+
+def _has_audio(turn: TurnRecord) -> bool:
+    return bool(turn.audio_file_id) and turn.audio_file_id not in {"pending", "missing"}
 
 
 def _session_response(session: PracticeSessionRecord) -> dict[str, Any]:
@@ -89,6 +95,20 @@ def _turn_response(turn: TurnRecord, signed_url: str | None) -> dict[str, Any]:
         "endedAt": turn.ended_at,
         "context": turn.context,
         "latencyMs": turn.latency_ms,
+        "speechMs": turn.speech_ms,
+        "timings": turn.timings,
+    }
+
+
+def _replay_response(
+    replay: dict[str, Any] | None, audio_url: str | None
+) -> dict[str, Any] | None:
+    if not replay or not audio_url:
+        return None
+    return {
+        "audioUrl": audio_url,
+        "durationMs": replay.get("durationMs"),
+        "segments": replay.get("segments", []),
     }
 
 
@@ -119,14 +139,14 @@ def _emit_step_metric(session_id: str | None, step_count: int, *, scope: str) ->
 async def list_history(
     historyStepCount: int = Query(..., ge=1),
     page: int = Query(1, ge=1),
-    pageSize: int = Query(20, le=50),
+    pageSize: int = Query(20, ge=1, le=50),
+    cursor: str | None = None,
     scenarioId: str | None = None,
     category: str | None = None,
     search: str | None = None,
     sort: str = Query("startedAtDesc"),
     x_user_id: str | None = Header(default=None, alias="X-User-Id"),
     repo: SessionRepository = Depends(_session_repo),
-    scenario_repo: ScenarioRepository = Depends(_scenario_repo),
 ):
     with start_span(
         "history.list",
@@ -137,55 +157,34 @@ async def list_history(
             "category": category,
             "search": search,
             "scenarioId": scenarioId,
+            "cursor": bool(cursor),
         },
     ):
         settings = load_settings()
-        if x_user_id:
-            sessions = await repo.list_sessions(settings.stub_user_id, x_user_id)
-        else:
-            sessions = await repo.list_sessions(settings.stub_user_id)
-        items = [
-            session
-            for session in sessions
-            if (not scenarioId or session.scenario_id == scenarioId)
-        ]
-        if category or search:
-            scenario_map: dict[str, Any] = {}
-            for session in items:
-                if session.scenario_id not in scenario_map:
-                    with start_span(
-                        "history.scenario_lookup",
-                        {"scenarioId": session.scenario_id},
-                    ):
-                        scenario_map[session.scenario_id] = await scenario_repo.get(
-                            session.scenario_id
-                        )
-            filtered: list[PracticeSessionRecord] = []
-            for session in items:
-                scenario = scenario_map.get(session.scenario_id)
-                if not scenario:
-                    continue
-                if category and scenario.category != category:
-                    continue
-                if search:
-                    haystack = f"{scenario.title} {scenario.objective}".lower()
-                    if search.lower() not in haystack:
-                        continue
-                filtered.append(session)
-            items = filtered
-        if sort == "startedAtAsc":
-            items.sort(key=lambda item: item.started_at or "")
-        else:
-            items.sort(key=lambda item: item.started_at or "", reverse=True)
-        start = (page - 1) * pageSize
-        end = start + pageSize
-        paged = items[start:end]
+        try:
+            result = await repo.list_history(
+                stub_user_id=settings.stub_user_id,
+                user_id=x_user_id,
+                scenario_id=scenarioId,
+                category=category,
+                search=search,
+                ascending=sort == "startedAtAsc",
+                page=page,
+                page_size=pageSize,
+                cursor=cursor,
+            )
+        except ValueError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=str(exc),
+            ) from exc
         _emit_step_metric(None, historyStepCount, scope="list")
         return {
-            "items": [_session_response(item) for item in paged],
+            "items": [_session_response(item) for item in result.items],
             "page": page,
             "pageSize": pageSize,
-            "total": len(items),
+            "total": result.total,
+            "nextCursor": result.next_cursor,
         }
 
 
@@ -197,7 +196,7 @@ async def get_history_detail(
     repo: SessionRepository = Depends(_session_repo),
     scenario_repo: ScenarioRepository = Depends(_scenario_repo),
     evaluation_repo: EvaluationRepository = Depends(_evaluation_repo),
-    signing_client: MinioClient | None = Depends(_signing_client),
+    signing_client: SignedUrlService | None = Depends(_signing_client),
 ):
     with start_span(
         "history.detail",
@@ -216,24 +215,37 @@ async def get_history_detail(
         turns.sort(key=lambda turn: turn.sequence)
         scenario = await scenario_repo.get(session.scenario_id)
         evaluation = await evaluation_repo.get_by_session(session_id)
-        # Generate signed URLs for each turn's audio file using MinIO
-        signed_map = {}
-        with start_span(
-            "history.sign_urls",
-            {"sessionId": session_id, "turnCount": len(turns)},
-        ):
-            for turn in turns:
-                if signing_client and turn.audio_file_id:
-                    signed_map[turn.audio_file_id] = await signing_client.get_signed_url(
-                        turn.audio_file_id, expires=900
-                    )
+        audio_turns = [turn for turn in turns if _has_audio(turn)]
+        replay_file_id = (session.replay or {}).get("audioFileId")
+        audio_urls: dict[str, str] = {}
+        replay_url: str | None = None
+        if settings.history_audio_redirect:
+            # Defer signing to GET /api/audio/{turnId}, which 302s to a cached URL.
+            audio_urls = {turn.id: f"/api/audio/{turn.id}" for turn in audio_turns}
+            if replay_file_id:
+                replay_url = f"/api/audio/sessions/{session_id}/replay"
+        elif signing_client:
+            names = [turn.audio_file_id for turn in audio_turns]
+            if replay_file_id:
+                names.append(replay_file_id)
+            with start_span(
+                "history.sign_urls",
+                {"sessionId": session_id, "turnCount": len(audio_turns)},
+            ):
+                signed_map = await signing_client.create_signed_urls(
+                    names, ttl_seconds=900
+                )
+            audio_urls = {
+                turn.id: signed_map[turn.audio_file_id]
+                for turn in audio_turns
+                if turn.audio_file_id in signed_map
+            }
+            replay_url = signed_map.get(replay_file_id) if replay_file_id else None
         _emit_step_metric(session_id, historyStepCount, scope="detail")
         return {
             "session": _session_response(session),
             "scenario": _scenario_response(scenario) if scenario else None,
-            "turns": [
-                _turn_response(turn, signed_map.get(turn.audio_file_id))
-                for turn in turns
-            ],
+            "turns": [_turn_response(turn, audio_urls.get(turn.id)) for turn in turns],
+            "replay": _replay_response(session.replay, replay_url),
             "evaluation": _evaluation_response(evaluation) if evaluation else None,
         }
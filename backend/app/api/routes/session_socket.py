@@ -1,43 +1,460 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
+import time
 from collections import defaultdict
 from typing import Any
 
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    WebSocket,
+    WebSocketDisconnect,
+    status,
+)
+
+from app.repositories.session_repository import SessionRepository
+from app.services.audio import StreamingPcmDecoder
+from app.services.pubsub import InMemoryPubSub, PubSubBackend
+from app.services.turn_intake import (
+    ensure_audio_size,
+    parse_turn_frame,
+    parse_turn_metadata,
+    register_turn,
+)
+from app.services.turn_stream import TurnStream
+from app.telemetry.otel import start_span
+from app.telemetry.tracing import emit_metric
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+OVERFLOW_POLICIES = {"drop_oldest", "disconnect"}
+DEFAULT_SEND_QUEUE_SIZE = 64
+DEFAULT_HEARTBEAT_SECONDS = 20.0
+DEFAULT_SEND_TIMEOUT_SECONDS = 10.0
+# Close codes: 1011 internal error (send failed), 1013 try again later (slow
+# consumer overflowed its queue), 1001 going away (missed heartbeats).
+_CLOSE_SEND_FAILED = 1011
+_CLOSE_OVERFLOW = 1013
+_CLOSE_STALE = 1001
+_CLOSE_TIMEOUT_SECONDS = 2.0
+PING_MESSAGE = json.dumps({"type": "ping"})
+
+
+class _Connection:
+    """One socket's bounded outbound queue and the writer task draining it."""
+
+    def __init__(self, hub: SessionSocketHub, session_id: str, websocket: WebSocket) -> None:
+        self.hub = hub
+        self.session_id = session_id
+        self.websocket = websocket
+        self.queue: asyncio.Queue[tuple[str, float]] = asyncio.Queue(hub.queue_size)
+        self.last_seen = time.monotonic()
+        self.closed = asyncio.Event()
+        self.dropped = 0
+        self.closing: asyncio.Task | None = None
+        # Streamed turns still being recorded, keyed by sequence.
+        self.streams: dict[int, TurnStream] = {}
+        self._writer = asyncio.create_task(self._write())
+
+    def offer(self, message: str) -> bool:
+        """Queue ``message`` without waiting; False when the queue is full."""
+        if self.closed.is_set():
+            return True
+        try:
+            self.queue.put_nowait((message, time.monotonic()))
+            return True
+        except asyncio.QueueFull:
+            pass
+        if self.hub.overflow_policy == "disconnect":
+            return False
+        self.queue.get_nowait()
+        self.queue.task_done()
+        self.queue.put_nowait((message, time.monotonic()))
+        self.dropped += 1
+        emit_metric("ws.send_dropped", 1, session_id=self.session_id)
+        return True
+
+    async def _write(self) -> None:
+        while True:
+            message, enqueued_at = await self.queue.get()
+            try:
+                await asyncio.wait_for(
+                    self.websocket.send_text(message), self.hub.send_timeout_seconds
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.info(
+                    "Socket send failed session=%s error=%s", self.session_id, exc
+                )
+                self.hub._prune(self, _CLOSE_SEND_FAILED, "send_failed")
+                return
+            finally:
+                self.queue.task_done()
+            emit_metric(
+                "ws.send_latency",
+                (time.monotonic() - enqueued_at) * 1000,
+                session_id=self.session_id,
+            )
+
+    def stop(self) -> None:
+        self.closed.set()
+        if self._writer is not asyncio.current_task():
+            self._writer.cancel()
+        # Nothing will drain what is left; release any ``drain`` waiters.
+        while not self.queue.empty():
+            self.queue.get_nowait()
+            self.queue.task_done()
+
 
 class SessionSocketHub:
-    def __init__(self) -> None:
-        self._connections: dict[str, set[WebSocket]] = defaultdict(set)
+    """Tracks this worker's session sockets and fans out channel messages.
+
+    ``broadcast`` publishes through the configured pub/sub backend; the
+    backend calls ``deliver`` on every worker, and each one queues the message
+    for the sockets it holds for that session. Every socket has a bounded
+    queue drained by its own writer task, so callers never wait on a client's
+    network: a full queue either drops its oldest message or disconnects the
+    client (``overflow_policy``). A heartbeat pings every socket and prunes
+    those that have not sent anything for two intervals.
+    """
+
+    def __init__(
+        self,
+        backend: PubSubBackend | None = None,
+        *,
+        queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow_policy: str = "drop_oldest",
+        heartbeat_seconds: float = DEFAULT_HEARTBEAT_SECONDS,
+        send_timeout_seconds: float = DEFAULT_SEND_TIMEOUT_SECONDS,
+    ) -> None:
+        self._connections: dict[str, dict[WebSocket, _Connection]] = defaultdict(dict)
+        self._backend: PubSubBackend | None = None
+        self._default_backend = backend or InMemoryPubSub()
+        self._heartbeat: asyncio.Task | None = None
+        self.configure(
+            queue_size=queue_size,
+            overflow_policy=overflow_policy,
+            heartbeat_seconds=heartbeat_seconds,
+            send_timeout_seconds=send_timeout_seconds,
+        )
+
+    def configure(
+        self,
+        *,
+        queue_size: int,
+        overflow_policy: str,
+        heartbeat_seconds: float,
+        send_timeout_seconds: float = DEFAULT_SEND_TIMEOUT_SECONDS,
+    ) -> None:
+        """Set queue and heartbeat limits; applies to sockets connected afterwards."""
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+        self.queue_size = max(1, queue_size)
+        self.overflow_policy = overflow_policy
+        self.heartbeat_seconds = heartbeat_seconds
+        self.send_timeout_seconds = send_timeout_seconds
 
-    async def connect(self, session_id: str, websocket: WebSocket) -> None:
+    async def start(self, backend: PubSubBackend | None = None) -> None:
+        if self._backend is not None:
+            await self._backend.close()
+        self._backend = backend or self._default_backend
+        await self._backend.start(self.deliver)
+        if self._heartbeat is None and self.heartbeat_seconds > 0:
+            self._heartbeat = asyncio.create_task(self._heartbeat_forever())
+
+    async def close(self) -> None:
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat = None
+        if self._backend is not None:
+            await self._backend.close()
+            self._backend = None
+        try:
+            await asyncio.wait_for(self.drain(), _CLOSE_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            pass
+        for connections in list(self._connections.values()):
+            for connection in list(connections.values()):
+                self._prune(connection, _CLOSE_STALE, "shutdown")
+
+    async def connect(self, session_id: str, websocket: WebSocket) -> _Connection:
         await websocket.accept()
-        self._connections[session_id].add(websocket)
+        connection = _Connection(self, session_id, websocket)
+        self._connections[session_id][websocket] = connection
+        return connection
 
     def disconnect(self, session_id: str, websocket: WebSocket) -> None:
-        self._connections[session_id].discard(websocket)
-        if not self._connections[session_id]:
+        connections = self._connections.get(session_id)
+        if connections is None:
+            return
+        connection = connections.pop(websocket, None)
+        if connection is not None:
+            connection.stop()
+        if not connections:
             self._connections.pop(session_id, None)
 
+    def _prune(self, connection: _Connection, code: int, reason: str) -> None:
+        if connection.closed.is_set():
+            return
+        self.disconnect(connection.session_id, connection.websocket)
+        emit_metric(
+            "ws.connection_pruned",
+            1,
+            session_id=connection.session_id,
+            attributes={"reason": reason},
+        )
+        connection.closing = asyncio.create_task(_close_quietly(connection.websocket, code))
+
     async def broadcast(self, session_id: str, payload: dict[str, Any]) -> None:
-        if session_id not in self._connections:
+        """Publish ``payload`` to the session's sockets.
+
+        Publish failures are logged rather than raised so a pub/sub outage
+        cannot fail the turn pipeline that reported the event.
+        """
+        try:
+            if self._backend is None:
+                await self.start()
+            await self._backend.publish(session_id, json.dumps(payload))
+        except Exception as exc:
+            logger.warning("Socket broadcast failed session=%s error=%s", session_id, exc)
+            emit_metric("ws.broadcast_failed", 1, session_id=session_id)
+
+    async def deliver(self, session_id: str, message: str) -> None:
+        connections = self._connections.get(session_id)
+        if not connections:
             return
-        message = json.dumps(payload)
-        for socket in list(self._connections[session_id]):
-            await socket.send_text(message)
+        for connection in list(connections.values()):
+            if not connection.offer(message):
+                self._prune(connection, _CLOSE_OVERFLOW, "overflow")
+
+    async def drain(self) -> None:
+        """Wait until every queued message has been sent (or its socket pruned)."""
+        for connections in list(self._connections.values()):
+            for connection in list(connections.values()):
+                await connection.queue.join()
+
+    def heartbeat(self) -> None:
+        """Ping every socket, prune the silent ones, and report queue depths."""
+        stale_before = time.monotonic() - 2 * self.heartbeat_seconds
+        for session_id, connections in list(self._connections.items()):
+            for connection in list(connections.values()):
+                if connection.last_seen < stale_before:
+                    self._prune(connection, _CLOSE_STALE, "heartbeat")
+                    continue
+                emit_metric(
+                    "ws.queue_depth", float(connection.queue.qsize()), session_id=session_id
+                )
+                if not connection.offer(PING_MESSAGE):
+                    self._prune(connection, _CLOSE_OVERFLOW, "overflow")
+
+    async def _heartbeat_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                self.heartbeat()
+            except Exception as exc:
+                logger.warning("Socket heartbeat failed: %s", exc)
+
+
+async def _close_quietly(websocket: WebSocket, code: int) -> None:
+    try:
+        await asyncio.wait_for(websocket.close(code=code), _CLOSE_TIMEOUT_SECONDS)
+    except Exception:
+        pass
 
 
 hub = SessionSocketHub()
 
 
+# Pipeline runs started from socket frames; held so they are not collected.
+_TURN_TASKS: set[asyncio.Task] = set()
+
+
+def _repo(websocket: WebSocket) -> SessionRepository:
+    return SessionRepository(websocket.app.state.mongodb)
+
+
+def _reply(connection: _Connection, payload: dict[str, Any]) -> None:
+    if not connection.offer(json.dumps(payload, default=str)):
+        hub._prune(connection, _CLOSE_OVERFLOW, "overflow")
+
+
+def _turn_error(connection: _Connection, sequence: Any, status_code: int, detail: Any) -> None:
+    _reply(
+        connection,
+        {"type": "turn_error", "sequence": sequence, "status": status_code, "detail": detail},
+    )
+
+
+async def _append_chunk(
+    connection: _Connection, header: dict[str, Any], audio: memoryview
+) -> None:
+    """Feed one chunk of a turn that is still being recorded."""
+    from app.services.turn_pipeline import transcribe_partial, turn_sample_rate
+
+    sequence = header.get("sequence")
+    index = header.get("index")
+    if not isinstance(sequence, int) or sequence < 0 or not isinstance(index, int):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid turn frame; please resend the turn.",
+        )
+    stream = connection.streams.get(sequence)
+    if stream is None:
+        # Only one turn is recorded at a time; drop any abandoned stream.
+        for stale in connection.streams.values():
+            await stale.abort()
+        connection.streams.clear()
+        stream = TurnStream(
+            connection.session_id,
+            sequence,
+            decoder=StreamingPcmDecoder(turn_sample_rate()),
+            transcribe=transcribe_partial,
+            on_partial=lambda transcript: _reply(
+                connection,
+                {"type": "partial_transcript", "sequence": sequence, "transcript": transcript},
+            ),
+        )
+        await stream.start()
+        connection.streams[sequence] = stream
+    try:
+        await stream.append(index, bytes(audio))
+    except HTTPException:
+        connection.streams.pop(sequence, None)
+        await stream.abort()
+        raise
+
+
+async def _accept_turn_frame(
+    connection: _Connection, repo: SessionRepository, frame: bytes
+) -> None:
+    """Handle a binary frame: a whole turn, a streamed chunk, or end/abort of a stream.
+
+    Whole turns and ``end`` frames are registered like
+    ``POST /sessions/{id}/turns`` and answered with ``turn_ack`` (the same
+    receipt); any rejection is answered with ``turn_error`` carrying the HTTP
+    status the endpoint would have returned. Chunks are only answered on
+    error, and with ``partial_transcript`` messages while recording.
+    """
+    # Imported here: the pipeline imports ``hub`` from this module.
+    from app.services.turn_pipeline import enqueue_turn_pipeline
+
+    session_id = connection.session_id
+    sequence = None
+    streamed_pcm = None
+    try:
+        header, audio = parse_turn_frame(frame)
+        sequence = header.get("sequence")
+        kind = header.get("type", "turn")
+        if kind == "chunk":
+            await _append_chunk(connection, header, audio)
+            return
+        if kind == "abort":
+            stream = connection.streams.pop(sequence, None)
+            if stream is not None:
+                await stream.abort()
+            return
+        if kind not in {"turn", "end"}:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Invalid turn frame; please resend the turn.",
+            )
+        metadata = parse_turn_metadata(header)
+        with start_span(
+            "turns.create",
+            {
+                "sessionId": session_id,
+                "sequence": metadata.sequence,
+                "transport": "websocket",
+                "streamed": kind == "end",
+            },
+        ):
+            if kind == "end":
+                stream = connection.streams.pop(metadata.sequence, None)
+                if stream is None:
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail="No audio was streamed for this turn; please resend the turn.",
+                    )
+                streamed_pcm = await stream.finish(bytes(audio))
+            else:
+                ensure_audio_size(len(audio))
+            receipt = await register_turn(repo, session_id, metadata)
+    except HTTPException as exc:
+        _turn_error(connection, sequence, exc.status_code, exc.detail)
+        return
+    except Exception as exc:
+        logger.warning("Socket turn failed session=%s error=%s", session_id, exc)
+        _turn_error(
+            connection,
+            sequence,
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            "Turn could not be stored; please resend the turn.",
+        )
+        return
+
+    _reply(connection, {"type": "turn_ack", "sequence": metadata.sequence, **receipt})
+    if receipt["status"] != "accepted":
+        return
+    if streamed_pcm is not None:
+        pipeline = enqueue_turn_pipeline(
+            session_id=session_id, turn_id=receipt["turnId"], pcm=streamed_pcm
+        )
+    else:
+        pipeline = enqueue_turn_pipeline(
+            session_id=session_id, turn_id=receipt["turnId"], audio_bytes=audio
+        )
+    task = asyncio.create_task(pipeline)
+    _TURN_TASKS.add(task)
+    task.add_done_callback(_TURN_TASKS.discard)
+
+
+async def _receive(
+    websocket: WebSocket, connection: _Connection, repo: SessionRepository
+) -> None:
+    # Any client frame (including ``{"type": "pong"}``) counts as liveness.
+    while True:
+        message = await websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise WebSocketDisconnect(message.get("code", 1000))
+        connection.last_seen = time.monotonic()
+        frame = message.get("bytes")
+        if frame is not None:
+            await _accept_turn_frame(connection, repo, frame)
+
+
 @router.websocket("/ws/sessions/{session_id}")
-async def session_socket(websocket: WebSocket, session_id: str):
-    await hub.connect(session_id, websocket)
+async def session_socket(
+    websocket: WebSocket,
+    session_id: str,
+    repo: SessionRepository = Depends(_repo),
+):
+    connection = await hub.connect(session_id, websocket)
+    reader = asyncio.create_task(_receive(websocket, connection, repo))
+    pruned = asyncio.create_task(connection.closed.wait())
     try:
-        while True:
-            await websocket.receive_text()
-    except WebSocketDisconnect:
+        await asyncio.wait({reader, pruned}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        for task in (reader, pruned):
+            task.cancel()
+        if reader.done() and not reader.cancelled():
+            exc = reader.exception()
+            if exc is not None and not isinstance(exc, WebSocketDisconnect):
+                logger.info("Socket receive failed session=%s error=%s", session_id, exc)
         hub.disconnect(session_id, websocket)
+        for stream in connection.streams.values():
+            await stream.abort()
+        connection.streams.clear()
+        if connection.closing is not None:
+            await connection.closing
@@ -2,22 +2,35 @@ from __future__ import annotations
 
 import base64
 import binascii
-from datetime import datetime, timezone
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile, status
+from starlette.types import Message, Receive
 
 from app.clients.mongodb import MongoDBClient
-from app.config import load_settings
 from app.dependencies import get_mongodb_client
-from app.models.session import TurnInput, enforce_drift
+from app.models.session import TurnInput
 from app.repositories.session_repository import SessionRepository
+from app.services.turn_intake import (
+    MAX_AUDIO_BYTES,
+    audio_too_large,
+    ensure_audio_size,
+    parse_turn_metadata,
+    register_turn,
+)
 from app.services.turn_pipeline import enqueue_turn_pipeline
 from app.telemetry.otel import start_span
 
 router = APIRouter()
 
-MAX_AUDIO_BYTES = 128 * 1024
 MAX_AUDIO_BASE64_CHARS = 175000
+# Room for multipart boundaries and the metadata fields around the audio part.
+MULTIPART_OVERHEAD_BYTES = 16 * 1024
+UPLOAD_METADATA_HEADERS = {
+    "sequence": "x-turn-sequence",
+    "startedAt": "x-turn-started-at",
+    "endedAt": "x-turn-ended-at",
+    "context": "x-turn-context",
+}
 
 
 def _repo(mongodb: MongoDBClient = Depends(get_mongodb_client)) -> SessionRepository:
@@ -54,67 +67,110 @@ async def submit_turn(
         "turns.create",
         {"sessionId": session_id, "sequence": payload.sequence},
     ):
-        size = _audio_size_bytes(payload.audioBase64)
-        if size > MAX_AUDIO_BYTES:
-            raise HTTPException(
-                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-                detail="Audio exceeds 128 KB; shorten or split the turn.",
+        ensure_audio_size(_audio_size_bytes(payload.audioBase64))
+        receipt = await register_turn(repo, session_id, payload)
+        if receipt["status"] == "accepted":
+            await enqueue_turn_pipeline(
+                session_id=session_id,
+                turn_id=receipt["turnId"],
+                audio_base64=payload.audioBase64,
             )
-
-        session = await repo.get_session(session_id)
-        if not session:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-
-        if session.status == "ended":
-            return {"sessionId": session_id, "turnId": "", "aiTurnId": None, "status": "closed"}
-
-        try:
-            enforce_drift(payload.startedAt, datetime.now(timezone.utc))
-            enforce_drift(payload.endedAt, datetime.now(timezone.utc))
-        except ValueError as exc:
-            raise HTTPException(
-                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=str(exc),
-            ) from exc
-
-        existing_turns = await repo.list_turns(session_id)
-        existing_sequences = {turn.sequence for turn in existing_turns}
-        if payload.sequence in existing_sequences:
-            return {
-                "sessionId": session_id,
-                "turnId": "",
-                "aiTurnId": None,
-                "status": "duplicate",
-            }
-        expected_sequence = max(existing_sequences, default=-1) + 1
-        if payload.sequence != expected_sequence:
+        return receipt
+
+
+def _limited_receive(receive: Receive, limit: int) -> Receive:
+    """Wrap an ASGI receive so the body is rejected as soon as it passes ``limit``."""
+    received = 0
+
+    async def _receive() -> Message:
+        nonlocal received
+        message = await receive()
+        if message["type"] == "http.request":
+            received += len(message.get("body", b""))
+            if received > limit:
+                raise audio_too_large()
+        return message
+
+    return _receive
+
+
+def _check_content_length(request: Request, limit: int) -> None:
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > limit:
+        raise audio_too_large()
+
+
+async def _read_raw_upload(request: Request) -> tuple[dict[str, str], bytes]:
+    _check_content_length(request, MAX_AUDIO_BYTES)
+    fields = {
+        field: request.headers[header]
+        for field, header in UPLOAD_METADATA_HEADERS.items()
+        if header in request.headers
+    }
+    body = bytearray()
+    async for chunk in request.stream():
+        body.extend(chunk)
+        if len(body) > MAX_AUDIO_BYTES:
+            raise audio_too_large()
+    return fields, bytes(body)
+
+
+async def _read_multipart_upload(request: Request) -> tuple[dict[str, str], bytes]:
+    limit = MAX_AUDIO_BYTES + MULTIPART_OVERHEAD_BYTES
+    _check_content_length(request, limit)
+    limited = Request(request.scope, _limited_receive(request.receive, limit))
+    form = await limited.form(max_files=1, max_fields=len(UPLOAD_METADATA_HEADERS))
+    try:
+        audio = form.get("audio")
+        if not isinstance(audio, UploadFile):
             raise HTTPException(
                 status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-                detail=f"Invalid sequence; expected {expected_sequence}.",
+                detail="Missing audio payload; please resend the turn.",
             )
+        fields = {
+            field: value
+            for field in UPLOAD_METADATA_HEADERS
+            if isinstance(value := form.get(field), str)
+        }
+        return fields, await audio.read()
+    finally:
+        await form.close()
 
-        record = await repo.add_turn(
-            {
-                "sessionId": session_id,
-                "sequence": payload.sequence,
-                "speaker": "trainee",
-                "transcript": None,
-                "audioFileId": "pending",
-                "audioUrl": None,
-                "asrStatus": "pending",
-                "startedAt": payload.startedAt.isoformat(),
-                "endedAt": payload.endedAt.isoformat(),
-                "context": payload.context,
-                "latencyMs": None,
-            }
-        )
-        await enqueue_turn_pipeline(
-            session_id=session_id, turn_id=record.id, audio_base64=payload.audioBase64
-        )
 
-        return {
-            "sessionId": session_id,
-            "turnId": record.id,
-            "aiTurnId": None,
-            "status": "accepted",
-        }
+@router.post("/sessions/{session_id}/turns:upload", status_code=status.HTTP_202_ACCEPTED)
+async def upload_turn(
+    session_id: str,
+    request: Request,
+    repo: SessionRepository = Depends(_repo),
+):
+    """Submit a turn as raw audio instead of base64 JSON.
+
+    Accepts ``application/octet-stream`` (or ``audio/*``) with the metadata in
+    ``X-Turn-*`` headers, or ``multipart/form-data`` with an ``audio`` file and
+    ``sequence``/``startedAt``/``endedAt``/``context`` fields. The body is
+    rejected with 413 as soon as it passes the audio limit.
+    """
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    if content_type == "multipart/form-data":
+        fields, audio = await _read_multipart_upload(request)
+    elif content_type == "application/octet-stream" or content_type.startswith("audio/"):
+        fields, audio = await _read_raw_upload(request)
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Send audio as application/octet-stream or multipart/form-data.",
+        )
+    metadata = parse_turn_metadata(fields)
+    with start_span(
+        "turns.create",
+        {"sessionId": session_id, "sequence": metadata.sequence, "transport": "upload"},
+    ):
+        ensure_audio_size(len(audio))
+        receipt = await register_turn(repo, session_id, metadata)
+        if receipt["status"] == "accepted":
+            await enqueue_turn_pipeline(
+                session_id=session_id,
+                turn_id=receipt["turnId"],
+                audio_bytes=audio,
+            )
+        return receipt
@@ -0,0 +1,101 @@
+"""Rendition profiles for turn audio.
+
+Parsing and describing profiles needs nothing beyond the standard library,
+so ``app.config`` can validate ``AUDIO_RENDITIONS`` without importing the
+encoders in ``app.services.renditions``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+# Where a rendition goes: the stored turn object, browser replay, the omni
+# model's audio input, and speech recognition.
+CONSUMERS = ("archive", "playback", "llm", "asr")
+
+# format -> (ffmpeg muxer, ffmpeg codec, file extension, MIME type). WAV is
+# produced as raw PCM and given its header here, because ffmpeg cannot fill in
+# the RIFF sizes when writing to a pipe.
+_FORMATS = {
+    "mp3": ("mp3", "libmp3lame", "mp3", "audio/mpeg"),
+    "webm": ("webm", "libopus", "webm", "audio/webm"),
+    "ogg": ("ogg", "libopus", "ogg", "audio/ogg"),
+    "wav": ("s16le", "pcm_s16le", "wav", "audio/wav"),
+}
+_OPUS_SAMPLE_RATES = {8000, 12000, 16000, 24000, 48000}
+
+
+@dataclass(frozen=True)
+class RenditionProfile:
+    """One mono encoding of turn audio, e.g. ``mp3:16000:16k``."""
+
+    format: str
+    sample_rate: int
+    bitrate: str | None = None
+
+    @property
+    def extension(self) -> str:
+        return _FORMATS[self.format][2]
+
+    @property
+    def content_type(self) -> str:
+        return _FORMATS[self.format][3]
+
+    @property
+    def spec(self) -> str:
+        parts = [self.format, str(self.sample_rate)]
+        if self.bitrate:
+            parts.append(self.bitrate)
+        return ":".join(parts)
+
+    def ffmpeg_output_args(self) -> list[str]:
+        muxer, codec, _, _ = _FORMATS[self.format]
+        args = ["-ac", "1", "-ar", str(self.sample_rate), "-c:a", codec]
+        if self.bitrate:
+            args += ["-b:a", self.bitrate]
+        return args + ["-f", muxer, "pipe:1"]
+
+
+DEFAULT_RENDITIONS = {
+    "archive": RenditionProfile("mp3", 24000, "24k"),
+    "playback": RenditionProfile("webm", 24000, "24k"),
+    "llm": RenditionProfile("mp3", 16000, "16k"),
+    "asr": RenditionProfile("wav", 16000),
+}
+
+
+def parse_rendition(spec: str) -> RenditionProfile:
+    """Parse ``format:sample_rate[:bitrate]``; raises ``ValueError``."""
+    parts = [part.strip() for part in spec.split(":")]
+    if len(parts) not in {2, 3} or parts[0] not in _FORMATS:
+        raise ValueError(f"Invalid rendition {spec!r}; expected format:sample_rate[:bitrate]")
+    audio_format = parts[0]
+    try:
+        sample_rate = int(parts[1])
+    except ValueError:
+        raise ValueError(f"Invalid sample rate in rendition {spec!r}")
+    if sample_rate <= 0:
+        raise ValueError(f"Invalid sample rate in rendition {spec!r}")
+    if _FORMATS[audio_format][1] == "libopus" and sample_rate not in _OPUS_SAMPLE_RATES:
+        raise ValueError(f"Opus does not support {sample_rate} Hz in rendition {spec!r}")
+    bitrate = parts[2] if len(parts) == 3 and parts[2] else None
+    if audio_format == "wav" and bitrate:
+        raise ValueError(f"WAV renditions take no bitrate: {spec!r}")
+    return RenditionProfile(audio_format, sample_rate, bitrate)
+
+
+def parse_renditions(spec: str | None) -> dict[str, RenditionProfile]:
+    """Overlay ``consumer=format:rate[:bitrate]`` pairs on the defaults.
+
+    ``spec`` is comma-separated, e.g. ``"playback=mp3:24000:32k,asr=mp3:16000:16k"``.
+    """
+    profiles = dict(DEFAULT_RENDITIONS)
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        consumer, separator, profile = item.partition("=")
+        consumer = consumer.strip()
+        if not separator or consumer not in CONSUMERS:
+            raise ValueError(f"Invalid rendition consumer in {item.strip()!r}")
+        profiles[consumer] = parse_rendition(profile)
+    return profiles
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import base64
+
+
+class AudioConversionError(RuntimeError):
+    pass
+
+
+def decode_audio_base64(payload: str) -> bytes:
+    try:
+        return base64.b64decode(payload, validate=True)
+    except ValueError as exc:
+        raise AudioConversionError("Invalid base64 audio payload") from exc
+
+
+class AudioBuffer:
+    """Audio bytes passed through the pipeline without re-encoding.
+
+    Wraps ``bytes`` (or a ``memoryview`` into a larger frame) and computes the
+    base64 and data-URI forms the model APIs need lazily, at most once each.
+    A buffer built from base64 keeps the original string as its base64 view,
+    so it is never encoded again.
+    """
+
+    __slots__ = ("_data", "_base64", "_data_uris")
+
+    def __init__(self, data: bytes | bytearray | memoryview, *, base64_text: str | None = None):
+        self._data = data
+        self._base64 = base64_text
+        self._data_uris: dict[str, str] = {}
+
+    @classmethod
+    def from_base64(cls, payload: str) -> "AudioBuffer":
+        return cls(decode_audio_base64(payload), base64_text=payload)
+
+    @classmethod
+    def from_base64_chunks(cls, chunks: list[str]) -> "AudioBuffer":
+        """Decode streamed base64 fragments into one buffer without joining them.
+
+        Fragments need not be aligned to 4 characters; leftovers carry over.
+        """
+        decoded: list[bytes] = []
+        carry = ""
+        for chunk in chunks:
+            text = carry + chunk if carry else chunk
+            usable = len(text) - len(text) % 4
+            carry = text[usable:]
+            if usable:
+                decoded.append(decode_audio_base64(text[:usable]))
+        if carry:
+            decoded.append(decode_audio_base64(carry))
+        return cls(b"".join(decoded))
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self._data)
+
+    def to_bytes(self) -> bytes:
+        """The audio as ``bytes``; only copies when wrapping a view or bytearray."""
+        if isinstance(self._data, bytes):
+            return self._data
+        self._data = bytes(self._data)
+        return self._data
+
+    @property
+    def base64(self) -> str:
+        if self._base64 is None:
+            uri = next(iter(self._data_uris.values()), None)
+            if uri is not None:
+                self._base64 = uri[uri.index(",") + 1 :]
+            else:
+                self._base64 = base64.b64encode(self._data).decode("ascii")
+        return self._base64
+
+    def data_uri(self, mime_type: str = "") -> str:
+        """``data:`` URI for the audio, cached per MIME type.
+
+        When no base64 text exists yet the encoding goes straight into the
+        URI, so a large clip is not also held as a bare base64 string.
+        """
+        uri = self._data_uris.get(mime_type)
+        if uri is None:
+            prefix = f"data:{mime_type};base64,"
+            if self._base64 is not None:
+                uri = prefix + self._base64
+            else:
+                encoded = bytearray(prefix.encode("ascii"))
+                encoded += base64.b64encode(self._data)
+                uri = encoded.decode("ascii")
+            self._data_uris[mime_type] = uri
+        return uri
@@ -0,0 +1,253 @@
+"""Record and replay LLM provider traffic ("cassettes").
+
+Both LLM clients send every request through an httpx transport. With
+``LLM_CASSETTE_MODE=record`` the transport forwards to the provider and
+appends each exchange to a JSON-lines cassette: the request fingerprint,
+the response status and headers, and every body chunk with its offset from
+the moment the request was sent. With ``LLM_CASSETTE_MODE=replay`` no
+request leaves the process; responses are served from the cassette with
+the recorded chunk timing multiplied by ``LLM_CASSETTE_TIME_SCALE`` (0
+serves them at once), so pipeline runs can be compared without provider
+latency in the numbers.
+
+Fingerprints hash the method, path and JSON body with inline base64 audio
+left out: audio is re-encoded on every run and never byte-identical, while
+the prompt text around it is. Exchanges with the same fingerprint are
+replayed in recorded order. Each recorded exchange is tagged with the
+``sessionId`` of the span it ran in, and ``LLM_CASSETTE_SESSION`` limits a
+replay to one recorded session.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable
+
+import httpx
+
+from app.config import Settings
+from app.telemetry.otel import current_span
+
+_DROPPED_HEADERS = {"content-length", "content-encoding", "transfer-encoding", "connection"}
+
+
+class CassetteMiss(httpx.TransportError):
+    """A replayed request has no recorded exchange."""
+
+
+def _elapsed_ms(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 3)
+
+
+def _without_audio(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _without_audio(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_without_audio(item) for item in value]
+    if isinstance(value, str) and value.startswith("data:") and ";base64," in value[:64]:
+        return "data:<audio>"
+    return value
+
+
+def fingerprint(method: str, path: str, body: bytes) -> str:
+    try:
+        payload: Any = json.loads(body) if body else None
+    except ValueError:
+        payload = hashlib.sha256(body).hexdigest()
+    canonical = json.dumps(
+        [method.upper(), path, _without_audio(payload)],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+class Cassette:
+    """Recorded exchanges of one cassette file."""
+
+    def __init__(self, path: Path, entries: list[dict[str, Any]] | None = None) -> None:
+        self.path = path
+        self._by_fingerprint: dict[str, list[dict[str, Any]]] = defaultdict(list)
+        self._served: dict[str, int] = defaultdict(int)
+        for entry in entries or []:
+            self._by_fingerprint[entry["fingerprint"]].append(entry)
+
+    @classmethod
+    def load(cls, path: Path, *, session_id: str | None = None) -> Cassette:
+        entries = []
+        if path.exists():
+            with path.open(encoding="utf-8") as handle:
+                for line in handle:
+                    if not line.strip():
+                        continue
+                    entry = json.loads(line)
+                    if session_id is None or entry.get("sessionId") == session_id:
+                        entries.append(entry)
+        return cls(path, entries)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._by_fingerprint.values())
+
+    def append(self, entry: dict[str, Any]) -> None:
+        self._by_fingerprint[entry["fingerprint"]].append(entry)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def next_match(self, key: str) -> dict[str, Any] | None:
+        """The next recorded exchange for ``key``, starting over once all were served."""
+        entries = self._by_fingerprint.get(key)
+        if not entries:
+            return None
+        index = self._served[key] % len(entries)
+        self._served[key] += 1
+        return entries[index]
+
+
+class _RecordingStream(httpx.AsyncByteStream):
+    def __init__(
+        self,
+        stream: httpx.AsyncByteStream,
+        started: float,
+        on_close: Callable[[list[list[Any]]], None],
+    ) -> None:
+        self._stream = stream
+        self._started = started
+        self._on_close = on_close
+        self._chunks: list[list[Any]] = []
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            # surrogateescape keeps bytes split mid-character intact.
+            self._chunks.append(
+                [_elapsed_ms(self._started), chunk.decode("utf-8", "surrogateescape")]
+            )
+            yield chunk
+
+    async def aclose(self) -> None:
+        await self._stream.aclose()
+        if not self._closed:
+            self._closed = True
+            self._on_close(self._chunks)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    def __init__(
+        self, cassette: Cassette, transport: httpx.AsyncBaseTransport | None = None
+    ) -> None:
+        self._cassette = cassette
+        self._transport = transport or httpx.AsyncHTTPTransport()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        # Uncompressed bodies keep the cassette readable and chunk sizes real.
+        request.headers["Accept-Encoding"] = "identity"
+        span = current_span()
+        entry: dict[str, Any] = {
+            "fingerprint": fingerprint(request.method, request.url.path, body),
+            "sessionId": span.attributes.get("sessionId") if span else None,
+            "method": request.method,
+            "path": request.url.path,
+            "recordedAt": datetime.now(timezone.utc).isoformat(),
+        }
+        started = time.monotonic()
+        response = await self._transport.handle_async_request(request)
+        entry["status"] = response.status_code
+        entry["headers"] = {
+            key: value
+            for key, value in response.headers.items()
+            if key.lower() not in _DROPPED_HEADERS
+        }
+        entry["headersMs"] = _elapsed_ms(started)
+
+        def save(chunks: list[list[Any]]) -> None:
+            entry["chunks"] = chunks
+            self._cassette.append(entry)
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_RecordingStream(response.stream, started, save),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class _ReplayStream(httpx.AsyncByteStream):
+    def __init__(self, chunks: list[list[Any]], start_ms: float, time_scale: float) -> None:
+        self._chunks = chunks
+        self._start_ms = start_ms
+        self._time_scale = time_scale
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        previous_ms = self._start_ms
+        for offset_ms, text in self._chunks:
+            delay = (offset_ms - previous_ms) * self._time_scale / 1000
+            if delay > 0:
+                await asyncio.sleep(delay)
+            previous_ms = offset_ms
+            yield text.encode("utf-8", "surrogateescape")
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    def __init__(self, cassette: Cassette, *, time_scale: float = 1.0) -> None:
+        self._cassette = cassette
+        self._time_scale = time_scale
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = await request.aread()
+        key = fingerprint(request.method, request.url.path, body)
+        entry = self._cassette.next_match(key)
+        if entry is None:
+            raise CassetteMiss(
+                f"No recorded exchange for {request.method} {request.url.path} "
+                f"(fingerprint {key}) in {self._cassette.path}",
+                request=request,
+            )
+        if entry["headersMs"] * self._time_scale > 0:
+            await asyncio.sleep(entry["headersMs"] * self._time_scale / 1000)
+        return httpx.Response(
+            status_code=entry["status"],
+            headers=entry["headers"],
+            stream=_ReplayStream(entry["chunks"], entry["headersMs"], self._time_scale),
+        )
+
+
+_cassettes: dict[tuple[str, str | None], Cassette] = {}
+
+
+def cassette_transport(settings: Settings) -> httpx.AsyncBaseTransport | None:
+    """Transport for a new LLM client, or ``None`` when cassettes are off.
+
+    Clients are short-lived, so each gets its own transport; the cassette
+    behind it is shared by the whole process.
+    """
+    if settings.llm_cassette_mode == "off" or not settings.llm_cassette_path:
+        return None
+    key = (settings.llm_cassette_path, settings.llm_cassette_session)
+    cassette = _cassettes.get(key)
+    if cassette is None:
+        path = Path(settings.llm_cassette_path)
+        if settings.llm_cassette_mode == "record":
+            cassette = Cassette(path)
+        else:
+            cassette = Cassette.load(path, session_id=settings.llm_cassette_session)
+        _cassettes[key] = cassette
+    if settings.llm_cassette_mode == "record":
+        return RecordingTransport(cassette)
+    return ReplayTransport(cassette, time_scale=settings.llm_cassette_time_scale)
+
+
+def reset_cassettes() -> None:
+    """Forget loaded cassettes so the next replay starts from the first exchange."""
+    _cassettes.clear()
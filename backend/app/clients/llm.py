@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import logging
 import asyncio
+import time
 from dataclasses import dataclass
 from typing import Any
 
 import httpx
 from openai import AsyncOpenAI
 
+from app.clients.audio_buffer import AudioBuffer
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,6 +27,17 @@ class LLMError(Exception):
         return f"LLMError(message={self.message!r}, status_code={self.status_code!r})"
 
 
+def _elapsed_ms(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+def _audio_data(audio: Any) -> str | None:
+    """Base64 audio of a message or delta; newer SDKs parse it into a model."""
+    if isinstance(audio, dict):
+        return audio.get("data")
+    return getattr(audio, "data", None)
+
+
 def _require_field(payload: dict[str, Any], field: str, context: str) -> None:
     if field not in payload:
         raise LLMError(f"Missing '{field}' in {context} response")
@@ -100,7 +114,8 @@ class QwenClient(_BaseLLMClient):
             payload: Dictionary containing model, messages, modalities, audio, stream params
 
         Returns:
-            Dictionary with choices containing message with content and optionally audio
+            Dictionary with choices containing message with content and optionally
+            audio (``{"data": AudioBuffer}``)
         """
         logger.info(f"QwenClient.generate called with payload keys: {payload.keys()}")
         # Extract parameters from payload
@@ -137,6 +152,7 @@ class QwenClient(_BaseLLMClient):
 
         for attempt in range(self._retries + 1):
             try:
+                started = time.monotonic()
                 completion = await asyncio.wait_for(
                     self._client.chat.completions.create(**client_params),
                     timeout=self._timeout,
@@ -145,6 +161,8 @@ class QwenClient(_BaseLLMClient):
                 # Process the response
                 text_parts = []
                 audio_parts = []
+                # Time to the first text/audio chunk of the attempt that succeeded.
+                timings: dict[str, float] = {}
 
                 if stream:
                     # Stream processing: collect all chunks
@@ -155,12 +173,16 @@ class QwenClient(_BaseLLMClient):
 
                                 # Collect text content
                                 if hasattr(delta, "content") and delta.content:
+                                    if not text_parts:
+                                        timings["firstTextMs"] = _elapsed_ms(started)
                                     text_parts.append(delta.content)
 
                                 # Collect audio data
                                 if hasattr(delta, "audio") and delta.audio:
-                                    audio_data = delta.audio.get("data")
+                                    audio_data = _audio_data(delta.audio)
                                     if audio_data:
+                                        if not audio_parts:
+                                            timings["firstAudioMs"] = _elapsed_ms(started)
                                         audio_parts.append(audio_data)
 
                     await asyncio.wait_for(_collect_stream(), timeout=self._timeout)
@@ -175,16 +197,17 @@ class QwenClient(_BaseLLMClient):
 
                         # Get audio data
                         if hasattr(message, "audio") and message.audio:
-                            audio_data = message.audio.get("data")
+                            audio_data = _audio_data(message.audio)
                             if audio_data:
                                 audio_parts.append(audio_data)
 
                 # Build response in the format expected by the rest of the codebase
                 response_message: dict[str, Any] = {"content": "".join(text_parts)}
                 if audio_parts:
-                    audio_data = "".join(audio_parts)
+                    # Decode fragment by fragment instead of joining one huge string.
+                    audio_data = AudioBuffer.from_base64_chunks(audio_parts)
                     logger.info(
-                        "Collected %s audio chunks, total base64 length: %s",
+                        "Collected %s audio chunks, total bytes: %s",
                         len(audio_parts),
                         len(audio_data),
                     )
@@ -192,7 +215,8 @@ class QwenClient(_BaseLLMClient):
                 else:
                     logger.warning("No audio parts collected from Qwen response")
 
-                return {"choices": [{"message": response_message}]}
+                timings["totalMs"] = _elapsed_ms(started)
+                return {"choices": [{"message": response_message}], "timings": timings}
             except Exception as exc:
                 if attempt < self._retries and self._should_retry(exc):
                     await asyncio.sleep(0.2 * (attempt + 1))
@@ -214,14 +238,15 @@ class QwenClient(_BaseLLMClient):
         Call Qwen API for Automatic Speech Recognition.
 
         Args:
-            payload: Dictionary containing model, input (audio data), format, prompt, stream
+            payload: Dictionary containing model, input (an AudioBuffer or base64
+                string), format, prompt, stream
 
         Returns:
             Dictionary with transcribed text
         """
         model = payload.get("model")
-        audio_base64 = payload.get("input")
-        if not model or not audio_base64:
+        audio_input = payload.get("input")
+        if not model or not audio_input:
             raise LLMError("Missing 'model' or 'input' for qwen asr")
 
         audio_format = payload.get("format", "wav")
@@ -229,7 +254,10 @@ class QwenClient(_BaseLLMClient):
         stream = payload.get("stream", True)
         stream_options = payload.get("stream_options")
 
-        audio_data_url = f"data:;base64,{audio_base64}"
+        if isinstance(audio_input, AudioBuffer):
+            audio_data_url = audio_input.data_uri()
+        else:
+            audio_data_url = f"data:;base64,{audio_input}"
         messages = [
             {
                 "role": "system", 
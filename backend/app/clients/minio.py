@@ -2,10 +2,15 @@ from __future__ import annotations
 
 import asyncio
 from dataclasses import dataclass
+from datetime import datetime, timedelta
 from io import BytesIO
+from itertools import islice
+from typing import AsyncIterator
 
 
 from minio import Minio
+from minio.commonconfig import REPLACE, CopySource
+from minio.deleteobjects import DeleteObject
 from minio.error import S3Error
 
 
@@ -44,12 +49,14 @@ class MinioClient:
             bucket: Bucket name to use
             secure: Whether to use HTTPS (default: False)
             region: Optional region for the bucket
+            public_endpoint: Optional endpoint used in presigned URLs handed to browsers
         """
         self._bucket = bucket
         self._access_key = access_key
         self._secret_key = secret_key
         self._secure = secure
         self._region = region
+        self._endpoint = endpoint
         self._public_endpoint = public_endpoint
         self._client = Minio(
             endpoint,
@@ -58,6 +65,7 @@ class MinioClient:
             secure=secure,
             region=region,
         )
+        self._signer: Minio | None = None
         self._loop = asyncio.get_event_loop()
 
     async def _ensure_bucket(self) -> None:
@@ -81,7 +89,12 @@ class MinioClient:
         await self._ensure_bucket()
 
     async def upload_file(
-        self, name: str, data: bytes, content_type: str
+        self,
+        name: str,
+        data: bytes,
+        content_type: str,
+        *,
+        metadata: dict[str, str] | None = None,
     ) -> str:
         """Upload a file to MinIO.
 
@@ -89,6 +102,7 @@ class MinioClient:
             name: Object name (key) for the file
             data: File content as bytes
             content_type: MIME type of the file (e.g., 'audio/wav')
+            metadata: Optional headers stored with the object (e.g., 'Cache-Control')
 
         Returns:
             The object name that was uploaded
@@ -105,6 +119,7 @@ class MinioClient:
                 data_stream,
                 len(data),
                 content_type=content_type,
+                metadata=metadata,
             )
             return name
         except S3Error as exc:
@@ -138,10 +153,24 @@ class MinioClient:
                 status_code=exc.code,
             ) from exc
 
-    async def get_signed_url(
-        self, name: str, expires: int = 900
-    ) -> str:
-        """Generate a presigned GET URL for an object.
+    def _get_signer(self) -> Minio:
+        """Return the client used for presigning, creating it once.
+
+        The signer always has an explicit region so presigning never has to
+        look up the bucket location over the network; it is pure HMAC work.
+        """
+        if self._signer is None:
+            self._signer = Minio(
+                self._public_endpoint or self._endpoint,
+                access_key=self._access_key,
+                secret_key=self._secret_key,
+                secure=self._secure,
+                region=self._region or "us-east-1",
+            )
+        return self._signer
+
+    def presign_get_url(self, name: str, expires: int = 900) -> str:
+        """Generate a presigned GET URL locally, without I/O.
 
         Args:
             name: Object name (key)
@@ -154,30 +183,30 @@ class MinioClient:
             MinioError: If URL generation fails
         """
         try:
-            # Convert expires seconds to timedelta
-            from datetime import timedelta
-            expires_delta = timedelta(seconds=expires)
-            signer = self._client
-            if self._public_endpoint:
-                signer = Minio(
-                    self._public_endpoint,
-                    access_key=self._access_key,
-                    secret_key=self._secret_key,
-                    secure=self._secure,
-                    region=self._region or "us-east-1",
-                )
-            url = await asyncio.to_thread(
-                signer.presigned_get_object,
+            return self._get_signer().presigned_get_object(
                 self._bucket,
                 name,
-                expires_delta,
+                timedelta(seconds=expires),
             )
-            return url
-        except S3Error as exc:
-            raise MinioError(
-                f"Failed to generate signed URL: {exc.message}",
-                status_code=exc.code,
-            ) from exc
+        except (S3Error, ValueError) as exc:
+            raise MinioError(f"Failed to generate signed URL: {exc}") from exc
+
+    async def get_signed_url(
+        self, name: str, expires: int = 900
+    ) -> str:
+        """Generate a presigned GET URL for an object.
+
+        Args:
+            name: Object name (key)
+            expires: URL expiration time in seconds (default: 900 = 15 minutes)
+
+        Returns:
+            Presigned URL string
+
+        Raises:
+            MinioError: If URL generation fails
+        """
+        return self.presign_get_url(name, expires)
 
     async def delete_file(self, name: str) -> None:
         """Delete a file from MinIO.
@@ -198,6 +227,96 @@ class MinioClient:
                 status_code=exc.code,
             ) from exc
 
+    async def delete_files(self, names: list[str]) -> list[tuple[str, str]]:
+        """Delete many files with batched multi-object delete requests.
+
+        Args:
+            names: Object names (keys) to delete
+
+        Returns:
+            (name, error message) for every object that could not be deleted
+
+        Raises:
+            MinioError: If the delete request itself fails
+        """
+        if not names:
+            return []
+
+        def _remove() -> list[tuple[str, str]]:
+            # remove_objects is lazy; iterating drives the batched requests.
+            errors = self._client.remove_objects(
+                self._bucket, (DeleteObject(name) for name in names)
+            )
+            return [(error.name, error.message) for error in errors]
+
+        try:
+            return await asyncio.to_thread(_remove)
+        except S3Error as exc:
+            raise MinioError(
+                f"Failed to delete files: {exc.message}",
+                status_code=exc.code,
+            ) from exc
+
+    async def iter_objects(
+        self, prefix: str | None = None, batch_size: int = 1000
+    ) -> AsyncIterator[list[tuple[str, datetime | None]]]:
+        """List objects page by page without holding the whole listing.
+
+        Args:
+            prefix: Only list keys starting with this prefix
+            batch_size: Maximum number of objects per yielded batch
+
+        Yields:
+            Batches of (object name, last modified) tuples
+
+        Raises:
+            MinioError: If listing fails
+        """
+        listing = self._client.list_objects(self._bucket, prefix=prefix, recursive=True)
+        while True:
+            try:
+                batch = await asyncio.to_thread(lambda: list(islice(listing, batch_size)))
+            except S3Error as exc:
+                raise MinioError(
+                    f"Failed to list files: {exc.message}",
+                    status_code=exc.code,
+                ) from exc
+            if not batch:
+                return
+            yield [(item.object_name, item.last_modified) for item in batch]
+
+    async def touch_file(self, name: str, *, metadata: dict[str, str] | None = None) -> bool:
+        """Copy an object onto itself so its last-modified time becomes now.
+
+        Args:
+            name: Object name (key) to refresh
+            metadata: Headers to store with the copy. They replace all current
+                headers, so include Content-Type or it reverts to the default.
+
+        Returns:
+            True if the object was refreshed, False if it does not exist
+
+        Raises:
+            MinioError: If the copy fails
+        """
+        try:
+            await asyncio.to_thread(
+                self._client.copy_object,
+                self._bucket,
+                name,
+                CopySource(self._bucket, name),
+                metadata=metadata,
+                metadata_directive=REPLACE,
+            )
+            return True
+        except S3Error as exc:
+            if exc.code == "NoSuchKey":
+                return False
+            raise MinioError(
+                f"Failed to refresh file: {exc.message}",
+                status_code=exc.code,
+            ) from exc
+
     async def file_exists(self, name: str) -> bool:
         """Check if a file exists in the bucket.
 
@@ -4,6 +4,8 @@ from dataclasses import dataclass
 import os
 from urllib.parse import urlparse
 
+from app.audio_profiles import RenditionProfile, parse_renditions
+
 
 class SettingsError(ValueError):
     pass
@@ -14,13 +16,50 @@ class Settings:
     mongo_host: str
     mongo_port: int
     mongo_db: str
+    mongo_ensure_indexes: bool
     minio_endpoint: str
     minio_access_key: str
     minio_secret_key: str
     minio_bucket: str
     minio_public_endpoint: str | None
+    history_audio_redirect: bool
+    replay_bundle_enabled: bool
+    ws_pubsub_backend: str
+    ws_send_queue_size: int
+    ws_overflow_policy: str
+    ws_heartbeat_seconds: int
+    gc_enabled: bool
+    gc_interval_seconds: int
+    gc_grace_seconds: int
+    session_retention_days: int
+    rollup_recompute_enabled: bool
+    rollup_recompute_interval_seconds: int
+    rollup_recompute_days: int
+    vad_enabled: bool
+    vad_energy_threshold_db: float
+    vad_zcr_max: float
+    vad_min_speech_ms: int
+    vad_padding_ms: int
+    audio_renditions: dict[str, RenditionProfile]
+    transcript_source: str
+    transcript_shadow_percent: int
+    metrics_flush_seconds: int
+    metrics_max_series: int
+    loop_lag_interval_ms: int
+    loop_lag_threshold_ms: int
+    log_level: str
+    log_format: str
+    log_max_chars: int
+    log_sampling: dict[str, float]
+    otlp_endpoint: str | None
+    otel_service_name: str
     dashscope_api_key: str
+    qwen_api_base: str
     qwen_voice_id: str | None
+    llm_cassette_mode: str
+    llm_cassette_path: str | None
+    llm_cassette_session: str | None
+    llm_cassette_time_scale: float
     chatai_api_base: str
     chatai_api_key: str
     chatai_api_model: str
@@ -75,17 +114,130 @@ def _optional_int(name: str, default: int) -> int:
         raise SettingsError(f"Invalid integer for {name}: {value}")
 
 
+def _optional_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value.strip())
+    except ValueError:
+        raise SettingsError(f"Invalid number for {name}: {value}")
+
+
+def parse_sampling(spec: str | None) -> dict[str, float]:
+    """``"app.telemetry=0.1,app.clients=0.5"`` -> ``{"app.telemetry": 0.1, ...}``."""
+    rates: dict[str, float] = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        name, separator, raw_rate = item.partition("=")
+        try:
+            rate = float(raw_rate)
+        except ValueError:
+            raise ValueError(f"expected logger=rate, got {item!r}") from None
+        if not separator or not name.strip() or not 0.0 <= rate <= 1.0:
+            raise ValueError(f"expected logger=rate with a rate in [0, 1], got {item!r}")
+        rates[name.strip()] = rate
+    return rates
+
+
 def load_settings() -> Settings:
     mongo_host = os.getenv("MONGO_HOST", "localhost").strip()
     mongo_port = _optional_int("MONGO_PORT", 27017)
     mongo_db = os.getenv("MONGO_DB", "real-talk-coach").strip()
+    mongo_ensure_indexes = _optional_bool("MONGO_ENSURE_INDEXES", default=True)
     minio_endpoint = os.getenv("MINIO_ENDPOINT", "localhost:9000").strip()
     minio_access_key = os.getenv("MINIO_ACCESS_KEY", "minioadmin").strip()
     minio_secret_key = os.getenv("MINIO_SECRET_KEY", "minioadmin").strip()
     minio_bucket = os.getenv("MINIO_BUCKET", "audio").strip()
     minio_public_endpoint = _optional_env("MINIO_PUBLIC_ENDPOINT")
+    history_audio_redirect = _optional_bool("HISTORY_AUDIO_REDIRECT", default=False)
+    replay_bundle_enabled = _optional_bool("REPLAY_BUNDLE_ENABLED", default=True)
+    ws_pubsub_backend = (os.getenv("WS_PUBSUB_BACKEND") or "memory").strip().lower()
+    if ws_pubsub_backend not in {"memory", "mongo"}:
+        raise SettingsError(f"Invalid WS_PUBSUB_BACKEND: {ws_pubsub_backend}")
+    ws_send_queue_size = _optional_int("WS_SEND_QUEUE_SIZE", 64)
+    ws_overflow_policy = (os.getenv("WS_OVERFLOW_POLICY") or "drop_oldest").strip().lower()
+    if ws_overflow_policy not in {"drop_oldest", "disconnect"}:
+        raise SettingsError(f"Invalid WS_OVERFLOW_POLICY: {ws_overflow_policy}")
+    ws_heartbeat_seconds = _optional_int("WS_HEARTBEAT_SECONDS", 20)
+    gc_enabled = _optional_bool("GC_ENABLED", default=False)
+    gc_interval_seconds = _optional_int("GC_INTERVAL_SECONDS", 6 * 3600)
+    gc_grace_seconds = _optional_int("GC_GRACE_SECONDS", 24 * 3600)
+    session_retention_days = _optional_int("SESSION_RETENTION_DAYS", 0)
+    rollup_recompute_enabled = _optional_bool("ROLLUP_RECOMPUTE_ENABLED", default=False)
+    rollup_recompute_interval_seconds = _optional_int(
+        "ROLLUP_RECOMPUTE_INTERVAL_SECONDS", 24 * 3600
+    )
+    rollup_recompute_days = _optional_int("ROLLUP_RECOMPUTE_DAYS", 7)
+    if rollup_recompute_days < 1:
+        raise SettingsError(f"Invalid ROLLUP_RECOMPUTE_DAYS: {rollup_recompute_days}")
+    vad_enabled = _optional_bool("VAD_ENABLED", default=True)
+    vad_energy_threshold_db = _optional_float("VAD_ENERGY_THRESHOLD_DB", -45.0)
+    vad_zcr_max = _optional_float("VAD_ZCR_MAX", 0.35)
+    if not 0.0 < vad_zcr_max <= 1.0:
+        raise SettingsError(f"Invalid VAD_ZCR_MAX: {vad_zcr_max}")
+    vad_min_speech_ms = _optional_int("VAD_MIN_SPEECH_MS", 250)
+    vad_padding_ms = _optional_int("VAD_PADDING_MS", 200)
+    try:
+        audio_renditions = parse_renditions(os.getenv("AUDIO_RENDITIONS"))
+    except ValueError as exc:
+        raise SettingsError(f"Invalid AUDIO_RENDITIONS: {exc}")
     dashscope_api_key = _require_env("DASHSCOPE_API_KEY")
+    qwen_api_base = _require_url(
+        "QWEN_API_BASE",
+        _optional_env("QWEN_API_BASE") or "https://dashscope.aliyuncs.com/compatible-mode/v1",
+    )
     qwen_voice_id = _optional_env("QWEN_VOICE_ID")
+    llm_cassette_mode = (os.getenv("LLM_CASSETTE_MODE") or "off").strip().lower()
+    if llm_cassette_mode not in {"off", "record", "replay"}:
+        raise SettingsError(f"Invalid LLM_CASSETTE_MODE: {llm_cassette_mode}")
+    llm_cassette_path = _optional_env("LLM_CASSETTE_PATH")
+    if llm_cassette_mode != "off" and not llm_cassette_path:
+        raise SettingsError(f"LLM_CASSETTE_MODE={llm_cassette_mode} requires LLM_CASSETTE_PATH")
+    llm_cassette_session = _optional_env("LLM_CASSETTE_SESSION")
+    llm_cassette_time_scale = _optional_float("LLM_CASSETTE_TIME_SCALE", 1.0)
+    if llm_cassette_time_scale < 0:
+        raise SettingsError(f"Invalid LLM_CASSETTE_TIME_SCALE: {llm_cassette_time_scale}")
+    transcript_source = (os.getenv("TRANSCRIPT_SOURCE") or "asr").strip().lower()
+    if transcript_source not in {"asr", "generation"}:
+        raise SettingsError(f"Invalid TRANSCRIPT_SOURCE: {transcript_source}")
+    if transcript_source == "generation" and qwen_voice_id:
+        # The omni model speaks everything it writes, transcript included.
+        raise SettingsError(
+            "TRANSCRIPT_SOURCE=generation requires text-only replies; unset QWEN_VOICE_ID"
+        )
+    transcript_shadow_percent = _optional_int("TRANSCRIPT_SHADOW_PERCENT", 0)
+    if not 0 <= transcript_shadow_percent <= 100:
+        raise SettingsError(f"Invalid TRANSCRIPT_SHADOW_PERCENT: {transcript_shadow_percent}")
+    metrics_flush_seconds = _optional_int("METRICS_FLUSH_SECONDS", 60)
+    metrics_max_series = _optional_int("METRICS_MAX_SERIES", 200)
+    if metrics_max_series < 1:
+        raise SettingsError(f"Invalid METRICS_MAX_SERIES: {metrics_max_series}")
+    loop_lag_interval_ms = _optional_int("LOOP_LAG_INTERVAL_MS", 100)
+    if loop_lag_interval_ms < 0:
+        raise SettingsError(f"Invalid LOOP_LAG_INTERVAL_MS: {loop_lag_interval_ms}")
+    loop_lag_threshold_ms = _optional_int("LOOP_LAG_THRESHOLD_MS", 200)
+    if loop_lag_threshold_ms < 1:
+        raise SettingsError(f"Invalid LOOP_LAG_THRESHOLD_MS: {loop_lag_threshold_ms}")
+    log_level = (os.getenv("LOG_LEVEL") or "INFO").strip().upper()
+    if log_level not in {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}:
+        raise SettingsError(f"Invalid LOG_LEVEL: {log_level}")
+    log_format = (os.getenv("LOG_FORMAT") or "json").strip().lower()
+    if log_format not in {"json", "text"}:
+        raise SettingsError(f"Invalid LOG_FORMAT: {log_format}")
+    log_max_chars = _optional_int("LOG_MAX_CHARS", 2000)
+    if log_max_chars < 100:
+        raise SettingsError(f"Invalid LOG_MAX_CHARS: {log_max_chars}")
+    try:
+        log_sampling = parse_sampling(os.getenv("LOG_SAMPLING"))
+    except ValueError as exc:
+        raise SettingsError(f"Invalid LOG_SAMPLING: {exc}")
+    otlp_endpoint = _optional_env("OTEL_EXPORTER_OTLP_ENDPOINT")
+    if otlp_endpoint:
+        otlp_endpoint = _require_url("OTEL_EXPORTER_OTLP_ENDPOINT", otlp_endpoint)
+    otel_service_name = _optional_env("OTEL_SERVICE_NAME") or "real-talk-coach-backend"
     chatai_api_base = _require_url("CHATAI_API_BASE", _require_env("CHATAI_API_BASE"))
     chatai_api_key = _require_env("CHATAI_API_KEY")
     chatai_api_model = _require_env("CHATAI_API_MODEL")
@@ -105,13 +257,50 @@ def load_settings() -> Settings:
         mongo_host=mongo_host,
         mongo_port=mongo_port,
         mongo_db=mongo_db,
+        mongo_ensure_indexes=mongo_ensure_indexes,
         minio_endpoint=minio_endpoint,
         minio_access_key=minio_access_key,
         minio_secret_key=minio_secret_key,
         minio_bucket=minio_bucket,
         minio_public_endpoint=minio_public_endpoint,
+        history_audio_redirect=history_audio_redirect,
+        replay_bundle_enabled=replay_bundle_enabled,
+        ws_pubsub_backend=ws_pubsub_backend,
+        ws_send_queue_size=ws_send_queue_size,
+        ws_overflow_policy=ws_overflow_policy,
+        ws_heartbeat_seconds=ws_heartbeat_seconds,
+        gc_enabled=gc_enabled,
+        gc_interval_seconds=gc_interval_seconds,
+        gc_grace_seconds=gc_grace_seconds,
+        session_retention_days=session_retention_days,
+        rollup_recompute_enabled=rollup_recompute_enabled,
+        rollup_recompute_interval_seconds=rollup_recompute_interval_seconds,
+        rollup_recompute_days=rollup_recompute_days,
+        vad_enabled=vad_enabled,
+        vad_energy_threshold_db=vad_energy_threshold_db,
+        vad_zcr_max=vad_zcr_max,
+        vad_min_speech_ms=vad_min_speech_ms,
+        vad_padding_ms=vad_padding_ms,
+        audio_renditions=audio_renditions,
+        transcript_source=transcript_source,
+        transcript_shadow_percent=transcript_shadow_percent,
+        metrics_flush_seconds=metrics_flush_seconds,
+        metrics_max_series=metrics_max_series,
+        loop_lag_interval_ms=loop_lag_interval_ms,
+        loop_lag_threshold_ms=loop_lag_threshold_ms,
+        log_level=log_level,
+        log_format=log_format,
+        log_max_chars=log_max_chars,
+        log_sampling=log_sampling,
+        otlp_endpoint=otlp_endpoint,
+        otel_service_name=otel_service_name,
         dashscope_api_key=dashscope_api_key,
+        qwen_api_base=qwen_api_base,
         qwen_voice_id=qwen_voice_id,
+        llm_cassette_mode=llm_cassette_mode,
+        llm_cassette_path=llm_cassette_path,
+        llm_cassette_session=llm_cassette_session,
+        llm_cassette_time_scale=llm_cassette_time_scale,
         chatai_api_base=chatai_api_base,
         chatai_api_key=chatai_api_key,
         chatai_api_model=chatai_api_model,
@@ -1,12 +1,14 @@
 """FastAPI dependencies for the application.
 
-This module provides dependency injection functions for MongoDB and MinIO clients.
+This module provides dependency injection functions for MongoDB and MinIO clients
+and the shared signed-URL service.
 """
 
 from fastapi import Request
 
 from app.clients.mongodb import MongoDBClient
 from app.clients.minio import MinioClient
+from app.services.signed_urls import SignedUrlService
 
 
 def get_mongodb_client(request: Request) -> MongoDBClient:
@@ -17,3 +19,8 @@ def get_mongodb_client(request: Request) -> MongoDBClient:
 def get_minio_client(request: Request) -> MinioClient | None:
     """Dependency for MinIO client from app state."""
     return request.app.state.minio
+
+
+def get_signed_url_service(request: Request) -> SignedUrlService | None:
+    """Dependency for the signed-URL service from app state (None without MinIO)."""
+    return getattr(request.app.state, "signed_urls", None)
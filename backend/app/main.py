@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from contextlib import asynccontextmanager
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.router import api_router
-from app.api.routes.session_socket import router as session_socket_router
+from app.api.routes.session_socket import hub, router as session_socket_router
 from app.clients.mongodb import MongoDBClient
 from app.clients.minio import MinioClient
 from app.config import load_settings, Settings
+from app.repositories.index_registry import ensure_indexes
+from app.services.audio_gc import run_gc_forever
+from app.services.metrics_rollups import run_recompute_forever
+from app.services.pubsub import InMemoryPubSub, MongoPubSub
+from app.services.signed_urls import SignedUrlService
+from app.telemetry.logs import configure_logging
+from app.telemetry.metrics import registry, run_flush_forever
+from app.telemetry.otel import OtlpSpanExporter
+from app.telemetry.profiling import LoopLagMonitor
+
+logger = logging.getLogger(__name__)
 
 CORS_ORIGINS = [
     "http://localhost:3000",
@@ -37,12 +50,40 @@ def get_minio(request: Request) -> MinioClient:
     return request.app.state.minio
 
 
+async def _start_socket_hub(app: FastAPI, settings: Settings) -> None:
+    hub.configure(
+        queue_size=settings.ws_send_queue_size,
+        overflow_policy=settings.ws_overflow_policy,
+        heartbeat_seconds=settings.ws_heartbeat_seconds,
+    )
+    if settings.ws_pubsub_backend == "mongo":
+        try:
+            await hub.start(MongoPubSub(app.state.mongodb))
+            return
+        except Exception as exc:
+            logger.warning("Mongo pub/sub unavailable, using in-memory fan-out: %s", exc)
+    await hub.start(InMemoryPubSub())
+
+
+async def _reconcile_indexes(app: FastAPI) -> None:
+    try:
+        app.state.index_report = await ensure_indexes(app.state.mongodb)
+    except Exception as exc:
+        logger.warning("Index reconciliation failed: %s", exc)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown."""
     # Load settings
     settings: Settings = load_settings()
     app.state.settings = settings
+    log_listener = configure_logging(
+        level=settings.log_level,
+        json_format=settings.log_format == "json",
+        max_chars=settings.log_max_chars,
+        sampling=settings.log_sampling,
+    )
 
     # Initialize MongoDB client
     mongo_connection_string = f"mongodb://{settings.mongo_host}:{settings.mongo_port}"
@@ -52,6 +93,11 @@ async def lifespan(app: FastAPI):
     )
     # Ensure MongoDB connection is established
     _ = await app.state.mongodb.db
+    # Build indexes in the background so a slow or unreachable server does not
+    # hold up startup; queries still work (as collection scans) meanwhile.
+    app.state.index_task = None
+    if settings.mongo_ensure_indexes:
+        app.state.index_task = asyncio.create_task(_reconcile_indexes(app))
 
     # Initialize MinIO client (optional - may fail if MinIO not available)
     try:
@@ -67,14 +113,62 @@ async def lifespan(app: FastAPI):
     except Exception:
         # MinIO is optional - log warning and continue
         app.state.minio = None
+    app.state.signed_urls = (
+        SignedUrlService(app.state.minio) if app.state.minio is not None else None
+    )
+
+    await _start_socket_hub(app, settings)
+
+    app.state.gc_task = None
+    if settings.gc_enabled:
+        app.state.gc_task = asyncio.create_task(run_gc_forever(settings))
+
+    app.state.rollup_task = None
+    if settings.rollup_recompute_enabled:
+        app.state.rollup_task = asyncio.create_task(run_recompute_forever(settings))
+
+    registry.configure(max_series=settings.metrics_max_series)
+    app.state.metrics_flush_task = None
+    if settings.metrics_flush_seconds > 0:
+        app.state.metrics_flush_task = asyncio.create_task(
+            run_flush_forever(settings.metrics_flush_seconds)
+        )
+
+    app.state.loop_monitor_task = None
+    if settings.loop_lag_interval_ms > 0:
+        monitor = LoopLagMonitor(
+            settings.loop_lag_interval_ms / 1000, settings.loop_lag_threshold_ms
+        )
+        app.state.loop_monitor_task = asyncio.create_task(monitor.run())
+
+    app.state.span_export_task = None
+    if settings.otlp_endpoint:
+        exporter = OtlpSpanExporter(
+            settings.otlp_endpoint, service_name=settings.otel_service_name
+        )
+        app.state.span_export_task = asyncio.create_task(exporter.run_forever())
 
     app.state.lifespan_started = True
     yield
     app.state.lifespan_shutdown = True
 
     # Shutdown: Close clients
+    for task in (
+        app.state.index_task,
+        app.state.gc_task,
+        app.state.rollup_task,
+        app.state.metrics_flush_task,
+        app.state.loop_monitor_task,
+        app.state.span_export_task,
+    ):
+        if task is not None and not task.done():
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+    await hub.close()
     if hasattr(app.state, 'mongodb') and app.state.mongodb:
         await app.state.mongodb.close()
+    log_listener.stop()
 
 
 app = FastAPI(lifespan=lifespan)
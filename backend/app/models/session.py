@@ -42,15 +42,18 @@ class PracticeSessionCreate(BaseModel):
         return self
 
 
-class TurnInput(BaseModel):
+class TurnMetadata(BaseModel):
     sequence: int = Field(..., ge=0)
-    audioBase64: str
     context: str | None = None
     startedAt: datetime
     endedAt: datetime
 
     @model_validator(mode="after")
-    def validate_timestamps(self) -> "TurnInput":
+    def validate_timestamps(self) -> "TurnMetadata":
         if self.endedAt < self.startedAt:
             raise ValueError("endedAt must be >= startedAt")
         return self
+
+
+class TurnInput(TurnMetadata):
+    audioBase64: str
@@ -6,6 +6,11 @@ from typing import Any
 from bson import ObjectId
 
 from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import IndexSpec
+
+INDEXES: tuple[IndexSpec, ...] = (
+    IndexSpec("Scenario", (("recordStatus", 1),), "recordStatus"),
+)
 
 
 class ConflictError(Exception):
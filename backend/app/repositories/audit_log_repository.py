@@ -4,6 +4,18 @@ from dataclasses import dataclass
 from typing import Any
 
 from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import HotQuery, IndexSpec
+
+INDEXES: tuple[IndexSpec, ...] = (
+    IndexSpec("AuditLog", (("timestamp", -1),), "timestamp"),
+    IndexSpec("AuditLog", (("entityType", 1), ("timestamp", -1)), "entityType_timestamp"),
+    IndexSpec("AuditLog", (("adminId", 1), ("timestamp", -1)), "adminId_timestamp"),
+)
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery("audit_log.by_entity_type", "AuditLog", {"entityType": ""}),
+    HotQuery("audit_log.by_admin", "AuditLog", {"adminId": ""}),
+)
 
 
 @dataclass(frozen=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -7,6 +8,17 @@ from typing import Any
 from bson.objectid import ObjectId
 
 from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import HotQuery, IndexSpec
+
+logger = logging.getLogger(__name__)
+
+INDEXES: tuple[IndexSpec, ...] = (
+    IndexSpec("Evaluation", (("sessionId", 1),), "sessionId"),
+)
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery("evaluations.by_session", "Evaluation", {"sessionId": ""}),
+)
 
 
 @dataclass(frozen=True)
@@ -118,7 +130,9 @@ class EvaluationRepository:
             # Fetch updated document
             return await self.get_evaluation(evaluation_id)
         except Exception as exc:
-            print(f"update_evaluation failed evaluation_id={evaluation_id} error={exc}")
+            logger.warning(
+                "update_evaluation failed evaluation_id=%s error=%s", evaluation_id, exc
+            )
             return None
 
     async def get_evaluation(self, evaluation_id: str) -> EvaluationRecord | None:
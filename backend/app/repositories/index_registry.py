@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from typing import Any
+
+from app.clients.mongodb import MongoDBClient
+from app.repositories import (
+    admin_scenario_repository,
+    audit_log_repository,
+    evaluation_repository,
+    rollup_repository,
+    scenario_repository,
+    session_repository,
+    skill_repository,
+)
+from app.repositories.indexes import (
+    HotQuery,
+    IndexReport,
+    IndexSpec,
+    QueryPlan,
+    explain_hot_queries,
+    reconcile_indexes,
+)
+
+logger = logging.getLogger(__name__)
+
+REGISTERED_INDEXES: tuple[IndexSpec, ...] = (
+    *session_repository.INDEXES,
+    *evaluation_repository.INDEXES,
+    *scenario_repository.INDEXES,
+    *admin_scenario_repository.INDEXES,
+    *skill_repository.INDEXES,
+    *audit_log_repository.INDEXES,
+    *rollup_repository.INDEXES,
+)
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    *session_repository.HOT_QUERIES,
+    *evaluation_repository.HOT_QUERIES,
+    *scenario_repository.HOT_QUERIES,
+    *audit_log_repository.HOT_QUERIES,
+    *rollup_repository.HOT_QUERIES,
+)
+
+
+async def ensure_indexes(client: MongoDBClient, *, dry_run: bool = False) -> IndexReport:
+    report = await reconcile_indexes(client, REGISTERED_INDEXES, dry_run=dry_run)
+    if report.created:
+        logger.info("Created indexes: %s", ", ".join(report.created))
+    for name, reason in report.drifted:
+        logger.warning("Index drift %s: %s", name, reason)
+    if report.extra:
+        logger.info("Unregistered indexes present: %s", ", ".join(report.extra))
+    for name, error in report.errors:
+        logger.error("Failed to create index %s: %s", name, error)
+    return report
+
+
+async def verify_hot_queries(client: MongoDBClient) -> list[QueryPlan]:
+    plans = await explain_hot_queries(client, HOT_QUERIES)
+    for plan in plans:
+        if not plan.uses_index:
+            logger.warning(
+                "Hot query %s on %s is not index-backed: %s",
+                plan.label,
+                plan.collection,
+                " <- ".join(plan.stages),
+            )
+    return plans
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    from app.config import load_settings
+
+    settings = load_settings()
+    client = MongoDBClient(
+        connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+        database=settings.mongo_db,
+    )
+    try:
+        output: dict[str, Any] = {}
+        report = await ensure_indexes(client, dry_run=args.dry_run)
+        output["indexes"] = report.as_dict()
+        if args.verify:
+            plans = await verify_hot_queries(client)
+            output["queries"] = [plan.as_dict() for plan in plans]
+        return output
+    finally:
+        await client.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Reconcile MongoDB indexes declared by the repositories."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report missing indexes without creating them.",
+    )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Run explain() on hot queries and report whether they use an index.",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    output = asyncio.run(_run(args))
+    print(json.dumps(output, indent=2))
+    failed = bool(output["indexes"]["errors"]) or any(
+        not plan["usesIndex"] for plan in output.get("queries", [])
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any
+
+from app.clients.mongodb import MongoDBClient
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexSpec:
+    """Declarative description of an index a repository relies on."""
+
+    collection: str
+    keys: tuple[tuple[str, int], ...]
+    name: str
+    unique: bool = False
+    sparse: bool = False
+
+    def options(self) -> dict[str, Any]:
+        options: dict[str, Any] = {}
+        if self.sparse:
+            options["sparse"] = True
+        return options
+
+
+@dataclass(frozen=True)
+class HotQuery:
+    """A query shape served on a hot path; verified with ``explain()``."""
+
+    label: str
+    collection: str
+    filter: dict[str, Any]
+    sort: tuple[tuple[str, int], ...] = ()
+
+
+@dataclass
+class IndexReport:
+    created: list[str] = field(default_factory=list)
+    present: list[str] = field(default_factory=list)
+    drifted: list[tuple[str, str]] = field(default_factory=list)
+    extra: list[str] = field(default_factory=list)
+    errors: list[tuple[str, str]] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "created": self.created,
+            "present": self.present,
+            "drifted": [{"index": name, "reason": reason} for name, reason in self.drifted],
+            "extra": self.extra,
+            "errors": [{"index": name, "error": error} for name, error in self.errors],
+        }
+
+
+@dataclass(frozen=True)
+class QueryPlan:
+    label: str
+    collection: str
+    stages: tuple[str, ...]
+    index_names: tuple[str, ...]
+
+    @property
+    def uses_index(self) -> bool:
+        return "COLLSCAN" not in self.stages and bool(self.index_names)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "label": self.label,
+            "collection": self.collection,
+            "stages": list(self.stages),
+            "indexes": list(self.index_names),
+            "usesIndex": self.uses_index,
+        }
+
+
+def _qualified(spec: IndexSpec) -> str:
+    return f"{spec.collection}.{spec.name}"
+
+
+def _normalize_keys(raw: Any) -> tuple[tuple[str, int], ...]:
+    items = raw.items() if isinstance(raw, dict) else raw
+    return tuple((str(field_name), int(direction)) for field_name, direction in items)
+
+
+def _drift_reason(spec: IndexSpec, info: dict[str, Any]) -> str | None:
+    existing_keys = _normalize_keys(info.get("key", ()))
+    if existing_keys != spec.keys:
+        return f"keys {list(existing_keys)} != {list(spec.keys)}"
+    if bool(info.get("unique", False)) != spec.unique:
+        return f"unique={bool(info.get('unique', False))} expected {spec.unique}"
+    if bool(info.get("sparse", False)) != spec.sparse:
+        return f"sparse={bool(info.get('sparse', False))} expected {spec.sparse}"
+    return None
+
+
+async def reconcile_indexes(
+    client: MongoDBClient,
+    specs: tuple[IndexSpec, ...],
+    *,
+    dry_run: bool = False,
+) -> IndexReport:
+    """Create missing indexes and report extra or drifted ones.
+
+    Drifted and extra indexes are only reported; dropping or rebuilding them is
+    left to an operator because it can be expensive on large collections.
+    """
+    report = IndexReport()
+    by_collection: dict[str, list[IndexSpec]] = {}
+    for spec in specs:
+        by_collection.setdefault(spec.collection, []).append(spec)
+
+    for collection_name, collection_specs in by_collection.items():
+        collection = await client.collection(collection_name)
+        existing: dict[str, dict[str, Any]] = await collection.index_information()
+        matched: set[str] = {"_id_"}
+        for spec in collection_specs:
+            info = existing.get(spec.name)
+            if info is None:
+                same_keys = next(
+                    (
+                        name
+                        for name, candidate in existing.items()
+                        if _normalize_keys(candidate.get("key", ())) == spec.keys
+                    ),
+                    None,
+                )
+                if same_keys is not None:
+                    matched.add(same_keys)
+                    report.drifted.append(
+                        (_qualified(spec), f"exists under name {same_keys!r}")
+                    )
+                    continue
+                if dry_run:
+                    report.created.append(_qualified(spec))
+                    continue
+                try:
+                    await client.create_index(
+                        collection_name,
+                        list(spec.keys),
+                        unique=spec.unique,
+                        name=spec.name,
+                        **spec.options(),
+                    )
+                    report.created.append(_qualified(spec))
+                except Exception as exc:
+                    report.errors.append((_qualified(spec), str(exc)))
+                continue
+            matched.add(spec.name)
+            reason = _drift_reason(spec, info)
+            if reason:
+                report.drifted.append((_qualified(spec), reason))
+            else:
+                report.present.append(_qualified(spec))
+        for name in existing:
+            if name not in matched:
+                report.extra.append(f"{collection_name}.{name}")
+    return report
+
+
+def _walk_plan(plan: dict[str, Any], stages: list[str], index_names: list[str]) -> None:
+    stage = plan.get("stage")
+    if stage:
+        stages.append(stage)
+    if plan.get("indexName"):
+        index_names.append(plan["indexName"])
+    child = plan.get("inputStage")
+    if isinstance(child, dict):
+        _walk_plan(child, stages, index_names)
+    for child in plan.get("inputStages", []) or []:
+        if isinstance(child, dict):
+            _walk_plan(child, stages, index_names)
+
+
+def summarize_explain(query: HotQuery, explain: dict[str, Any]) -> QueryPlan:
+    planner = explain.get("queryPlanner", {})
+    winning = planner.get("winningPlan", {})
+    # Newer servers wrap the classic plan in a queryPlan (SBE) envelope.
+    winning = winning.get("queryPlan", winning)
+    stages: list[str] = []
+    index_names: list[str] = []
+    _walk_plan(winning, stages, index_names)
+    return QueryPlan(
+        label=query.label,
+        collection=query.collection,
+        stages=tuple(stages),
+        index_names=tuple(index_names),
+    )
+
+
+async def explain_hot_queries(
+    client: MongoDBClient, queries: tuple[HotQuery, ...]
+) -> list[QueryPlan]:
+    plans: list[QueryPlan] = []
+    for query in queries:
+        collection = await client.collection(query.collection)
+        cursor = collection.find(query.filter)
+        if query.sort:
+            cursor = cursor.sort(list(query.sort))
+        explain = await cursor.explain()
+        plans.append(summarize_explain(query, explain))
+    return plans
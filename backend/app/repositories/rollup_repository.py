@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any
+
+from bson.objectid import ObjectId
+from pymongo import DeleteMany, ReplaceOne
+
+from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import HotQuery, IndexSpec
+
+INDEXES: tuple[IndexSpec, ...] = (
+    IndexSpec("MetricsRollup", (("kind", 1), ("day", 1)), "kind_day"),
+)
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery("rollups.by_kind_day", "MetricsRollup", {"kind": ""}, (("day", 1),)),
+)
+
+
+@dataclass(frozen=True)
+class RollupRecord:
+    kind: str
+    day: str
+    subject_id: str
+    sessions: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    duration_seconds: float = 0.0
+    evaluations: int = 0
+    rating_sum: float = 0.0
+    rating_count: int = 0
+    terminations: dict[str, int] = field(default_factory=dict)
+
+
+def rollup_id(kind: str, day: str, subject_id: str) -> str:
+    return f"{kind}:{day}:{subject_id}"
+
+
+def _from_doc(doc: dict[str, Any]) -> RollupRecord:
+    return RollupRecord(
+        kind=doc.get("kind", ""),
+        day=doc.get("day", ""),
+        subject_id=doc.get("subjectId", ""),
+        sessions=int(doc.get("sessions", 0) or 0),
+        succeeded=int(doc.get("succeeded", 0) or 0),
+        failed=int(doc.get("failed", 0) or 0),
+        duration_seconds=float(doc.get("durationSeconds", 0) or 0),
+        evaluations=int(doc.get("evaluations", 0) or 0),
+        rating_sum=float(doc.get("ratingSum", 0) or 0),
+        rating_count=int(doc.get("ratingCount", 0) or 0),
+        terminations=dict(doc.get("terminations") or {}),
+    )
+
+
+class RollupRepository:
+    """``MetricsRollup`` documents: one per (kind, UTC day, scenario or skill)."""
+
+    def __init__(self, client: MongoDBClient) -> None:
+        self._client = client
+
+    async def _rollups_collection(self):
+        return await self._client.collection("MetricsRollup")
+
+    async def claim_session(self, session_id: str, stage: str) -> dict[str, Any] | None:
+        """Flag an ended session as counted for ``stage``; ``None`` if it already was.
+
+        The flag is set atomically before the counters are incremented, so a
+        retried or duplicated event is counted at most once.
+        """
+        try:
+            object_id = ObjectId(session_id)
+        except Exception:
+            return None
+        sessions = await self._client.collection("PracticeSession")
+        return await sessions.find_one_and_update(
+            {
+                "_id": object_id,
+                "status": "ended",
+                "endedAt": {"$ne": None},
+                f"rollups.{stage}": {"$ne": True},
+            },
+            {"$set": {f"rollups.{stage}": True}},
+        )
+
+    async def increment(
+        self, kind: str, day: str, subject_id: str, counts: dict[str, float]
+    ) -> None:
+        if not counts:
+            return
+        collection = await self._rollups_collection()
+        await collection.update_one(
+            {"_id": rollup_id(kind, day, subject_id)},
+            {
+                "$inc": counts,
+                "$setOnInsert": {"kind": kind, "day": day, "subjectId": subject_id},
+            },
+            upsert=True,
+        )
+
+    async def list_rollups(self, kind: str, start_day: str, end_day: str) -> list[RollupRecord]:
+        """Rollups of ``kind`` for days in ``[start_day, end_day]``, oldest first."""
+        collection = await self._rollups_collection()
+        cursor = collection.find(
+            {"kind": kind, "day": {"$gte": start_day, "$lte": end_day}}
+        ).sort("day", 1)
+        return [_from_doc(doc) for doc in await cursor.to_list(length=None)]
+
+    async def replace_days(self, days: list[str], docs: list[dict[str, Any]]) -> None:
+        """Swap every rollup of ``days`` for ``docs``.
+
+        Each rollup is replaced in place (upserted), and only rollups of
+        ``days`` that ``docs`` no longer contain are deleted, so an increment
+        landing meanwhile never meets a missing or duplicate ``_id``.
+        """
+        collection = await self._rollups_collection()
+        requests: list[Any] = [ReplaceOne({"_id": doc["_id"]}, doc, upsert=True) for doc in docs]
+        requests.append(
+            DeleteMany({"day": {"$in": days}, "_id": {"$nin": [doc["_id"] for doc in docs]}})
+        )
+        await collection.bulk_write(requests, ordered=False)
+
+    async def mark_sessions(self, session_ids: list[str], stage: str) -> None:
+        if not session_ids:
+            return
+        sessions = await self._client.collection("PracticeSession")
+        await sessions.update_many(
+            {"_id": {"$in": [ObjectId(session_id) for session_id in session_ids]}},
+            {"$set": {f"rollups.{stage}": True}},
+        )
@@ -6,6 +6,20 @@ from typing import Any
 from bson import ObjectId
 
 from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import HotQuery, IndexSpec
+
+INDEXES: tuple[IndexSpec, ...] = (
+    IndexSpec("Scenario", (("status", 1), ("category", 1)), "status_category"),
+)
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery("scenarios.published", "Scenario", {"status": "published"}),
+    HotQuery(
+        "scenarios.published_by_category",
+        "Scenario",
+        {"status": "published", "category": ""},
+    ),
+)
 
 
 @dataclass(frozen=True)
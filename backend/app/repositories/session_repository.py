@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import base64
+import json
+import logging
+import re
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
@@ -7,6 +11,52 @@ from typing import Any
 from bson.objectid import ObjectId
 
 from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import HotQuery, IndexSpec
+
+logger = logging.getLogger(__name__)
+
+INDEXES: tuple[IndexSpec, ...] = (
+    IndexSpec("Turn", (("sessionId", 1), ("sequence", 1)), "sessionId_sequence"),
+    IndexSpec("Turn", (("audioFileId", 1),), "audioFileId"),
+    # Only timed AI turns carry scenarioId.
+    IndexSpec("Turn", (("scenarioId", 1), ("_id", -1)), "scenarioId_id", sparse=True),
+    IndexSpec(
+        "PracticeSession",
+        (("stubUserId", 1), ("userId", 1), ("startedAt", -1), ("_id", -1)),
+        "stubUserId_userId_startedAt_id",
+    ),
+    IndexSpec(
+        "PracticeSession",
+        (("stubUserId", 1), ("startedAt", -1), ("_id", -1)),
+        "stubUserId_startedAt_id",
+    ),
+    IndexSpec("PracticeSession", (("userId", 1), ("startedAt", -1)), "userId_startedAt"),
+    IndexSpec("PracticeSession", (("status", 1),), "status"),
+    IndexSpec("PracticeSession", (("scenarioId", 1),), "scenarioId"),
+    IndexSpec(
+        "PracticeSession",
+        (("replay.audioFileId", 1),),
+        "replay_audioFileId",
+        sparse=True,
+    ),
+)
+
+HOT_QUERIES: tuple[HotQuery, ...] = (
+    HotQuery("turns.by_session", "Turn", {"sessionId": ""}, (("sequence", 1),)),
+    HotQuery("turns.timings_by_scenario", "Turn", {"scenarioId": ""}, (("_id", -1),)),
+    HotQuery(
+        "sessions.by_user",
+        "PracticeSession",
+        {"stubUserId": "", "userId": ""},
+        (("startedAt", -1), ("_id", -1)),
+    ),
+    HotQuery(
+        "sessions.by_stub_user",
+        "PracticeSession",
+        {"stubUserId": ""},
+        (("startedAt", -1), ("_id", -1)),
+    ),
+)
 
 
 @dataclass(frozen=True)
@@ -29,6 +79,7 @@ class PracticeSessionRecord:
     termination_reason: str | None
     evaluation_id: str | None
     user_id: str | None = None
+    replay: dict[str, Any] | None = None
 
 
 @dataclass(frozen=True)
@@ -46,6 +97,15 @@ class TurnRecord:
     ended_at: str | None
     context: str | None
     latency_ms: int | None
+    speech_ms: int | None = None
+    timings: dict[str, float] | None = None
+
+
+@dataclass(frozen=True)
+class HistoryPage:
+    items: list[PracticeSessionRecord]
+    total: int | None
+    next_cursor: str | None
 
 
 def _normalize_termination_reason(raw: Any) -> str | None:
@@ -101,6 +161,7 @@ def _session_from_doc(doc: dict[str, Any]) -> PracticeSessionRecord:
         objective_reason=doc.get("objectiveReason"),
         termination_reason=_normalize_termination_reason(doc.get("terminationReason")),
         evaluation_id=_normalize_evaluation_id(doc.get("evaluationId")),
+        replay=doc.get("replay"),
     )
 
 
@@ -119,6 +180,8 @@ def _turn_from_doc(doc: dict[str, Any]) -> TurnRecord:
         ended_at=_normalize_date(doc.get("endedAt")),
         context=doc.get("context"),
         latency_ms=doc.get("latencyMs"),
+        speech_ms=doc.get("speechMs"),
+        timings=doc.get("timings"),
     )
 
 
@@ -143,6 +206,153 @@ def _doc_from_payload(payload: dict[str, Any]) -> dict[str, Any]:
     return doc
 
 
+def encode_history_cursor(doc: dict[str, Any]) -> str:
+    started_at = doc.get("startedAt")
+    position: dict[str, Any] = {"i": str(doc["_id"])}
+    if isinstance(started_at, datetime):
+        if started_at.tzinfo is None:
+            # PyMongo returns naive datetimes that are already UTC.
+            started_at = started_at.replace(tzinfo=timezone.utc)
+        started_at = started_at.isoformat()
+    elif isinstance(started_at, str):
+        # Legacy string-typed startedAt: compare as a string, not a date.
+        position["t"] = "str"
+    position["s"] = started_at
+    raw = json.dumps(position, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_history_cursor(token: str) -> tuple[datetime | str | None, ObjectId]:
+    """Decode a keyset cursor into its (startedAt, _id) position.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        object_id = ObjectId(data["i"])
+    except Exception as exc:
+        raise ValueError("Invalid history cursor") from exc
+    started_at = data.get("s")
+    if isinstance(started_at, str) and data.get("t") != "str":
+        try:
+            started_at = datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+        except ValueError:
+            pass  # Not a date at all, so it can only match a string-typed value
+    return started_at, object_id
+
+
+# BSON sorts null (and missing) before strings before dates, but $lt/$gt only
+# compare values of one type; the types past the cursor's are matched whole.
+_STARTED_AT_TYPES = (
+    {"startedAt": None},
+    {"startedAt": {"$type": "string"}},
+    {"startedAt": {"$type": "date"}},
+)
+
+
+def _started_at_rank(started_at: datetime | str | None) -> int:
+    if started_at is None:
+        return 0
+    return 1 if isinstance(started_at, str) else 2
+
+
+def _keyset_match(
+    position: tuple[datetime | str | None, ObjectId], *, ascending: bool
+) -> dict[str, Any]:
+    started_at, object_id = position
+    op = "$gt" if ascending else "$lt"
+    clauses: list[dict[str, Any]] = []
+    if started_at is not None:
+        clauses.append({"startedAt": {op: started_at}})
+    clauses.append({"startedAt": started_at, "_id": {op: object_id}})
+    rank = _started_at_rank(started_at)
+    later = range(rank + 1, len(_STARTED_AT_TYPES)) if ascending else range(rank)
+    clauses.extend(_STARTED_AT_TYPES[index] for index in later)
+    return {"$or": clauses}
+
+
+def _history_pipeline(
+    *,
+    stub_user_id: str | None,
+    user_id: str | None = None,
+    scenario_id: str | None = None,
+    category: str | None = None,
+    search: str | None = None,
+    ascending: bool = False,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: tuple[datetime | str | None, ObjectId] | None = None,
+) -> list[dict[str, Any]]:
+    """Build the history list aggregation.
+
+    Page-number mode ends in a ``$facet`` returning ``total`` and ``items``;
+    keyset mode (``cursor`` given) returns ``page_size + 1`` plain documents so
+    the caller can tell whether another page exists.
+    """
+    match: dict[str, Any] = {}
+    if stub_user_id:
+        match["stubUserId"] = stub_user_id
+    if user_id:
+        match["userId"] = user_id
+    if scenario_id:
+        match["scenarioId"] = scenario_id
+    if cursor is not None:
+        match = {"$and": [match, _keyset_match(cursor, ascending=ascending)]}
+    direction = 1 if ascending else -1
+    pipeline: list[dict[str, Any]] = [
+        {"$match": match},
+        {"$sort": {"startedAt": direction, "_id": direction}},
+    ]
+    if category or search:
+        pipeline.append(
+            {
+                "$lookup": {
+                    "from": "Scenario",
+                    "let": {
+                        "scenarioId": {
+                            "$convert": {
+                                "input": "$scenarioId",
+                                "to": "objectId",
+                                "onError": None,
+                                "onNull": None,
+                            }
+                        }
+                    },
+                    "pipeline": [
+                        {"$match": {"$expr": {"$eq": ["$_id", "$$scenarioId"]}}},
+                        {"$project": {"_id": 0, "category": 1, "title": 1, "objective": 1}},
+                    ],
+                    "as": "scenario",
+                }
+            }
+        )
+        scenario_match: dict[str, Any] = {}
+        if category:
+            scenario_match["scenario.category"] = category
+        if search:
+            pattern = {"$regex": re.escape(search), "$options": "i"}
+            scenario_match["$or"] = [
+                {"scenario.title": pattern},
+                {"scenario.objective": pattern},
+            ]
+        pipeline.append({"$match": scenario_match})
+        pipeline.append({"$project": {"scenario": 0}})
+    if cursor is not None:
+        pipeline.append({"$limit": page_size + 1})
+        return pipeline
+    pipeline.append(
+        {
+            "$facet": {
+                "total": [{"$count": "count"}],
+                "items": [{"$skip": (page - 1) * page_size}, {"$limit": page_size}],
+            }
+        }
+    )
+    return pipeline
+
+
 class SessionRepository:
     def __init__(self, client: MongoDBClient) -> None:
         self._client = client
@@ -191,7 +401,7 @@ class SessionRepository:
             # Fetch updated document
             return await self.get_session(session_id)
         except Exception as exc:
-            print(f"update_session failed session_id={session_id} error={exc}")
+            logger.warning("update_session failed session_id=%s error=%s", session_id, exc)
             return None
 
     async def add_turn(self, payload: dict[str, Any]) -> TurnRecord:
@@ -233,12 +443,35 @@ class SessionRepository:
         except Exception:
             return None
 
+    async def delete_turn(self, turn_id: str) -> None:
+        collection = await self._turns_collection()
+        await collection.delete_one({"_id": ObjectId(turn_id)})
+
     async def list_turns(self, session_id: str) -> list[TurnRecord]:
         collection = await self._turns_collection()
-        cursor = collection.find({"sessionId": session_id})
+        cursor = collection.find({"sessionId": session_id}).sort("sequence", 1)
         docs = await cursor.to_list(length=1000)
         return [_turn_from_doc(doc) for doc in docs]
 
+    async def list_turn_timings(
+        self, scenario_id: str, *, limit: int = 1000
+    ) -> list[dict[str, Any]]:
+        """``latencyMs`` and ``timings`` of the newest timed turns of a scenario.
+
+        The pipeline stores ``scenarioId`` on an AI turn together with its
+        timings, so this walks the ``scenarioId_id`` index and stops at ``limit``.
+        """
+        turns = await self._turns_collection()
+        cursor = (
+            turns.find(
+                {"scenarioId": scenario_id},
+                {"_id": 0, "latencyMs": 1, "timings": 1},
+            )
+            .sort("_id", -1)
+            .limit(limit)
+        )
+        return await cursor.to_list(length=limit)
+
     async def get_turn(self, turn_id: str) -> TurnRecord | None:
         try:
             collection = await self._turns_collection()
@@ -268,6 +501,56 @@ class SessionRepository:
         except Exception:
             return []
 
+    async def list_history(
+        self,
+        *,
+        stub_user_id: str | None,
+        user_id: str | None = None,
+        scenario_id: str | None = None,
+        category: str | None = None,
+        search: str | None = None,
+        ascending: bool = False,
+        page: int = 1,
+        page_size: int = 20,
+        cursor: str | None = None,
+    ) -> HistoryPage:
+        """Filter, sort and paginate history in a single aggregation.
+
+        Raises:
+            ValueError: If ``cursor`` is not a valid history cursor.
+        """
+        position = decode_history_cursor(cursor) if cursor else None
+        pipeline = _history_pipeline(
+            stub_user_id=stub_user_id,
+            user_id=user_id,
+            scenario_id=scenario_id,
+            category=category,
+            search=search,
+            ascending=ascending,
+            page=page,
+            page_size=page_size,
+            cursor=position,
+        )
+        collection = await self._sessions_collection()
+        result = await collection.aggregate(pipeline)
+        docs = await result.to_list(length=None)
+        if position is not None:
+            has_more = len(docs) > page_size
+            docs = docs[:page_size]
+            total = None
+        else:
+            facet = docs[0] if docs else {}
+            counts = facet.get("total") or []
+            total = counts[0]["count"] if counts else 0
+            docs = facet.get("items") or []
+            has_more = (page - 1) * page_size + len(docs) < total
+        next_cursor = encode_history_cursor(docs[-1]) if has_more and docs else None
+        return HistoryPage(
+            items=[_session_from_doc(doc) for doc in docs],
+            total=total,
+            next_cursor=next_cursor,
+        )
+
     async def delete_session(self, session_id: str) -> None:
         collection = await self._sessions_collection()
         await collection.delete_one({"_id": ObjectId(session_id)})
@@ -6,6 +6,9 @@ from typing import Any
 from bson import ObjectId
 
 from app.clients.mongodb import MongoDBClient
+from app.repositories.indexes import IndexSpec
+
+INDEXES: tuple[IndexSpec, ...] = (IndexSpec("Skill", (("status", 1),), "status"),)
 
 
 class ConflictError(Exception):
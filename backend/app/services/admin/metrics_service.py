@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from app.clients.mongodb import MongoDBClient
+from app.config import load_settings
+from app.repositories.admin_scenario_repository import AdminScenarioRepository
+from app.repositories.rollup_repository import RollupRecord, RollupRepository
+from app.repositories.skill_repository import AdminSkillRepository
+
+DEFAULT_RANGE_DAYS = 30
+MAX_RANGE_DAYS = 366
+
+
+def _client() -> MongoDBClient:
+    settings = load_settings()
+    mongo_connection_string = f"mongodb://{settings.mongo_host}:{settings.mongo_port}"
+    return MongoDBClient(
+        connection_string=mongo_connection_string,
+        database=settings.mongo_db,
+    )
+
+
+def _repo() -> RollupRepository:
+    return RollupRepository(_client())
+
+
+def _scenario_repo() -> AdminScenarioRepository:
+    return AdminScenarioRepository(_client())
+
+
+def _skill_repo() -> AdminSkillRepository:
+    return AdminSkillRepository(_client())
+
+
+def _ratio(numerator: float, denominator: float) -> float | None:
+    return round(numerator / denominator, 4) if denominator else None
+
+
+def _day_entry(record: RollupRecord) -> dict[str, Any]:
+    return {
+        "day": record.day,
+        "sessions": record.sessions,
+        "succeeded": record.succeeded,
+        "failed": record.failed,
+        "evaluations": record.evaluations,
+        "averageRating": _ratio(record.rating_sum, record.rating_count),
+    }
+
+
+def _scenario_summary(records: list[RollupRecord], title: str | None) -> dict[str, Any]:
+    sessions = sum(record.sessions for record in records)
+    succeeded = sum(record.succeeded for record in records)
+    rating_sum = sum(record.rating_sum for record in records)
+    rating_count = sum(record.rating_count for record in records)
+    terminations: dict[str, int] = {}
+    for record in records:
+        for reason, count in record.terminations.items():
+            terminations[reason] = terminations.get(reason, 0) + count
+    return {
+        "scenarioId": records[0].subject_id,
+        "scenarioTitle": title,
+        "sessions": sessions,
+        "succeeded": succeeded,
+        "failed": sum(record.failed for record in records),
+        "completionRate": _ratio(succeeded, sessions),
+        "averageDurationSeconds": _ratio(
+            sum(record.duration_seconds for record in records), sessions
+        ),
+        "terminations": terminations,
+        "evaluations": sum(record.evaluations for record in records),
+        "averageRating": _ratio(rating_sum, rating_count),
+        "days": [_day_entry(record) for record in records],
+    }
+
+
+def _skill_summary(records: list[RollupRecord], name: str | None) -> dict[str, Any]:
+    rating_sum = sum(record.rating_sum for record in records)
+    rating_count = sum(record.rating_count for record in records)
+    return {
+        "skillId": records[0].subject_id,
+        "skillName": name,
+        "evaluations": sum(record.evaluations for record in records),
+        "ratings": rating_count,
+        "averageRating": _ratio(rating_sum, rating_count),
+        "days": [
+            {
+                "day": record.day,
+                "ratings": record.rating_count,
+                "averageRating": _ratio(record.rating_sum, record.rating_count),
+            }
+            for record in records
+        ],
+    }
+
+
+def _by_subject(records: list[RollupRecord]) -> dict[str, list[RollupRecord]]:
+    grouped: dict[str, list[RollupRecord]] = {}
+    for record in records:
+        grouped.setdefault(record.subject_id, []).append(record)
+    return grouped
+
+
+class AdminMetricsService:
+    """Admin dashboard metrics, read from the ``MetricsRollup`` collection."""
+
+    def __init__(
+        self,
+        repo: RollupRepository | None = None,
+        scenario_repo: AdminScenarioRepository | None = None,
+        skill_repo: AdminSkillRepository | None = None,
+    ) -> None:
+        self.repo = repo or _repo()
+        self.scenario_repo = scenario_repo or _scenario_repo()
+        self.skill_repo = skill_repo or _skill_repo()
+
+    async def _scenario_titles(self, scenario_ids: list[str]) -> dict[str, str]:
+        results = await asyncio.gather(
+            *(self.scenario_repo.get(sid) for sid in scenario_ids if sid),
+            return_exceptions=True,
+        )
+        return {
+            record.id: record.title
+            for record in results
+            if not isinstance(record, Exception) and record is not None and record.title
+        }
+
+    async def summary(self, start: date | None, end: date | None) -> dict[str, Any]:
+        end = end or datetime.now(timezone.utc).date()
+        start = start or end - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+        if start > end or (end - start).days >= MAX_RANGE_DAYS:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Expected from <= to within {MAX_RANGE_DAYS} days",
+            )
+        scenario_records, skill_records = await asyncio.gather(
+            self.repo.list_rollups("scenario", start.isoformat(), end.isoformat()),
+            self.repo.list_rollups("skill", start.isoformat(), end.isoformat()),
+        )
+        scenarios = _by_subject(scenario_records)
+        skills = _by_subject(skill_records)
+        titles = await self._scenario_titles(list(scenarios))
+        skill_names: dict[str, str] = {}
+        if skills:
+            all_skills = await self.skill_repo.list_skills(include_deleted=True)
+            skill_names = {skill.id: skill.name for skill in all_skills}
+        return {
+            "from": start.isoformat(),
+            "to": end.isoformat(),
+            "scenarios": [
+                _scenario_summary(records, titles.get(scenario_id))
+                for scenario_id, records in scenarios.items()
+            ],
+            "skills": [
+                _skill_summary(records, skill_names.get(skill_id))
+                for skill_id, records in skills.items()
+            ],
+        }
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import math
 from typing import Any
 
 from fastapi import HTTPException, status
@@ -36,6 +37,38 @@ def _admin_id(token: str | None) -> str:
     return token or "admin"
 
 
+def _percentile(ordered: list[float], q: float) -> float:
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def _distribution(values: list[float]) -> dict[str, float | int]:
+    ordered = sorted(values)
+    return {
+        "count": len(ordered),
+        "p50": _percentile(ordered, 0.5),
+        "p95": _percentile(ordered, 0.95),
+        "p99": _percentile(ordered, 0.99),
+        "max": ordered[-1],
+    }
+
+
+def summarize_turn_timings(rows: list[dict[str, Any]]) -> dict[str, Any]:
+    """Percentiles of ``latencyMs`` and of each stage in ``timings``."""
+    # Turns created before timings existed carry -1 or no latency at all.
+    latencies = [
+        row["latencyMs"] for row in rows if row.get("latencyMs") is not None and row["latencyMs"] >= 0
+    ]
+    stages: dict[str, list[float]] = {}
+    for row in rows:
+        for stage, duration in (row.get("timings") or {}).items():
+            stages.setdefault(stage, []).append(duration)
+    return {
+        "turns": len(rows),
+        "latencyMs": _distribution(latencies) if latencies else None,
+        "stages": {stage: _distribution(values) for stage, values in stages.items()},
+    }
+
+
 def _validate_required(data: dict[str, Any]) -> None:
     required = [
         "category",
@@ -93,6 +126,11 @@ class AdminScenariosService:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Scenario not found")
         return scenario
 
+    async def latency_summary(self, scenario_id: str, *, limit: int = 1000) -> dict[str, Any]:
+        await self.get_scenario(scenario_id)
+        rows = await self.session_repo.list_turn_timings(scenario_id, limit=limit)
+        return {"scenarioId": scenario_id, **summarize_turn_timings(rows)}
+
     async def create_scenario(self, data: dict[str, Any], *, admin_token: str | None) -> AdminScenarioRecord:
         _validate_required(data)
         try:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+from typing import Any
 
 from fastapi import HTTPException, status
 
@@ -9,6 +10,7 @@ from app.config import load_settings
 from app.repositories.admin_scenario_repository import AdminScenarioRepository
 from app.repositories.session_repository import SessionRepository, PracticeSessionRecord
 from app.services.audit_log_service import record_audit_entry
+from app.services.session_cleanup import cleanup_jobs, cleanup_session
 
 
 def _client() -> MongoDBClient:
@@ -88,14 +90,39 @@ class AdminSessionsService:
         return _response(session, scenario.title if scenario else None)
 
     async def delete_session(self, session_id: str, *, admin_token: str | None) -> None:
-        try:
-            await self.repo.delete_session(session_id)
-            await record_audit_entry(
-                admin_id=_admin_id(admin_token),
-                action="delete",
-                entity_type="session",
-                entity_id=session_id,
-                details=f"Deleted session {session_id}",
+        session = await self.repo.get_session(session_id)
+        if not session:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+        await cleanup_session(session_id)
+        await record_audit_entry(
+            admin_id=_admin_id(admin_token),
+            action="delete",
+            entity_type="session",
+            entity_id=session_id,
+            details=f"Deleted session {session_id}",
+        )
+
+    async def start_bulk_delete(
+        self, session_ids: list[str], *, admin_token: str | None
+    ) -> dict[str, Any]:
+        if not session_ids:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="sessionIds must not be empty",
             )
-        except Exception as exc:
-            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found") from exc
+        progress = cleanup_jobs.start(session_ids)
+        await record_audit_entry(
+            admin_id=_admin_id(admin_token),
+            action="delete",
+            entity_type="session",
+            entity_id=progress.job_id,
+            details=f"Bulk delete of {len(progress.session_ids)} sessions: "
+            + ", ".join(progress.session_ids),
+        )
+        return progress.as_dict()
+
+    def get_cleanup_job(self, job_id: str) -> dict[str, Any]:
+        progress = cleanup_jobs.get(job_id)
+        if not progress:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Cleanup job not found")
+        return progress.as_dict()
@@ -1,20 +1,35 @@
 from __future__ import annotations
 
-import base64
+import asyncio
 import subprocess
 import tempfile
+from dataclasses import dataclass
 from pathlib import Path
 
+import numpy as np
 
-class AudioConversionError(RuntimeError):
-    pass
+from app.clients.audio_buffer import AudioBuffer, AudioConversionError, decode_audio_base64
 
+STREAM_READ_BYTES = 64 * 1024
 
-def decode_audio_base64(payload: str) -> bytes:
-    try:
-        return base64.b64decode(payload, validate=True)
-    except ValueError as exc:
-        raise AudioConversionError("Invalid base64 audio payload") from exc
+
+def pcm_stream_command(sample_rate: int) -> list[str]:
+    """ffmpeg command that decodes audio on stdin to mono int16 PCM on stdout."""
+    return [
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:0",
+        "-f",
+        "s16le",
+        "-ac",
+        "1",
+        "-ar",
+        str(sample_rate),
+        "pipe:1",
+    ]
 
 
 def convert_raw_pcm_to_mp3(pcm_bytes: bytes, sample_rate: int = 24000) -> bytes:
@@ -100,7 +115,9 @@ def convert_wav_to_mp3(wav_bytes: bytes) -> bytes:
         return mp3_path.read_bytes()
 
 
-def convert_audio_to_mp3(audio_bytes: bytes, input_suffix: str = ".webm") -> bytes:
+def convert_audio_to_mp3(
+    audio_bytes: bytes | memoryview, input_suffix: str = ".webm"
+) -> bytes:
     with tempfile.TemporaryDirectory() as tmp_dir:
         input_path = Path(tmp_dir) / f"input{input_suffix}"
         mp3_path = Path(tmp_dir) / "output.mp3"
@@ -166,3 +183,194 @@ def convert_mp3_to_wav(mp3_bytes: bytes) -> bytes:
                 f"ffmpeg conversion failed: {exc.stderr.decode('utf-8', errors='ignore')}"
             ) from exc
         return wav_path.read_bytes()
+
+
+def decode_audio_to_pcm(
+    audio_bytes: bytes | memoryview, sample_rate: int = 24000
+) -> np.ndarray:
+    """Decode any ffmpeg-readable audio to mono int16 PCM samples.
+
+    Audio is piped through ffmpeg's stdin/stdout, so no temp files are written.
+    """
+    try:
+        result = subprocess.run(
+            pcm_stream_command(sample_rate),
+            input=audio_bytes,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
+        raise AudioConversionError("ffmpeg is required for audio->PCM conversion") from exc
+    except subprocess.CalledProcessError as exc:
+        raise AudioConversionError(
+            f"ffmpeg conversion failed: {exc.stderr.decode('utf-8', errors='ignore')}"
+        ) from exc
+    return np.frombuffer(result.stdout, dtype=np.int16)
+
+
+def concatenate_pcm(
+    segments: list[np.ndarray], *, gap_samples: int = 0
+) -> tuple[np.ndarray, list[int]]:
+    """Join PCM segments into one buffer with optional silence between them.
+
+    Returns the joined samples and the start offset (in samples) of each
+    segment. The output is allocated once and filled in place.
+    """
+    total = sum(len(segment) for segment in segments)
+    total += gap_samples * max(0, len(segments) - 1)
+    joined = np.zeros(total, dtype=np.int16)
+    offsets: list[int] = []
+    position = 0
+    for index, segment in enumerate(segments):
+        if index:
+            position += gap_samples
+        offsets.append(position)
+        joined[position : position + len(segment)] = segment
+        position += len(segment)
+    return joined, offsets
+
+
+# Sample rate the VAD thresholds (VAD_ZCR_MAX) are tuned at.
+VAD_REFERENCE_RATE = 16000
+
+
+@dataclass(frozen=True)
+class VadConfig:
+    """Thresholds for the energy + zero-crossing voice activity detector.
+
+    A frame counts as speech when its RMS level is at least
+    ``energy_threshold_db`` dBFS and at most ``zcr_max`` of its adjacent
+    samples change sign (broadband hiss crosses zero far more often than
+    voiced speech). ``zcr_max`` is tuned at ``VAD_REFERENCE_RATE`` and scaled
+    to ``sample_rate``: speech crosses zero a similar number of times per
+    second, so a higher rate means fewer crossings per sample.
+    ``padding_ms`` of audio is kept around the detected speech so word
+    onsets and tails are not clipped.
+    """
+
+    sample_rate: int = 16000
+    frame_ms: int = 30
+    energy_threshold_db: float = -45.0
+    zcr_max: float = 0.35
+    min_speech_ms: int = 250
+    padding_ms: int = 200
+
+
+@dataclass(frozen=True)
+class SpeechActivity:
+    start_sample: int
+    end_sample: int
+    speech_ms: int
+    duration_ms: int
+
+    @property
+    def has_speech(self) -> bool:
+        return self.end_sample > self.start_sample
+
+
+def detect_speech(samples: np.ndarray, config: VadConfig = VadConfig()) -> SpeechActivity:
+    """Find the span of ``samples`` (mono int16 PCM) that contains speech.
+
+    Returns an empty span when less than ``min_speech_ms`` of speech frames
+    were found.
+    """
+    frame_size = config.sample_rate * config.frame_ms // 1000
+    duration_ms = len(samples) * 1000 // config.sample_rate
+    frame_count = len(samples) // frame_size if frame_size else 0
+    if frame_count == 0:
+        return SpeechActivity(0, 0, 0, duration_ms)
+
+    frames = samples[: frame_count * frame_size].reshape(frame_count, frame_size)
+    scaled = frames.astype(np.float32) / 32768.0
+    rms = np.sqrt(np.mean(np.square(scaled), axis=1))
+    level_db = 20.0 * np.log10(np.maximum(rms, 1e-10))
+    signs = np.signbit(frames)
+    zero_crossing_rate = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (
+        frame_size - 1
+    )
+    zcr_max = config.zcr_max * VAD_REFERENCE_RATE / config.sample_rate
+    voiced = np.flatnonzero(
+        (level_db >= config.energy_threshold_db) & (zero_crossing_rate <= zcr_max)
+    )
+    speech_ms = len(voiced) * config.frame_ms
+    if speech_ms < config.min_speech_ms:
+        return SpeechActivity(0, 0, speech_ms, duration_ms)
+
+    padding = config.sample_rate * config.padding_ms // 1000
+    start = max(0, int(voiced[0]) * frame_size - padding)
+    end = min(len(samples), (int(voiced[-1]) + 1) * frame_size + padding)
+    return SpeechActivity(start, end, speech_ms, duration_ms)
+
+
+class StreamingPcmDecoder:
+    """Decode container audio (e.g. webm chunks) to PCM while it is still arriving.
+
+    One ffmpeg process runs per stream: ``feed`` writes to its stdin and a
+    reader task collects int16 samples from stdout as they are produced, so by
+    the time ``finish`` closes stdin only the tail is left to decode.
+    ``decoded()`` returns the samples so far, e.g. for partial transcription.
+    """
+
+    def __init__(self, sample_rate: int = 24000, command: list[str] | None = None) -> None:
+        self.sample_rate = sample_rate
+        self._command = command or pcm_stream_command(sample_rate)
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader: asyncio.Task | None = None
+        self._output = bytearray()
+
+    async def start(self) -> None:
+        try:
+            self._process = await asyncio.create_subprocess_exec(
+                *self._command,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError as exc:
+            raise AudioConversionError("ffmpeg is required for streamed PCM decoding") from exc
+        self._reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        while True:
+            chunk = await self._process.stdout.read(STREAM_READ_BYTES)
+            if not chunk:
+                return
+            self._output.extend(chunk)
+
+    def decoded(self) -> np.ndarray:
+        """Whole samples decoded so far."""
+        usable = len(self._output) - len(self._output) % 2
+        return np.frombuffer(bytes(self._output[:usable]), dtype=np.int16)
+
+    async def feed(self, data: bytes) -> None:
+        try:
+            self._process.stdin.write(data)
+            await self._process.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError) as exc:
+            raise AudioConversionError("ffmpeg stopped accepting audio") from exc
+
+    async def finish(self) -> np.ndarray:
+        """Close the input, wait for the tail to be decoded, and return all samples."""
+        process = self._process
+        process.stdin.close()
+        try:
+            await process.stdin.wait_closed()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        await self._reader
+        stderr = await process.stderr.read()
+        if await process.wait() != 0:
+            raise AudioConversionError(
+                f"ffmpeg conversion failed: {stderr.decode('utf-8', errors='ignore')}"
+            )
+        samples = self.decoded()
+        self._output = bytearray()
+        return samples
+
+    async def abort(self) -> None:
+        if self._process is not None and self._process.returncode is None:
+            self._process.kill()
+            await self._process.wait()
+        if self._reader is not None:
+            self._reader.cancel()
@@ -0,0 +1,419 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import numpy as np
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo.errors import DuplicateKeyError
+
+from app.clients.minio import MinioClient
+from app.clients.mongodb import MongoDBClient
+from app.config import Settings, load_settings
+from app.services.audio_storage import UNSTORED_AUDIO_IDS, referenced_audio
+from app.services.session_cleanup import delete_sessions
+from app.telemetry.otel import start_span
+from app.telemetry.tracing import emit_metric
+
+logger = logging.getLogger(__name__)
+
+GC_BATCH_SIZE = 1000
+# Content-addressed audio, and the per-turn objects written before it; other
+# keys in the bucket are left alone.
+AUDIO_PREFIX = "audio/"
+LEGACY_AUDIO_PREFIX = "turn-"
+SWEPT_PREFIXES = (AUDIO_PREFIX, LEGACY_AUDIO_PREFIX)
+BLOOM_ERROR_RATE = 0.001
+LEASE_COLLECTION = "Lease"
+GC_LEASE_ID = "audio_gc"
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings, backed by a numpy bit array.
+
+    False positives only make the collector keep an orphan a little longer;
+    there are no false negatives, so a referenced object is never deleted.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = BLOOM_ERROR_RATE) -> None:
+        capacity = max(1, capacity)
+        self._size = max(
+            64, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        )
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = np.zeros((self._size + 7) // 8, dtype=np.uint8)
+
+    @property
+    def nbytes(self) -> int:
+        return self._bits.nbytes
+
+    def _positions(self, key: str) -> list[int]:
+        # Double hashing: k positions from one 128-bit digest.
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return [(first + index * second) % self._size for index in range(self._hashes)]
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(key)
+        )
+
+
+@dataclass
+class GcReport:
+    dry_run: bool
+    sessions_expired: int = 0
+    turns_orphaned: int = 0
+    turns_marked_missing: int = 0
+    objects_scanned: int = 0
+    objects_referenced: int = 0
+    objects_in_grace: int = 0
+    objects_deleted: int = 0
+    filter_bytes: int = 0
+    errors: list[str] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "dryRun": self.dry_run,
+            "sessionsExpired": self.sessions_expired,
+            "turnsOrphaned": self.turns_orphaned,
+            "turnsMarkedMissing": self.turns_marked_missing,
+            "objectsScanned": self.objects_scanned,
+            "objectsReferenced": self.objects_referenced,
+            "objectsInGrace": self.objects_in_grace,
+            "objectsDeleted": self.objects_deleted,
+            "filterBytes": self.filter_bytes,
+            "errors": list(self.errors),
+        }
+
+
+def _object_ids(values: list[Any]) -> list[ObjectId]:
+    ids = []
+    for value in values:
+        try:
+            ids.append(ObjectId(value))
+        except (InvalidId, TypeError):
+            continue
+    return ids
+
+
+async def expire_sessions(
+    client: MongoDBClient,
+    minio: MinioClient,
+    report: GcReport,
+    *,
+    cutoff: datetime,
+    batch_size: int = GC_BATCH_SIZE,
+) -> None:
+    """Delete ended sessions whose ``endedAt`` is older than ``cutoff``."""
+    sessions = await client.collection("PracticeSession")
+    cursor = sessions.find(
+        {"status": "ended", "endedAt": {"$lt": cutoff}},
+        {"_id": 1},
+        batch_size=batch_size,
+    )
+    batch: list[str] = []
+    async for doc in cursor:
+        batch.append(str(doc["_id"]))
+        if len(batch) >= batch_size:
+            await _expire_batch(client, minio, report, batch)
+            batch = []
+    if batch:
+        await _expire_batch(client, minio, report, batch)
+
+
+async def _expire_batch(
+    client: MongoDBClient, minio: MinioClient, report: GcReport, session_ids: list[str]
+) -> None:
+    report.sessions_expired += len(session_ids)
+    if report.dry_run:
+        return
+    progress = await delete_sessions(client, minio, session_ids)
+    report.errors.extend(progress.errors)
+
+
+async def reclaim_turns(
+    client: MongoDBClient,
+    report: GcReport,
+    *,
+    cutoff: datetime,
+    batch_size: int = GC_BATCH_SIZE,
+) -> None:
+    """Fail stale pending uploads and delete turns whose session is gone."""
+    turns = await client.collection("Turn")
+    sessions = await client.collection("PracticeSession")
+    cutoff_id = ObjectId.from_datetime(cutoff)
+    stale = {"audioFileId": "pending", "_id": {"$lt": cutoff_id}}
+    if report.dry_run:
+        report.turns_marked_missing += await turns.count_documents(stale)
+    else:
+        result = await turns.update_many(
+            stale, {"$set": {"audioFileId": "missing", "asrStatus": "failed"}}
+        )
+        report.turns_marked_missing += result.modified_count
+
+    cursor = await turns.aggregate(
+        [{"$match": {"_id": {"$lt": cutoff_id}}}, {"$group": {"_id": "$sessionId"}}],
+        batchSize=batch_size,
+    )
+    batch: list[str] = []
+    async for doc in cursor:
+        batch.append(doc["_id"])
+        if len(batch) >= batch_size:
+            await _reclaim_orphans(turns, sessions, report, batch, cutoff_id)
+            batch = []
+    if batch:
+        await _reclaim_orphans(turns, sessions, report, batch, cutoff_id)
+
+
+async def _reclaim_orphans(
+    turns, sessions, report: GcReport, session_ids: list[Any], cutoff_id: ObjectId
+) -> None:
+    existing = {
+        str(doc["_id"])
+        async for doc in sessions.find(
+            {"_id": {"$in": _object_ids(session_ids)}}, {"_id": 1}
+        )
+    }
+    missing = [session_id for session_id in session_ids if str(session_id) not in existing]
+    if not missing:
+        return
+    query = {"sessionId": {"$in": missing}, "_id": {"$lt": cutoff_id}}
+    if report.dry_run:
+        report.turns_orphaned += await turns.count_documents(query)
+        return
+    result = await turns.delete_many(query)
+    report.turns_orphaned += result.deleted_count
+
+
+async def build_reference_filter(
+    client: MongoDBClient, *, batch_size: int = GC_BATCH_SIZE
+) -> BloomFilter:
+    """Stream every stored audio reference into a bloom filter."""
+    turns = await client.collection("Turn")
+    sessions = await client.collection("PracticeSession")
+    capacity = await turns.estimated_document_count()
+    capacity += await sessions.estimated_document_count()
+    references = BloomFilter(max(capacity, 1024))
+    async for doc in turns.find({}, {"_id": 0, "audioFileId": 1}, batch_size=batch_size):
+        audio_file_id = doc.get("audioFileId")
+        if audio_file_id and audio_file_id not in UNSTORED_AUDIO_IDS:
+            references.add(audio_file_id)
+    async for doc in sessions.find(
+        {"replay.audioFileId": {"$exists": True}},
+        {"_id": 0, "replay.audioFileId": 1},
+        batch_size=batch_size,
+    ):
+        references.add(doc["replay"]["audioFileId"])
+    return references
+
+
+async def sweep_objects(
+    client: MongoDBClient,
+    minio: MinioClient,
+    references: BloomFilter,
+    report: GcReport,
+    *,
+    cutoff: datetime,
+    batch_size: int = GC_BATCH_SIZE,
+) -> None:
+    """Delete listed audio objects that are unreferenced and older than ``cutoff``.
+
+    The bloom filter is a snapshot: a turn that reuses existing bytes can
+    start pointing at an old object after it was built. Candidates are
+    therefore checked against Mongo once more right before deletion. The
+    grace period covers uploads whose turn has not been saved yet.
+    """
+    for prefix in SWEPT_PREFIXES:
+        async for batch in minio.iter_objects(prefix=prefix, batch_size=batch_size):
+            await _sweep_batch(client, minio, references, report, batch, cutoff)
+
+
+async def _sweep_batch(
+    client: MongoDBClient,
+    minio: MinioClient,
+    references: BloomFilter,
+    report: GcReport,
+    batch: list[tuple[str, datetime | None]],
+    cutoff: datetime,
+) -> None:
+    candidates = []
+    for name, last_modified in batch:
+        report.objects_scanned += 1
+        if name in references:
+            report.objects_referenced += 1
+        elif last_modified is None or last_modified >= cutoff:
+            report.objects_in_grace += 1
+        else:
+            candidates.append(name)
+    if not candidates:
+        return
+    referenced = await referenced_audio(client, candidates)
+    report.objects_referenced += len(referenced)
+    orphans = [name for name in candidates if name not in referenced]
+    if not orphans:
+        return
+    if report.dry_run:
+        report.objects_deleted += len(orphans)
+        return
+    errors = await minio.delete_files(orphans)
+    report.objects_deleted += len(orphans) - len(errors)
+    report.errors.extend(f"{name}: {message}" for name, message in errors)
+
+
+async def acquire_gc_lease(
+    client: MongoDBClient, holder: str, *, seconds: int, now: datetime | None = None
+) -> bool:
+    """Take the GC lease for ``seconds``; ``False`` while another pass holds it.
+
+    Every worker with ``GC_ENABLED`` schedules passes; the lease document
+    lets only one of them sweep at a time. A crashed holder's lease expires.
+    """
+    now = now or datetime.now(timezone.utc)
+    leases = await client.collection(LEASE_COLLECTION)
+    try:
+        await leases.find_one_and_update(
+            {"_id": GC_LEASE_ID, "expiresAt": {"$lt": now}},
+            {"$set": {"holder": holder, "expiresAt": now + timedelta(seconds=seconds)}},
+            upsert=True,
+        )
+    except DuplicateKeyError:
+        # The lease exists and has not expired.
+        return False
+    return True
+
+
+async def release_gc_lease(client: MongoDBClient, holder: str) -> None:
+    leases = await client.collection(LEASE_COLLECTION)
+    await leases.delete_one({"_id": GC_LEASE_ID, "holder": holder})
+
+
+async def run_gc(
+    client: MongoDBClient,
+    minio: MinioClient,
+    *,
+    grace_seconds: int,
+    retention_days: int = 0,
+    dry_run: bool = False,
+    batch_size: int = GC_BATCH_SIZE,
+    now: datetime | None = None,
+) -> GcReport:
+    """Run one retention + orphan collection pass.
+
+    Sessions past retention go first so their audio is swept in the same
+    pass. The reference filter is built before objects are listed.
+    """
+    now = now or datetime.now(timezone.utc)
+    grace_cutoff = now - timedelta(seconds=grace_seconds)
+    report = GcReport(dry_run=dry_run)
+    with start_span("gc.run", {"dryRun": dry_run, "retentionDays": retention_days}):
+        if retention_days > 0:
+            await expire_sessions(
+                client,
+                minio,
+                report,
+                cutoff=now - timedelta(days=retention_days),
+                batch_size=batch_size,
+            )
+        await reclaim_turns(client, report, cutoff=grace_cutoff, batch_size=batch_size)
+        references = await build_reference_filter(client, batch_size=batch_size)
+        report.filter_bytes = references.nbytes
+        await sweep_objects(
+            client, minio, references, report, cutoff=grace_cutoff, batch_size=batch_size
+        )
+    for name in ("sessions_expired", "turns_orphaned", "objects_deleted"):
+        emit_metric(f"gc.{name}", float(getattr(report, name)), attributes={"dryRun": dry_run})
+    return report
+
+
+def _clients(settings: Settings) -> tuple[MongoDBClient, MinioClient]:
+    client = MongoDBClient(
+        connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+        database=settings.mongo_db,
+    )
+    minio = MinioClient(
+        endpoint=settings.minio_endpoint,
+        access_key=settings.minio_access_key,
+        secret_key=settings.minio_secret_key,
+        bucket=settings.minio_bucket,
+    )
+    return client, minio
+
+
+async def run_gc_once(settings: Settings, *, dry_run: bool = False) -> GcReport | None:
+    """Run one pass; ``None`` if another instance holds the GC lease.
+
+    Dry runs delete nothing and skip the lease.
+    """
+    client, minio = _clients(settings)
+    holder = uuid.uuid4().hex
+    try:
+        if not dry_run and not await acquire_gc_lease(
+            client, holder, seconds=settings.gc_interval_seconds
+        ):
+            return None
+        try:
+            return await run_gc(
+                client,
+                minio,
+                grace_seconds=settings.gc_grace_seconds,
+                retention_days=settings.session_retention_days,
+                dry_run=dry_run,
+            )
+        finally:
+            if not dry_run:
+                await release_gc_lease(client, holder)
+    finally:
+        await client.close()
+
+
+async def run_gc_forever(settings: Settings) -> None:
+    """Run a GC pass every ``gc_interval_seconds`` until cancelled."""
+    while True:
+        await asyncio.sleep(settings.gc_interval_seconds)
+        try:
+            report = await run_gc_once(settings)
+            if report is None:
+                logger.info("Audio GC skipped: another instance holds the lease")
+            else:
+                logger.info("Audio GC finished: %s", report.as_dict())
+        except Exception as exc:
+            logger.warning("Audio GC failed: %s", exc)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Apply session retention and delete orphaned turns and audio objects."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Report what would be deleted without deleting anything.",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(run_gc_once(load_settings(), dry_run=args.dry_run))
+    if report is None:
+        print("Another instance is running a GC pass; try again later.")
+        return 1
+    print(json.dumps(report.as_dict(), indent=2))
+    return 1 if report.errors else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
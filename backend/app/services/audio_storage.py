@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import re
+from typing import Any, Iterable
+
+from app.clients.minio import MinioClient, MinioError
+from app.clients.mongodb import MongoDBClient
+from app.telemetry.tracing import emit_metric
+
+logger = logging.getLogger(__name__)
+
+CONTENT_PREFIX = "audio/sha256"
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+UNSTORED_AUDIO_IDS = frozenset({"", "pending", "missing"})
+RELEASE_BATCH_SIZE = 1000
+
+_CONTENT_NAME = re.compile(rf"^{CONTENT_PREFIX}/[0-9a-f]{{2}}/[0-9a-f]{{64}}\.\w+$")
+
+
+def content_object_name(data: bytes, extension: str = "mp3") -> str:
+    """Object key derived from the audio bytes, sharded by the first hash byte."""
+    digest = hashlib.sha256(data).hexdigest()
+    return f"{CONTENT_PREFIX}/{digest[:2]}/{digest}.{extension}"
+
+
+def is_content_addressed(name: str) -> bool:
+    return bool(_CONTENT_NAME.match(name))
+
+
+async def store_audio(
+    minio: MinioClient,
+    data: bytes,
+    content_type: str = "audio/mpeg",
+    *,
+    extension: str = "mp3",
+) -> str:
+    """Store ``data`` under its content hash and return the object name.
+
+    Identical bytes map to the same key, so a retried submission or a repeated
+    AI reply is only written once. Objects never change after upload and carry
+    an immutable Cache-Control header. An existing object is copied onto
+    itself instead, which resets its last-modified time: the GC grace period
+    then covers the window before the caller's reference is written. The
+    copy replaces every stored header, so it restates the content type too.
+
+    The returned object is not referenced yet, so a concurrent release or GC
+    pass may still remove it. Write the reference, then call
+    ``confirm_audio``.
+    """
+    name = content_object_name(data, extension)
+    metadata = {"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    if await minio.touch_file(name, metadata={"Content-Type": content_type, **metadata}):
+        emit_metric("audio.store.dedupe_hit", 1, attributes={"bytes": len(data)})
+        return name
+    await minio.upload_file(name, data, content_type, metadata=metadata)
+    emit_metric("audio.store.uploaded", 1, attributes={"bytes": len(data)})
+    return name
+
+
+async def confirm_audio(
+    minio: MinioClient, name: str, data: bytes, content_type: str = "audio/mpeg"
+) -> None:
+    """Re-upload ``name`` if it was deleted before its reference was written.
+
+    Call after the turn or replay bundle pointing at ``name`` is saved. From
+    then on ``release_audio`` and the GC see the reference and keep the object.
+    """
+    if await minio.file_exists(name):
+        return
+    await minio.upload_file(
+        name, data, content_type, metadata={"Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    )
+    emit_metric("audio.store.reuploaded", 1)
+
+
+async def referenced_audio(client: MongoDBClient, names: list[str]) -> set[str]:
+    """Return the subset of ``names`` still referenced by a turn or replay bundle."""
+    turns = await client.collection("Turn")
+    sessions = await client.collection("PracticeSession")
+    referenced = set(await turns.distinct("audioFileId", {"audioFileId": {"$in": names}}))
+    referenced.update(
+        await sessions.distinct(
+            "replay.audioFileId", {"replay.audioFileId": {"$in": names}}
+        )
+    )
+    return referenced
+
+
+async def release_audio(
+    minio: MinioClient, client: MongoDBClient, names: Iterable[str]
+) -> list[str]:
+    """Delete objects in ``names`` that nothing references any more.
+
+    Call after the referencing turns are gone. Content-addressed objects can
+    be shared between turns and replay bundles, so ``Turn.audioFileId`` and
+    ``PracticeSession.replay.audioFileId`` are the reference count; legacy
+    per-turn objects are deleted unconditionally. Objects are checked and
+    removed in batches of ``RELEASE_BATCH_SIZE``. Returns the deleted names.
+    """
+    candidates = [name for name in dict.fromkeys(names) if name not in UNSTORED_AUDIO_IDS]
+    deleted: list[str] = []
+    for start in range(0, len(candidates), RELEASE_BATCH_SIZE):
+        batch = candidates[start : start + RELEASE_BATCH_SIZE]
+        shared = [name for name in batch if is_content_addressed(name)]
+        try:
+            referenced = await referenced_audio(client, shared) if shared else set()
+            unreferenced = [name for name in batch if name not in referenced]
+            errors = await minio.delete_files(unreferenced)
+        except Exception as exc:
+            logger.warning("Failed to release %s audio files: %s", len(batch), exc)
+            continue
+        for name, message in errors:
+            logger.warning("Failed to release audio file %s: %s", name, message)
+        failed = {name for name, _ in errors}
+        deleted.extend(name for name in unreferenced if name not in failed)
+    return deleted
+
+
+async def migrate_legacy_audio(
+    client: MongoDBClient,
+    minio: MinioClient,
+    *,
+    dry_run: bool = False,
+    delete_legacy: bool = False,
+    batch_size: int = 200,
+) -> dict[str, int]:
+    """Rewrite turns that still point at ``turn-{id}.mp3`` objects.
+
+    Each legacy object is downloaded, stored under its content hash and the
+    turn's ``audioFileId`` updated. Legacy objects are only removed with
+    ``delete_legacy`` once the turn has been rewritten.
+    """
+    turns = await client.collection("Turn")
+    stats = {"scanned": 0, "migrated": 0, "deduplicated": 0, "deleted": 0, "failed": 0}
+    seen: set[str] = set()
+    cursor = turns.find(
+        {"audioFileId": {"$regex": r"^turn-"}},
+        {"_id": 1, "audioFileId": 1},
+        batch_size=batch_size,
+    )
+    async for doc in cursor:
+        stats["scanned"] += 1
+        legacy_name = doc["audioFileId"]
+        try:
+            data = await minio.download_file(legacy_name)
+        except MinioError as exc:
+            logger.warning("Skipping turn %s: %s", doc["_id"], exc)
+            stats["failed"] += 1
+            continue
+        name = content_object_name(data)
+        if name in seen:
+            stats["deduplicated"] += 1
+        seen.add(name)
+        if dry_run:
+            continue
+        try:
+            await store_audio(minio, data)
+            await turns.update_one(
+                {"_id": doc["_id"], "audioFileId": legacy_name},
+                {"$set": {"audioFileId": name, "audioUrl": ""}},
+            )
+            await confirm_audio(minio, name, data)
+            stats["migrated"] += 1
+            if delete_legacy:
+                await minio.delete_file(legacy_name)
+                stats["deleted"] += 1
+        except Exception as exc:
+            logger.warning("Failed to migrate turn %s: %s", doc["_id"], exc)
+            stats["failed"] += 1
+    return stats
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    from app.config import load_settings
+
+    settings = load_settings()
+    client = MongoDBClient(
+        connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+        database=settings.mongo_db,
+    )
+    minio = MinioClient(
+        endpoint=settings.minio_endpoint,
+        access_key=settings.minio_access_key,
+        secret_key=settings.minio_secret_key,
+        bucket=settings.minio_bucket,
+    )
+    try:
+        await minio.initialize()
+        return await migrate_legacy_audio(
+            client,
+            minio,
+            dry_run=args.dry_run,
+            delete_legacy=args.delete_legacy,
+        )
+    finally:
+        await client.close()
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Move turn audio to the content-addressed object layout."
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="Hash legacy objects and report what would change without writing.",
+    )
+    parser.add_argument(
+        "--delete-legacy",
+        action="store_true",
+        help="Remove turn-{id}.mp3 objects after their turn has been rewritten.",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    stats = asyncio.run(_run(args))
+    print(json.dumps(stats, indent=2))
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ import json
 from dataclasses import dataclass
 from typing import Any
 
+from app.clients.cassette import cassette_transport
 from app.clients.llm import EvaluatorClient, LLMError
 from app.config import load_settings
 from app.models.evaluation import EvaluationResult, EvaluationScore
@@ -94,6 +95,7 @@ async def evaluate_session(context: EvaluationContext) -> EvaluationResult:
         api_key=settings.chatai_api_key,
         timeout=20.0,
         retries=1,
+        transport=cassette_transport(settings),
     )
     transcript = _format_transcript(context.turns)
     skill_rubric = _format_skill_rubric(context.skill_summaries)
@@ -0,0 +1,291 @@
+"""Admin metrics rollups, maintained incrementally and recomputed nightly.
+
+The admin dashboard reads ``MetricsRollup`` documents instead of scanning
+sessions and evaluations: one per scenario and UTC day (sessions ended,
+objective outcomes, termination reasons, duration, evaluation ratings) and
+one per skill and day (ratings). Both are keyed by the day the session
+ended, so an evaluation finishing after midnight still lands on its
+session's day.
+
+``record_session_end`` and ``record_evaluation`` ``$inc`` the counters as
+events happen. Each first sets a flag on the session (``rollups.ended`` /
+``rollups.evaluated``), so a repeated event is not counted twice. A crash
+between the flag and the increment, or a session that ended through a path
+without a hook, leaves the counters short; ``recompute_rollups`` repairs
+that by rebuilding the last few complete days from the raw collections.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from app.clients.mongodb import MongoDBClient
+from app.config import Settings, load_settings
+from app.repositories.rollup_repository import RollupRepository, rollup_id
+from app.repositories.session_repository import _normalize_termination_reason
+from app.telemetry.otel import start_span
+from app.telemetry.tracing import emit_metric
+
+logger = logging.getLogger(__name__)
+
+RECOMPUTE_BATCH_SIZE = 500
+
+
+def _as_utc(value: Any) -> datetime | None:
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if not isinstance(value, datetime):
+        return None
+    # PyMongo returns naive datetimes that are already UTC.
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def rollup_day(value: Any) -> str | None:
+    """UTC day (``YYYY-MM-DD``) of a stored timestamp."""
+    value = _as_utc(value)
+    return value.astimezone(timezone.utc).date().isoformat() if value else None
+
+
+def session_counts(session: dict[str, Any]) -> dict[str, float]:
+    """Scenario counters contributed by one ended session."""
+    counts: dict[str, float] = {"sessions": 1}
+    objective_status = session.get("objectiveStatus")
+    if objective_status in {"succeeded", "failed"}:
+        counts[objective_status] = 1
+    reason = _normalize_termination_reason(session.get("terminationReason"))
+    if reason:
+        counts[f"terminations.{reason}"] = 1
+    started_at = _as_utc(session.get("startedAt"))
+    ended_at = _as_utc(session.get("endedAt"))
+    if started_at and ended_at and ended_at >= started_at:
+        counts["durationSeconds"] = round((ended_at - started_at).total_seconds(), 3)
+    return counts
+
+
+def evaluation_counts(
+    scores: list[dict[str, Any]],
+) -> tuple[dict[str, float], dict[str, dict[str, float]]]:
+    """Scenario and per-skill counters contributed by one completed evaluation."""
+    scenario: dict[str, float] = {"evaluations": 1}
+    skills: dict[str, dict[str, float]] = {}
+    for score in scores:
+        skill_id = score.get("skillId")
+        rating = score.get("rating")
+        if not skill_id or not isinstance(rating, (int, float)):
+            continue
+        scenario["ratingSum"] = scenario.get("ratingSum", 0) + rating
+        scenario["ratingCount"] = scenario.get("ratingCount", 0) + 1
+        skill = skills.setdefault(skill_id, {"evaluations": 1, "ratingSum": 0, "ratingCount": 0})
+        skill["ratingSum"] += rating
+        skill["ratingCount"] += 1
+    return scenario, skills
+
+
+async def record_session_end(client: MongoDBClient, session_id: str) -> bool:
+    """Count an ended session; ``False`` if it was already counted."""
+    repo = RollupRepository(client)
+    session = await repo.claim_session(session_id, "ended")
+    if session is None:
+        return False
+    day = rollup_day(session.get("endedAt"))
+    if day is None:
+        return False
+    await repo.increment(
+        "scenario", day, session.get("scenarioId") or "", session_counts(session)
+    )
+    return True
+
+
+async def record_evaluation(
+    client: MongoDBClient, session_id: str, scores: list[dict[str, Any]]
+) -> bool:
+    """Count a completed evaluation; ``False`` if it was already counted."""
+    repo = RollupRepository(client)
+    session = await repo.claim_session(session_id, "evaluated")
+    if session is None:
+        return False
+    day = rollup_day(session.get("endedAt"))
+    if day is None:
+        return False
+    scenario, skills = evaluation_counts(scores)
+    await repo.increment("scenario", day, session.get("scenarioId") or "", scenario)
+    for skill_id, counts in skills.items():
+        await repo.increment("skill", day, skill_id, counts)
+    return True
+
+
+@dataclass
+class RecomputeReport:
+    days: list[str]
+    sessions: int = 0
+    evaluations: int = 0
+    rollups: int = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "days": list(self.days),
+            "sessions": self.sessions,
+            "evaluations": self.evaluations,
+            "rollups": self.rollups,
+        }
+
+
+def _add(
+    docs: dict[str, dict[str, Any]],
+    kind: str,
+    day: str,
+    subject_id: str,
+    counts: dict[str, float],
+) -> None:
+    key = rollup_id(kind, day, subject_id)
+    doc = docs.setdefault(key, {"_id": key, "kind": kind, "day": day, "subjectId": subject_id})
+    for name, value in counts.items():
+        if name.startswith("terminations."):
+            terminations = doc.setdefault("terminations", {})
+            reason = name.split(".", 1)[1]
+            terminations[reason] = terminations.get(reason, 0) + value
+        else:
+            doc[name] = doc.get(name, 0) + value
+
+
+async def _recompute_batch(
+    client: MongoDBClient,
+    sessions: list[dict[str, Any]],
+    docs: dict[str, dict[str, Any]],
+    report: RecomputeReport,
+    counted: dict[str, list[str]],
+) -> None:
+    by_id = {session["_id"]: session for session in sessions}
+    evaluations = await client.collection("Evaluation")
+    async for evaluation in evaluations.find(
+        {"sessionId": {"$in": list(by_id)}, "status": "completed"},
+        {"_id": 0, "sessionId": 1, "scores": 1},
+    ):
+        # A session has at most one evaluation; pop guards against strays.
+        session = by_id.pop(evaluation["sessionId"], None)
+        if session is None:
+            continue
+        day = rollup_day(session.get("endedAt"))
+        scenario, skills = evaluation_counts(evaluation.get("scores") or [])
+        _add(docs, "scenario", day, session.get("scenarioId") or "", scenario)
+        for skill_id, counts in skills.items():
+            _add(docs, "skill", day, skill_id, counts)
+        counted["evaluated"].append(session["_id"])
+        report.evaluations += 1
+
+
+async def recompute_rollups(
+    client: MongoDBClient,
+    *,
+    days: int,
+    now: datetime | None = None,
+    batch_size: int = RECOMPUTE_BATCH_SIZE,
+) -> RecomputeReport:
+    """Rebuild the rollups of the ``days`` complete UTC days before ``now``.
+
+    Today is left to the incremental updates: sessions are still ending,
+    and a rebuild racing them could count one twice. Days older than the
+    window keep their rollups, including sessions since removed by
+    retention.
+    """
+    now = now or datetime.now(timezone.utc)
+    end = datetime.combine(now.astimezone(timezone.utc).date(), datetime.min.time(), timezone.utc)
+    start = end - timedelta(days=days)
+    report = RecomputeReport(
+        days=[(start + timedelta(days=offset)).date().isoformat() for offset in range(days)]
+    )
+    docs: dict[str, dict[str, Any]] = {}
+    counted: dict[str, list[str]] = {"ended": [], "evaluated": []}
+    with start_span("rollups.recompute", {"days": days}):
+        sessions = await client.collection("PracticeSession")
+        cursor = sessions.find(
+            {"status": "ended", "endedAt": {"$gte": start, "$lt": end}},
+            {
+                "scenarioId": 1,
+                "objectiveStatus": 1,
+                "terminationReason": 1,
+                "startedAt": 1,
+                "endedAt": 1,
+            },
+            batch_size=batch_size,
+        )
+        batch: list[dict[str, Any]] = []
+        async for session in cursor:
+            session["_id"] = str(session["_id"])
+            day = rollup_day(session.get("endedAt"))
+            if day is None:
+                continue
+            _add(docs, "scenario", day, session.get("scenarioId") or "", session_counts(session))
+            counted["ended"].append(session["_id"])
+            report.sessions += 1
+            batch.append(session)
+            if len(batch) >= batch_size:
+                await _recompute_batch(client, batch, docs, report, counted)
+                batch = []
+        if batch:
+            await _recompute_batch(client, batch, docs, report, counted)
+
+        repo = RollupRepository(client)
+        await repo.replace_days(report.days, list(docs.values()))
+        for stage, session_ids in counted.items():
+            for offset in range(0, len(session_ids), batch_size):
+                await repo.mark_sessions(session_ids[offset : offset + batch_size], stage)
+    report.rollups = len(docs)
+    emit_metric("rollups.recomputed_sessions", float(report.sessions), attributes={"days": days})
+    return report
+
+
+def _client(settings: Settings) -> MongoDBClient:
+    return MongoDBClient(
+        connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+        database=settings.mongo_db,
+    )
+
+
+async def run_recompute_once(settings: Settings, *, days: int | None = None) -> RecomputeReport:
+    client = _client(settings)
+    try:
+        return await recompute_rollups(client, days=days or settings.rollup_recompute_days)
+    finally:
+        await client.close()
+
+
+async def run_recompute_forever(settings: Settings) -> None:
+    """Recompute every ``rollup_recompute_interval_seconds`` until cancelled."""
+    while True:
+        await asyncio.sleep(settings.rollup_recompute_interval_seconds)
+        try:
+            report = await run_recompute_once(settings)
+            logger.info("Rollup recompute finished: %s", report.as_dict())
+        except Exception as exc:
+            logger.warning("Rollup recompute failed: %s", exc)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Rebuild admin metrics rollups from sessions and evaluations."
+    )
+    parser.add_argument(
+        "--days",
+        type=int,
+        default=None,
+        help="Complete days to rebuild (default: ROLLUP_RECOMPUTE_DAYS).",
+    )
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    report = asyncio.run(run_recompute_once(load_settings(), days=args.days))
+    print(json.dumps(report.as_dict(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 import json
 from typing import Any
 
+from app.clients.cassette import cassette_transport
 from app.clients.llm import EvaluatorClient
 from app.config import load_settings
 
@@ -45,6 +46,7 @@ async def run_objective_check(
         base_url=settings.objective_check_api_base,
         api_key=settings.objective_check_api_key,
         timeout=4.0,
+        transport=cassette_transport(settings),
     )
     try:
         payload = {
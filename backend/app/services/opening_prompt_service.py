@@ -5,6 +5,7 @@ import re
 from datetime import datetime, timezone
 from typing import Any
 
+from app.clients.cassette import cassette_transport
 from app.clients.llm import EvaluatorClient, LLMError
 from app.config import load_settings
 from app.telemetry.otel import start_span
@@ -123,6 +124,7 @@ async def generate_opening_prompt(*, scenario: Any, language: str) -> tuple[str,
         api_key=settings.chatai_api_key,
         timeout=20.0,
         retries=1,
+        transport=cassette_transport(settings),
     )
     try:
         for attempt in range(2):
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable, Protocol
+
+from bson import ObjectId
+from pymongo import CursorType
+from pymongo.errors import CollectionInvalid, PyMongoError
+
+from app.clients.mongodb import MongoDBClient
+
+logger = logging.getLogger(__name__)
+
+Deliver = Callable[[str, str], Awaitable[None]]
+
+SOCKET_MESSAGE_COLLECTION = "SocketMessage"
+SOCKET_MESSAGE_CAP_BYTES = 16 * 1024 * 1024
+_RETRY_SECONDS = 1.0
+# ObjectIds from different workers are only ordered to the second (and by
+# their clocks), so a resumed tail re-reads this much and skips what it saw.
+_RESUME_OVERLAP_SECONDS = 5.0
+_SEEN_IDS = 10_000
+
+
+def _resume_query(last_id: Any) -> dict[str, Any]:
+    """Everything inserted up to ``_RESUME_OVERLAP_SECONDS`` before ``last_id``.
+
+    The tail walks the capped collection in natural (insertion) order; the
+    ``_id`` bound only skips the part of it that is certainly old.
+    """
+    if last_id is None:
+        return {}
+    since = last_id.generation_time - timedelta(seconds=_RESUME_OVERLAP_SECONDS)
+    return {"_id": {"$gte": ObjectId.from_datetime(since)}}
+
+
+def _remember(seen: OrderedDict[Any, None], message_id: Any) -> None:
+    seen[message_id] = None
+    if len(seen) > _SEEN_IDS:
+        seen.popitem(last=False)
+
+
+class PubSubBackend(Protocol):
+    """Carries session-channel messages to every worker's hub.
+
+    ``publish`` is called once per message; the backend invokes the
+    ``deliver`` callback given to ``start`` in every subscribed process,
+    including the publishing one.
+    """
+
+    async def start(self, deliver: Deliver) -> None: ...
+
+    async def publish(self, channel: str, message: str) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class InMemoryPubSub:
+    """Single-process backend: publishing delivers directly."""
+
+    def __init__(self) -> None:
+        self._deliver: Deliver | None = None
+
+    async def start(self, deliver: Deliver) -> None:
+        self._deliver = deliver
+
+    async def publish(self, channel: str, message: str) -> None:
+        if self._deliver is not None:
+            await self._deliver(channel, message)
+
+    async def close(self) -> None:
+        self._deliver = None
+
+
+class MongoPubSub:
+    """Multi-worker backend that tails a capped MongoDB collection.
+
+    Every worker inserts published messages into ``SocketMessage`` and follows
+    it with a tailable, awaitData cursor, so each message is written once and
+    delivered by whichever worker holds the session's sockets. Unlike change
+    streams this works on a standalone server (no replica set required).
+    """
+
+    def __init__(
+        self,
+        client: MongoDBClient,
+        *,
+        collection: str = SOCKET_MESSAGE_COLLECTION,
+        cap_bytes: int = SOCKET_MESSAGE_CAP_BYTES,
+    ) -> None:
+        self._client = client
+        self._collection_name = collection
+        self._cap_bytes = cap_bytes
+        self._origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._task: asyncio.Task | None = None
+
+    async def _ensure_collection(self):
+        database = await self._client.db
+        try:
+            await database.create_collection(
+                self._collection_name, capped=True, size=self._cap_bytes
+            )
+        except CollectionInvalid:
+            pass  # Already exists
+        return database[self._collection_name]
+
+    async def start(self, deliver: Deliver) -> None:
+        collection = await self._ensure_collection()
+        latest = await collection.find_one({}, sort=[("$natural", -1)])
+        seen: OrderedDict[Any, None] = OrderedDict()
+        if latest is not None:
+            # Messages from before the start count as seen, so the first
+            # resume does not deliver them.
+            async for doc in collection.find(_resume_query(latest["_id"]), {"_id": 1}):
+                _remember(seen, doc["_id"])
+        self._task = asyncio.create_task(self._tail(collection, deliver, seen))
+
+    async def _tail(
+        self, collection, deliver: Deliver, seen: OrderedDict[Any, None]
+    ) -> None:
+        last_id = next(reversed(seen), None)
+        while True:
+            cursor = collection.find(
+                _resume_query(last_id),
+                cursor_type=CursorType.TAILABLE_AWAIT,
+                max_await_time_ms=1000,
+            )
+            try:
+                while cursor.alive:
+                    async for doc in cursor:
+                        if doc["_id"] in seen:
+                            continue
+                        _remember(seen, doc["_id"])
+                        last_id = doc["_id"]
+                        try:
+                            await deliver(doc["channel"], doc["message"])
+                        except Exception as exc:
+                            logger.warning(
+                                "Socket message delivery failed channel=%s error=%s",
+                                doc.get("channel"),
+                                exc,
+                            )
+            except asyncio.CancelledError:
+                raise
+            except PyMongoError as exc:
+                logger.warning("Socket message tail interrupted: %s", exc)
+            finally:
+                await cursor.close()
+            # A tailable cursor on an empty collection dies immediately.
+            await asyncio.sleep(_RETRY_SECONDS)
+
+    async def publish(self, channel: str, message: str) -> None:
+        collection = await self._client.collection(self._collection_name)
+        await collection.insert_one(
+            {
+                "channel": channel,
+                "message": message,
+                "origin": self._origin,
+                "createdAt": datetime.now(timezone.utc),
+            }
+        )
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import io
+import subprocess
+import wave
+
+import numpy as np
+
+from app.audio_profiles import RenditionProfile
+from app.services.audio import AudioConversionError
+
+
+def _wav_bytes(samples: np.ndarray, sample_rate: int) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as output:
+        output.setnchannels(1)
+        output.setsampwidth(2)
+        output.setframerate(sample_rate)
+        output.writeframes(samples.astype("<i2", copy=False).tobytes())
+    return buffer.getvalue()
+
+
+def _run_ffmpeg(
+    input_args: list[str], data: bytes | memoryview, profile: RenditionProfile
+) -> bytes:
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-loglevel", "error", *input_args, "-i", "pipe:0"]
+            + profile.ffmpeg_output_args(),
+            input=data,
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+    except FileNotFoundError as exc:
+        raise AudioConversionError(f"ffmpeg is required for {profile.spec} encoding") from exc
+    except subprocess.CalledProcessError as exc:
+        raise AudioConversionError(
+            f"ffmpeg conversion failed: {exc.stderr.decode('utf-8', errors='ignore')}"
+        ) from exc
+    if profile.format == "wav":
+        return _wav_bytes(np.frombuffer(result.stdout, dtype="<i2"), profile.sample_rate)
+    return result.stdout
+
+
+def encode_pcm(samples: np.ndarray, sample_rate: int, profile: RenditionProfile) -> bytes:
+    """Encode mono int16 PCM at ``sample_rate`` into ``profile``.
+
+    WAV at the source rate is written directly, without starting ffmpeg.
+    """
+    if profile.format == "wav" and profile.sample_rate == sample_rate:
+        return _wav_bytes(samples, sample_rate)
+    return _run_ffmpeg(
+        ["-f", "s16le", "-ar", str(sample_rate), "-ac", "1"], samples.tobytes(), profile
+    )
+
+
+def encode_audio(audio_bytes: bytes | memoryview, profile: RenditionProfile) -> bytes:
+    """Encode any ffmpeg-readable audio (WAV, WebM, MP3, ...) into ``profile``."""
+    return _run_ffmpeg([], audio_bytes, profile)
+
+
+def encode_renditions(
+    samples: np.ndarray, sample_rate: int, profiles: dict[str, RenditionProfile]
+) -> dict[str, bytes]:
+    """Encode PCM once per distinct profile and map each consumer to its bytes."""
+    encoded: dict[RenditionProfile, bytes] = {}
+    renditions: dict[str, bytes] = {}
+    for consumer, profile in profiles.items():
+        if profile not in encoded:
+            encoded[profile] = encode_pcm(samples, sample_rate, profile)
+        renditions[consumer] = encoded[profile]
+    return renditions
+
+
+def pcm_sample_rate(profiles: dict[str, RenditionProfile]) -> int:
+    """Decode rate that serves every profile without upsampling any of them."""
+    return max(profile.sample_rate for profile in profiles.values())
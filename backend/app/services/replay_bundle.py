@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from app.audio_profiles import DEFAULT_RENDITIONS, RenditionProfile
+from app.clients.minio import MinioClient, MinioError
+from app.clients.mongodb import MongoDBClient
+from app.repositories.session_repository import SessionRepository, TurnRecord
+from app.services.audio import AudioConversionError, concatenate_pcm, decode_audio_to_pcm
+from app.services.audio_storage import (
+    UNSTORED_AUDIO_IDS,
+    confirm_audio,
+    release_audio,
+    store_audio,
+)
+from app.services.renditions import encode_pcm
+
+logger = logging.getLogger(__name__)
+
+REPLAY_SAMPLE_RATE = 24000
+REPLAY_GAP_MS = 300
+
+
+@dataclass(frozen=True)
+class ReplaySegment:
+    turn_id: str
+    sequence: int
+    speaker: str
+    start_ms: int
+    duration_ms: int
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "turnId": self.turn_id,
+            "sequence": self.sequence,
+            "speaker": self.speaker,
+            "startMs": self.start_ms,
+            "durationMs": self.duration_ms,
+        }
+
+
+def _samples_to_ms(samples: int, sample_rate: int) -> int:
+    return int(round(samples * 1000 / sample_rate))
+
+
+def has_pending_audio(turns: list[TurnRecord]) -> bool:
+    return any(turn.audio_file_id == "pending" for turn in turns)
+
+
+async def _load_pcm(minio: MinioClient, turn: TurnRecord, sample_rate: int):
+    try:
+        data = await minio.download_file(turn.audio_file_id)
+        return await asyncio.to_thread(decode_audio_to_pcm, data, sample_rate)
+    except (MinioError, AudioConversionError) as exc:
+        logger.warning("Skipping turn %s in replay bundle: %s", turn.id, exc)
+        return None
+
+
+async def build_replay_bundle(
+    client: MongoDBClient,
+    minio: MinioClient,
+    session_id: str,
+    *,
+    sample_rate: int = REPLAY_SAMPLE_RATE,
+    gap_ms: int = REPLAY_GAP_MS,
+    profile: RenditionProfile = DEFAULT_RENDITIONS["playback"],
+) -> dict[str, Any] | None:
+    """Concatenate a session's turn audio into one clip and index it.
+
+    Every turn is decoded to PCM, joined in sequence order with a short
+    silence between turns and encoded once with the ``playback`` rendition
+    (Opus/WebM by default), so the bundle has no per-clip encoder padding.
+    The result is stored content-addressed and recorded on the session as
+    ``replay`` with the start offset of each turn.
+
+    Returns:
+        The stored ``replay`` document, or None if no turn has audio.
+    """
+    repo = SessionRepository(client)
+    session = await repo.get_session(session_id)
+    if not session:
+        return None
+    turns = await repo.list_turns(session_id)
+    turns = [turn for turn in turns if turn.audio_file_id not in UNSTORED_AUDIO_IDS]
+    pcm = await asyncio.gather(*(_load_pcm(minio, turn, sample_rate) for turn in turns))
+    included = [(turn, samples) for turn, samples in zip(turns, pcm) if samples is not None]
+    if not included:
+        return None
+
+    gap_samples = sample_rate * gap_ms // 1000
+    joined, offsets = concatenate_pcm(
+        [samples for _, samples in included], gap_samples=gap_samples
+    )
+    bundle_bytes = await asyncio.to_thread(encode_pcm, joined, sample_rate, profile)
+    audio_file_id = await store_audio(
+        minio, bundle_bytes, profile.content_type, extension=profile.extension
+    )
+    segments = [
+        ReplaySegment(
+            turn_id=turn.id,
+            sequence=turn.sequence,
+            speaker=turn.speaker,
+            start_ms=_samples_to_ms(offset, sample_rate),
+            duration_ms=_samples_to_ms(len(samples), sample_rate),
+        )
+        for (turn, samples), offset in zip(included, offsets)
+    ]
+    replay = {
+        "audioFileId": audio_file_id,
+        "durationMs": _samples_to_ms(len(joined), sample_rate),
+        "segments": [segment.as_dict() for segment in segments],
+        "createdAt": datetime.now(timezone.utc).isoformat(),
+    }
+    await repo.update_session(session_id, {"replay": replay})
+    await confirm_audio(minio, audio_file_id, bundle_bytes, profile.content_type)
+    previous = (session.replay or {}).get("audioFileId")
+    if previous and previous != audio_file_id:
+        await release_audio(minio, client, [previous])
+    return replay
@@ -1,19 +1,61 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any
 
 from bson import ObjectId
 
 from app.clients.minio import MinioClient
 from app.clients.mongodb import MongoDBClient
 from app.config import load_settings
-from app.repositories.evaluation_repository import EvaluationRepository
-from app.repositories.session_repository import SessionRepository
+from app.services.audio_storage import release_audio
+from app.telemetry.otel import start_span
+from app.telemetry.tracing import emit_metric
 
 logger = logging.getLogger(__name__)
 
+CLEANUP_CONCURRENCY = 4
+MAX_TRACKED_JOBS = 100
 
-async def cleanup_session(session_id: str) -> None:
+
+def _utc_now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class CleanupProgress:
+    """Mutable progress of one cleanup run, readable while it is in flight."""
+
+    job_id: str
+    session_ids: list[str]
+    status: str = "pending"
+    sessions_done: int = 0
+    turns_deleted: int = 0
+    objects_deleted: int = 0
+    errors: list[str] = field(default_factory=list)
+    started_at: str | None = None
+    finished_at: str | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "jobId": self.job_id,
+            "status": self.status,
+            "sessionsTotal": len(self.session_ids),
+            "sessionsDone": self.sessions_done,
+            "turnsDeleted": self.turns_deleted,
+            "objectsDeleted": self.objects_deleted,
+            "errors": list(self.errors),
+            "startedAt": self.started_at,
+            "finishedAt": self.finished_at,
+        }
+
+
+def _clients() -> tuple[MongoDBClient, MinioClient]:
     settings = load_settings()
     mongo_connection_string = f"mongodb://{settings.mongo_host}:{settings.mongo_port}"
     client = MongoDBClient(
@@ -26,33 +68,123 @@ async def cleanup_session(session_id: str) -> None:
         secret_key=settings.minio_secret_key,
         bucket=settings.minio_bucket,
     )
-    session_repo = SessionRepository(client)
-    evaluation_repo = EvaluationRepository(client)
-    try:
-        session = await session_repo.get_session(session_id)
-        if not session:
-            return
-        turns = await session_repo.list_turns(session_id)
-        for turn in turns:
-            if turn.audio_file_id:
-                try:
-                    await minio_client.delete_file(turn.audio_file_id)
-                except Exception as exc:
-                    logger.warning(
-                        "Failed to delete audio file %s: %s", turn.audio_file_id, exc
-                    )
-            try:
-                turns_collection = await client.collection("Turn")
-                await turns_collection.delete_one({"_id": ObjectId(turn.id)})
-            except Exception as exc:
-                logger.warning("Failed to delete turn %s: %s", turn.id, exc)
-        evaluation = await evaluation_repo.get_by_session(session_id)
-        if evaluation:
+    return client, minio_client
+
+
+async def _delete_session_documents(
+    client: MongoDBClient, session_id: str, progress: CleanupProgress
+) -> list[str]:
+    """Delete one session's documents and return the audio it referenced."""
+    sessions = await client.collection("PracticeSession")
+    turns = await client.collection("Turn")
+    evaluations = await client.collection("Evaluation")
+    session = await sessions.find_one(
+        {"_id": ObjectId(session_id)}, {"replay.audioFileId": 1}
+    )
+    if not session:
+        return []
+    audio_ids = await turns.distinct("audioFileId", {"sessionId": session_id})
+    replay_id = (session.get("replay") or {}).get("audioFileId")
+    if replay_id:
+        audio_ids.append(replay_id)
+    result = await turns.delete_many({"sessionId": session_id})
+    progress.turns_deleted += result.deleted_count
+    await evaluations.delete_many({"sessionId": session_id})
+    await sessions.delete_one({"_id": ObjectId(session_id)})
+    return audio_ids
+
+
+async def delete_sessions(
+    client: MongoDBClient,
+    minio_client: MinioClient,
+    session_ids: list[str],
+    *,
+    concurrency: int = CLEANUP_CONCURRENCY,
+    progress: CleanupProgress | None = None,
+) -> CleanupProgress:
+    """Delete sessions with their turns, evaluation and unshared audio.
+
+    Documents are removed with one ``delete_many`` per collection per session,
+    at most ``concurrency`` sessions at a time. Audio is released once at the
+    end so objects shared between the deleted sessions are checked together
+    and removed in batched MinIO requests.
+    """
+    progress = progress or CleanupProgress(job_id=uuid.uuid4().hex, session_ids=session_ids)
+    progress.status = "running"
+    progress.started_at = progress.started_at or _utc_now()
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    audio_ids: list[str] = []
+
+    async def _one(session_id: str) -> None:
+        async with semaphore:
             try:
-                eval_collection = await client.collection("Evaluation")
-                await eval_collection.delete_one({"_id": ObjectId(evaluation.id)})
+                audio_ids.extend(
+                    await _delete_session_documents(client, session_id, progress)
+                )
             except Exception as exc:
-                logger.warning("Failed to delete evaluation %s: %s", evaluation.id, exc)
-        await session_repo.delete_session(session_id)
+                logger.warning("Failed to delete session %s: %s", session_id, exc)
+                progress.errors.append(f"{session_id}: {exc}")
+            finally:
+                progress.sessions_done += 1
+
+    with start_span("session.cleanup", {"sessionCount": len(session_ids)}):
+        await asyncio.gather(*(_one(session_id) for session_id in session_ids))
+        deleted = await release_audio(minio_client, client, audio_ids)
+    progress.objects_deleted += len(deleted)
+    progress.status = "failed" if progress.errors else "completed"
+    progress.finished_at = _utc_now()
+    emit_metric(
+        "session.cleanup.sessions",
+        float(len(session_ids)),
+        attributes={"status": progress.status, "objects": len(deleted)},
+    )
+    return progress
+
+
+async def cleanup_session(session_id: str) -> None:
+    client, minio_client = _clients()
+    try:
+        await delete_sessions(client, minio_client, [session_id])
     finally:
         await client.close()
+
+
+class CleanupJobs:
+    """Runs cleanups as background tasks and keeps their recent progress."""
+
+    def __init__(self, max_jobs: int = MAX_TRACKED_JOBS) -> None:
+        self._jobs: OrderedDict[str, CleanupProgress] = OrderedDict()
+        self._tasks: set[asyncio.Task] = set()
+        self._max_jobs = max_jobs
+
+    def start(self, session_ids: list[str]) -> CleanupProgress:
+        progress = CleanupProgress(
+            job_id=uuid.uuid4().hex, session_ids=list(dict.fromkeys(session_ids))
+        )
+        self._jobs[progress.job_id] = progress
+        while len(self._jobs) > self._max_jobs:
+            self._jobs.popitem(last=False)
+        task = asyncio.get_running_loop().create_task(self._run(progress))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return progress
+
+    def get(self, job_id: str) -> CleanupProgress | None:
+        return self._jobs.get(job_id)
+
+    async def _run(self, progress: CleanupProgress) -> None:
+        client, minio_client = _clients()
+        try:
+            await delete_sessions(
+                client, minio_client, progress.session_ids, progress=progress
+            )
+        except Exception as exc:
+            logger.warning("Cleanup job %s failed: %s", progress.job_id, exc)
+            progress.errors.append(str(exc))
+            progress.status = "failed"
+            progress.finished_at = _utc_now()
+        finally:
+            await client.close()
+
+
+cleanup_jobs = CleanupJobs()
@@ -6,6 +6,8 @@ from typing import Any
 
 from app.repositories.session_repository import SessionRepository
 from app.tasks.evaluation_runner import enqueue
+from app.tasks.replay_bundle_runner import enqueue as enqueue_replay_bundle
+from app.tasks.rollup_runner import enqueue as enqueue_rollup
 from app.telemetry.tracing import emit_metric
 from app.config import load_settings
 
@@ -77,7 +79,10 @@ async def finalize_session(
             },
         )
     if _is_terminal(session.status):
+        enqueue_rollup(session_id)
         enqueue(session_id)
+        if load_settings().replay_bundle_enabled:
+            enqueue_replay_bundle(session_id)
 
 
 async def initiate_session(
@@ -87,7 +92,6 @@ async def initiate_session(
     scenario: Any,
     language: str,
 ) -> None:
-    print(f"[{session_id}] ===== initiate_session called =====")  # DEBUG
     logger.info(f"[{session_id}] initiate_session called")
     now = datetime.now(timezone.utc).isoformat()
     session = await repo.update_session(
@@ -132,7 +136,6 @@ async def initiate_session(
         )
     from app.services.turn_pipeline import generate_initial_ai_turn
 
-    print(f"[{session_id}] About to call generate_initial_ai_turn")  # DEBUG
     logger.info(f"[{session_id}] About to call generate_initial_ai_turn")
     await generate_initial_ai_turn(
         session_id=session_id,
@@ -140,5 +143,4 @@ async def initiate_session(
         opening_prompt=opening_prompt,
         language=language,
     )
-    print(f"[{session_id}] generate_initial_ai_turn completed")  # DEBUG
     logger.info(f"[{session_id}] generate_initial_ai_turn completed")
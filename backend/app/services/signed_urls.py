@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable
+
+from app.clients.minio import MinioClient
+
+DEFAULT_TTL_SECONDS = 900
+REFRESH_MARGIN_SECONDS = 60
+MAX_CACHED_URLS = 10_000
+
+
+@dataclass(frozen=True)
+class SignedUrl:
+    url: str
+    expires_at: float
+
+    def remaining_seconds(self, now: float | None = None) -> int:
+        return max(0, int(self.expires_at - (now if now is not None else time.time())))
+
+
+class SignedUrlService:
+    """Presigns audio object URLs with one reusable signer and caches them.
+
+    URLs are reused until ``refresh_margin_seconds`` before they expire, so a
+    client never receives a URL that dies mid-playback. The cache is a bounded
+    LRU keyed by object name and TTL.
+    """
+
+    def __init__(
+        self,
+        signer: MinioClient,
+        *,
+        refresh_margin_seconds: int = REFRESH_MARGIN_SECONDS,
+        max_entries: int = MAX_CACHED_URLS,
+        clock=time.time,
+    ) -> None:
+        self._signer = signer
+        self._refresh_margin = refresh_margin_seconds
+        self._max_entries = max_entries
+        self._clock = clock
+        self._cache: OrderedDict[tuple[str, int], SignedUrl] = OrderedDict()
+
+    def sign(self, name: str, ttl_seconds: int = DEFAULT_TTL_SECONDS) -> SignedUrl:
+        key = (name, ttl_seconds)
+        now = self._clock()
+        cached = self._cache.get(key)
+        if cached and cached.expires_at - self._refresh_margin > now:
+            self._cache.move_to_end(key)
+            return cached
+        signed = SignedUrl(
+            url=self._signer.presign_get_url(name, expires=ttl_seconds),
+            expires_at=now + ttl_seconds,
+        )
+        self._cache[key] = signed
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+        return signed
+
+    def invalidate(self, name: str) -> None:
+        for key in [key for key in self._cache if key[0] == name]:
+            self._cache.pop(key, None)
+
+    async def get_signed_url(self, name: str, expires: int = DEFAULT_TTL_SECONDS) -> str:
+        return self.sign(name, expires).url
+
+    async def create_signed_urls(
+        self, names: Iterable[str], ttl_seconds: int = DEFAULT_TTL_SECONDS
+    ) -> dict[str, str]:
+        """Sign every object in ``names`` in one call (duplicates signed once)."""
+        return {name: self.sign(name, ttl_seconds).url for name in dict.fromkeys(names)}
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import struct
+from datetime import datetime, timezone
+from typing import Any
+
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+
+from app.models.session import TurnMetadata, enforce_drift
+from app.repositories.session_repository import SessionRepository
+
+MAX_AUDIO_BYTES = 128 * 1024
+# Binary socket frames: a 4-byte big-endian header length, a UTF-8 JSON header
+# with the ``TurnMetadata`` fields, then the raw audio bytes.
+FRAME_HEADER_PREFIX = struct.Struct(">I")
+MAX_FRAME_HEADER_BYTES = 4096
+
+
+def audio_too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail="Audio exceeds 128 KB; shorten or split the turn.",
+    )
+
+
+def ensure_audio_size(size_bytes: int) -> None:
+    if size_bytes <= 0:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Missing audio payload; please resend the turn.",
+        )
+    if size_bytes > MAX_AUDIO_BYTES:
+        raise audio_too_large()
+
+
+def parse_turn_frame(frame: bytes) -> tuple[dict[str, Any], memoryview]:
+    """Split a binary turn frame into its JSON header and audio bytes.
+
+    The audio is returned as a view into ``frame`` so it is not copied.
+    """
+    if len(frame) < FRAME_HEADER_PREFIX.size:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid turn frame; please resend the turn.",
+        )
+    (header_size,) = FRAME_HEADER_PREFIX.unpack_from(frame)
+    header_end = FRAME_HEADER_PREFIX.size + header_size
+    if header_size > MAX_FRAME_HEADER_BYTES or header_end > len(frame):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid turn frame; please resend the turn.",
+        )
+    try:
+        header = json.loads(bytes(frame[FRAME_HEADER_PREFIX.size : header_end]))
+    except (UnicodeDecodeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid turn frame; please resend the turn.",
+        ) from exc
+    if not isinstance(header, dict):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="Invalid turn frame; please resend the turn.",
+        )
+    return header, memoryview(frame)[header_end:]
+
+
+def parse_turn_metadata(header: dict[str, Any]) -> TurnMetadata:
+    """Validate frame-header or upload metadata with the same rules as ``TurnInput``."""
+    try:
+        return TurnMetadata.model_validate(header)
+    except ValidationError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=exc.errors(include_url=False, include_context=False),
+        ) from exc
+
+
+async def register_turn(
+    repo: SessionRepository, session_id: str, metadata: TurnMetadata
+) -> dict[str, Any]:
+    """Check a trainee turn against the session and store it as pending.
+
+    Returns the receipt sent back to the client. Only receipts with status
+    ``accepted`` have a new turn whose audio should go to the pipeline.
+    """
+    session = await repo.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+
+    if session.status == "ended":
+        return {"sessionId": session_id, "turnId": "", "aiTurnId": None, "status": "closed"}
+
+    try:
+        enforce_drift(metadata.startedAt, datetime.now(timezone.utc))
+        enforce_drift(metadata.endedAt, datetime.now(timezone.utc))
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=str(exc),
+        ) from exc
+
+    existing_turns = await repo.list_turns(session_id)
+    existing_sequences = {turn.sequence for turn in existing_turns}
+    if metadata.sequence in existing_sequences:
+        return {
+            "sessionId": session_id,
+            "turnId": "",
+            "aiTurnId": None,
+            "status": "duplicate",
+        }
+    expected_sequence = max(existing_sequences, default=-1) + 1
+    if metadata.sequence != expected_sequence:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid sequence; expected {expected_sequence}.",
+        )
+
+    record = await repo.add_turn(
+        {
+            "sessionId": session_id,
+            "sequence": metadata.sequence,
+            "speaker": "trainee",
+            "transcript": None,
+            "audioFileId": "pending",
+            "audioUrl": None,
+            "asrStatus": "pending",
+            "startedAt": metadata.startedAt.isoformat(),
+            "endedAt": metadata.endedAt.isoformat(),
+            "context": metadata.context,
+            "latencyMs": None,
+        }
+    )
+    return {
+        "sessionId": session_id,
+        "turnId": record.id,
+        "aiTurnId": None,
+        "status": "accepted",
+    }
@@ -1,32 +1,59 @@
 from __future__ import annotations
 
-import base64
 import asyncio
+import difflib
 import logging
+import random
+import re
+import time
 from datetime import datetime, timezone
 from typing import Any
 
+import numpy as np
+
 from app.api.routes.session_socket import hub
+from app.audio_profiles import RenditionProfile
 from app.clients.mongodb import MongoDBClient
 from app.clients.minio import MinioClient
+from app.clients.cassette import cassette_transport
 from app.clients.llm import QwenClient
 from app.config import load_settings
 from app.repositories.scenario_repository import ScenarioRepository
 from app.repositories.session_repository import SessionRepository
 from app.services.audio import (
+    AudioBuffer,
     AudioConversionError,
-    convert_audio_to_mp3,
-    convert_mp3_to_wav,
-    convert_wav_to_mp3,
+    VadConfig,
     decode_audio_base64,
+    decode_audio_to_pcm,
+    detect_speech,
 )
+from app.services.audio_storage import confirm_audio, store_audio
 from app.services.objective_check import run_objective_check
+from app.services.renditions import (
+    encode_audio,
+    encode_pcm,
+    encode_renditions,
+    pcm_sample_rate,
+)
 from app.services.session_service import terminate_session
+from app.services.turn_timings import TurnTimings
+from app.tasks.rollup_runner import enqueue as enqueue_rollup
 from app.telemetry.otel import start_span
 from app.telemetry.tracing import emit_event, emit_metric
 
-QWEN_BASE_URL = "https://dashscope.aliyuncs.com/compatible-mode/v1"
 QWEN_MODEL = "qwen3-omni-flash"
+# Raw PCM replies from the omni model are 16-bit mono at this rate.
+QWEN_AUDIO_SAMPLE_RATE = 24000
+# Renditions produced for every trainee turn; "playback" is only used by the replay bundle.
+TURN_CONSUMERS = ("archive", "llm", "asr")
+# With TRANSCRIPT_SOURCE=generation the reply starts with the trainee's words in this block.
+TRANSCRIPT_INSTRUCTION = (
+    "Before your reply, write exactly what the trainee said in their audio, verbatim and in "
+    "the language they spoke, inside <transcript></transcript> tags. Then give your reply "
+    "outside the tags."
+)
+_TRANSCRIPT_BLOCK = re.compile(r"<transcript>(.*?)</transcript>", re.DOTALL)
 logger = logging.getLogger(__name__)
 
 
@@ -51,9 +78,53 @@ def _extract_qwen_audio(response: dict[str, Any]) -> bytes | None:
     payload = audio.get("data") or audio.get("content")
     if not payload:
         return None
+    if isinstance(payload, AudioBuffer):
+        return payload.to_bytes()
     return decode_audio_base64(payload)
 
 
+def turn_sample_rate() -> int:
+    """Rate trainee turns are decoded at, streamed or not."""
+    profiles = load_settings().audio_renditions
+    return pcm_sample_rate({consumer: profiles[consumer] for consumer in TURN_CONSUMERS})
+
+
+def _encode_ai_audio(audio_bytes: bytes, profile: RenditionProfile) -> bytes:
+    """Encode the model's reply audio, WAV or raw PCM, into ``profile``."""
+    if audio_bytes[:4] == b"RIFF":
+        return encode_audio(audio_bytes, profile)
+    samples = np.frombuffer(audio_bytes, dtype="<i2", count=len(audio_bytes) // 2)
+    return encode_pcm(samples, QWEN_AUDIO_SAMPLE_RATE, profile)
+
+
+def _first_chunk_ms(response: dict[str, Any]) -> float | None:
+    """Time from request to the first streamed text or audio chunk."""
+    timings = response.get("timings") or {}
+    firsts = [timings[key] for key in ("firstTextMs", "firstAudioMs") if key in timings]
+    return min(firsts) if firsts else None
+
+
+def _split_trainee_transcript(text: str) -> tuple[str | None, str]:
+    """Separate the ``<transcript>`` block from the reply text.
+
+    Returns ``(None, text)`` when the model left the block out or empty.
+    """
+    match = _TRANSCRIPT_BLOCK.search(text)
+    if not match:
+        return None, text
+    reply = (text[: match.start()] + text[match.end() :]).strip()
+    return match.group(1).strip() or None, reply
+
+
+def _transcript_agreement(first: str, second: str) -> float:
+    """Character-level similarity of two transcripts, ignoring case, spacing and punctuation."""
+
+    def normalize(text: str) -> str:
+        return re.sub(r"[\W_]+", "", text.lower())
+
+    return difflib.SequenceMatcher(None, normalize(first), normalize(second)).ratio()
+
+
 def _turn_payload(turn) -> dict[str, Any]:
     return {
         "id": turn.id,
@@ -69,6 +140,7 @@ def _turn_payload(turn) -> dict[str, Any]:
         "endedAt": turn.ended_at,
         "context": turn.context,
         "latencyMs": turn.latency_ms,
+        "speechMs": turn.speech_ms,
     }
 
 
@@ -191,12 +263,14 @@ def _build_turn_messages(
     scenario: Any | None,
     turns: list[Any],
     current_turn_id: str,
-    audio_base64: str,
+    audio: AudioBuffer,
+    audio_format: str = "mp3",
+    transcribe: bool = False,
 ) -> list[dict[str, Any]]:
-    if scenario:
-        messages: list[dict[str, Any]] = [{"role": "system", "content": _build_system_prompt(scenario)}]
-    else:
-        messages = [{"role": "system", "content": "You are an AI coach."}]
+    system_prompt = _build_system_prompt(scenario) if scenario else "You are an AI coach."
+    if transcribe:
+        system_prompt += "\n" + TRANSCRIPT_INSTRUCTION
+    messages: list[dict[str, Any]] = [{"role": "system", "content": system_prompt}]
 
     for turn in sorted(turns, key=lambda item: item.sequence):
         if turn.speaker == "ai":
@@ -213,8 +287,8 @@ def _build_turn_messages(
                 {
                     "type": "input_audio",
                     "input_audio": {
-                        "data": f"data:audio/mp3;base64,{audio_base64}",
-                        "format": "mp3",
+                        "data": audio.data_uri(f"audio/{audio_format}"),
+                        "format": audio_format,
                     },
                 }
             )
@@ -241,7 +315,6 @@ async def generate_initial_ai_turn(
     import logging
     logger = logging.getLogger(__name__)
 
-    print(f"[{session_id}] ===== generate_initial_ai_turn called =====")  # DEBUG
     logger.info(f"[{session_id}] Starting AI turn initiation")
 
     settings = load_settings()
@@ -251,8 +324,9 @@ async def generate_initial_ai_turn(
         database=settings.mongo_db,
     )
     qwen_client = QwenClient(
-        base_url=QWEN_BASE_URL,
+        base_url=settings.qwen_api_base,
         api_key=settings.dashscope_api_key,
+        transport=cassette_transport(settings),
     )
     repo = SessionRepository(mongo_client)
 
@@ -261,28 +335,24 @@ async def generate_initial_ai_turn(
             "turn.initiation",
             {"sessionId": session_id},
         ):
-            logger.info(f"[{session_id}] Starting AI turn initiation")
             messages = _build_initiation_messages(
                 scenario, opening_prompt=opening_prompt, language=language
             )
-            prompt_dump = "\n\n".join(
-                f"{message.get('role')}: {message.get('content')}" for message in messages
-            )
-            logger.info(f"[{session_id}] INIT_PROMPT\n{prompt_dump}")
-            print(f"[{session_id}] INIT_PROMPT\n{prompt_dump}", flush=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                prompt_dump = "\n\n".join(
+                    f"{message.get('role')}: {message.get('content')}" for message in messages
+                )
+                logger.debug("[%s] INIT_PROMPT\n%s", session_id, prompt_dump)
             try:
                 payload = _qwen_generation_payload(
                     model=QWEN_MODEL,
                     messages=messages,
                     voice_id=settings.qwen_voice_id,
                 )
-                print(f"[{session_id}] Calling Qwen API with model: {QWEN_MODEL}, voice_id: {settings.qwen_voice_id}")  # DEBUG
                 logger.info(f"[{session_id}] Calling Qwen API with model: {QWEN_MODEL}, voice_id: {settings.qwen_voice_id}")
                 generation_response = await qwen_client.generate(payload)
-                # print(f"[{session_id}] Qwen API call successful, response: {generation_response}")  # DEBUG
                 logger.info(f"[{session_id}] Qwen API call successful")
             except Exception as exc:
-                print(f"[{session_id}] Qwen generation failed: {exc}")  # DEBUG
                 logger.error(f"[{session_id}] Qwen generation failed: {exc}", exc_info=True)
                 emit_event(
                     "turn.initiation_failed",
@@ -314,26 +384,19 @@ async def generate_initial_ai_turn(
             ai_audio_url = None
             ai_audio_id = None
             try:
-                logger.info(f"[{session_id}] Extracting audio from Qwen response (initial turn)")
-                logger.info(f"[{session_id}] Full Qwen response keys: {generation_response.keys()}")
-                logger.info(f"[{session_id}] Response structure: {generation_response}")
-
                 audio_bytes = _extract_qwen_audio(generation_response)
                 if audio_bytes:
-                    logger.info(f"[{session_id}] Got {len(audio_bytes)} bytes of audio data")
-                    logger.info(f"[{session_id}] First 100 bytes (hex): {audio_bytes[:100].hex()}")
-                    logger.info(f"[{session_id}] First 4 bytes: {audio_bytes[:4]} (RIFF=WAV, otherwise=raw PCM)")
-
-                    # Detect format: WAV starts with "RIFF", raw PCM doesn't
-                    if audio_bytes[:4] == b'RIFF':
-                        logger.info(f"[{session_id}] Detected WAV format, converting to MP3")
-                        mp3_bytes = convert_wav_to_mp3(audio_bytes)
-                    else:
-                        logger.info(f"[{session_id}] Detected raw PCM format, converting to MP3")
-                        from app.services.audio import convert_raw_pcm_to_mp3
-                        mp3_bytes = convert_raw_pcm_to_mp3(audio_bytes, sample_rate=24000)
+                    logger.info(
+                        "[%s] Got %s bytes of audio (%s)",
+                        session_id,
+                        len(audio_bytes),
+                        "WAV" if audio_bytes[:4] == b"RIFF" else "raw PCM",
+                    )
 
-                    logger.info(f"[{session_id}] Converted to {len(mp3_bytes)} bytes of MP3, uploading to MinIO")
+                    archive = settings.audio_renditions["archive"]
+                    encoded_audio = _encode_ai_audio(audio_bytes, archive)
+
+                    logger.info(f"[{session_id}] Encoded {len(encoded_audio)} bytes of {archive.spec}, uploading to MinIO")
                     minio_client = MinioClient(
                         endpoint=settings.minio_endpoint,
                         access_key=settings.minio_access_key,
@@ -342,8 +405,12 @@ async def generate_initial_ai_turn(
                         public_endpoint=settings.minio_public_endpoint,
                     )
                     await minio_client.initialize()
-                    object_name = f"turn-{ai_turn.id}.mp3"
-                    await minio_client.upload_file(object_name, mp3_bytes, "audio/mpeg")
+                    object_name = await store_audio(
+                        minio_client,
+                        encoded_audio,
+                        archive.content_type,
+                        extension=archive.extension,
+                    )
                     ai_audio_id = object_name
                     # Generate signed URL for the audio file
                     ai_audio_url = await minio_client.get_signed_url(object_name, expires=900)
@@ -367,6 +434,9 @@ async def generate_initial_ai_turn(
                         "audioUrl": ai_audio_url or "",
                     },
                 )
+                await confirm_audio(
+                    minio_client, ai_audio_id, encoded_audio, archive.content_type
+                )
                 updated_ai_turn = await repo.get_turn(ai_turn_id)
                 if updated_ai_turn:
                     ai_turn = updated_ai_turn
@@ -431,11 +501,37 @@ async def generate_initial_ai_turn(
         await mongo_client.close()
 
 
-async def enqueue_turn_pipeline(*, session_id: str, turn_id: str, audio_base64: str) -> None:
-    await _process_turn(session_id=session_id, turn_id=turn_id, audio_base64=audio_base64)
+async def enqueue_turn_pipeline(
+    *,
+    session_id: str,
+    turn_id: str,
+    audio_base64: str | None = None,
+    audio_bytes: bytes | memoryview | None = None,
+    pcm: np.ndarray | None = None,
+) -> None:
+    """Run the pipeline for a stored trainee turn.
+
+    Callers pass the base64 payload of the JSON endpoint, the raw bytes
+    received from a socket frame or upload, or the PCM a streamed turn was
+    decoded to while it was recorded (at ``turn_sample_rate()``).
+    """
+    await _process_turn(
+        session_id=session_id,
+        turn_id=turn_id,
+        audio_base64=audio_base64,
+        audio_bytes=audio_bytes,
+        pcm=pcm,
+    )
 
 
-async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) -> None:
+async def _process_turn(
+    *,
+    session_id: str,
+    turn_id: str,
+    audio_base64: str | None = None,
+    audio_bytes: bytes | memoryview | None = None,
+    pcm: np.ndarray | None = None,
+) -> None:
     settings = load_settings()
     mongo_connection_string = f"mongodb://{settings.mongo_host}:{settings.mongo_port}"
     mongo_client = MongoDBClient(
@@ -443,36 +539,102 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
         database=settings.mongo_db,
     )
     qwen_client = QwenClient(
-        base_url=QWEN_BASE_URL,
+        base_url=settings.qwen_api_base,
         api_key=settings.dashscope_api_key,
+        transport=cassette_transport(settings),
     )
     repo = SessionRepository(mongo_client)
 
+    timings = TurnTimings(session_id=session_id, turn_id=turn_id)
+
     try:
         with start_span(
             "turn.pipeline",
             {"sessionId": session_id, "turnId": turn_id},
         ):
+            profiles = {
+                consumer: settings.audio_renditions[consumer] for consumer in TURN_CONSUMERS
+            }
+            sample_rate = pcm_sample_rate(profiles)
+            with timings.stage("decode"):
+                if pcm is None and audio_bytes is None:
+                    try:
+                        audio_bytes = decode_audio_base64(audio_base64 or "")
+                    except AudioConversionError:
+                        await _handle_audio_error(
+                            repo, session_id, turn_id, "Audio decode failed"
+                        )
+                        return
+                try:
+                    samples = (
+                        pcm
+                        if pcm is not None
+                        else await asyncio.to_thread(
+                            decode_audio_to_pcm, audio_bytes, sample_rate
+                        )
+                    )
+                except AudioConversionError:
+                    await _handle_audio_error(
+                        repo, session_id, turn_id, "Audio conversion failed"
+                    )
+                    return
+            # The trainee audio is no longer needed once decoded.
+            audio_bytes = pcm = None
+            if settings.vad_enabled:
+                with timings.stage("vad"):
+                    activity = detect_speech(samples, _vad_config(settings, sample_rate))
+                emit_metric(
+                    "turn.speech_ms",
+                    activity.speech_ms,
+                    session_id=session_id,
+                    turn_id=turn_id,
+                    attributes={"durationMs": activity.duration_ms},
+                )
+                if not activity.has_speech:
+                    await _reject_silent_turn(repo, session_id, turn_id)
+                    return
+                # The trainee stopped talking this long before the clip ended.
+                timings.record(
+                    "trailingSilence",
+                    max(0, activity.duration_ms - activity.end_sample * 1000 // sample_rate),
+                )
+                samples = samples[activity.start_sample : activity.end_sample]
+                await repo.update_turn(turn_id, {"speechMs": activity.speech_ms})
             try:
-                audio_bytes = base64.b64decode(audio_base64, validate=True)
-            except ValueError:
-                await _handle_audio_error(repo, session_id, turn_id, "Audio decode failed")
-                return
-            try:
-                mp3_bytes = convert_audio_to_mp3(audio_bytes)
+                with timings.stage("transcode"):
+                    renditions = await asyncio.to_thread(
+                        encode_renditions, samples, sample_rate, profiles
+                    )
             except AudioConversionError:
-                await _handle_audio_error(repo, session_id, turn_id, "Audio conversion failed")
+                await _handle_audio_error(
+                    repo, session_id, turn_id, "Audio conversion failed"
+                )
                 return
+            samples = None
+            for consumer, data in renditions.items():
+                emit_metric(
+                    "audio.rendition_bytes",
+                    len(data),
+                    session_id=session_id,
+                    turn_id=turn_id,
+                    attributes={"consumer": consumer, "profile": profiles[consumer].spec},
+                )
 
-            minio_client = MinioClient(
-                endpoint=settings.minio_endpoint,
-                access_key=settings.minio_access_key,
-                secret_key=settings.minio_secret_key,
-                bucket=settings.minio_bucket,
-            )
-            await minio_client.initialize()
-            object_name = f"turn-{turn_id}.mp3"
-            await minio_client.upload_file(object_name, mp3_bytes, "audio/mpeg")
+            with timings.stage("upload"):
+                minio_client = MinioClient(
+                    endpoint=settings.minio_endpoint,
+                    access_key=settings.minio_access_key,
+                    secret_key=settings.minio_secret_key,
+                    bucket=settings.minio_bucket,
+                )
+                await minio_client.initialize()
+                archive = profiles["archive"]
+                object_name = await store_audio(
+                    minio_client,
+                    renditions["archive"],
+                    archive.content_type,
+                    extension=archive.extension,
+                )
             file_id = object_name
             # No immediate URL; will generate signed URL on demand
             await repo.update_turn(
@@ -483,31 +645,43 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
                     "asrStatus": "pending",
                 },
             )
+            await confirm_audio(
+                minio_client, file_id, renditions["archive"], archive.content_type
+            )
 
-            mp3_base64 = base64.b64encode(mp3_bytes).decode("utf-8")
-            asyncio.create_task(
-                _run_asr_update(
-                    session_id=session_id,
-                    turn_id=turn_id,
-                    mp3_base64=mp3_base64,
+            asr_audio = AudioBuffer(renditions["asr"])
+            transcribe = settings.transcript_source == "generation"
+            if not transcribe:
+                asyncio.create_task(
+                    _run_asr_update(
+                        session_id=session_id,
+                        turn_id=turn_id,
+                        audio=asr_audio,
+                        audio_format=profiles["asr"].format,
+                    )
                 )
-            )
+            llm_audio = AudioBuffer(renditions["llm"])
+            renditions = None
 
-            turns = await repo.list_turns(session_id)
-            max_sequence = max((turn.sequence for turn in turns), default=-1)
+            with timings.stage("context"):
+                turns = await repo.list_turns(session_id)
+                max_sequence = max((turn.sequence for turn in turns), default=-1)
 
-            session = await repo.get_session(session_id)
-            scenario = None
-            if session:
-                scenario_repo = ScenarioRepository(mongo_client)
-                scenario = await scenario_repo.get(session.scenario_id)
+                session = await repo.get_session(session_id)
+                scenario = None
+                if session:
+                    scenario_repo = ScenarioRepository(mongo_client)
+                    scenario = await scenario_repo.get(session.scenario_id)
 
             messages = _build_turn_messages(
                 scenario=scenario,
                 turns=turns,
                 current_turn_id=turn_id,
-                audio_base64=mp3_base64,
+                audio=llm_audio,
+                audio_format=profiles["llm"].format,
+                transcribe=transcribe,
             )
+            generation_started = time.monotonic()
             generation_task = qwen_client.generate(
                 _qwen_generation_payload(
                     model=QWEN_MODEL,
@@ -536,10 +710,37 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
                     turn_id=turn_id,
                     attributes={"error": str(exc)},
                 )
+                if transcribe:
+                    # Keep the trainee transcript for history and evaluation.
+                    asyncio.create_task(
+                        _run_asr_update(
+                            session_id=session_id,
+                            turn_id=turn_id,
+                            audio=asr_audio,
+                            audio_format=profiles["asr"].format,
+                        )
+                    )
                 await _terminate_for_qwen_error(repo, session_id)
                 return
 
+            timings.record("generation", (time.monotonic() - generation_started) * 1000)
+            first_chunk_ms = _first_chunk_ms(generation_response)
+            if first_chunk_ms is not None:
+                timings.record("generationFirstToken", first_chunk_ms)
+
             transcript = _parse_qwen_text(generation_response)
+            if transcribe:
+                trainee_transcript, transcript = _split_trainee_transcript(transcript)
+                await _record_generated_transcript(
+                    repo,
+                    session_id=session_id,
+                    turn_id=turn_id,
+                    transcript=trainee_transcript,
+                    latency_ms=(time.monotonic() - generation_started) * 1000,
+                    asr_audio=asr_audio,
+                    asr_format=profiles["asr"].format,
+                    shadow_percent=settings.transcript_shadow_percent,
+                )
             ai_turn = await repo.add_turn(
                 {
                     "sessionId": session_id,
@@ -562,24 +763,28 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
             try:
                 audio_bytes = _extract_qwen_audio(generation_response)
                 if audio_bytes:
-                    if audio_bytes[:4] == b"RIFF":
-                        mp3_bytes = convert_wav_to_mp3(audio_bytes)
-                    else:
-                        from app.services.audio import convert_raw_pcm_to_mp3
-
-                        mp3_bytes = convert_raw_pcm_to_mp3(audio_bytes, sample_rate=24000)
-                    minio_client = MinioClient(
-                        endpoint=settings.minio_endpoint,
-                        access_key=settings.minio_access_key,
-                        secret_key=settings.minio_secret_key,
-                        bucket=settings.minio_bucket,
-                        public_endpoint=settings.minio_public_endpoint,
-                    )
-                    await minio_client.initialize()
-                    object_name = f"turn-{ai_turn.id}.mp3"
-                    await minio_client.upload_file(object_name, mp3_bytes, "audio/mpeg")
-                    ai_audio_id = object_name
-                    ai_audio_url = await minio_client.get_signed_url(object_name, expires=900)
+                    archive = settings.audio_renditions["archive"]
+                    with timings.stage("aiAudioEncode"):
+                        encoded_audio = _encode_ai_audio(audio_bytes, archive)
+                    with timings.stage("aiAudioUpload"):
+                        minio_client = MinioClient(
+                            endpoint=settings.minio_endpoint,
+                            access_key=settings.minio_access_key,
+                            secret_key=settings.minio_secret_key,
+                            bucket=settings.minio_bucket,
+                            public_endpoint=settings.minio_public_endpoint,
+                        )
+                        await minio_client.initialize()
+                        object_name = await store_audio(
+                            minio_client,
+                            encoded_audio,
+                            archive.content_type,
+                            extension=archive.extension,
+                        )
+                        ai_audio_id = object_name
+                        ai_audio_url = await minio_client.get_signed_url(
+                            object_name, expires=900
+                        )
             except AudioConversionError as exc:
                 emit_event(
                     "turn.audio_error",
@@ -596,25 +801,37 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
                         "audioUrl": ai_audio_url,
                     },
                 )
+                await confirm_audio(
+                    minio_client, ai_audio_id, encoded_audio, archive.content_type
+                )
                 updated_ai_turn = await repo.get_turn(ai_turn_id)
                 if updated_ai_turn:
                     ai_turn = updated_ai_turn
 
-            await hub.broadcast(
-                session_id,
-                {
-                    "type": "ai_turn",
-                    "turn": _turn_payload(ai_turn),
-                },
-            )
+            with timings.stage("broadcast"):
+                await hub.broadcast(
+                    session_id,
+                    {
+                        "type": "ai_turn",
+                        "turn": _turn_payload(ai_turn),
+                    },
+                )
+            timings.mark_replied()
             emit_metric(
                 "turn.ai_created",
                 1,
                 session_id=session_id,
                 turn_id=ai_turn_id,
             )
+            # Stored after the broadcast so the extra write does not delay the reply.
+            timing_fields = {"latencyMs": timings.latency_ms, "timings": timings.as_doc()}
+            if session:
+                # Lets the admin latency summary read a scenario's turns by index.
+                timing_fields["scenarioId"] = session.scenario_id
+            await repo.update_turn(ai_turn_id, timing_fields)
 
             if transcript:
+                objective_started = time.monotonic()
                 if scenario:
                     objective = await run_objective_check(
                         scenario_objective=scenario.objective,
@@ -632,6 +849,8 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
                         )
                     else:
                         objective = None
+                timings.record("objectiveCheck", (time.monotonic() - objective_started) * 1000)
+                await repo.update_turn(ai_turn_id, {"timings": timings.as_doc()})
                 if objective and objective.status in {"succeeded", "failed"}:
                     await repo.update_session(
                         session_id,
@@ -653,7 +872,74 @@ async def _process_turn(*, session_id: str, turn_id: str, audio_base64: str) ->
         await mongo_client.close()
 
 
-async def _run_asr_update(*, session_id: str, turn_id: str, mp3_base64: str) -> None:
+async def _record_generated_transcript(
+    repo: SessionRepository,
+    *,
+    session_id: str,
+    turn_id: str,
+    transcript: str | None,
+    latency_ms: float,
+    asr_audio: AudioBuffer,
+    asr_format: str,
+    shadow_percent: int,
+) -> None:
+    """Store the trainee transcript taken from the generation reply.
+
+    Falls back to standalone ASR when the reply had no transcript. A
+    ``shadow_percent`` share of the other turns also runs ASR, only to report
+    how closely the two transcripts agree.
+    """
+    source = "generation" if transcript else "asr_fallback"
+    emit_metric(
+        "turn.transcript_source",
+        1,
+        session_id=session_id,
+        turn_id=turn_id,
+        attributes={"source": source},
+    )
+    if transcript is None:
+        asyncio.create_task(
+            _run_asr_update(
+                session_id=session_id,
+                turn_id=turn_id,
+                audio=asr_audio,
+                audio_format=asr_format,
+            )
+        )
+        return
+    await repo.update_turn(turn_id, {"asrStatus": "completed", "transcript": transcript})
+    emit_metric(
+        "turn.transcript_latency",
+        latency_ms,
+        session_id=session_id,
+        turn_id=turn_id,
+        attributes={"source": "generation"},
+    )
+    if random.random() * 100 < shadow_percent:
+        asyncio.create_task(
+            _run_asr_update(
+                session_id=session_id,
+                turn_id=turn_id,
+                audio=asr_audio,
+                audio_format=asr_format,
+                compare_with=transcript,
+            )
+        )
+
+
+async def _run_asr_update(
+    *,
+    session_id: str,
+    turn_id: str,
+    audio: AudioBuffer,
+    audio_format: str,
+    compare_with: str | None = None,
+) -> None:
+    """Transcribe a trainee turn with standalone ASR and store the result.
+
+    With ``compare_with`` the turn already has a transcript: nothing is
+    written and only the agreement between the two is reported.
+    """
     import logging
     logger = logging.getLogger(__name__)
 
@@ -664,31 +950,31 @@ async def _run_asr_update(*, session_id: str, turn_id: str, mp3_base64: str) ->
         database=settings.mongo_db,
     )
     qwen_client = QwenClient(
-        base_url=QWEN_BASE_URL,
+        base_url=settings.qwen_api_base,
         api_key=settings.dashscope_api_key,
+        transport=cassette_transport(settings),
     )
     repo = SessionRepository(mongo_client)
     try:
         try:
-            mp3_bytes = decode_audio_base64(mp3_base64)
-            wav_bytes = convert_mp3_to_wav(mp3_bytes)
-            wav_base64 = base64.b64encode(wav_bytes).decode("ascii")
             logger.info(
-                "[%s] ASR start turn_id=%s mp3_base64_len=%s wav_base64_len=%s",
+                "[%s] ASR start turn_id=%s format=%s bytes=%s",
                 session_id,
                 turn_id,
-                len(mp3_base64),
-                len(wav_base64),
+                audio_format,
+                len(audio),
             )
+            asr_started = time.monotonic()
             asr_response = await qwen_client.asr(
                 {
                     "model": QWEN_MODEL,
-                    "input": wav_base64,
-                    "format": "wav",
+                    "input": audio,
+                    "format": audio_format,
                 }
             )
         except Exception as exc:
-            await repo.update_turn(turn_id, {"asrStatus": "failed"})
+            if compare_with is None:
+                await repo.update_turn(turn_id, {"asrStatus": "failed"})
             status_code = getattr(exc, "status_code", None)
             body = getattr(exc, "body", None)
             logger.error(
@@ -708,6 +994,21 @@ async def _run_asr_update(*, session_id: str, turn_id: str, mp3_base64: str) ->
             )
             return
 
+        emit_metric(
+            "turn.transcript_latency",
+            (time.monotonic() - asr_started) * 1000,
+            session_id=session_id,
+            turn_id=turn_id,
+            attributes={"source": "asr" if compare_with is None else "asr_shadow"},
+        )
+        if compare_with is not None:
+            emit_metric(
+                "turn.transcript_agreement",
+                _transcript_agreement(compare_with, asr_response.get("text") or ""),
+                session_id=session_id,
+                turn_id=turn_id,
+            )
+            return
         await repo.update_turn(
             turn_id,
             {"asrStatus": "completed", "transcript": asr_response.get("text")},
@@ -723,6 +1024,29 @@ async def _run_asr_update(*, session_id: str, turn_id: str, mp3_base64: str) ->
         await mongo_client.close()
 
 
+async def transcribe_partial(samples: np.ndarray, sample_rate: int) -> str:
+    """Transcribe the PCM decoded so far for a turn that is still being recorded."""
+    settings = load_settings()
+    qwen_client = QwenClient(
+        base_url=settings.qwen_api_base,
+        api_key=settings.dashscope_api_key,
+        transport=cassette_transport(settings),
+    )
+    try:
+        profile = settings.audio_renditions["asr"]
+        asr_bytes = await asyncio.to_thread(encode_pcm, samples, sample_rate, profile)
+        response = await qwen_client.asr(
+            {
+                "model": QWEN_MODEL,
+                "input": AudioBuffer(asr_bytes),
+                "format": profile.format,
+            }
+        )
+    finally:
+        await qwen_client.close()
+    return response.get("text") or ""
+
+
 async def _terminate_for_qwen_error(repo: SessionRepository, session_id: str) -> None:
     await repo.update_session(
         session_id,
@@ -732,6 +1056,7 @@ async def _terminate_for_qwen_error(repo: SessionRepository, session_id: str) ->
             "endedAt": _utc_now(),
         },
     )
+    enqueue_rollup(session_id)
     emit_event(
         "session.terminated",
         session_id=session_id,
@@ -747,6 +1072,36 @@ async def _terminate_for_qwen_error(repo: SessionRepository, session_id: str) ->
     )
 
 
+def _vad_config(settings, sample_rate: int) -> VadConfig:
+    return VadConfig(
+        sample_rate=sample_rate,
+        energy_threshold_db=settings.vad_energy_threshold_db,
+        zcr_max=settings.vad_zcr_max,
+        min_speech_ms=settings.vad_min_speech_ms,
+        padding_ms=settings.vad_padding_ms,
+    )
+
+
+async def _reject_silent_turn(repo: SessionRepository, session_id: str, turn_id: str) -> None:
+    """Drop a turn with no detected speech so the trainee can record it again.
+
+    The pending turn is deleted, which frees its sequence number for the retry.
+    """
+    turn = await repo.get_turn(turn_id)
+    await repo.delete_turn(turn_id)
+    emit_metric("turn.silent_rejected", 1, session_id=session_id, turn_id=turn_id)
+    await hub.broadcast(
+        session_id,
+        {
+            "type": "turn_error",
+            "sequence": turn.sequence if turn else None,
+            "status": 422,
+            "code": "no_speech",
+            "detail": "No speech detected; please record your turn again.",
+        },
+    )
+
+
 async def _handle_audio_error(
     repo: SessionRepository, session_id: str, turn_id: str, reason: str
 ) -> None:
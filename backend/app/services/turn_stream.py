@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable
+
+import numpy as np
+from fastapi import HTTPException, status
+
+from app.services.audio import AudioConversionError, StreamingPcmDecoder
+from app.telemetry.tracing import emit_metric
+
+logger = logging.getLogger(__name__)
+
+# Streamed turns are not held to MAX_AUDIO_BYTES; this bounds per-turn memory.
+MAX_STREAMED_AUDIO_BYTES = 8 * 1024 * 1024
+PARTIAL_INTERVAL_SECONDS = 1.5
+
+Transcribe = Callable[[np.ndarray, int], Awaitable[str]]
+OnPartial = Callable[[str], None]
+
+
+class TurnStream:
+    """A trainee turn whose audio arrives in chunks while they are speaking.
+
+    Chunks are fed to a ``StreamingPcmDecoder`` as they arrive. At most one
+    partial transcription runs at a time, over the samples decoded so far, and
+    only once ``partial_interval_seconds`` have passed since the previous one.
+    ``finish`` decodes the tail and returns the PCM, which the pipeline uses
+    in place of decoding the whole turn.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        sequence: int,
+        *,
+        decoder: StreamingPcmDecoder | None = None,
+        transcribe: Transcribe | None = None,
+        on_partial: OnPartial | None = None,
+        partial_interval_seconds: float = PARTIAL_INTERVAL_SECONDS,
+        max_bytes: int = MAX_STREAMED_AUDIO_BYTES,
+    ) -> None:
+        self.session_id = session_id
+        self.sequence = sequence
+        self.received_bytes = 0
+        self.next_index = 0
+        self._decoder = decoder or StreamingPcmDecoder()
+        self._transcribe = transcribe
+        self._on_partial = on_partial
+        self._partial_interval = partial_interval_seconds
+        self._max_bytes = max_bytes
+        self._partial: asyncio.Task | None = None
+        self._last_partial_at = time.monotonic()
+        self._transcribed_samples = 0
+        self._started_at = time.monotonic()
+
+    async def start(self) -> None:
+        try:
+            await self._decoder.start()
+        except AudioConversionError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Streaming is unavailable; send the whole turn instead.",
+            ) from exc
+
+    async def append(self, index: int, data: bytes) -> None:
+        if index != self.next_index:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail=f"Missing audio chunk {self.next_index}; please resend the turn.",
+            )
+        if self.received_bytes + len(data) > self._max_bytes:
+            raise HTTPException(
+                status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                detail=f"Audio exceeds {self._max_bytes // (1024 * 1024)} MB; "
+                "shorten or split the turn.",
+            )
+        await self._feed(data)
+        self.next_index += 1
+        self._maybe_transcribe()
+
+    async def _feed(self, data: bytes) -> None:
+        try:
+            await self._decoder.feed(data)
+        except AudioConversionError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Audio conversion failed; please resend the turn.",
+            ) from exc
+        self.received_bytes += len(data)
+
+    def _maybe_transcribe(self) -> None:
+        if self._transcribe is None or self._on_partial is None:
+            return
+        if self._partial is not None and not self._partial.done():
+            return
+        if time.monotonic() - self._last_partial_at < self._partial_interval:
+            return
+        samples = self._decoder.decoded()
+        if len(samples) <= self._transcribed_samples:
+            return
+        self._transcribed_samples = len(samples)
+        self._last_partial_at = time.monotonic()
+        self._partial = asyncio.create_task(self._run_partial(samples))
+
+    async def _run_partial(self, samples: np.ndarray) -> None:
+        started = time.monotonic()
+        try:
+            transcript = await self._transcribe(samples, self._decoder.sample_rate)
+        except Exception as exc:
+            logger.info(
+                "[%s] Partial ASR failed sequence=%s error=%s",
+                self.session_id,
+                self.sequence,
+                exc,
+            )
+            return
+        emit_metric(
+            "turn.partial_asr_latency",
+            (time.monotonic() - started) * 1000,
+            session_id=self.session_id,
+        )
+        if transcript:
+            self._on_partial(transcript)
+
+    async def finish(self, tail: bytes = b"") -> np.ndarray:
+        """Feed any trailing audio, decode what is left, and return the turn's PCM."""
+        if tail:
+            if self.received_bytes + len(tail) > self._max_bytes:
+                await self.abort()
+                raise HTTPException(
+                    status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                    detail=f"Audio exceeds {self._max_bytes // (1024 * 1024)} MB; "
+                    "shorten or split the turn.",
+                )
+            await self._feed(tail)
+        if self._partial is not None:
+            self._partial.cancel()
+        if self.received_bytes == 0:
+            await self._decoder.abort()
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Missing audio payload; please resend the turn.",
+            )
+        flush_started = time.monotonic()
+        try:
+            samples = await self._decoder.finish()
+        except AudioConversionError as exc:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="Audio conversion failed; please resend the turn.",
+            ) from exc
+        emit_metric(
+            "turn.stream_flush_latency",
+            (time.monotonic() - flush_started) * 1000,
+            session_id=self.session_id,
+            attributes={"bytes": self.received_bytes, "chunks": self.next_index},
+        )
+        return samples
+
+    async def abort(self) -> None:
+        if self._partial is not None:
+            self._partial.cancel()
+        await self._decoder.abort()
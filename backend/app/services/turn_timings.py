@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from app.telemetry.tracing import emit_metric
+
+# Stored under ``Turn.timings`` in this order; all values are milliseconds.
+STAGES = (
+    "trailingSilence",
+    "decode",
+    "vad",
+    "transcode",
+    "upload",
+    "context",
+    "generationFirstToken",
+    "generation",
+    "aiAudioEncode",
+    "aiAudioUpload",
+    "broadcast",
+    "objectiveCheck",
+)
+
+
+class TurnTimings:
+    """Latency waterfall of one trainee turn through the pipeline.
+
+    Each stage is stored as ``<stage>Ms`` and observed as ``turn.stage_ms``
+    labelled by ``stage``. ``latency_ms`` approximates the wait the trainee
+    experiences: the silence recorded after they stopped speaking plus the
+    time from receiving the turn to broadcasting the AI reply.
+    """
+
+    def __init__(self, *, session_id: str, turn_id: str) -> None:
+        self._session_id = session_id
+        self._turn_id = turn_id
+        self._started = time.monotonic()
+        self._stages: dict[str, float] = {}
+        self._replied_ms: float | None = None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, (time.monotonic() - started) * 1000)
+
+    def record(self, name: str, duration_ms: float) -> None:
+        self._stages[name] = round(duration_ms, 1)
+        emit_metric(
+            "turn.stage_ms",
+            duration_ms,
+            session_id=self._session_id,
+            turn_id=self._turn_id,
+            attributes={"stage": name},
+        )
+
+    def mark_replied(self) -> None:
+        self._replied_ms = (time.monotonic() - self._started) * 1000
+
+    @property
+    def latency_ms(self) -> int | None:
+        if self._replied_ms is None:
+            return None
+        return round(self._replied_ms + self._stages.get("trailingSilence", 0))
+
+    def as_doc(self) -> dict[str, float]:
+        return {
+            f"{name}Ms": self._stages[name] for name in STAGES if name in self._stages
+        }
@@ -13,6 +13,7 @@ from app.repositories.evaluation_repository import EvaluationRecord, EvaluationR
 from app.repositories.scenario_repository import ScenarioRepository
 from app.repositories.session_repository import SessionRepository
 from app.services.evaluation_service import EvaluationContext, evaluate_session
+from app.services.metrics_rollups import record_evaluation
 from app.telemetry.otel import start_span
 from app.telemetry.tracing import emit_metric
 
@@ -153,6 +154,7 @@ async def _run_attempts(
                     session_id=session_id,
                     attempts=attempt_number,
                 )
+                await _record_rollup(repos, session_id, result)
                 await _emit_queue_latency_metric(
                     session_id,
                     (record.queued_at if record else evaluation.queued_at),
@@ -271,6 +273,18 @@ async def _mark_completed(
         )
 
 
+async def _record_rollup(repos: _Repos, session_id: str, result) -> None:
+    try:
+        await record_evaluation(
+            repos.mongodb_client,
+            session_id,
+            [{"skillId": score.skill_id, "rating": score.rating} for score in result.scores],
+        )
+    except Exception as exc:
+        # The nightly recompute fills in what was missed here.
+        logger.warning("Rollup update failed session_id=%s error=%s", session_id, exc)
+
+
 async def _emit_queue_latency_metric(
     session_id: str,
     queued_at: str | None,
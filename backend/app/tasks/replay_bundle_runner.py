@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+
+from app.clients.minio import MinioClient
+from app.clients.mongodb import MongoDBClient
+from app.config import load_settings
+from app.repositories.session_repository import SessionRepository
+from app.services.replay_bundle import build_replay_bundle, has_pending_audio
+from app.telemetry.otel import start_span
+from app.telemetry.tracing import emit_metric
+
+logger = logging.getLogger(__name__)
+
+_IN_FLIGHT: set[str] = set()
+_LOCK = asyncio.Lock()
+# The last AI turn may still be uploading when a session ends.
+_PENDING_AUDIO_WAITS = (2.0, 5.0, 10.0)
+
+
+def enqueue(session_id: str) -> None:
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop; replay bundle enqueue skipped")
+        return
+    loop.create_task(_run_replay_bundle(session_id))
+
+
+async def _run_replay_bundle(session_id: str) -> None:
+    async with _LOCK:
+        if session_id in _IN_FLIGHT:
+            return
+        _IN_FLIGHT.add(session_id)
+    try:
+        settings = load_settings()
+        client = MongoDBClient(
+            connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+            database=settings.mongo_db,
+        )
+        minio = MinioClient(
+            endpoint=settings.minio_endpoint,
+            access_key=settings.minio_access_key,
+            secret_key=settings.minio_secret_key,
+            bucket=settings.minio_bucket,
+        )
+        try:
+            await _wait_for_pending_audio(SessionRepository(client), session_id)
+            started = time.perf_counter()
+            with start_span("replay.bundle", {"sessionId": session_id}):
+                replay = await build_replay_bundle(
+                    client,
+                    minio,
+                    session_id,
+                    profile=settings.audio_renditions["playback"],
+                )
+            if replay:
+                emit_metric(
+                    "replay.bundle_latency",
+                    time.perf_counter() - started,
+                    session_id=session_id,
+                    attributes={"segments": len(replay["segments"])},
+                )
+        finally:
+            await client.close()
+    except Exception as exc:
+        logger.warning("Replay bundle failed session_id=%s error=%s", session_id, exc)
+    finally:
+        async with _LOCK:
+            _IN_FLIGHT.discard(session_id)
+
+
+async def _wait_for_pending_audio(repo: SessionRepository, session_id: str) -> None:
+    for delay in _PENDING_AUDIO_WAITS:
+        if not has_pending_audio(await repo.list_turns(session_id)):
+            return
+        await asyncio.sleep(delay)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from app.clients.mongodb import MongoDBClient
+from app.config import load_settings
+from app.services.metrics_rollups import record_session_end
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(session_id: str) -> None:
+    """Count an ended session in the admin metrics rollups, off the request path."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        logger.warning("No running event loop; rollup update skipped")
+        return
+    loop.create_task(_record_session_end(session_id))
+
+
+async def _record_session_end(session_id: str) -> None:
+    try:
+        settings = load_settings()
+        client = MongoDBClient(
+            connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+            database=settings.mongo_db,
+        )
+        try:
+            await record_session_end(client, session_id)
+        finally:
+            await client.close()
+    except Exception as exc:
+        # The nightly recompute fills in what was missed here.
+        logger.warning("Rollup update failed session_id=%s error=%s", session_id, exc)
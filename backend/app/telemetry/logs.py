@@ -0,0 +1,146 @@
+"""Process-wide logging: structured lines, redaction, sampling, off-loop I/O.
+
+``configure_logging`` routes the root logger through one ``QueueHandler``.
+The calling thread only builds the record: the message is
+truncated to ``max_chars`` and inline base64 (data URIs and long base64
+runs, i.e. audio) is replaced by a placeholder, so a stray payload costs a
+bounded amount of work and log volume. Formatting and the write to stderr
+happen on the ``QueueListener`` thread, away from the event loop.
+
+Records below WARNING can be sampled per logger: ``{"app.telemetry": 0.1}``
+keeps about one in ten records of ``app.telemetry`` and its children.
+Warnings and errors are always kept. ``LOG_SAMPLING`` is parsed into that
+mapping by ``app.config.parse_sampling``, so loading settings does not
+import this module.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import re
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+from app.telemetry.otel import current_span
+
+DEFAULT_MAX_CHARS = 2000
+
+_BASE64 = re.compile(
+    r"data:[\w/+.-]*;base64,[A-Za-z0-9+/=]*|[A-Za-z0-9+/]{200,}={0,2}"
+)
+_STANDARD_ATTRIBUTES = set(
+    vars(logging.LogRecord("", logging.INFO, "", 0, "", None, None))
+) | {"message", "asctime", "taskName"}
+
+
+def redact(text: str, max_chars: int = DEFAULT_MAX_CHARS) -> str:
+    """Truncate ``text`` to ``max_chars`` and replace inline base64 in it."""
+    extra = len(text) - max_chars
+    if extra > 0:
+        text = text[:max_chars]
+    text = _BASE64.sub(lambda match: f"<base64 {len(match.group())} chars>", text)
+    if extra > 0:
+        text += f"... [{extra} more chars]"
+    return text
+
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rates: dict[str, float]) -> None:
+        super().__init__()
+        # Longest name first, so the most specific logger wins.
+        self._rates = sorted(rates.items(), key=lambda item: len(item[0]), reverse=True)
+
+    def _rate(self, name: str) -> float:
+        for prefix, rate in self._rates:
+            if name == prefix or name.startswith(prefix + "."):
+                return rate
+        return 1.0
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        rate = self._rate(record.name)
+        return rate >= 1.0 or random.random() < rate
+
+
+class RedactingQueueHandler(logging.handlers.QueueHandler):
+    def __init__(self, log_queue: queue.Queue, max_chars: int = DEFAULT_MAX_CHARS) -> None:
+        super().__init__(log_queue)
+        self._max_chars = max_chars
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        message = redact(record.getMessage(), self._max_chars)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        for key, value in list(vars(record).items()):
+            if key not in _STANDARD_ATTRIBUTES and isinstance(value, str):
+                setattr(record, key, redact(value, self._max_chars))
+        span = current_span()
+        if span is not None:
+            record.traceId = span.trace_id
+            if "sessionId" in span.attributes and not hasattr(record, "sessionId"):
+                record.sessionId = span.attributes["sessionId"]
+        return record
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line; ``extra=`` fields become top-level keys."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry: dict[str, Any] = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _STANDARD_ATTRIBUTES:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+TEXT_FORMAT = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+
+def configure_logging(
+    *,
+    level: str = "INFO",
+    json_format: bool = True,
+    max_chars: int = DEFAULT_MAX_CHARS,
+    sampling: dict[str, float] | None = None,
+    stream: Any = None,
+) -> logging.handlers.QueueListener:
+    """Route the root logger through a queue; returns the started listener.
+
+    A handler installed by an earlier call is replaced. Stop the listener on
+    shutdown to flush what is still queued.
+    """
+    log_queue: queue.Queue = queue.Queue(-1)
+    handler = RedactingQueueHandler(log_queue, max_chars)
+    if sampling:
+        handler.addFilter(SamplingFilter(sampling))
+
+    output = logging.StreamHandler(stream or sys.stderr)
+    output.setFormatter(JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT))
+
+    root = logging.getLogger()
+    for existing in list(root.handlers):
+        if isinstance(existing, RedactingQueueHandler):
+            root.removeHandler(existing)
+    root.addHandler(handler)
+    root.setLevel(level.upper())
+
+    listener = logging.handlers.QueueListener(log_queue, output, respect_handler_level=True)
+    listener.start()
+    return listener
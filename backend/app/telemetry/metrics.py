@@ -0,0 +1,307 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import re
+from typing import Any
+
+logger = logging.getLogger("app.telemetry")
+
+# Log-linear (HDR-style) buckets: each power of two is split into SUB_BUCKETS
+# equal slices, so a recorded value is known to within ~3% at any magnitude.
+SUB_BUCKETS = 16
+MIN_EXPONENT = -7  # values up to 2**-7 share the first bucket
+MAX_EXPONENT = 27  # values above 2**27 (~37 h in ms, ~128 MB) share the last one
+BUCKET_COUNT = 1 + (MAX_EXPONENT - MIN_EXPONENT) * SUB_BUCKETS
+_MIN_VALUE = 2.0**MIN_EXPONENT
+_INDEX_OFFSET = 1 - (MIN_EXPONENT + 1) * SUB_BUCKETS
+# Prometheus ``le`` bounds; powers of two line up with bucket edges exactly.
+PROMETHEUS_BOUNDS = tuple(2.0**exponent for exponent in range(-3, 18))
+SUMMARY_QUANTILES = (0.5, 0.95, 0.99)
+
+DEFAULT_MAX_SERIES = 200
+OVERFLOW_LABELS = (("overflow", "true"),)
+# Per-request identifiers never become labels; they would create a series per session.
+_UNLABELED_ATTRIBUTES = frozenset({"sessionId", "session_id", "turnId", "turn_id", "sc_id"})
+_MAX_LABEL_VALUE_LENGTH = 32
+_LABEL_CACHE_SIZE = 4096
+_INVALID_NAME_CHARS = re.compile(r"[^a-zA-Z0-9_]")
+
+LabelSet = tuple[tuple[str, str], ...]
+SeriesKey = tuple[str, LabelSet]
+
+
+def metric_name(name: str) -> str:
+    """``turn.asr_latency`` -> ``turn_asr_latency``."""
+    return _INVALID_NAME_CHARS.sub("_", name)
+
+
+def _label_candidates(attributes: dict[str, Any]) -> list[tuple[str, str | bool]]:
+    return [
+        (key, value)
+        for key, value in attributes.items()
+        if isinstance(value, (str, bool))
+        and key not in _UNLABELED_ATTRIBUTES
+        and (isinstance(value, bool) or len(value) <= _MAX_LABEL_VALUE_LENGTH)
+    ]
+
+
+def label_set(attributes: dict[str, Any] | None) -> LabelSet:
+    """Labels for a series: short string and boolean attributes other than ids."""
+    if not attributes:
+        return ()
+    labels = [
+        (metric_name(key), str(value).lower() if isinstance(value, bool) else value)
+        for key, value in _label_candidates(attributes)
+    ]
+    return tuple(sorted(labels))
+
+
+def bucket_index(value: float) -> int:
+    """Index of the bucket ``(lower, upper]`` holding ``value``."""
+    if value <= _MIN_VALUE:
+        return 0
+    mantissa, exponent = math.frexp(value)
+    sub_bucket = math.ceil((mantissa * 2 - 1) * SUB_BUCKETS) - 1
+    if sub_bucket < 0:
+        # Exact powers of two close the previous bucket.
+        exponent -= 1
+        sub_bucket = SUB_BUCKETS - 1
+    return min(exponent * SUB_BUCKETS + sub_bucket + _INDEX_OFFSET, BUCKET_COUNT - 1)
+
+
+def bucket_upper_bound(index: int) -> float:
+    if index == 0:
+        return _MIN_VALUE
+    octave, sub_bucket = divmod(index - 1, SUB_BUCKETS)
+    return 2.0 ** (MIN_EXPONENT + octave) * (1 + (sub_bucket + 1) / SUB_BUCKETS)
+
+
+_PROMETHEUS_INDEXES = tuple(bucket_index(bound) for bound in PROMETHEUS_BOUNDS)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: LabelSet, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = labels + extra
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    value = float(value)
+    return str(int(value)) if value.is_integer() else repr(value)
+
+
+def quantile(counts: list[int], total: int, q: float, maximum: float) -> float:
+    """Upper edge of the bucket holding the ``q`` quantile, capped at ``maximum``."""
+    if total <= 0:
+        return 0.0
+    rank = max(1, math.ceil(q * total))
+    seen = 0
+    for index, count in enumerate(counts):
+        seen += count
+        if seen >= rank:
+            return min(bucket_upper_bound(index), maximum)
+    return maximum
+
+
+class Histogram:
+    """Preallocated log-linear histogram; ``observe`` is an index and an increment."""
+
+    __slots__ = ("counts", "sum", "count", "max")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bucket_index(value)] += 1
+        self.sum += value
+        self.count += 1
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> float:
+        return quantile(self.counts, self.count, q, self.max)
+
+
+class Counter:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+
+class _FlushState:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * BUCKET_COUNT
+        self.sum = 0.0
+        self.count = 0
+
+
+class MetricsRegistry:
+    """Histograms and counters aggregated in process.
+
+    Every ``emit_metric`` value is observed into a histogram named after the
+    metric, so counts (value 1), latencies and sizes all get a count, a sum
+    and buckets. Events and other occurrences are plain counters. Each metric
+    holds at most ``max_series`` label sets; further label sets are folded
+    into one ``overflow="true"`` series. Nothing is serialized while
+    recording: summaries are rendered for Prometheus on scrape and logged by
+    ``run_flush_forever``.
+    """
+
+    def __init__(self, max_series: int = DEFAULT_MAX_SERIES) -> None:
+        self.max_series = max_series
+        self._histograms: dict[SeriesKey, Histogram] = {}
+        self._counters: dict[SeriesKey, Counter] = {}
+        self._series_per_name: dict[str, int] = {}
+        self._label_cache: dict[tuple, LabelSet] = {}
+        self._flushed: dict[SeriesKey, _FlushState] = {}
+
+    def configure(self, *, max_series: int) -> None:
+        self.max_series = max_series
+
+    def _labels(self, name: str, attributes: dict[str, Any] | None) -> LabelSet:
+        if not attributes:
+            return ()
+        # Keyed only on what can become a label: sizes, durations and ids
+        # differ on nearly every call and would fill the cache with one-offs.
+        cache_key = (name, *_label_candidates(attributes))
+        labels = self._label_cache.get(cache_key)
+        if labels is None:
+            labels = label_set(attributes)
+            if len(self._label_cache) < _LABEL_CACHE_SIZE:
+                self._label_cache[cache_key] = labels
+        return labels
+
+    def _admit(self, name: str, labels: LabelSet) -> LabelSet:
+        """Labels to record a new series under, honouring ``max_series``."""
+        series = self._series_per_name.get(name, 0)
+        if series >= self.max_series:
+            return OVERFLOW_LABELS
+        self._series_per_name[name] = series + 1
+        return labels
+
+    def observe(self, name: str, value: float, attributes: dict[str, Any] | None = None) -> None:
+        if not math.isfinite(value):
+            # NaN and infinities have no bucket; count them instead of failing the caller.
+            self.increment("metrics.non_finite", {"metric": name})
+            return
+        key = (name, self._labels(name, attributes))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            key = (name, self._admit(name, key[1]))
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram()
+        histogram.observe(value)
+
+    def increment(
+        self, name: str, attributes: dict[str, Any] | None = None, amount: float = 1
+    ) -> None:
+        key = (name, self._labels(name, attributes))
+        counter = self._counters.get(key)
+        if counter is None:
+            key = (name, self._admit(name, key[1]))
+            counter = self._counters.get(key)
+            if counter is None:
+                counter = self._counters[key] = Counter()
+        counter.value += amount
+
+    def histogram(self, name: str, attributes: dict[str, Any] | None = None) -> Histogram | None:
+        return self._histograms.get((name, label_set(attributes)))
+
+    def counter(self, name: str, attributes: dict[str, Any] | None = None) -> float:
+        counter = self._counters.get((name, label_set(attributes)))
+        return counter.value if counter else 0
+
+    def reset(self) -> None:
+        self._histograms.clear()
+        self._counters.clear()
+        self._series_per_name.clear()
+        self._label_cache.clear()
+        self._flushed.clear()
+
+    def render_prometheus(self) -> str:
+        """Text exposition format 0.0.4."""
+        lines: list[str] = []
+        counters: dict[str, list[tuple[LabelSet, Counter]]] = {}
+        for (name, labels), counter in self._counters.items():
+            counters.setdefault(metric_name(name), []).append((labels, counter))
+        for name in sorted(counters):
+            lines.append(f"# TYPE {name} counter")
+            for labels, counter in sorted(counters[name], key=lambda item: item[0]):
+                lines.append(f"{name}{_format_labels(labels)} {_format_value(counter.value)}")
+
+        histograms: dict[str, list[tuple[LabelSet, Histogram]]] = {}
+        for (name, labels), histogram in self._histograms.items():
+            histograms.setdefault(metric_name(name), []).append((labels, histogram))
+        for name in sorted(histograms):
+            lines.append(f"# TYPE {name} histogram")
+            for labels, histogram in sorted(histograms[name], key=lambda item: item[0]):
+                cumulative = 0
+                start = 0
+                for bound, index in zip(PROMETHEUS_BOUNDS, _PROMETHEUS_INDEXES):
+                    cumulative += sum(histogram.counts[start : index + 1])
+                    start = index + 1
+                    le = (("le", _format_value(bound)),)
+                    lines.append(f"{name}_bucket{_format_labels(labels, le)} {cumulative}")
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels, (('le', '+Inf'),))} {histogram.count}"
+                )
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                lines.append(f"{name}_count{_format_labels(labels)} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def flush_summaries(self) -> list[dict[str, Any]]:
+        """Per-series summaries of the values observed since the previous flush."""
+        summaries = []
+        for key, histogram in list(self._histograms.items()):
+            state = self._flushed.get(key)
+            if state is None:
+                state = self._flushed[key] = _FlushState()
+            count = histogram.count - state.count
+            if count <= 0:
+                continue
+            counts = [now - before for now, before in zip(histogram.counts, state.counts)]
+            total = histogram.sum - state.sum
+            state.counts = list(histogram.counts)
+            state.sum = histogram.sum
+            state.count = histogram.count
+            name, labels = key
+            summary: dict[str, Any] = {
+                "type": "metric_summary",
+                "name": name,
+                "labels": dict(labels),
+                "count": count,
+                "sum": round(total, 3),
+            }
+            for q in SUMMARY_QUANTILES:
+                summary[f"p{round(q * 100)}"] = round(
+                    quantile(counts, count, q, histogram.max), 3
+                )
+            summaries.append(summary)
+        return summaries
+
+
+registry = MetricsRegistry()
+
+
+async def run_flush_forever(interval_seconds: float, metrics: MetricsRegistry | None = None) -> None:
+    """Log one summary line per active series every ``interval_seconds``."""
+    metrics = metrics or registry
+    while True:
+        await asyncio.sleep(interval_seconds)
+        for summary in metrics.flush_summaries():
+            logger.info(json.dumps(summary, sort_keys=True))
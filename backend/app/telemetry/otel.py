@@ -1,13 +1,228 @@
 from __future__ import annotations
 
+import asyncio
+import logging
+import os
+import time
+from collections import deque
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 
+import httpx
+
+from app.telemetry.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+SPAN_BUFFER_SIZE = 2048
+EXPORT_INTERVAL_SECONDS = 5.0
+EXPORT_BATCH_SIZE = 512
+
+
+class Span:
+    """One timed operation. Nested spans share the trace id of the outermost one."""
+
+    __slots__ = (
+        "name",
+        "attributes",
+        "trace_id",
+        "span_id",
+        "parent_id",
+        "start_ns",
+        "end_ns",
+        "status",
+        "error",
+    )
+
+    def __init__(self, name: str, attributes: dict[str, Any], parent: Span | None) -> None:
+        self.name = name
+        self.attributes = attributes
+        self.trace_id = parent.trace_id if parent else os.urandom(16).hex()
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns: int | None = None
+        self.status = "ok"
+        self.error: str | None = None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        end_ns = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end_ns - self.start_ns) / 1_000_000
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "parentId": self.parent_id,
+            "startTimeUnixNano": self.start_ns,
+            "durationMs": round(self.duration_ms, 3),
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+class SpanRecorder:
+    """Bounded in-process buffer of finished spans.
+
+    Spans are also queued for export only while an exporter is attached, so
+    the queue does not fill up in deployments without OTLP.
+    """
+
+    def __init__(self, capacity: int = SPAN_BUFFER_SIZE) -> None:
+        self._finished: deque[Span] = deque(maxlen=capacity)
+        self._unexported: deque[Span] = deque(maxlen=capacity)
+        self.exporting = False
+
+    def record(self, span: Span) -> None:
+        self._finished.append(span)
+        if self.exporting:
+            self._unexported.append(span)
+
+    def recent(self, name: str | None = None, limit: int = 100) -> list[Span]:
+        """Newest spans first, optionally only those called ``name``."""
+        spans = [span for span in reversed(self._finished) if name is None or span.name == name]
+        return spans[:limit]
+
+    def take_unexported(self, limit: int = EXPORT_BATCH_SIZE) -> list[Span]:
+        batch = []
+        while self._unexported and len(batch) < limit:
+            batch.append(self._unexported.popleft())
+        return batch
+
+    def clear(self) -> None:
+        self._finished.clear()
+        self._unexported.clear()
+
+
+recorder = SpanRecorder()
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
 
 @contextmanager
 def start_span(name: str, attributes: dict[str, Any] | None = None):
-    span = {"name": name, "attributes": attributes or {}}
+    """Time the enclosed block as a span.
+
+    The span records wall time, ``ok``/``error`` status and ``attributes``,
+    is kept in the in-process ``recorder`` and observed into the
+    ``span_duration_ms`` histogram.
+    """
+    span = Span(name, dict(attributes or {}), _current_span.get())
+    token = _current_span.set(span)
     try:
         yield span
+    except BaseException as exc:
+        if not isinstance(exc, GeneratorExit):
+            span.status = "error"
+            span.error = f"{type(exc).__name__}: {exc}"
+        raise
     finally:
-        pass
+        span.end_ns = time.time_ns()
+        try:
+            _current_span.reset(token)
+        except ValueError:
+            # Closed from a different context than it was opened in.
+            _current_span.set(None)
+        recorder.record(span)
+        registry.observe(
+            "span.duration_ms", span.duration_ms, {"span": name, "status": span.status}
+        )
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def otlp_payload(spans: list[Span], service_name: str) -> dict[str, Any]:
+    """OTLP/HTTP JSON body for ``spans`` (ids are hex, times are nanosecond strings)."""
+    otlp_spans = []
+    for span in spans:
+        otlp_span: dict[str, Any] = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": 1,
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns or span.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in span.attributes.items()
+                if value is not None
+            ],
+            "status": {"code": 2, "message": span.error or ""}
+            if span.status == "error"
+            else {"code": 1},
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        otlp_spans.append(otlp_span)
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [
+                        {"key": "service.name", "value": {"stringValue": service_name}}
+                    ]
+                },
+                "scopeSpans": [{"scope": {"name": "app.telemetry"}, "spans": otlp_spans}],
+            }
+        ]
+    }
+
+
+class OtlpSpanExporter:
+    """Periodically posts recorded spans to an OTLP/HTTP collector as JSON."""
+
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        service_name: str,
+        span_recorder: SpanRecorder | None = None,
+        interval_seconds: float = EXPORT_INTERVAL_SECONDS,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._url = endpoint.rstrip("/") + "/v1/traces"
+        self._service_name = service_name
+        self._recorder = span_recorder or recorder
+        self._interval = interval_seconds
+        self._client = httpx.AsyncClient(timeout=10.0, transport=transport)
+
+    async def export_pending(self) -> int:
+        exported = 0
+        while batch := self._recorder.take_unexported():
+            response = await self._client.post(
+                self._url, json=otlp_payload(batch, self._service_name)
+            )
+            response.raise_for_status()
+            exported += len(batch)
+        return exported
+
+    async def run_forever(self) -> None:
+        self._recorder.exporting = True
+        try:
+            while True:
+                await asyncio.sleep(self._interval)
+                try:
+                    await self.export_pending()
+                except httpx.HTTPError as exc:
+                    logger.warning("OTLP span export failed: %s", exc)
+        finally:
+            self._recorder.exporting = False
+            await self._client.aclose()
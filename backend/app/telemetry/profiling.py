@@ -0,0 +1,141 @@
+"""Event-loop lag monitoring and on-demand stack sampling.
+
+``LoopLagMonitor`` sleeps for a fixed interval in a loop and records how
+much later than requested it woke up as the ``event_loop.lag_ms``
+histogram. Lag means some coroutine held the loop (CPU-bound work, a
+blocking call) while sockets and requests waited. By the time the monitor
+wakes up the culprit has returned, so a watchdog thread checks the
+monitor's heartbeat as well and, once the loop has been stuck for longer
+than the threshold, logs the loop thread's stack while it is still stuck.
+
+``sample_stacks`` samples thread stacks for a while and counts them in
+the collapsed format read by flamegraph.pl, speedscope and similar tools:
+one ``thread;outer;...;inner count`` line per distinct stack.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from types import FrameType
+
+from app.telemetry.metrics import MetricsRegistry, registry
+
+logger = logging.getLogger(__name__)
+
+_APP_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class LoopLagMonitor:
+    def __init__(
+        self,
+        interval_seconds: float = 0.1,
+        threshold_ms: float = 200.0,
+        metrics: MetricsRegistry | None = None,
+    ) -> None:
+        self._interval = interval_seconds
+        self._threshold_ms = threshold_ms
+        self._metrics = metrics or registry
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._heartbeat = time.monotonic()
+        self._reported_heartbeat: float | None = None
+        self._stopped = threading.Event()
+
+    async def run(self) -> None:
+        """Sample lag until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.monotonic()
+        self._stopped.clear()
+        watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        watchdog.start()
+        try:
+            while True:
+                started = self._loop.time()
+                await asyncio.sleep(self._interval)
+                lag_ms = max((self._loop.time() - started - self._interval) * 1000, 0.0)
+                self._heartbeat = time.monotonic()
+                self._metrics.observe("event_loop.lag_ms", lag_ms)
+        finally:
+            self._stopped.set()
+
+    def _watch(self) -> None:
+        while not self._stopped.wait(self._interval):
+            self.check()
+
+    def check(self) -> str | None:
+        """Log (once per stall) and return the loop's stack if it is stuck."""
+        heartbeat = self._heartbeat
+        stalled_ms = (time.monotonic() - heartbeat - self._interval) * 1000
+        if stalled_ms < self._threshold_ms or self._reported_heartbeat == heartbeat:
+            return None
+        frame = sys._current_frames().get(self._loop_thread_id)
+        if frame is None:
+            return None
+        self._reported_heartbeat = heartbeat
+        stack = "".join(traceback.format_stack(frame))
+        task_name = None
+        try:
+            task = asyncio.current_task(self._loop)
+            task_name = task.get_name() if task else None
+        except RuntimeError:
+            pass
+        logger.warning(
+            "Event loop blocked for %.0f ms (task %s); loop thread stack:\n%s",
+            stalled_ms,
+            task_name,
+            stack,
+        )
+        return stack
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = code.co_filename
+    if path.startswith(_APP_ROOT + os.sep):
+        path = os.path.relpath(path, _APP_ROOT)
+    else:
+        path = os.path.join(*path.split(os.sep)[-2:])
+    return f"{code.co_name} ({path}:{code.co_firstlineno})"
+
+
+def _collapse(thread_name: str, frame: FrameType | None) -> str:
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join([thread_name, *reversed(labels)])
+
+
+def sample_stacks(
+    duration_seconds: float,
+    interval_seconds: float = 0.005,
+    *,
+    thread_ids: set[int] | None = None,
+) -> Counter[str]:
+    """Count the collapsed stacks of ``thread_ids`` (all other threads by default).
+
+    Blocks the calling thread for ``duration_seconds``; run it off the loop.
+    """
+    own = threading.get_ident()
+    counts: Counter[str] = Counter()
+    deadline = time.monotonic() + duration_seconds
+    while time.monotonic() < deadline:
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id == own or (thread_ids is not None and thread_id not in thread_ids):
+                continue
+            counts[_collapse(names.get(thread_id, str(thread_id)), frame)] += 1
+        time.sleep(interval_seconds)
+    return counts
+
+
+def render_collapsed(counts: Counter[str]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in sorted(counts.items()))
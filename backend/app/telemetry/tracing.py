@@ -4,6 +4,8 @@ import json
 import logging
 from typing import Any
 
+from app.telemetry.metrics import registry
+
 logger = logging.getLogger("app.telemetry")
 
 
@@ -44,6 +46,7 @@ def emit_event(
         turn_id=turn_id,
         attributes=attributes,
     )
+    registry.increment("events_total", {"event": name})
     logger.info(json.dumps(payload, sort_keys=True))
     return payload
 
@@ -74,13 +77,19 @@ def emit_metric(
     session_id: str | None = None,
     turn_id: str | None = None,
     attributes: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    payload = build_metric(
-        name,
-        value,
-        session_id=session_id,
-        turn_id=turn_id,
-        attributes=attributes,
-    )
-    logger.info(json.dumps(payload, sort_keys=True))
-    return payload
+) -> None:
+    """Record ``value`` in the in-process registry.
+
+    Values reach logs as periodic summaries (``run_flush_forever``); the
+    per-call JSON line is only built when ``app.telemetry`` logs at DEBUG.
+    """
+    registry.observe(name, value, attributes)
+    if logger.isEnabledFor(logging.DEBUG):
+        payload = build_metric(
+            name,
+            value,
+            session_id=session_id,
+            turn_id=turn_id,
+            attributes=attributes,
+        )
+        logger.debug(json.dumps(payload, sort_keys=True))
@@ -0,0 +1,121 @@
+"""Peak memory and CPU per turn for audio buffer handling, before and after AudioBuffer.
+
+ffmpeg is replaced by fixed-size stand-ins so only the pipeline's own
+copies and base64 work are measured. Sizes follow a long trainee turn:
+128 KB of webm in, ~100 KB of MP3, 30 s of 24 kHz WAV for ASR, and 10 s of
+24 kHz PCM streamed back by the model in 2 KB base64 fragments.
+
+Usage:
+    python -m benchmarks.bench_audio_buffer --iterations 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import time
+import tracemalloc
+from typing import Any, Callable
+
+from app.services.audio import AudioBuffer
+
+TRAINEE_BYTES = 128 * 1024
+MP3_BYTES = 100 * 1024
+WAV_BYTES = 30 * 24000 * 2
+AI_PCM_BYTES = 10 * 24000 * 2
+FRAGMENT_CHARS = 2048
+
+
+def _fake_to_mp3(data: Any) -> bytes:
+    return bytes(MP3_BYTES)
+
+
+def _fake_to_wav(data: Any) -> bytes:
+    return bytes(WAV_BYTES)
+
+
+def _inputs() -> dict[str, Any]:
+    trainee = os.urandom(TRAINEE_BYTES)
+    ai_base64 = base64.b64encode(os.urandom(AI_PCM_BYTES)).decode("ascii")
+    return {
+        "trainee_base64": base64.b64encode(trainee).decode("ascii"),
+        "ai_fragments": [
+            ai_base64[index : index + FRAGMENT_CHARS]
+            for index in range(0, len(ai_base64), FRAGMENT_CHARS)
+        ],
+    }
+
+
+def legacy_turn(inputs: dict[str, Any]) -> list[Any]:
+    """The string-based path: base64 → bytes → mp3 → base64 → bytes → wav → base64.
+
+    Returns what the old ``_process_turn`` / ``_run_asr_update`` locals kept
+    alive at the same time.
+    """
+    audio_bytes = base64.b64decode(inputs["trainee_base64"], validate=True)
+    mp3_bytes = _fake_to_mp3(audio_bytes)
+    mp3_base64 = base64.b64encode(mp3_bytes).decode("utf-8")
+    generation_uri = f"data:audio/mp3;base64,{mp3_base64}"
+    asr_mp3 = base64.b64decode(mp3_base64, validate=True)
+    wav_bytes = _fake_to_wav(asr_mp3)
+    wav_base64 = base64.b64encode(wav_bytes).decode("ascii")
+    asr_uri = f"data:;base64,{wav_base64}"
+    ai_audio = base64.b64decode("".join(inputs["ai_fragments"]), validate=True)
+    return [
+        audio_bytes,
+        mp3_bytes,
+        mp3_base64,
+        generation_uri,
+        asr_mp3,
+        wav_bytes,
+        wav_base64,
+        asr_uri,
+        ai_audio,
+    ]
+
+
+def buffer_turn(inputs: dict[str, Any]) -> list[Any]:
+    """The AudioBuffer path: each encoding is computed once and shared."""
+    trainee = AudioBuffer.from_base64(inputs["trainee_base64"])
+    mp3_audio = AudioBuffer(_fake_to_mp3(trainee.view))
+    trainee = None  # _process_turn drops the input once it is encoded
+    generation_uri = mp3_audio.data_uri("audio/mp3")
+    wav_audio = AudioBuffer(_fake_to_wav(mp3_audio.to_bytes()))
+    asr_uri = wav_audio.data_uri()
+    ai_audio = AudioBuffer.from_base64_chunks(inputs["ai_fragments"]).to_bytes()
+    return [mp3_audio, generation_uri, wav_audio, asr_uri, ai_audio]
+
+
+def measure(turn: Callable[[dict[str, Any]], list[Any]], iterations: int) -> dict[str, float]:
+    inputs = _inputs()
+    turn(inputs)  # warm up
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    baseline, _ = tracemalloc.get_traced_memory()
+    turn(inputs)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    started = time.process_time()
+    for _ in range(iterations):
+        turn(inputs)
+    cpu_ms = (time.process_time() - started) * 1000 / iterations
+    return {"peakKb": round((peak - baseline) / 1024, 1), "cpuMsPerTurn": round(cpu_ms, 3)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=50)
+    args = parser.parse_args(argv)
+    results = {
+        "before": measure(legacy_turn, args.iterations),
+        "after": measure(buffer_turn, args.iterations),
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,88 @@
+"""Per-call cost of emit_metric, before and after in-process aggregation.
+
+``before`` is the former body of ``emit_metric``: build the payload dict,
+``json.dumps(..., sort_keys=True)`` it and log it at INFO through a stream
+handler (writing to /dev/null). ``after`` is the current ``emit_metric``
+with ``app.telemetry`` at INFO, i.e. a registry lookup and a histogram
+increment. Calls mirror one turn's mix: no attributes, a bounded label, and
+a label plus numeric attributes that never become labels.
+
+Usage:
+    python -m benchmarks.bench_metrics --calls 200000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import time
+from typing import Any, Callable
+
+from app.telemetry.metrics import MetricsRegistry
+from app.telemetry.tracing import build_metric, emit_metric
+
+CALLS = (
+    ("turn.ai_created", 1, None),
+    ("turn.transcript_latency", 812.5, {"source": "asr"}),
+    ("audio.rendition_bytes", 24576, {"consumer": "llm", "profile": "mp3:16000:16k"}),
+    ("turn.speech_ms", 4250, {"durationMs": 5100}),
+)
+
+
+def legacy_emit_metric(
+    name: str,
+    value: float,
+    *,
+    session_id: str | None = None,
+    turn_id: str | None = None,
+    attributes: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    payload = build_metric(
+        name, value, session_id=session_id, turn_id=turn_id, attributes=attributes
+    )
+    logging.getLogger("app.telemetry").info(json.dumps(payload, sort_keys=True))
+    return payload
+
+
+_registry = MetricsRegistry()
+
+
+def registry_observe(
+    name: str, value: float, *, attributes: dict[str, Any] | None = None, **ids: Any
+) -> None:
+    _registry.observe(name, value, attributes)
+
+
+def measure(emit: Callable[..., Any], calls: int) -> dict[str, float]:
+    rounds = max(1, calls // len(CALLS))
+    started = time.perf_counter()
+    for _ in range(rounds):
+        for name, value, attributes in CALLS:
+            emit(name, value, session_id="session-1", turn_id="turn-1", attributes=attributes)
+    elapsed = time.perf_counter() - started
+    return {"nsPerCall": round(elapsed * 1e9 / (rounds * len(CALLS)), 1)}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    telemetry_logger = logging.getLogger("app.telemetry")
+    telemetry_logger.propagate = False
+    telemetry_logger.setLevel(logging.INFO)
+    with open(os.devnull, "w") as devnull:
+        telemetry_logger.addHandler(logging.StreamHandler(devnull))
+        results = {
+            "before": measure(legacy_emit_metric, args.calls),
+            "after": measure(emit_metric, args.calls),
+            "registryOnly": measure(registry_observe, args.calls),
+        }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
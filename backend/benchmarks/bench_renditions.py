@@ -0,0 +1,84 @@
+"""Bytes and encode time per audio rendition profile.
+
+Encodes the same synthetic 10 s voice-like clip (24 kHz PCM: a gliding
+harmonic tone with syllable-rate amplitude modulation and light noise) into
+each profile. ``payloadKb`` is the base64 size actually uploaded for the
+llm/asr consumers. The ``legacy-*`` rows are the fixed encodings used before
+rendition profiles (24 kbps MP3 for storage and the LLM, 24 kHz WAV for ASR).
+Requires ffmpeg on PATH.
+
+Usage:
+    python -m benchmarks.bench_renditions --iterations 5
+    python -m benchmarks.bench_renditions --profile opus16=ogg:16000:16k
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import time
+
+import numpy as np
+
+from app.audio_profiles import DEFAULT_RENDITIONS, RenditionProfile, parse_rendition
+from app.services.renditions import encode_pcm
+from loadtest.fixtures import voice_like_clip
+
+SAMPLE_RATE = 24000
+CLIP_SECONDS = 10
+LEGACY_RENDITIONS = {
+    "legacy-archive": RenditionProfile("mp3", 24000, "24k"),
+    "legacy-llm": RenditionProfile("mp3", 24000, "24k"),
+    "legacy-asr": RenditionProfile("wav", 24000),
+}
+
+
+def measure(
+    samples: np.ndarray, profile: RenditionProfile, iterations: int
+) -> dict[str, float | str]:
+    timings = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        data = encode_pcm(samples, SAMPLE_RATE, profile)
+        timings.append((time.perf_counter() - started) * 1000)
+    return {
+        "profile": profile.spec,
+        "bytes": len(data),
+        "payloadKb": round(((len(data) + 2) // 3 * 4) / 1024, 1),
+        "encodeMs": round(statistics.median(timings), 2),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument(
+        "--profile",
+        action="append",
+        default=[],
+        metavar="NAME=FORMAT:RATE[:BITRATE]",
+        help="Extra profile to measure; may be repeated.",
+    )
+    args = parser.parse_args(argv)
+    if shutil.which("ffmpeg") is None:
+        print("ffmpeg is required for this benchmark", file=sys.stderr)
+        return 1
+
+    profiles = {**LEGACY_RENDITIONS, **DEFAULT_RENDITIONS}
+    for item in args.profile:
+        name, _, spec = item.partition("=")
+        profiles[name] = parse_rendition(spec)
+
+    samples = voice_like_clip(CLIP_SECONDS, SAMPLE_RATE)
+    results = {
+        name: measure(samples, profile, args.iterations) for name, profile in profiles.items()
+    }
+    print(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,364 @@
+"""Benchmark cases for ``benchmarks.suite``.
+
+Inputs are fixed and built once per case, so timings only move when the
+code under test does. Cases that shell out to ffmpeg skip themselves when it
+is not on PATH.
+"""
+
+from __future__ import annotations
+
+import base64
+import io
+import json
+import shutil
+import wave
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import numpy as np
+from bson import ObjectId
+
+from app.api.routes.history import _session_response
+from app.api.routes.session_socket import SessionSocketHub
+from app.repositories.session_repository import (
+    SessionRepository,
+    TurnRecord,
+    _doc_from_payload,
+    _session_from_doc,
+    _turn_from_doc,
+    encode_history_cursor,
+)
+from app.services import audio
+from app.services.audio import AudioBuffer, VadConfig
+from app.services.evaluation_service import _parse_tool_call
+from app.services.pubsub import InMemoryPubSub
+from app.services.turn_pipeline import _build_turn_messages
+from benchmarks.suite import SkipCase, case
+from loadtest.fixtures import voice_like_clip
+
+SAMPLE_RATE = 24000
+CLIP_SECONDS = 5
+BASE_TIME = datetime(2025, 1, 6, 9, 0, tzinfo=timezone.utc)
+
+SCENARIO = SimpleNamespace(
+    title="Release date negotiation",
+    description="A product manager wants to ship a risky release on Friday.",
+    ai_persona={"name": "Jordan", "role": "Product manager", "background": "Deadline driven."},
+    trainee_persona={"name": "Sam", "role": "Engineer", "background": "Owns the QA plan."},
+)
+SENTENCE = "I hear you, but shipping on Friday without the regression run worries me. "
+
+
+def _turns(count: int) -> list[TurnRecord]:
+    turns = []
+    for sequence in range(count):
+        turns.append(
+            TurnRecord(
+                id=f"turn-{sequence}",
+                session_id="session-1",
+                sequence=sequence,
+                speaker="ai" if sequence % 2 == 0 else "trainee",
+                transcript=SENTENCE * 2,
+                audio_file_id=f"sessions/session-1/turns/{sequence}.mp3",
+                audio_url=None,
+                asr_status="completed",
+                created_at=(BASE_TIME + timedelta(seconds=10 * sequence)).isoformat(),
+                started_at=(BASE_TIME + timedelta(seconds=10 * sequence)).isoformat(),
+                ended_at=(BASE_TIME + timedelta(seconds=10 * sequence + 6)).isoformat(),
+                context="Sprint review" if sequence == 1 else None,
+                latency_ms=1200,
+            )
+        )
+    # Shuffled the way list_turns may return them; the builder sorts.
+    return turns[1::2] + turns[::2]
+
+
+def _turn_doc(sequence: int) -> dict:
+    started = BASE_TIME + timedelta(seconds=10 * sequence)
+    return {
+        "_id": ObjectId(),
+        "sessionId": "session-1",
+        "sequence": sequence,
+        "speaker": "ai" if sequence % 2 == 0 else "trainee",
+        "transcript": SENTENCE,
+        "audioFileId": f"sessions/session-1/turns/{sequence}.mp3",
+        "audioUrl": None,
+        "asrStatus": "completed",
+        "createdAt": started,
+        "startedAt": started,
+        "endedAt": started + timedelta(seconds=6),
+        "context": None,
+        "latencyMs": 1200,
+        "speechMs": 5400,
+        "timings": {"decodeMs": 3.1, "generationMs": 950.0, "broadcastMs": 0.4},
+    }
+
+
+def _session_doc(index: int) -> dict:
+    started = BASE_TIME - timedelta(hours=index)
+    return {
+        "_id": ObjectId(),
+        "scenarioId": "65a0c0ffee0000000000beef",
+        "stubUserId": "pilot-user",
+        "userId": "user-1",
+        "language": "en",
+        "openingPrompt": {"text": "Friday works, right?"},
+        "status": "ended",
+        "clientSessionStartedAt": started,
+        "startedAt": started,
+        "endedAt": started + timedelta(minutes=6),
+        "totalDurationSeconds": 360,
+        "idleLimitSeconds": 8,
+        "durationLimitSeconds": 300,
+        "wsChannel": "/ws/sessions/x",
+        "objectiveStatus": "succeeded",
+        "objectiveReason": None,
+        "terminationReason": {"reason": "manual"},
+        "evaluationId": "65a0c0ffee0000000000cafe",
+    }
+
+
+def _pcm(seconds: int = CLIP_SECONDS, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    return voice_like_clip(seconds, sample_rate)
+
+
+def _wav(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(samples.tobytes())
+    return buffer.getvalue()
+
+
+def _require_ffmpeg() -> None:
+    if shutil.which("ffmpeg") is None:
+        raise SkipCase("ffmpeg not on PATH")
+
+
+@case("turn_messages.{turns}", turns=(10, 100, 500))
+def turn_messages(turns: int):
+    history = _turns(turns)
+    current = max(history, key=lambda turn: turn.sequence if turn.speaker == "trainee" else -1)
+    # The data URI is cached on the buffer, as it is across one turn's calls.
+    clip = AudioBuffer(bytes(32 * 1024))
+    yield lambda: _build_turn_messages(
+        scenario=SCENARIO, turns=history, current_turn_id=current.id, audio=clip
+    )
+
+
+@case("records.turn_from_doc.100")
+def turn_from_doc():
+    docs = [_turn_doc(sequence) for sequence in range(100)]
+    yield lambda: [_turn_from_doc(doc) for doc in docs]
+
+
+@case("records.session_from_doc.50")
+def session_from_doc():
+    docs = [_session_doc(index) for index in range(50)]
+    yield lambda: [_session_from_doc(doc) for doc in docs]
+
+
+@case("records.doc_from_payload")
+def doc_from_payload():
+    payload = {
+        "sessionId": "session-1",
+        "sequence": 3,
+        "speaker": "trainee",
+        "clientSessionStartedAt": "2025-01-06T09:00:00.000Z",
+        "startedAt": "2025-01-06T09:00:10.250000+00:00",
+        "endedAt": "2025-01-06T09:00:16.500000+00:00",
+        "createdAt": "not a date",
+        "context": None,
+    }
+    yield lambda: _doc_from_payload(payload)
+
+
+@case("audio.decode_base64")
+def decode_base64():
+    encoded = base64.b64encode(_pcm().tobytes()).decode("ascii")
+    yield lambda: audio.decode_audio_base64(encoded)
+
+
+@case("audio.buffer_from_base64_chunks")
+def buffer_from_base64_chunks():
+    encoded = base64.b64encode(_pcm().tobytes()).decode("ascii")
+    # Streamed fragments are not aligned to 4 characters.
+    chunks = [encoded[index : index + 2046] for index in range(0, len(encoded), 2046)]
+    yield lambda: AudioBuffer.from_base64_chunks(chunks)
+
+
+@case("audio.buffer_data_uri")
+def buffer_data_uri():
+    data = _pcm().tobytes()
+    yield lambda: AudioBuffer(data).data_uri("audio/mp3")
+
+
+@case("audio.concatenate_pcm")
+def concatenate_pcm():
+    segments = [_pcm(1) for _ in range(20)]
+    yield lambda: audio.concatenate_pcm(segments, gap_samples=SAMPLE_RATE // 4)
+
+
+@case("audio.detect_speech")
+def detect_speech():
+    config = VadConfig(sample_rate=16000)
+    samples = np.concatenate([np.zeros(8000, dtype=np.int16), _pcm(10, 16000)])
+    yield lambda: audio.detect_speech(samples, config)
+
+
+@case("audio.convert_raw_pcm_to_mp3")
+def convert_raw_pcm_to_mp3():
+    _require_ffmpeg()
+    pcm = _pcm().tobytes()
+    yield lambda: audio.convert_raw_pcm_to_mp3(pcm, SAMPLE_RATE)
+
+
+@case("audio.convert_wav_to_mp3")
+def convert_wav_to_mp3():
+    _require_ffmpeg()
+    wav_bytes = _wav(_pcm())
+    yield lambda: audio.convert_wav_to_mp3(wav_bytes)
+
+
+@case("audio.convert_audio_to_mp3")
+def convert_audio_to_mp3():
+    _require_ffmpeg()
+    wav_bytes = _wav(_pcm())
+    yield lambda: audio.convert_audio_to_mp3(wav_bytes, ".wav")
+
+
+@case("audio.convert_mp3_to_wav")
+def convert_mp3_to_wav():
+    _require_ffmpeg()
+    mp3_bytes = audio.convert_wav_to_mp3(_wav(_pcm()))
+    yield lambda: audio.convert_mp3_to_wav(mp3_bytes)
+
+
+@case("audio.decode_audio_to_pcm")
+def decode_audio_to_pcm():
+    _require_ffmpeg()
+    mp3_bytes = audio.convert_wav_to_mp3(_wav(_pcm()))
+    yield lambda: audio.decode_audio_to_pcm(mp3_bytes, 16000)
+
+
+class _NullSocket:
+    async def accept(self) -> None:
+        return None
+
+    async def send_text(self, message: str) -> None:
+        return None
+
+    async def close(self, code: int = 1000) -> None:
+        return None
+
+
+@case("socket.broadcast.{sockets}", sockets=(1, 10, 100))
+async def socket_broadcast(sockets: int):
+    hub = SessionSocketHub(heartbeat_seconds=0)
+    await hub.start(InMemoryPubSub())
+    for _ in range(sockets):
+        await hub.connect("session-1", _NullSocket())
+    payload = {"type": "ai_turn", "turn": {**_turn_doc(2), "_id": "turn-2"}}
+    payload["turn"] = {key: str(value) for key, value in payload["turn"].items()}
+
+    async def broadcast() -> None:
+        await hub.broadcast("session-1", payload)
+        await hub.drain()
+
+    try:
+        yield broadcast
+    finally:
+        await hub.close()
+
+
+@case("evaluation.parse_tool_call")
+def parse_tool_call():
+    arguments = {
+        "scores": [
+            {"skillId": f"skill-{index}", "rating": 1 + index % 5, "note": SENTENCE * 3}
+            for index in range(6)
+        ],
+        "summary": SENTENCE * 8,
+    }
+    response = {
+        "choices": [
+            {
+                "message": {
+                    "content": None,
+                    "tool_calls": [
+                        {
+                            "id": "call-1",
+                            "type": "function",
+                            "function": {
+                                "name": "evaluation_result",
+                                "arguments": json.dumps(arguments),
+                            },
+                        }
+                    ],
+                }
+            }
+        ]
+    }
+    yield lambda: _parse_tool_call(response)
+
+
+class _Cursor:
+    def __init__(self, docs: list[dict]) -> None:
+        self._docs = docs
+
+    async def to_list(self, length: int | None = None) -> list[dict]:
+        return list(self._docs)
+
+
+class _Collection:
+    """Answers every aggregation with the same documents; no database work."""
+
+    def __init__(self, docs: list[dict]) -> None:
+        self._docs = docs
+
+    async def aggregate(self, pipeline: list[dict]) -> _Cursor:
+        return _Cursor(self._docs)
+
+
+class _Client:
+    def __init__(self, docs: list[dict]) -> None:
+        self._collection = _Collection(docs)
+
+    async def collection(self, name: str) -> _Collection:
+        return self._collection
+
+
+@case("history.list_page")
+async def history_list_page():
+    items = [_session_doc(index) for index in range(20)]
+    repo = SessionRepository(_Client([{"total": [{"count": 500}], "items": items}]))
+
+    async def list_page() -> list[dict]:
+        page = await repo.list_history(
+            stub_user_id="pilot-user",
+            user_id="user-1",
+            category="Negotiation",
+            search="release",
+            page=3,
+            page_size=20,
+        )
+        return [_session_response(item) for item in page.items]
+
+    yield list_page
+
+
+@case("history.list_cursor")
+async def history_list_cursor():
+    docs = [_session_doc(index) for index in range(21)]
+    repo = SessionRepository(_Client(docs))
+    cursor = encode_history_cursor(docs[0])
+
+    async def list_cursor() -> list[dict]:
+        page = await repo.list_history(
+            stub_user_id="pilot-user", user_id="user-1", page_size=20, cursor=cursor
+        )
+        return [_session_response(item) for item in page.items]
+
+    yield list_cursor
@@ -0,0 +1,223 @@
+"""Re-run a recorded practice session against its replayed LLM traffic.
+
+The session's provider calls must have been recorded into a cassette
+(``LLM_CASSETTE_MODE=record``, see ``app.clients.cassette``). Each run
+copies the session's opening turns into a fresh session, feeds every
+trainee turn's archived audio through ``_process_turn`` one after the
+other, then evaluates the copy through ``evaluate_session``. Provider
+responses come from the cassette, with their recorded timing scaled by
+``--time-scale``: 0 leaves only our own overhead in the numbers, 1 adds the
+upstream latency seen when recording.
+
+Per run, the JSON output gives the wall time of each turn, its stored
+latency and stage waterfall, and the evaluation time, followed by the
+median over all runs. Copies are deleted afterwards unless ``--keep``. A
+copy that ends on its objective is also evaluated in the background, as in
+production; the cassette serves that call the same recorded evaluation.
+
+Usage:
+    LLM_CASSETTE_PATH=cassettes/staging.jsonl \\
+        python -m benchmarks.replay_session 65a0c0ffee0000000000beef --time-scale 0 --runs 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import time
+from typing import Any
+
+from bson import ObjectId
+
+
+def _ms(started: float) -> float:
+    return round((time.monotonic() - started) * 1000, 1)
+
+
+async def _settle(before: set[asyncio.Task]) -> None:
+    """Wait for background work the pipeline left behind (e.g. standalone ASR)."""
+    pending = asyncio.all_tasks() - before - {asyncio.current_task()}
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def _copy_session(client, source_id: str) -> tuple[str, list[dict[str, Any]]]:
+    """Copy the session and its turns up to the first trainee turn.
+
+    Returns the copy's id and the source trainee turns, in order.
+    """
+    sessions = await client.collection("PracticeSession")
+    turns = await client.collection("Turn")
+    session = await sessions.find_one({"_id": ObjectId(source_id)})
+    if session is None:
+        raise SystemExit(f"Session {source_id} not found")
+    session.pop("_id")
+    session.update(
+        {
+            "status": "active",
+            "endedAt": None,
+            "objectiveStatus": "unknown",
+            "objectiveReason": None,
+            "terminationReason": None,
+            "evaluationId": None,
+        }
+    )
+    copy_id = str((await sessions.insert_one(session)).inserted_id)
+
+    source_turns = await turns.find({"sessionId": source_id}).sort("sequence", 1).to_list(None)
+    trainee_turns = [turn for turn in source_turns if turn["speaker"] == "trainee"]
+    first_trainee = trainee_turns[0]["sequence"] if trainee_turns else None
+    for turn in source_turns:
+        if first_trainee is not None and turn["sequence"] >= first_trainee:
+            break
+        turn.pop("_id")
+        await turns.insert_one({**turn, "sessionId": copy_id})
+    return copy_id, trainee_turns
+
+
+async def replay_once(source_id: str, *, keep: bool) -> dict[str, Any]:
+    from app.clients.minio import MinioClient
+    from app.clients.mongodb import MongoDBClient
+    from app.config import load_settings
+    from app.repositories.session_repository import SessionRepository
+    from app.services.session_cleanup import cleanup_session
+    from app.services.turn_pipeline import _process_turn
+    from app.tasks.evaluation_runner import _build_repositories, _evaluate_once
+
+    settings = load_settings()
+    client = MongoDBClient(
+        connection_string=f"mongodb://{settings.mongo_host}:{settings.mongo_port}",
+        database=settings.mongo_db,
+    )
+    minio_client = MinioClient(
+        endpoint=settings.minio_endpoint,
+        access_key=settings.minio_access_key,
+        secret_key=settings.minio_secret_key,
+        bucket=settings.minio_bucket,
+    )
+    repo = SessionRepository(client)
+    copy_id, trainee_turns = await _copy_session(client, source_id)
+    run: dict[str, Any] = {"sessionId": copy_id, "turns": []}
+    try:
+        for source_turn in trainee_turns:
+            audio = await minio_client.download_file(source_turn["audioFileId"])
+            turn = await repo.add_turn(
+                {
+                    "sessionId": copy_id,
+                    "sequence": source_turn["sequence"],
+                    "speaker": "trainee",
+                    "transcript": None,
+                    "audioFileId": "pending",
+                    "audioUrl": None,
+                    "asrStatus": "pending",
+                    "startedAt": source_turn.get("startedAt"),
+                    "endedAt": source_turn.get("endedAt"),
+                    "context": source_turn.get("context"),
+                    "latencyMs": None,
+                }
+            )
+            before = asyncio.all_tasks()
+            started = time.monotonic()
+            await _process_turn(session_id=copy_id, turn_id=turn.id, audio_bytes=audio)
+            wall_ms = _ms(started)
+            await _settle(before)
+            replies = [
+                item
+                for item in await repo.list_turns(copy_id)
+                if item.speaker == "ai" and item.sequence > source_turn["sequence"]
+            ]
+            reply = replies[0] if replies else None
+            run["turns"].append(
+                {
+                    "sequence": source_turn["sequence"],
+                    "wallMs": wall_ms,
+                    "latencyMs": reply.latency_ms if reply else None,
+                    "timings": reply.timings if reply else None,
+                }
+            )
+            session = await repo.get_session(copy_id)
+            if session is None or session.status == "ended":
+                break
+
+        repos = await _build_repositories()
+        try:
+            started = time.monotonic()
+            await _evaluate_once(copy_id, repos)
+            run["evaluationMs"] = _ms(started)
+        finally:
+            await repos.mongodb_client.close()
+    finally:
+        await client.close()
+        if not keep:
+            await cleanup_session(copy_id)
+    return run
+
+
+def summarize(runs: list[dict[str, Any]]) -> dict[str, Any]:
+    wall = [turn["wallMs"] for run in runs for turn in run["turns"]]
+    latency = [
+        turn["latencyMs"] for run in runs for turn in run["turns"] if turn["latencyMs"]
+    ]
+    stages: dict[str, list[float]] = {}
+    for run in runs:
+        for turn in run["turns"]:
+            for stage, value in (turn["timings"] or {}).items():
+                stages.setdefault(stage, []).append(value)
+    evaluation = [run["evaluationMs"] for run in runs if "evaluationMs" in run]
+    return {
+        "turnWallMs": round(statistics.median(wall), 1) if wall else None,
+        "turnLatencyMs": round(statistics.median(latency), 1) if latency else None,
+        "stageMs": {
+            stage: round(statistics.median(values), 1) for stage, values in sorted(stages.items())
+        },
+        "evaluationMs": round(statistics.median(evaluation), 1) if evaluation else None,
+    }
+
+
+async def replay(source_id: str, runs: int, keep: bool) -> list[dict[str, Any]]:
+    from app.api.routes.session_socket import hub
+    from app.clients.cassette import reset_cassettes
+
+    # Started up front so its long-lived tasks are not mistaken for turn work.
+    await hub.start()
+    results = []
+    try:
+        for _ in range(runs):
+            # Every run is served the recorded exchanges from the first one on.
+            reset_cassettes()
+            results.append(await replay_once(source_id, keep=keep))
+    finally:
+        await hub.close()
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("session_id", help="Recorded session to re-run.")
+    parser.add_argument("--cassette", default=os.getenv("LLM_CASSETTE_PATH"))
+    parser.add_argument("--time-scale", type=float, default=0.0)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--keep", action="store_true", help="Keep the copied sessions.")
+    args = parser.parse_args(argv)
+    if not args.cassette:
+        parser.error("--cassette or LLM_CASSETTE_PATH is required")
+
+    # Settings are read on every pipeline call, so the environment drives replay.
+    os.environ.update(
+        {
+            "LLM_CASSETTE_MODE": "replay",
+            "LLM_CASSETTE_PATH": args.cassette,
+            "LLM_CASSETTE_SESSION": args.session_id,
+            "LLM_CASSETTE_TIME_SCALE": str(args.time_scale),
+        }
+    )
+    runs = asyncio.run(replay(args.session_id, args.runs, args.keep))
+    print(json.dumps({"runs": runs, "median": summarize(runs)}, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,291 @@
+"""Microbenchmarks for backend hot paths, with a results history.
+
+Each case (see ``benchmarks.hot_paths``) is timed ``timeit``-style: the
+loop count is doubled until one repeat takes ``--min-time`` seconds, then
+``--repeat`` repeats are taken with the garbage collector off, and the
+median and minimum time per call are kept.
+
+Results are compared with the newest entry of the history file recorded on
+the same host and Python version (or the newest one for ``--baseline
+COMMIT``). The run fails when any case's minimum is more than
+``--threshold`` slower than its baseline. ``--save`` appends passing runs to
+the history, so the baseline only moves when nothing regressed.
+
+Usage:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --filter turn_messages --save
+    python -m benchmarks.suite --baseline 0855870 --threshold 0.1
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent
+DEFAULT_HISTORY = BENCHMARKS_DIR / "results" / "history.jsonl"
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_MIN_TIME = 0.05
+DEFAULT_REPEAT = 7
+_MAX_LOOPS = 1 << 20
+
+
+class SkipCase(Exception):
+    """Raised by a case's setup when it cannot run here (e.g. no ffmpeg)."""
+
+
+@dataclass(frozen=True)
+class Case:
+    name: str
+    setup: Callable[..., Any]
+    params: dict[str, Any]
+
+    @property
+    def is_async(self) -> bool:
+        return inspect.isasyncgenfunction(self.setup)
+
+
+CASES: dict[str, Case] = {}
+
+
+def case(name: str, **params: tuple[Any, ...]):
+    """Register a benchmark case.
+
+    The decorated function is a generator (or async generator) that prepares
+    inputs, yields the callable to time and cleans up afterwards. With one
+    keyword parameter, a case is registered per value and ``name`` is
+    formatted with it: ``@case("turn_messages.{turns}", turns=(10, 100))``.
+    """
+
+    def register(setup: Callable[..., Any]) -> Callable[..., Any]:
+        if not params:
+            variants: list[dict[str, Any]] = [{}]
+        else:
+            (key, values), *rest = params.items()
+            if rest:
+                raise ValueError("A benchmark case takes at most one parameter")
+            variants = [{key: value} for value in values]
+        for kwargs in variants:
+            full_name = name.format(**kwargs)
+            if full_name in CASES:
+                raise ValueError(f"Duplicate benchmark case: {full_name}")
+            CASES[full_name] = Case(full_name, setup, kwargs)
+        return setup
+
+    return register
+
+
+def _summary(per_call: list[float], loops: int) -> dict[str, Any]:
+    return {
+        "medianUs": round(statistics.median(per_call) * 1e6, 3),
+        "minUs": round(min(per_call) * 1e6, 3),
+        "loops": loops,
+        "repeats": len(per_call),
+    }
+
+
+def _measure_sync(case_: Case, min_time: float, repeat: int) -> dict[str, Any]:
+    def run(fn: Callable[[], Any], loops: int) -> float:
+        started = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        return time.perf_counter() - started
+
+    with contextmanager(case_.setup)(**case_.params) as fn:
+        fn()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            loops = 1
+            while run(fn, loops) < min_time and loops < _MAX_LOOPS:
+                loops *= 2
+            per_call = [run(fn, loops) / loops for _ in range(repeat)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return _summary(per_call, loops)
+
+
+async def _measure_async(case_: Case, min_time: float, repeat: int) -> dict[str, Any]:
+    async def run(fn: Callable[[], Any], loops: int) -> float:
+        started = time.perf_counter()
+        for _ in range(loops):
+            await fn()
+        return time.perf_counter() - started
+
+    async with asynccontextmanager(case_.setup)(**case_.params) as fn:
+        await fn()
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            loops = 1
+            while await run(fn, loops) < min_time and loops < _MAX_LOOPS:
+                loops *= 2
+            per_call = [await run(fn, loops) / loops for _ in range(repeat)]
+        finally:
+            if gc_enabled:
+                gc.enable()
+    return _summary(per_call, loops)
+
+
+def measure(
+    case_: Case, *, min_time: float = DEFAULT_MIN_TIME, repeat: int = DEFAULT_REPEAT
+) -> dict[str, Any]:
+    """Time one case; returns ``{"skipped": reason}`` when its setup skips it."""
+    try:
+        if case_.is_async:
+            return asyncio.run(_measure_async(case_, min_time, repeat))
+        return _measure_sync(case_, min_time, repeat)
+    except SkipCase as exc:
+        return {"skipped": str(exc)}
+
+
+def machine() -> dict[str, str]:
+    return {
+        "host": platform.node(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+    }
+
+
+def current_commit() -> str:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BENCHMARKS_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return completed.stdout.strip()
+
+
+def load_history(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with path.open() as handle:
+        return [json.loads(line) for line in handle if line.strip()]
+
+
+def find_baseline(
+    history: list[dict[str, Any]], *, host: dict[str, str], commit: str | None = None
+) -> dict[str, Any] | None:
+    """Newest run from the same host and Python, optionally at ``commit``."""
+    for entry in reversed(history):
+        entry_machine = entry.get("machine", {})
+        if entry_machine.get("host") != host["host"]:
+            continue
+        if entry_machine.get("python") != host["python"]:
+            continue
+        if commit and not str(entry.get("commit", "")).startswith(commit):
+            continue
+        return entry
+    return None
+
+
+def compare(
+    results: dict[str, dict[str, Any]],
+    baseline: dict[str, dict[str, Any]] | None,
+    threshold: float,
+) -> list[dict[str, Any]]:
+    """Per-case change against ``baseline``; ``regressed`` beyond ``threshold``.
+
+    Minimum times are compared: on a shared machine other load only ever
+    adds time, so the minimum is far steadier than the median.
+    """
+    rows = []
+    for name, result in results.items():
+        row: dict[str, Any] = {"name": name, **result}
+        before = (baseline or {}).get(name, {}).get("minUs")
+        if "minUs" in result and before:
+            change = result["minUs"] / before - 1
+            row["baselineUs"] = before
+            row["change"] = round(change, 4)
+            row["regressed"] = change > threshold
+        rows.append(row)
+    return rows
+
+
+def _format_row(row: dict[str, Any]) -> str:
+    if "skipped" in row:
+        return f"{row['name']:<40} {'skipped: ' + row['skipped']}"
+    line = f"{row['name']:<36} {row['minUs']:>10.2f} us  (median {row['medianUs']:.2f})"
+    if "change" in row:
+        flag = "  REGRESSION" if row["regressed"] else ""
+        line += f"  baseline {row['baselineUs']:.2f} us, {row['change']:+.1%}{flag}"
+    return line
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--filter", default="", help="Only cases whose name contains this.")
+    parser.add_argument("--min-time", type=float, default=DEFAULT_MIN_TIME)
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--baseline", help="Compare with the newest run at this commit.")
+    parser.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    parser.add_argument("--save", action="store_true", help="Append a passing run to history.")
+    args = parser.parse_args(argv)
+
+    import benchmarks.hot_paths  # noqa: F401  (registers the cases)
+
+    selected = [CASES[name] for name in sorted(CASES) if args.filter in name]
+    if not selected:
+        print(f"No benchmark case matches {args.filter!r}", file=sys.stderr)
+        return 2
+
+    host = machine()
+    results = {}
+    for case_ in selected:
+        results[case_.name] = measure(case_, min_time=args.min_time, repeat=args.repeat)
+    baseline = find_baseline(load_history(args.history), host=host, commit=args.baseline)
+    rows = compare(results, baseline["results"] if baseline else None, args.threshold)
+    if baseline:
+        print(f"Baseline: {baseline['commit']} recorded {baseline['recordedAt']}")
+    else:
+        print("No baseline for this host and Python version yet.")
+    for row in rows:
+        print(_format_row(row))
+
+    regressions = [row["name"] for row in rows if row.get("regressed")]
+    if regressions:
+        print(
+            f"{len(regressions)} case(s) regressed by more than {args.threshold:.0%}: "
+            + ", ".join(regressions),
+            file=sys.stderr,
+        )
+        return 1
+    if args.save:
+        args.history.parent.mkdir(parents=True, exist_ok=True)
+        entry = {
+            "recordedAt": datetime.now(timezone.utc).isoformat(),
+            "commit": current_commit(),
+            "machine": host,
+            "results": results,
+        }
+        with args.history.open("a") as handle:
+            handle.write(json.dumps(entry, sort_keys=True) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    # Under ``python -m`` this file is ``__main__``; the cases register with
+    # (and raise ``SkipCase`` from) the importable ``benchmarks.suite``.
+    from benchmarks import suite
+
+    raise SystemExit(suite.main())
@@ -0,0 +1,7 @@
+"""Offline load test: simulated trainees against one backend and fake providers.
+
+``python -m loadtest --trainees 20`` starts ``loadtest.providers`` (a
+stand-in for DashScope and the evaluator), starts the backend through
+``loadtest.serve``, drives the trainees through the public API and the
+session socket, and prints a JSON report (see ``loadtest.report``).
+"""
@@ -0,0 +1,41 @@
+"""Synthetic speech shared by the load test and the benchmarks.
+
+Deterministic, so runs compare like for like without a recorded clip.
+"""
+
+from __future__ import annotations
+
+import io
+import wave
+
+import numpy as np
+
+FIXTURE_SAMPLE_RATE = 16000
+LEADING_SILENCE_SECONDS = 0.3
+TRAILING_SILENCE_SECONDS = 0.6
+
+
+def voice_like_clip(seconds: int, sample_rate: int) -> np.ndarray:
+    """Mono int16 PCM with a gliding pitch, harmonics and a syllable envelope."""
+    t = np.arange(seconds * sample_rate) / sample_rate
+    pitch = 140 + 30 * np.sin(2 * np.pi * 0.5 * t)
+    phase = 2 * np.pi * np.cumsum(pitch) / sample_rate
+    voiced = sum(np.sin(harmonic * phase) / harmonic for harmonic in range(1, 8))
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 4 * t)) ** 2 / 4
+    noise = np.random.default_rng(0).normal(0, 0.02, len(t))
+    signal = (voiced * envelope * 0.4 + noise) * 32767
+    return np.clip(signal, -32768, 32767).astype(np.int16)
+
+
+def speech_fixture(speech_seconds: int = 4) -> bytes:
+    """WAV clip: short silence, voice-like audio, then the trailing pause."""
+    voice = voice_like_clip(speech_seconds, FIXTURE_SAMPLE_RATE)
+    leading = np.zeros(int(LEADING_SILENCE_SECONDS * FIXTURE_SAMPLE_RATE), dtype=np.int16)
+    trailing = np.zeros(int(TRAILING_SILENCE_SECONDS * FIXTURE_SAMPLE_RATE), dtype=np.int16)
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(FIXTURE_SAMPLE_RATE)
+        wav.writeframes(np.concatenate([leading, voice, trailing]).tobytes())
+    return buffer.getvalue()
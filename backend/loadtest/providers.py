@@ -0,0 +1,283 @@
+"""Local stand-in for the DashScope and evaluator chat-completions APIs.
+
+One ``POST /chat/completions`` endpoint answers every request the backend
+makes, recognised by its shape:
+
+- ASR (system prompt of ``QwenClient.asr``): a streamed fixed transcript.
+- Tool calls (objective check, evaluation): the tool named by
+  ``tool_choice`` with a ``continue`` status or a score per listed skill.
+- Anything else is reply generation: streamed text chunks and, when the
+  request asks for audio, 24 kHz 16-bit PCM chunks as base64, like the omni
+  model.
+
+Latencies are configurable and jittered so runs resemble the real services
+without any network access.
+
+Usage:
+    python -m loadtest.providers --port 8090 --first-chunk-ms 400
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import random
+import re
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, AsyncIterator
+
+import numpy as np
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+
+AUDIO_SAMPLE_RATE = 24000
+AUDIO_CHUNK_SECONDS = 0.1
+ASR_SYSTEM_PROMPT = "You are a speech-to-text service"
+TRAINEE_TRANSCRIPT = "I think we can ship on Friday if QA signs off by Thursday."
+REPLY_TEXT = (
+    "Friday is tight. What happens to the release if QA finds a blocker on "
+    "Thursday afternoon, and who makes the call to slip?"
+)
+_SKILL_LINE = re.compile(r"^(\S+): ")
+
+
+@dataclass(frozen=True)
+class ProviderConfig:
+    """Latency model of the fake providers; all times in milliseconds."""
+
+    first_chunk_ms: float = 400.0
+    chunk_interval_ms: float = 40.0
+    jitter: float = 0.2
+    reply_audio_seconds: float = 3.0
+    asr_ms: float = 300.0
+    tool_call_ms: float = 150.0
+    evaluation_ms: float = 1500.0
+    error_rate: float = 0.0
+
+
+def _reply_audio(seconds: float) -> bytes:
+    t = np.arange(int(seconds * AUDIO_SAMPLE_RATE)) / AUDIO_SAMPLE_RATE
+    tone = 0.2 * np.sin(2 * np.pi * 180 * t) * (0.6 + 0.4 * np.sin(2 * np.pi * 3 * t))
+    return (tone * 32767).astype("<i2").tobytes()
+
+
+def _text_chunks(text: str, count: int) -> list[str]:
+    words = text.split(" ")
+    size = max(1, -(-len(words) // count))
+    return [
+        " ".join(words[start : start + size]) + ("" if start + size >= len(words) else " ")
+        for start in range(0, len(words), size)
+    ]
+
+
+def _message_text(message: dict[str, Any]) -> str:
+    content = message.get("content")
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return " ".join(part.get("text", "") for part in content if isinstance(part, dict))
+    return ""
+
+
+def _skill_ids(messages: list[dict[str, Any]]) -> list[str]:
+    """Skill ids from the ``Skills:`` block of the evaluation prompt."""
+    text = "\n".join(_message_text(message) for message in messages)
+    _, _, rest = text.partition("Skills:\n")
+    skills_block, _, _ = rest.partition("\nTranscript:")
+    ids = []
+    for line in skills_block.splitlines():
+        match = _SKILL_LINE.match(line)
+        if match:
+            ids.append(match.group(1))
+    return ids
+
+
+def _evaluation(messages: list[dict[str, Any]]) -> dict[str, Any]:
+    return {
+        "scores": [
+            {"skillId": skill_id, "rating": 3, "note": "Load-test placeholder score."}
+            for skill_id in _skill_ids(messages)
+        ],
+        "summary": "Load-test placeholder evaluation.",
+    }
+
+
+def _chunk(model: str, delta: dict[str, Any], finish_reason: str | None = None) -> str:
+    payload = {
+        "id": "chatcmpl-loadtest",
+        "object": "chat.completion.chunk",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+    }
+    return f"data: {json.dumps(payload)}\n\n"
+
+
+def _completion(model: str, message: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "id": "chatcmpl-loadtest",
+        "object": "chat.completion",
+        "created": int(time.time()),
+        "model": model,
+        "choices": [{"index": 0, "message": message, "finish_reason": "stop"}],
+        "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0},
+    }
+
+
+class FakeProvider:
+    def __init__(self, config: ProviderConfig, *, seed: int | None = None) -> None:
+        self.config = config
+        self._random = random.Random(seed)
+        self._audio = _reply_audio(config.reply_audio_seconds)
+        self.requests: dict[str, int] = {}
+
+    async def _wait(self, milliseconds: float) -> None:
+        jitter = self.config.jitter
+        factor = self._random.uniform(1 - jitter, 1 + jitter) if jitter else 1.0
+        await asyncio.sleep(max(0.0, milliseconds * factor) / 1000)
+
+    def _count(self, kind: str) -> None:
+        self.requests[kind] = self.requests.get(kind, 0) + 1
+
+    async def chat_completions(self, request: Request) -> Response:
+        body = await request.json()
+        model = body.get("model") or "loadtest"
+        messages = body.get("messages") or []
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            self._count("error")
+            return JSONResponse({"error": {"message": "injected failure"}}, status_code=503)
+
+        if body.get("tools"):
+            name = ((body.get("tool_choice") or {}).get("function") or {}).get("name")
+            if name == "evaluation_result":
+                self._count("evaluation")
+                await self._wait(self.config.evaluation_ms)
+                arguments = _evaluation(messages)
+            else:
+                self._count("tool_call")
+                await self._wait(self.config.tool_call_ms)
+                arguments = {"status": "continue", "reason": "Load test keeps going."}
+            tool_call = {
+                "id": f"call_{uuid.uuid4().hex[:12]}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(arguments)},
+            }
+            message = {"role": "assistant", "content": None, "tool_calls": [tool_call]}
+            return JSONResponse(_completion(model, message))
+
+        system = next((m for m in messages if m.get("role") == "system"), {})
+        if _message_text(system).startswith(ASR_SYSTEM_PROMPT):
+            self._count("asr")
+            return await self._respond(body, model, [TRAINEE_TRANSCRIPT], self.config.asr_ms)
+
+        if "Return only JSON" in _message_text(system):
+            self._count("evaluation")
+            await self._wait(self.config.evaluation_ms)
+            content = json.dumps(_evaluation(messages))
+            return JSONResponse(_completion(model, {"role": "assistant", "content": content}))
+
+        self._count("generation")
+        text = REPLY_TEXT
+        if any("<transcript>" in _message_text(message) for message in messages):
+            text = f"<transcript>{TRAINEE_TRANSCRIPT}</transcript>\n{REPLY_TEXT}"
+        audio = self._audio if body.get("audio") else b""
+        step = int(AUDIO_CHUNK_SECONDS * AUDIO_SAMPLE_RATE) * 2
+        audio_chunks = [audio[start : start + step] for start in range(0, len(audio), step)]
+        text_chunks = _text_chunks(text, min(len(audio_chunks), 12) or 12)
+        return await self._respond(
+            body, model, text_chunks, self.config.first_chunk_ms, audio_chunks
+        )
+
+    async def _respond(
+        self,
+        body: dict[str, Any],
+        model: str,
+        text_chunks: list[str],
+        first_chunk_ms: float,
+        audio_chunks: list[bytes] | None = None,
+    ) -> Response:
+        audio_chunks = audio_chunks or []
+        if not body.get("stream"):
+            await self._wait(first_chunk_ms)
+            message: dict[str, Any] = {"role": "assistant", "content": "".join(text_chunks)}
+            if audio_chunks:
+                message["audio"] = {"data": base64.b64encode(b"".join(audio_chunks)).decode()}
+            return JSONResponse(_completion(model, message))
+
+        async def events() -> AsyncIterator[str]:
+            await self._wait(first_chunk_ms)
+            for index in range(max(len(text_chunks), len(audio_chunks))):
+                if index:
+                    await self._wait(self.config.chunk_interval_ms)
+                delta: dict[str, Any] = {}
+                if index < len(text_chunks):
+                    delta["content"] = text_chunks[index]
+                if index < len(audio_chunks):
+                    delta["audio"] = {"data": base64.b64encode(audio_chunks[index]).decode()}
+                yield _chunk(model, delta)
+            yield _chunk(model, {}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    async def stats(self, request: Request) -> Response:
+        return JSONResponse({"requests": self.requests})
+
+
+def create_app(config: ProviderConfig | None = None, *, seed: int | None = None) -> Starlette:
+    provider = FakeProvider(config or ProviderConfig(), seed=seed)
+    app = Starlette(
+        routes=[
+            Route("/chat/completions", provider.chat_completions, methods=["POST"]),
+            Route("/stats", provider.stats, methods=["GET"]),
+        ]
+    )
+    app.state.provider = provider
+    return app
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--first-chunk-ms", type=float, default=ProviderConfig.first_chunk_ms)
+    parser.add_argument(
+        "--chunk-interval-ms", type=float, default=ProviderConfig.chunk_interval_ms
+    )
+    parser.add_argument("--jitter", type=float, default=ProviderConfig.jitter)
+    parser.add_argument(
+        "--reply-audio-seconds", type=float, default=ProviderConfig.reply_audio_seconds
+    )
+    parser.add_argument("--asr-ms", type=float, default=ProviderConfig.asr_ms)
+    parser.add_argument("--tool-call-ms", type=float, default=ProviderConfig.tool_call_ms)
+    parser.add_argument("--evaluation-ms", type=float, default=ProviderConfig.evaluation_ms)
+    parser.add_argument("--error-rate", type=float, default=ProviderConfig.error_rate)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    import uvicorn
+
+    config = ProviderConfig(
+        first_chunk_ms=args.first_chunk_ms,
+        chunk_interval_ms=args.chunk_interval_ms,
+        jitter=args.jitter,
+        reply_audio_seconds=args.reply_audio_seconds,
+        asr_ms=args.asr_ms,
+        tool_call_ms=args.tool_call_ms,
+        evaluation_ms=args.evaluation_ms,
+        error_rate=args.error_rate,
+    )
+    uvicorn.run(
+        create_app(config, seed=args.seed), host=args.host, port=args.port, log_level="warning"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
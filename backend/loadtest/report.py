@@ -0,0 +1,167 @@
+"""Load-test results and the JSON report built from them.
+
+Client-side numbers come from the load generator:
+
+- ``turnLatencyMs``: from sending a trainee turn to receiving its
+  ``ai_turn`` message on the session socket.
+- ``timeToFirstAudioMs``: from sending the turn to the first byte of the
+  reply audio downloaded from its ``audioUrl``.
+- ``sessionCreateMs``: ``POST /api/sessions`` round trip.
+
+Server-side numbers are read from the backend's ``/api/metrics`` at the end
+of the run: event-loop lag and the mean of each turn stage. Percentiles are
+nearest-rank over all samples, except the server histograms, which are
+interpolated within buckets.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any
+
+QUANTILES = (0.5, 0.95, 0.99)
+_SAMPLE_LINE = re.compile(r"^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})?\s+(\S+)$")
+_LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def percentile(values: list[float], q: float) -> float | None:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def distribution(values: list[float]) -> dict[str, Any]:
+    summary: dict[str, Any] = {"count": len(values)}
+    for q in QUANTILES:
+        value = percentile(values, q)
+        summary[f"p{round(q * 100)}"] = round(value, 1) if value is not None else None
+    summary["max"] = round(max(values), 1) if values else None
+    return summary
+
+
+@dataclass
+class LoadResults:
+    session_create_ms: list[float] = field(default_factory=list)
+    turn_latency_ms: list[float] = field(default_factory=list)
+    time_to_first_audio_ms: list[float] = field(default_factory=list)
+    errors: Counter = field(default_factory=Counter)
+    sessions_started: int = 0
+    sessions_completed: int = 0
+    turns_attempted: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    ended_at: float | None = None
+
+    def error(self, kind: str) -> None:
+        self.errors[kind] += 1
+
+    def finish(self) -> None:
+        self.ended_at = time.monotonic()
+
+
+def parse_prometheus(text: str) -> list[tuple[str, dict[str, str], float]]:
+    """``(name, labels, value)`` for every sample line of a text exposition."""
+    samples = []
+    for line in text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        match = _SAMPLE_LINE.match(line.strip())
+        if not match:
+            continue
+        name, raw_labels, raw_value = match.groups()
+        labels = {key: value for key, value in _LABEL.findall(raw_labels or "")}
+        samples.append((name, labels, float(raw_value)))
+    return samples
+
+
+def histogram_quantile(buckets: list[tuple[float, float]], q: float) -> float | None:
+    """Quantile from cumulative ``(le, count)`` buckets, as PromQL computes it."""
+    buckets = sorted(buckets)
+    if not buckets or buckets[-1][1] <= 0:
+        return None
+    rank = q * buckets[-1][1]
+    lower_bound, lower_count = 0.0, 0.0
+    for bound, count in buckets:
+        if count >= rank:
+            if math.isinf(bound):
+                return lower_bound
+            if count == lower_count:
+                return bound
+            return lower_bound + (bound - lower_bound) * (rank - lower_count) / (
+                count - lower_count
+            )
+        lower_bound, lower_count = bound, count
+    return buckets[-1][0]
+
+
+def server_summary(metrics_text: str) -> dict[str, Any]:
+    samples = parse_prometheus(metrics_text)
+    lag_buckets: dict[float, float] = {}
+    lag_count = 0.0
+    stage_sums: dict[str, float] = {}
+    stage_counts: dict[str, float] = {}
+    for name, labels, value in samples:
+        if name == "event_loop_lag_ms_bucket":
+            bound = math.inf if labels["le"] == "+Inf" else float(labels["le"])
+            lag_buckets[bound] = lag_buckets.get(bound, 0.0) + value
+        elif name == "event_loop_lag_ms_count":
+            lag_count += value
+        elif name == "turn_stage_ms_sum" and "stage" in labels:
+            stage_sums[labels["stage"]] = value
+        elif name == "turn_stage_ms_count" and "stage" in labels:
+            stage_counts[labels["stage"]] = value
+
+    lag: dict[str, Any] | None = None
+    if lag_count:
+        buckets = list(lag_buckets.items())
+        lag = {"samples": int(lag_count)}
+        for q in QUANTILES:
+            lag[f"p{round(q * 100)}"] = round(histogram_quantile(buckets, q) or 0.0, 2)
+    return {
+        "eventLoopLagMs": lag,
+        "stageMeanMs": {
+            stage: round(stage_sums.get(stage, 0.0) / count, 1)
+            for stage, count in sorted(stage_counts.items())
+            if count
+        },
+    }
+
+
+def build_report(
+    results: LoadResults, *, config: dict[str, Any], metrics_text: str | None = None
+) -> dict[str, Any]:
+    ended_at = results.ended_at if results.ended_at is not None else time.monotonic()
+    duration = max(ended_at - results.started_at, 1e-9)
+    turns_completed = len(results.turn_latency_ms)
+    error_total = sum(results.errors.values())
+    report: dict[str, Any] = {
+        "config": config,
+        "durationSeconds": round(duration, 1),
+        "sessions": {
+            "started": results.sessions_started,
+            "completed": results.sessions_completed,
+        },
+        "turns": {
+            "attempted": results.turns_attempted,
+            "completed": turns_completed,
+            "perSecond": round(turns_completed / duration, 2),
+        },
+        "turnLatencyMs": distribution(results.turn_latency_ms),
+        "timeToFirstAudioMs": distribution(results.time_to_first_audio_ms),
+        "sessionCreateMs": distribution(results.session_create_ms),
+        "errors": {
+            "total": error_total,
+            "byKind": dict(sorted(results.errors.items())),
+            "turnErrorRate": round(
+                (results.turns_attempted - turns_completed) / results.turns_attempted, 4
+            )
+            if results.turns_attempted
+            else None,
+        },
+    }
+    report["server"] = server_summary(metrics_text) if metrics_text else None
+    return report
@@ -0,0 +1,492 @@
+"""Drive simulated trainees through one backend instance and report latency.
+
+Each trainee creates a session, opens its socket, waits for the opening AI
+turn, then sends ``--turns`` trainee turns of a fixed speech clip through
+``POST /api/sessions/{id}/turns``, waiting for each ``ai_turn`` and fetching
+its audio before thinking for ``--think-seconds`` and replying again. The
+session is stopped manually at the end. Trainees start evenly over
+``--ramp-seconds`` and each uses its own ``X-User-Id`` so the per-user
+session cap does not apply.
+
+By default the harness starts ``loadtest.providers`` and ``loadtest.serve``
+as subprocesses with the backend pointed at the fake providers, a fresh
+``loadtest_<timestamp>`` database and a fresh bucket, both removed at the
+end unless ``--keep-data`` is given. MongoDB and MinIO come from the usual
+``MONGO_*``/``MINIO_*`` variables (``docker compose up -d mongodb minio``).
+With ``--target`` it drives an already running backend instead.
+
+Usage:
+    python -m loadtest --trainees 20 --turns 5 --ramp-seconds 10
+    python -m loadtest --target http://127.0.0.1:8000 --admin-token "$ADMIN_ACCESS_TOKEN"
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from contextlib import suppress
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from loadtest.fixtures import speech_fixture
+from loadtest.providers import ProviderConfig
+from loadtest.report import LoadResults, build_report
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+PONG_MESSAGE = json.dumps({"type": "pong"})
+REPLY_TYPES = {"ai_turn", "turn_error", "termination", "closed"}
+
+
+def _iso(moment: datetime) -> str:
+    return moment.isoformat()
+
+
+def _elapsed_ms(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
+
+
+class SessionInbox:
+    """Replies received on a session socket; pings are answered as they come."""
+
+    def __init__(self, websocket: Any) -> None:
+        self._websocket = websocket
+        self._replies: asyncio.Queue[dict[str, Any]] = asyncio.Queue()
+        self._reader = asyncio.create_task(self._read())
+
+    async def _read(self) -> None:
+        try:
+            async for raw in self._websocket:
+                try:
+                    message = json.loads(raw)
+                except (TypeError, ValueError):
+                    continue
+                if message.get("type") == "ping":
+                    await self._websocket.send(PONG_MESSAGE)
+                elif message.get("type") in REPLY_TYPES:
+                    self._replies.put_nowait(message)
+        finally:
+            self._replies.put_nowait({"type": "closed"})
+
+    async def next_reply(self, timeout: float) -> dict[str, Any]:
+        return await asyncio.wait_for(self._replies.get(), timeout)
+
+    async def close(self) -> None:
+        self._reader.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await self._reader
+
+
+async def seed_scenario(http: httpx.AsyncClient, admin_token: str) -> str:
+    """Create and publish a skill and scenario to practice against."""
+    headers = {"X-Admin-Token": admin_token}
+    skill = await http.post(
+        "/api/admin/skills",
+        headers=headers,
+        json={
+            "name": "Pushing back on deadlines",
+            "category": "loadtest",
+            "rubric": "States risks and proposes a concrete alternative.",
+            "description": "Load-test skill.",
+        },
+    )
+    skill.raise_for_status()
+    scenario = await http.post(
+        "/api/admin/scenarios",
+        headers=headers,
+        json={
+            "category": "loadtest",
+            "title": "Release date negotiation",
+            "description": "A product manager wants to ship a risky release on Friday.",
+            "objective": "Agree on a release date with a clear QA gate.",
+            "aiPersona": {"name": "Jordan", "role": "Product manager", "background": "Pushy."},
+            "traineePersona": {"name": "Sam", "role": "Engineer", "background": "Cautious."},
+            "endCriteria": ["A date and a QA gate are agreed"],
+            "skills": [skill.json()["id"]],
+            "idleLimitSeconds": 600,
+            "durationLimitSeconds": 3600,
+        },
+    )
+    scenario.raise_for_status()
+    scenario_id = scenario.json()["id"]
+    published = await http.post(f"/api/admin/scenarios/{scenario_id}/publish", headers=headers)
+    published.raise_for_status()
+    return scenario_id
+
+
+async def _first_audio_byte(http: httpx.AsyncClient, url: str) -> bool:
+    async with http.stream("GET", url, follow_redirects=True) as response:
+        if response.status_code != 200:
+            return False
+        async for chunk in response.aiter_bytes():
+            if chunk:
+                return True
+    return False
+
+
+async def run_trainee(
+    index: int,
+    *,
+    http: httpx.AsyncClient,
+    ws_base: str,
+    scenario_id: str,
+    audio_base64: str,
+    speech_seconds: float,
+    turns: int,
+    think_seconds: float,
+    reply_timeout: float,
+    results: LoadResults,
+) -> None:
+    import websockets
+
+    headers = {"X-User-Id": f"loadtest-trainee-{index}"}
+    started = time.perf_counter()
+    try:
+        created = await http.post(
+            "/api/sessions",
+            headers=headers,
+            json={
+                "scenarioId": scenario_id,
+                "clientSessionStartedAt": _iso(datetime.now(timezone.utc)),
+            },
+        )
+    except httpx.HTTPError:
+        results.error("session_create_failed")
+        return
+    if created.status_code != 201:
+        results.error(f"session_create_{created.status_code}")
+        return
+    results.session_create_ms.append(_elapsed_ms(started))
+    results.sessions_started += 1
+    session_id = created.json()["id"]
+
+    try:
+        async with websockets.connect(f"{ws_base}/ws/sessions/{session_id}") as websocket:
+            inbox = SessionInbox(websocket)
+            try:
+                outcome = await _converse(
+                    http,
+                    inbox,
+                    session_id=session_id,
+                    audio_base64=audio_base64,
+                    speech_seconds=speech_seconds,
+                    turns=turns,
+                    think_seconds=think_seconds,
+                    reply_timeout=reply_timeout,
+                    results=results,
+                )
+            finally:
+                await inbox.close()
+    except (OSError, websockets.exceptions.WebSocketException):
+        results.error("socket_failed")
+        outcome = "failed"
+
+    if outcome != "ended":
+        # Stop failed sessions too, so they do not hold server resources.
+        try:
+            stopped = await http.post(
+                f"/api/sessions/{session_id}/manual-stop", json={"reason": "manual"}
+            )
+        except httpx.HTTPError:
+            results.error("manual_stop_failed")
+            return
+        if stopped.status_code != 202:
+            results.error(f"manual_stop_{stopped.status_code}")
+            return
+    if outcome == "completed":
+        results.sessions_completed += 1
+
+
+async def _converse(
+    http: httpx.AsyncClient,
+    inbox: SessionInbox,
+    *,
+    session_id: str,
+    audio_base64: str,
+    speech_seconds: float,
+    turns: int,
+    think_seconds: float,
+    reply_timeout: float,
+    results: LoadResults,
+) -> str:
+    """Wait for the opening turn, then send the trainee turns.
+
+    Returns ``completed``, ``failed``, or ``ended`` when the server closed
+    the session itself.
+    """
+    try:
+        reply = await inbox.next_reply(reply_timeout)
+    except asyncio.TimeoutError:
+        results.error("opening_turn_timeout")
+        return "failed"
+    if reply["type"] != "ai_turn":
+        results.error(f"opening_{reply['type']}")
+        return "ended" if reply["type"] == "termination" else "failed"
+
+    for number in range(turns):
+        if number:
+            await asyncio.sleep(think_seconds)
+        next_sequence = reply["turn"]["sequence"] + 1
+        now = datetime.now(timezone.utc)
+        results.turns_attempted += 1
+        sent = time.perf_counter()
+        # The request returns once the pipeline is done; the reply arrives on the socket first.
+        submit = asyncio.create_task(
+            http.post(
+                f"/api/sessions/{session_id}/turns",
+                json={
+                    "sequence": next_sequence,
+                    "audioBase64": audio_base64,
+                    "startedAt": _iso(now - timedelta(seconds=speech_seconds)),
+                    "endedAt": _iso(now),
+                },
+            )
+        )
+        try:
+            reply = await inbox.next_reply(reply_timeout)
+        except asyncio.TimeoutError:
+            submit.cancel()
+            results.error("turn_timeout")
+            return "failed"
+        latency_ms = _elapsed_ms(sent)
+        try:
+            receipt = await submit
+        except httpx.HTTPError:
+            results.error("turn_submit_failed")
+            return "failed"
+        if receipt.status_code != 202:
+            results.error(f"turn_submit_{receipt.status_code}")
+            return "failed"
+
+        if reply["type"] == "termination":
+            results.error("session_terminated")
+            return "ended"
+        if reply["type"] != "ai_turn":
+            results.error(reply["type"])
+            return "failed"
+        results.turn_latency_ms.append(latency_ms)
+        audio_url = reply["turn"].get("audioUrl")
+        if not audio_url:
+            results.error("reply_without_audio")
+            continue
+        try:
+            if await _first_audio_byte(http, audio_url):
+                results.time_to_first_audio_ms.append(_elapsed_ms(sent))
+            else:
+                results.error("reply_audio_fetch")
+        except httpx.HTTPError:
+            results.error("reply_audio_fetch")
+    return "completed"
+
+
+async def run_load(args: argparse.Namespace, base_url: str, admin_token: str) -> dict[str, Any]:
+    audio = Path(args.audio).read_bytes() if args.audio else speech_fixture(args.speech_seconds)
+    audio_base64 = base64.b64encode(audio).decode("ascii")
+    ws_base = "ws" + base_url.removeprefix("http")
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=args.trainees)
+    async with httpx.AsyncClient(
+        base_url=base_url, timeout=args.reply_timeout, limits=limits
+    ) as http:
+        scenario_id = args.scenario_id or await seed_scenario(http, admin_token)
+        results = LoadResults()
+
+        async def trainee(index: int) -> None:
+            await asyncio.sleep(index * args.ramp_seconds / max(args.trainees, 1))
+            await run_trainee(
+                index,
+                http=http,
+                ws_base=ws_base,
+                scenario_id=scenario_id,
+                audio_base64=audio_base64,
+                speech_seconds=args.speech_seconds,
+                turns=args.turns,
+                think_seconds=args.think_seconds,
+                reply_timeout=args.reply_timeout,
+                results=results,
+            )
+
+        await asyncio.gather(*(trainee(index) for index in range(args.trainees)))
+        results.finish()
+        metrics_text = None
+        with suppress(httpx.HTTPError):
+            response = await http.get("/api/metrics")
+            if response.status_code == 200:
+                metrics_text = response.text
+
+    config = {
+        "trainees": args.trainees,
+        "turnsPerSession": args.turns,
+        "rampSeconds": args.ramp_seconds,
+        "thinkSeconds": args.think_seconds,
+        "speechSeconds": args.speech_seconds,
+        "target": base_url,
+    }
+    return build_report(results, config=config, metrics_text=metrics_text)
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def _spawn(module: str, arguments: list[str], env: dict[str, str]) -> subprocess.Popen:
+    return subprocess.Popen(
+        [sys.executable, "-m", module, *arguments], cwd=BACKEND_DIR, env=env
+    )
+
+
+def _wait_until_ready(url: str, process: subprocess.Popen, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url} exited with status {process.returncode} before starting")
+        with suppress(httpx.HTTPError):
+            if httpx.get(url, timeout=1.0).status_code < 500:
+                return
+        time.sleep(0.2)
+    raise RuntimeError(f"{url} did not become ready within {timeout:.0f}s")
+
+
+def backend_env(args: argparse.Namespace, provider_url: str, admin_token: str) -> dict[str, str]:
+    """Environment for a backend that talks to the fake providers only."""
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S")
+    return {
+        **os.environ,
+        "QWEN_API_BASE": provider_url,
+        "CHATAI_API_BASE": provider_url,
+        "OBJECTIVE_CHECK_API_BASE": provider_url,
+        "DASHSCOPE_API_KEY": "loadtest",
+        "CHATAI_API_KEY": "loadtest",
+        "OBJECTIVE_CHECK_API_KEY": "loadtest",
+        "CHATAI_API_MODEL": "loadtest",
+        "EVALUATOR_MODEL": "loadtest",
+        "OBJECTIVE_CHECK_MODEL": "loadtest",
+        "QWEN_VOICE_ID": args.voice,
+        "STUB_USER_ID": "loadtest",
+        "ADMIN_ACCESS_TOKEN": admin_token,
+        "ADMIN_AUTH_DISABLED": "false",
+        "MONGO_DB": f"loadtest_{run_id}",
+        "MINIO_BUCKET": f"loadtest-{run_id}",
+        "METRICS_FLUSH_SECONDS": "0",
+        "GC_ENABLED": "false",
+    }
+
+
+def drop_run_data(env: dict[str, str]) -> None:
+    """Remove the database and bucket a harness-started backend wrote to."""
+    from minio import Minio
+    from pymongo import MongoClient
+
+    mongo = MongoClient(
+        env.get("MONGO_HOST", "localhost"),
+        int(env.get("MONGO_PORT", "27017")),
+        serverSelectionTimeoutMS=5000,
+    )
+    try:
+        mongo.drop_database(env["MONGO_DB"])
+    finally:
+        mongo.close()
+
+    bucket = env["MINIO_BUCKET"]
+    minio = Minio(
+        env.get("MINIO_ENDPOINT", "localhost:9000"),
+        access_key=env.get("MINIO_ACCESS_KEY", "minioadmin"),
+        secret_key=env.get("MINIO_SECRET_KEY", "minioadmin"),
+        secure=False,
+    )
+    if minio.bucket_exists(bucket):
+        for item in minio.list_objects(bucket, recursive=True):
+            minio.remove_object(bucket, item.object_name)
+        minio.remove_bucket(bucket)
+
+
+def _provider_arguments(args: argparse.Namespace, port: int) -> list[str]:
+    return [
+        "--port", str(port),
+        "--first-chunk-ms", str(args.first_chunk_ms),
+        "--chunk-interval-ms", str(args.chunk_interval_ms),
+        "--reply-audio-seconds", str(args.reply_audio_seconds),
+        "--asr-ms", str(args.asr_ms),
+        "--evaluation-ms", str(args.evaluation_ms),
+        "--error-rate", str(args.provider_error_rate),
+        "--seed", "0",
+    ]  # fmt: skip
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trainees", type=int, default=10)
+    parser.add_argument("--turns", type=int, default=5, help="Trainee turns per session.")
+    parser.add_argument("--ramp-seconds", type=float, default=10.0)
+    parser.add_argument("--think-seconds", type=float, default=2.0)
+    parser.add_argument("--speech-seconds", type=int, default=4)
+    parser.add_argument("--audio", help="Trainee turn audio file; synthesized when omitted.")
+    parser.add_argument("--reply-timeout", type=float, default=60.0)
+    parser.add_argument("--target", help="Base URL of a running backend to drive instead.")
+    parser.add_argument("--admin-token", default="loadtest-admin")
+    parser.add_argument("--scenario-id", help="Published scenario to use instead of seeding one.")
+    parser.add_argument("--voice", default="Cherry", help="QWEN_VOICE_ID; empty for text only.")
+    parser.add_argument("--first-chunk-ms", type=float, default=ProviderConfig.first_chunk_ms)
+    parser.add_argument(
+        "--chunk-interval-ms", type=float, default=ProviderConfig.chunk_interval_ms
+    )
+    parser.add_argument(
+        "--reply-audio-seconds", type=float, default=ProviderConfig.reply_audio_seconds
+    )
+    parser.add_argument("--asr-ms", type=float, default=ProviderConfig.asr_ms)
+    parser.add_argument("--evaluation-ms", type=float, default=ProviderConfig.evaluation_ms)
+    parser.add_argument("--provider-error-rate", type=float, default=0.0)
+    parser.add_argument("--keep-data", action="store_true")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout.")
+    args = parser.parse_args(argv)
+
+    processes: list[subprocess.Popen] = []
+    env: dict[str, str] | None = None
+    try:
+        if args.target:
+            base_url = args.target.rstrip("/")
+        else:
+            provider_port, backend_port = _free_port(), _free_port()
+            provider_url = f"http://127.0.0.1:{provider_port}"
+            base_url = f"http://127.0.0.1:{backend_port}"
+            env = backend_env(args, provider_url, args.admin_token)
+            processes.append(
+                _spawn("loadtest.providers", _provider_arguments(args, provider_port), env)
+            )
+            _wait_until_ready(f"{provider_url}/stats", processes[-1])
+            processes.append(_spawn("loadtest.serve", ["--port", str(backend_port)], env))
+            _wait_until_ready(f"{base_url}/api/healthz", processes[-1])
+        report = asyncio.run(run_load(args, base_url, args.admin_token))
+    finally:
+        for process in reversed(processes):
+            process.terminate()
+            with suppress(subprocess.TimeoutExpired):
+                process.wait(timeout=10)
+            if process.poll() is None:
+                process.kill()
+        if env is not None and not args.keep_data:
+            try:
+                drop_run_data(env)
+            except Exception as exc:
+                print(f"Could not remove load-test data: {exc}", file=sys.stderr)
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,36 @@
+"""Run the backend under uvicorn for a load test.
+
+The backend samples event-loop lag itself (``app.telemetry.profiling``)
+into the ``event_loop.lag_ms`` histogram, which the load test reads back
+from ``/api/metrics``. ``--lag-interval`` sets how often it samples.
+
+Usage:
+    python -m loadtest.serve --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+
+LAG_SAMPLE_SECONDS = 0.05
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--lag-interval", type=float, default=LAG_SAMPLE_SECONDS)
+    args = parser.parse_args(argv)
+    os.environ["LOOP_LAG_INTERVAL_MS"] = str(max(1, round(args.lag_interval * 1000)))
+
+    import uvicorn
+
+    from app.main import app
+
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
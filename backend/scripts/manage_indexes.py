@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Reconcile the MongoDB indexes declared by the repositories.
+
+Usage:
+    python scripts/manage_indexes.py --dry-run
+    python scripts/manage_indexes.py
+    python scripts/manage_indexes.py --verify
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.repositories.index_registry import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+"""
+Move turn audio from turn-{id}.mp3 objects to the content-addressed layout.
+
+Usage:
+    python scripts/migrate_audio_layout.py --dry-run
+    python scripts/migrate_audio_layout.py
+    python scripts/migrate_audio_layout.py --delete-legacy
+"""
+
+import os
+import sys
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.audio_storage import main
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from datetime import date
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import status
+
+from app.api.routes.admin import metrics
+from app.config import load_settings
+from app.main import app
+
+
+@pytest_asyncio.fixture
+async def client():
+    calls: list[tuple[date | None, date | None]] = []
+
+    class FakeService:
+        async def summary(self, start, end):
+            calls.append((start, end))
+            return {"from": str(start), "to": str(end), "scenarios": [], "skills": []}
+
+    app.dependency_overrides[metrics._service] = FakeService
+    transport = httpx.ASGITransport(app=app)
+    try:
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as test_client:
+            yield test_client, calls
+    finally:
+        app.dependency_overrides.pop(metrics._service, None)
+
+
+@pytest.mark.asyncio
+async def test_requires_admin_token(client):
+    test_client, _ = client
+    response = await test_client.get("/api/admin/metrics")
+    assert response.status_code == status.HTTP_401_UNAUTHORIZED
+
+
+@pytest.mark.asyncio
+async def test_passes_day_range_to_rollups(client):
+    test_client, calls = client
+    response = await test_client.get(
+        "/api/admin/metrics?from=2025-06-01&to=2025-06-30",
+        headers={"X-Admin-Token": load_settings().admin_access_token},
+    )
+    assert response.status_code == status.HTTP_200_OK
+    assert calls == [(date(2025, 6, 1), date(2025, 6, 30))]
+
+    response = await test_client.get(
+        "/api/admin/metrics?from=June",
+        headers={"X-Admin-Token": load_settings().admin_access_token},
+    )
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
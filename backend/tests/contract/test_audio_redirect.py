@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+from dataclasses import replace
+
+import httpx
+import pytest
+
+from app.api.routes import audio as audio_routes
+from app.main import app
+from app.repositories.session_repository import PracticeSessionRecord, TurnRecord
+from app.services.signed_urls import SignedUrlService
+
+
+def _session(stub_user_id: str = "pilot-user") -> PracticeSessionRecord:
+    return PracticeSessionRecord(
+        id="session-1",
+        scenario_id="scenario-1",
+        stub_user_id=stub_user_id,
+        language="en",
+        opening_prompt=None,
+        status="ended",
+        client_session_started_at="2025-01-01T00:00:00Z",
+        started_at="2025-01-01T00:00:00Z",
+        ended_at="2025-01-01T00:10:00Z",
+        total_duration_seconds=600,
+        idle_limit_seconds=8,
+        duration_limit_seconds=300,
+        ws_channel="/ws/sessions/session-1",
+        objective_status="unknown",
+        objective_reason=None,
+        termination_reason="manual",
+        evaluation_id=None,
+    )
+
+
+def _turn(audio_file_id: str) -> TurnRecord:
+    return TurnRecord(
+        id="turn-1",
+        session_id="session-1",
+        sequence=0,
+        speaker="ai",
+        transcript="Hi",
+        audio_file_id=audio_file_id,
+        audio_url="",
+        asr_status=None,
+        created_at=None,
+        started_at=None,
+        ended_at=None,
+        context=None,
+        latency_ms=None,
+    )
+
+
+class FakeSigner:
+    def presign_get_url(self, name, expires=900):
+        return f"https://minio/audio/{name}?sig=1"
+
+
+def _override(turn: TurnRecord, session: PracticeSessionRecord) -> None:
+    class FakeRepo:
+        async def get_turn(self, turn_id):
+            return turn
+
+        async def get_session(self, session_id):
+            return session
+
+    app.dependency_overrides[audio_routes._session_repo] = lambda: FakeRepo()
+    app.dependency_overrides[audio_routes._signing_client] = lambda: SignedUrlService(
+        FakeSigner()
+    )
+
+
+@pytest.mark.asyncio
+async def test_audio_redirects_to_presigned_url():
+    _override(_turn("turn-1.mp3"), _session())
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/audio/turn-1")
+
+    assert response.status_code == 302
+    assert response.headers["location"] == "https://minio/audio/turn-1.mp3?sig=1"
+    assert response.headers["cache-control"].startswith("private, max-age=")
+    app.dependency_overrides.pop(audio_routes._session_repo, None)
+    app.dependency_overrides.pop(audio_routes._signing_client, None)
+
+
+@pytest.mark.asyncio
+async def test_audio_pending_or_foreign_turn_is_not_found():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        _override(_turn("pending"), _session())
+        pending = await client.get("/api/audio/turn-1")
+        _override(_turn("turn-1.mp3"), _session(stub_user_id="other"))
+        foreign = await client.get("/api/audio/turn-1")
+
+    assert pending.status_code == 404
+    assert foreign.status_code == 404
+    app.dependency_overrides.pop(audio_routes._session_repo, None)
+    app.dependency_overrides.pop(audio_routes._signing_client, None)
+
+
+@pytest.mark.asyncio
+async def test_session_replay_redirects_to_bundle():
+    session = replace(_session(), replay={"audioFileId": "audio/sha256/ab/bundle.mp3"})
+    _override(_turn("turn-1.mp3"), session)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/audio/sessions/session-1/replay")
+        _override(_turn("turn-1.mp3"), _session())
+        missing = await client.get("/api/audio/sessions/session-1/replay")
+
+    assert response.status_code == 302
+    assert response.headers["location"] == "https://minio/audio/audio/sha256/ab/bundle.mp3?sig=1"
+    assert missing.status_code == 404
+    app.dependency_overrides.pop(audio_routes._session_repo, None)
+    app.dependency_overrides.pop(audio_routes._signing_client, None)
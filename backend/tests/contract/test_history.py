@@ -9,7 +9,7 @@ from fastapi import status
 from app.api.routes import history as history_routes
 from app.api.routes import sessions as sessions_routes
 from app.main import app
-from app.repositories.session_repository import PracticeSessionRecord
+from app.repositories.session_repository import HistoryPage, PracticeSessionRecord
 
 
 @pytest.fixture(autouse=True)
@@ -51,13 +51,45 @@ def _session(session_id: str, started_at: str, scenario_id: str = "scenario-1"):
     )
 
 
+class FakeHistoryRepo:
+    """Mimics SessionRepository.list_history over an in-memory session list."""
+
+    def __init__(self, sessions, scenarios=None):
+        self._sessions = sessions
+        self._scenarios = scenarios or {}
+        self.calls = []
+
+    async def list_history(self, **kwargs):
+        self.calls.append(kwargs)
+        items = list(self._sessions)
+        if kwargs.get("category") or kwargs.get("search"):
+            filtered = []
+            for session in items:
+                scenario = self._scenarios.get(session.scenario_id)
+                if not scenario:
+                    continue
+                if kwargs.get("category") and scenario["category"] != kwargs["category"]:
+                    continue
+                search = kwargs.get("search")
+                if search and search.lower() not in scenario["title"].lower():
+                    continue
+                filtered.append(session)
+            items = filtered
+        items.sort(
+            key=lambda item: (item.started_at or "", item.id),
+            reverse=not kwargs.get("ascending"),
+        )
+        start = (kwargs["page"] - 1) * kwargs["page_size"]
+        return HistoryPage(
+            items=items[start : start + kwargs["page_size"]],
+            total=len(items),
+            next_cursor=None,
+        )
+
+
 @pytest.mark.asyncio
 async def test_history_requires_step_count(monkeypatch):
-    class FakeRepo:
-        async def list_sessions(self, stub_user_id=None):
-            return []
-
-    app.dependency_overrides[history_routes._session_repo] = lambda: FakeRepo()
+    app.dependency_overrides[history_routes._session_repo] = lambda: FakeHistoryRepo([])
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         response = await client.get("/api/sessions")
@@ -75,24 +107,8 @@ async def test_history_default_sort_and_page_size(monkeypatch):
         _session(f"session-{i}", "2025-01-03T00:00:00Z") for i in range(3, 25)
     ]
 
-    class FakeRepo:
-        async def list_sessions(self, stub_user_id=None):
-            return sessions
-
-    class FakeScenarioRepo:
-        async def get(self, scenario_id: str):
-            return type(
-                "Scenario",
-                (),
-                {
-                    "category": "Feedback",
-                    "title": "Difficult feedback",
-                    "objective": "Provide clear feedback",
-                },
-            )()
-
-    app.dependency_overrides[history_routes._session_repo] = lambda: FakeRepo()
-    app.dependency_overrides[history_routes._scenario_repo] = lambda: FakeScenarioRepo()
+    repo = FakeHistoryRepo(sessions)
+    app.dependency_overrides[history_routes._session_repo] = lambda: repo
 
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
@@ -101,11 +117,13 @@ async def test_history_default_sort_and_page_size(monkeypatch):
     assert response.status_code == status.HTTP_200_OK
     payload = response.json()
     assert payload["pageSize"] == 20
+    assert payload["total"] == 24
     assert len(payload["items"]) == 20
-    assert payload["items"][0]["id"] == "session-3"
+    assert payload["items"][0]["startedAt"] == "2025-01-03T00:00:00Z"
+    assert repo.calls[0]["ascending"] is False
+    assert repo.calls[0]["stub_user_id"] == "pilot-user"
 
     app.dependency_overrides.pop(history_routes._session_repo, None)
-    app.dependency_overrides.pop(history_routes._scenario_repo, None)
 
 
 @pytest.mark.asyncio
@@ -115,11 +133,7 @@ async def test_history_sort_ascending(monkeypatch):
         _session("session-2", "2025-01-01T00:00:00Z"),
     ]
 
-    class FakeRepo:
-        async def list_sessions(self, stub_user_id=None):
-            return sessions
-
-    app.dependency_overrides[history_routes._session_repo] = lambda: FakeRepo()
+    app.dependency_overrides[history_routes._session_repo] = lambda: FakeHistoryRepo(sessions)
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
         response = await client.get(
@@ -140,34 +154,13 @@ async def test_history_filtering_by_category_and_search(monkeypatch):
         _session("session-2", "2025-01-01T00:00:00Z", "scenario-2"),
     ]
 
-    class FakeRepo:
-        async def list_sessions(self, stub_user_id=None):
-            return sessions
-
-    class FakeScenarioRepo:
-        async def get(self, scenario_id: str):
-            if scenario_id == "scenario-1":
-                return type(
-                    "Scenario",
-                    (),
-                    {
-                        "category": "Feedback",
-                        "title": "Difficult feedback",
-                        "objective": "Provide clear feedback",
-                    },
-                )()
-            return type(
-                "Scenario",
-                (),
-                {
-                    "category": "Conflict",
-                    "title": "Hard conversation",
-                    "objective": "Resolve tension",
-                },
-            )()
-
-    app.dependency_overrides[history_routes._session_repo] = lambda: FakeRepo()
-    app.dependency_overrides[history_routes._scenario_repo] = lambda: FakeScenarioRepo()
+    scenarios = {
+        "scenario-1": {"category": "Feedback", "title": "Difficult feedback"},
+        "scenario-2": {"category": "Conflict", "title": "Hard conversation"},
+    }
+    app.dependency_overrides[history_routes._session_repo] = lambda: FakeHistoryRepo(
+        sessions, scenarios
+    )
 
     transport = httpx.ASGITransport(app=app)
     async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
@@ -182,7 +175,23 @@ async def test_history_filtering_by_category_and_search(monkeypatch):
     assert payload["items"][0]["id"] == "session-1"
 
     app.dependency_overrides.pop(history_routes._session_repo, None)
-    app.dependency_overrides.pop(history_routes._scenario_repo, None)
+
+
+@pytest.mark.asyncio
+async def test_history_rejects_invalid_cursor(monkeypatch):
+    class FakeRepo:
+        async def list_history(self, **kwargs):
+            raise ValueError("Invalid history cursor")
+
+    app.dependency_overrides[history_routes._session_repo] = lambda: FakeRepo()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get(
+            "/api/sessions", params={"historyStepCount": 1, "cursor": "garbage"}
+        )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    app.dependency_overrides.pop(history_routes._session_repo, None)
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import httpx
+import pytest
+
+from app.main import app
+from app.telemetry.metrics import registry
+from app.telemetry.otel import recorder, start_span
+from app.telemetry.tracing import emit_metric
+
+
+@pytest.fixture(autouse=True)
+def _set_env(monkeypatch):
+    monkeypatch.setenv("DASHSCOPE_API_KEY", "dash")
+    monkeypatch.setenv("CHATAI_API_BASE", "https://api.chataiapi.com/v1")
+    monkeypatch.setenv("CHATAI_API_KEY", "secret")
+    monkeypatch.setenv("CHATAI_API_MODEL", "gpt-5-mini")
+    monkeypatch.setenv("EVALUATOR_MODEL", "gpt-5-mini")
+    monkeypatch.setenv("OBJECTIVE_CHECK_API_KEY", "secret")
+    monkeypatch.setenv("OBJECTIVE_CHECK_MODEL", "gpt-5-mini")
+    monkeypatch.setenv("STUB_USER_ID", "pilot-user")
+    monkeypatch.setenv("ADMIN_ACCESS_TOKEN", "admin-token")
+    registry.reset()
+    recorder.clear()
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_serves_prometheus_text():
+    emit_metric("turn.asr_latency", 420.0, session_id="s-1")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/api/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "turn_asr_latency_count 1" in response.text
+
+
+@pytest.mark.asyncio
+async def test_admin_spans_lists_recent_spans():
+    with start_span("turns.asr"):
+        pass
+    with start_span("turns.generate"):
+        pass
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        unauthorized = await client.get("/api/admin/spans")
+        response = await client.get(
+            "/api/admin/spans?name=turns.asr", headers={"X-Admin-Token": "admin-token"}
+        )
+
+    assert unauthorized.status_code == 401
+    spans = response.json()["spans"]
+    assert [span["name"] for span in spans] == ["turns.asr"]
+    assert spans[0]["status"] == "ok"
+
+
+@pytest.mark.asyncio
+async def test_admin_profile_returns_collapsed_stacks():
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        unauthorized = await client.get("/api/admin/profile")
+        response = await client.get(
+            "/api/admin/profile",
+            params={"seconds": 0.05, "interval_ms": 1},
+            headers={"X-Admin-Token": "admin-token"},
+        )
+
+    assert unauthorized.status_code == 401
+    assert response.status_code == 200
+    lines = response.text.splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert stack.startswith("MainThread;")
+        assert int(count) > 0
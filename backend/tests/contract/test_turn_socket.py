@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import struct
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+from fastapi.testclient import TestClient
+
+from app.api.routes import session_socket
+from app.main import app
+from app.repositories.session_repository import PracticeSessionRecord, TurnRecord
+
+
+def _session(session_id: str) -> PracticeSessionRecord:
+    return PracticeSessionRecord(
+        id=session_id,
+        scenario_id="scenario-1",
+        stub_user_id="pilot-user",
+        language="en",
+        opening_prompt="Hello",
+        status="active",
+        client_session_started_at="2025-01-01T00:00:00Z",
+        started_at="2025-01-01T00:00:00Z",
+        ended_at=None,
+        total_duration_seconds=None,
+        idle_limit_seconds=8,
+        duration_limit_seconds=300,
+        ws_channel=f"/ws/sessions/{session_id}",
+        objective_status="unknown",
+        objective_reason=None,
+        termination_reason=None,
+        evaluation_id=None,
+    )
+
+
+class FakeRepo:
+    def __init__(self):
+        self.turns: list[TurnRecord] = []
+
+    async def get_session(self, session_id):
+        return _session(session_id)
+
+    async def list_turns(self, session_id):
+        return list(self.turns)
+
+    async def add_turn(self, payload):
+        record = TurnRecord(
+            id=f"turn-{len(self.turns) + 1}",
+            session_id=payload["sessionId"],
+            sequence=payload["sequence"],
+            speaker=payload["speaker"],
+            transcript=None,
+            audio_file_id=payload["audioFileId"],
+            audio_url=None,
+            asr_status=payload["asrStatus"],
+            created_at=None,
+            started_at=payload["startedAt"],
+            ended_at=payload["endedAt"],
+            context=payload.get("context"),
+            latency_ms=None,
+        )
+        self.turns.append(record)
+        return record
+
+
+@pytest.fixture
+def pipeline_calls(monkeypatch):
+    calls = []
+
+    def _fake_pipeline(**kwargs):
+        calls.append(kwargs)
+        return asyncio.sleep(0)
+
+    monkeypatch.setattr(
+        "app.services.turn_pipeline.enqueue_turn_pipeline", _fake_pipeline
+    )
+    repo = FakeRepo()
+    app.dependency_overrides[session_socket._repo] = lambda: repo
+    yield calls
+    app.dependency_overrides.pop(session_socket._repo, None)
+
+
+def _frame(sequence: int, audio: bytes, **overrides) -> bytes:
+    now = datetime.now(timezone.utc).isoformat()
+    header = {"sequence": sequence, "startedAt": now, "endedAt": now, **overrides}
+    encoded = json.dumps(header).encode("utf-8")
+    return struct.pack(">I", len(encoded)) + encoded + audio
+
+
+def test_binary_turn_frame_is_acked_and_piped_without_base64(pipeline_calls):
+    client = TestClient(app)
+    with client.websocket_connect("/ws/sessions/session-1") as websocket:
+        websocket.send_bytes(_frame(0, b"webm-bytes", context="opening"))
+        ack = websocket.receive_json()
+
+    assert ack == {
+        "type": "turn_ack",
+        "sequence": 0,
+        "sessionId": "session-1",
+        "turnId": "turn-1",
+        "aiTurnId": None,
+        "status": "accepted",
+    }
+    assert pipeline_calls == [
+        {"session_id": "session-1", "turn_id": "turn-1", "audio_bytes": b"webm-bytes"}
+    ]
+
+
+def test_binary_turn_frame_reports_validation_errors(pipeline_calls):
+    client = TestClient(app)
+    with client.websocket_connect("/ws/sessions/session-1") as websocket:
+        websocket.send_bytes(_frame(3, b"audio"))
+        wrong_sequence = websocket.receive_json()
+        websocket.send_bytes(_frame(0, b"a" * (128 * 1024 + 1)))
+        oversized = websocket.receive_json()
+        websocket.send_bytes(_frame(0, b""))
+        empty = websocket.receive_json()
+        websocket.send_bytes(b"\x00\x00\x10\x00{")
+        garbled = websocket.receive_json()
+
+    assert wrong_sequence["type"] == "turn_error"
+    assert wrong_sequence["status"] == 422
+    assert "expected 0" in wrong_sequence["detail"]
+    assert oversized["status"] == 413
+    assert "resend" in empty["detail"]
+    assert garbled["status"] == 422
+    assert pipeline_calls == []
+
+
+def test_streamed_turn_pipes_the_decoded_pcm_on_end(pipeline_calls, monkeypatch):
+    # ``cat`` stands in for ffmpeg: the "PCM" is the bytes that were sent.
+    monkeypatch.setattr("app.services.audio.pcm_stream_command", lambda rate: ["cat"])
+    client = TestClient(app)
+    with client.websocket_connect("/ws/sessions/session-1") as websocket:
+        websocket.send_bytes(_frame(0, b"chunk-0|", type="chunk", index=0))
+        websocket.send_bytes(_frame(0, b"chunk-1|", type="chunk", index=1))
+        websocket.send_bytes(_frame(0, b"tail", type="end"))
+        ack = websocket.receive_json()
+
+    assert ack["type"] == "turn_ack"
+    assert ack["status"] == "accepted"
+    [call] = pipeline_calls
+    assert call.keys() == {"session_id", "turn_id", "pcm"}
+    assert call["turn_id"] == "turn-1"
+    assert call["pcm"].dtype == np.int16
+    assert call["pcm"].tobytes() == b"chunk-0|chunk-1|tail"
+
+
+def test_streamed_turn_errors_on_missing_chunks(pipeline_calls, monkeypatch):
+    monkeypatch.setattr("app.services.audio.pcm_stream_command", lambda rate: ["cat"])
+    client = TestClient(app)
+    with client.websocket_connect("/ws/sessions/session-1") as websocket:
+        websocket.send_bytes(_frame(0, b"late", type="chunk", index=2))
+        gap = websocket.receive_json()
+        websocket.send_bytes(_frame(0, b"", type="end"))
+        unknown = websocket.receive_json()
+
+    assert gap == {
+        "type": "turn_error",
+        "sequence": 0,
+        "status": 422,
+        "detail": "Missing audio chunk 0; please resend the turn.",
+    }
+    assert unknown["status"] == 422
+    assert pipeline_calls == []
@@ -155,3 +155,90 @@ async def test_turn_rejects_missing_audio_guidance():
 
     assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
     assert "resend" in response.text.lower()
+
+
+def _upload_headers(sequence: int = 0) -> dict[str, str]:
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "Content-Type": "application/octet-stream",
+        "X-Turn-Sequence": str(sequence),
+        "X-Turn-Started-At": now,
+        "X-Turn-Ended-At": now,
+    }
+
+
+@pytest.mark.asyncio
+async def test_raw_upload_hands_bytes_to_pipeline(monkeypatch):
+    calls = []
+
+    async def _record_pipeline(**kwargs):
+        calls.append(kwargs)
+
+    monkeypatch.setattr(turns_routes, "enqueue_turn_pipeline", _record_pipeline)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/sessions/session-1/turns:upload",
+            content=b"webm-audio",
+            headers=_upload_headers(),
+        )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["status"] == "accepted"
+    assert calls == [
+        {"session_id": "session-1", "turn_id": "turn-1", "audio_bytes": b"webm-audio"}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_raw_upload_enforces_limit_while_streaming():
+    async def _body():
+        for _ in range(3):
+            yield b"a" * (64 * 1024)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/sessions/session-1/turns:upload",
+            content=_body(),
+            headers=_upload_headers(),
+        )
+
+    assert response.status_code == status.HTTP_413_REQUEST_ENTITY_TOO_LARGE
+    assert "128" in response.text
+
+
+@pytest.mark.asyncio
+async def test_raw_upload_validates_metadata_and_media_type():
+    headers = _upload_headers()
+    headers.pop("X-Turn-Started-At")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        missing = await client.post(
+            "/api/sessions/session-1/turns:upload", content=b"audio", headers=headers
+        )
+        wrong_type = await client.post(
+            "/api/sessions/session-1/turns:upload",
+            content=b"audio",
+            headers={**_upload_headers(), "Content-Type": "text/plain"},
+        )
+
+    assert missing.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+    assert wrong_type.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+
+@pytest.mark.asyncio
+async def test_multipart_upload_reads_form_fields():
+    pytest.importorskip("python_multipart")
+    now = datetime.now(timezone.utc).isoformat()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.post(
+            "/api/sessions/session-1/turns:upload",
+            data={"sequence": "0", "startedAt": now, "endedAt": now},
+            files={"audio": ("turn.webm", b"webm-audio", "audio/webm")},
+        )
+
+    assert response.status_code == status.HTTP_202_ACCEPTED
+    assert response.json()["turnId"] == "turn-1"
@@ -306,6 +306,10 @@ def _stub_pipeline(monkeypatch):
         "app.services.session_service.enqueue",
         _noop_enqueue,
     )
+    monkeypatch.setattr(
+        "app.services.session_service.enqueue_replay_bundle",
+        _noop_enqueue,
+    )
 
 
 def _timestamp(offset_seconds: int = 0) -> str:
@@ -0,0 +1,70 @@
+import base64
+import json
+
+import httpx
+import pytest
+
+from app.clients.audio_buffer import AudioBuffer, AudioConversionError
+from app.clients.llm import QwenClient
+
+
+def test_from_base64_reuses_original_text():
+    payload = base64.b64encode(b"trainee audio").decode("ascii")
+
+    audio = AudioBuffer.from_base64(payload)
+
+    assert audio.to_bytes() == b"trainee audio"
+    assert audio.base64 is payload
+
+
+def test_data_uri_is_built_once_per_mime_type():
+    audio = AudioBuffer(b"\x00\x01\x02")
+
+    first = audio.data_uri("audio/mp3")
+
+    assert first == "data:audio/mp3;base64,AAEC"
+    assert audio.data_uri("audio/mp3") is first
+    assert audio.data_uri() == "data:;base64,AAEC"
+
+
+def test_from_base64_chunks_handles_unaligned_fragments():
+    raw = bytes(range(256)) * 7
+    encoded = base64.b64encode(raw).decode("ascii")
+    fragments = [encoded[index : index + 37] for index in range(0, len(encoded), 37)]
+
+    assert AudioBuffer.from_base64_chunks(fragments).to_bytes() == raw
+    with pytest.raises(AudioConversionError):
+        AudioBuffer.from_base64_chunks(["not base64!"])
+
+
+def test_view_wraps_frame_without_copying():
+    frame = b"header|audio-bytes"
+    audio = AudioBuffer(memoryview(frame)[7:])
+
+    assert audio.view.obj is frame
+    assert len(audio) == 11
+    assert audio.to_bytes() == b"audio-bytes"
+
+
+@pytest.mark.asyncio
+async def test_qwen_asr_accepts_audio_buffer():
+    seen = {}
+
+    async def handler(request):
+        seen["payload"] = json.loads(request.content)
+        return httpx.Response(200, json={"choices": [{"message": {"content": "hello"}}]})
+
+    client = QwenClient(
+        base_url="https://dashscope.aliyuncs.com/compatible-mode/v1",
+        api_key="secret",
+        transport=httpx.MockTransport(handler),
+    )
+
+    result = await client.asr(
+        {"model": "qwen-asr", "input": AudioBuffer(b"data"), "stream": False}
+    )
+    await client.close()
+
+    audio_part = seen["payload"]["messages"][1]["content"][0]["input_audio"]
+    assert result == {"text": "hello"}
+    assert audio_part["data"] == "data:;base64,ZGF0YQ=="
@@ -0,0 +1,231 @@
+from datetime import datetime, timedelta, timezone
+from itertools import count
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from app.services.audio_gc import (
+    BloomFilter,
+    GcReport,
+    acquire_gc_lease,
+    build_reference_filter,
+    release_gc_lease,
+    run_gc,
+    sweep_objects,
+)
+from app.services.audio_storage import content_object_name
+
+NOW = datetime(2025, 6, 1, tzinfo=timezone.utc)
+OLD = NOW - timedelta(days=3)
+_seconds = count()
+
+
+def _old_id():
+    return ObjectId.from_datetime(OLD + timedelta(seconds=next(_seconds)))
+
+
+class _AsyncCursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    def find(self, query, projection=None, **kwargs):
+        return _AsyncCursor(list(self._collection.find(query, projection)))
+
+    async def find_one(self, query, projection=None):
+        return self._collection.find_one(query, projection)
+
+    async def aggregate(self, pipeline, **kwargs):
+        return _AsyncCursor(list(self._collection.aggregate(pipeline)))
+
+    async def count_documents(self, query):
+        return self._collection.count_documents(query)
+
+    async def estimated_document_count(self):
+        return self._collection.estimated_document_count()
+
+    async def distinct(self, key, query):
+        return self._collection.distinct(key, query)
+
+    async def update_many(self, query, update):
+        return self._collection.update_many(query, update)
+
+    async def find_one_and_update(self, query, update, upsert=False):
+        return self._collection.find_one_and_update(query, update, upsert=upsert)
+
+    async def delete_many(self, query):
+        return self._collection.delete_many(query)
+
+    async def delete_one(self, query):
+        return self._collection.delete_one(query)
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+class FakeMinio:
+    def __init__(self, objects):
+        self.objects = dict(objects)
+
+    async def iter_objects(self, prefix=None, batch_size=1000):
+        items = sorted(
+            (name, modified)
+            for name, modified in self.objects.items()
+            if prefix is None or name.startswith(prefix)
+        )
+        for start in range(0, len(items), batch_size):
+            yield items[start : start + batch_size]
+
+    async def delete_files(self, names):
+        for name in names:
+            self.objects.pop(name, None)
+        return []
+
+
+def test_bloom_filter_has_no_false_negatives():
+    references = BloomFilter(500)
+    keys = [content_object_name(str(index).encode()) for index in range(500)]
+    for key in keys:
+        references.add(key)
+
+    assert all(key in references for key in keys)
+    misses = sum(f"absent-{index}" in references for index in range(5000))
+    assert misses < 50
+
+
+@pytest.fixture
+def world():
+    db = mongomock.MongoClient()["test_db"]
+    live = content_object_name(b"live")
+    expired_audio = content_object_name(b"expired")
+    orphan = content_object_name(b"orphan")
+    fresh = content_object_name(b"fresh")
+    live_session = db["PracticeSession"].insert_one(
+        {"_id": _old_id(), "status": "ended", "endedAt": NOW - timedelta(days=1)}
+    ).inserted_id
+    expired_session = db["PracticeSession"].insert_one(
+        {"_id": _old_id(), "status": "ended", "endedAt": NOW - timedelta(days=60)}
+    ).inserted_id
+    db["Turn"].insert_many(
+        [
+            {"_id": _old_id(), "sessionId": str(live_session), "audioFileId": live},
+            {"_id": _old_id(), "sessionId": str(live_session), "audioFileId": "pending"},
+            {"_id": _old_id(), "sessionId": str(expired_session), "audioFileId": expired_audio},
+            {"_id": _old_id(), "sessionId": "deleted-session", "audioFileId": "missing"},
+        ]
+    )
+    minio = FakeMinio(
+        {
+            live: OLD,
+            expired_audio: OLD,
+            orphan: OLD,
+            fresh: NOW - timedelta(minutes=5),
+        }
+    )
+    return db, minio, {"live": live, "orphan": orphan, "fresh": fresh, "expired": expired_audio}
+
+
+@pytest.mark.asyncio
+async def test_gc_dry_run_changes_nothing(world):
+    db, minio, _ = world
+
+    report = await run_gc(
+        _Client(db), minio, grace_seconds=3600, retention_days=30, dry_run=True, now=NOW
+    )
+
+    assert report.sessions_expired == 1
+    assert report.turns_marked_missing == 1
+    assert report.turns_orphaned == 1
+    assert report.objects_deleted == 1
+    assert len(minio.objects) == 4
+    assert db["Turn"].count_documents({}) == 4
+
+
+@pytest.mark.asyncio
+async def test_gc_applies_retention_and_deletes_old_orphans(world):
+    db, minio, names = world
+
+    report = await run_gc(
+        _Client(db), minio, grace_seconds=3600, retention_days=30, batch_size=2, now=NOW
+    )
+
+    assert report.errors == []
+    assert report.sessions_expired == 1
+    assert report.turns_orphaned == 1
+    assert report.objects_in_grace == 1
+    assert set(minio.objects) == {names["live"], names["fresh"]}
+    assert db["PracticeSession"].count_documents({}) == 1
+    assert db["Turn"].count_documents({"audioFileId": "pending"}) == 0
+    assert db["Turn"].count_documents({"sessionId": "deleted-session"}) == 0
+
+
+@pytest.mark.asyncio
+async def test_sweep_rechecks_references_made_after_the_filter_was_built(world):
+    db, minio, names = world
+    minio.objects["exports/report.csv"] = OLD
+    references = await build_reference_filter(_Client(db))
+    # A new turn deduplicates onto the old, so far unreferenced, object.
+    db["Turn"].insert_one({"sessionId": "new-session", "audioFileId": names["orphan"]})
+    report = GcReport(dry_run=False)
+
+    await sweep_objects(
+        _Client(db), minio, references, report, cutoff=NOW - timedelta(hours=1)
+    )
+
+    assert names["orphan"] in minio.objects
+    assert report.objects_deleted == 0
+    # Keys outside audio/ are neither listed nor deleted.
+    assert report.objects_scanned == 4
+    assert "exports/report.csv" in minio.objects
+
+
+@pytest.mark.asyncio
+async def test_sweep_reclaims_unreferenced_legacy_turn_objects(world):
+    db, minio, _ = world
+    db["Turn"].insert_one({"sessionId": "legacy", "audioFileId": "turn-kept.mp3"})
+    minio.objects.update({"turn-kept.mp3": OLD, "turn-orphan.mp3": OLD})
+    references = await build_reference_filter(_Client(db))
+    report = GcReport(dry_run=False)
+
+    await sweep_objects(
+        _Client(db), minio, references, report, cutoff=NOW - timedelta(hours=1)
+    )
+
+    assert "turn-kept.mp3" in minio.objects
+    assert "turn-orphan.mp3" not in minio.objects
+    assert report.objects_scanned == 6
+
+
+@pytest.mark.asyncio
+async def test_gc_lease_admits_one_holder_until_released_or_expired():
+    client = _Client(mongomock.MongoClient()["test_db"])
+
+    assert await acquire_gc_lease(client, "worker-a", seconds=60, now=NOW)
+    assert not await acquire_gc_lease(client, "worker-b", seconds=60, now=NOW)
+    # A crashed holder's lease runs out.
+    later = NOW + timedelta(seconds=61)
+    assert await acquire_gc_lease(client, "worker-b", seconds=60, now=later)
+    # Only the holder can release it.
+    await release_gc_lease(client, "worker-a")
+    assert not await acquire_gc_lease(client, "worker-c", seconds=60, now=later)
+    await release_gc_lease(client, "worker-b")
+    assert await acquire_gc_lease(client, "worker-c", seconds=60, now=later)
@@ -0,0 +1,188 @@
+import mongomock
+import pytest
+
+from app.services.audio_storage import (
+    IMMUTABLE_CACHE_CONTROL,
+    confirm_audio,
+    content_object_name,
+    is_content_addressed,
+    migrate_legacy_audio,
+    release_audio,
+    store_audio,
+)
+
+
+class FakeMinio:
+    def __init__(self, objects=None):
+        self.objects = dict(objects or {})
+        self.uploads = []
+        self.deleted = []
+        self.touched = []
+        self.headers = {}
+
+    async def file_exists(self, name):
+        return name in self.objects
+
+    async def touch_file(self, name, *, metadata=None):
+        if name not in self.objects:
+            return False
+        self.touched.append(name)
+        # Like S3, a copy with REPLACE keeps only the headers it is given.
+        self.headers[name] = {"Content-Type": "binary/octet-stream", **(metadata or {})}
+        return True
+
+    async def upload_file(self, name, data, content_type, *, metadata=None):
+        self.uploads.append((name, metadata))
+        self.headers[name] = {"Content-Type": content_type, **(metadata or {})}
+        self.objects[name] = data
+        return name
+
+    async def download_file(self, name):
+        return self.objects[name]
+
+    async def delete_file(self, name):
+        self.deleted.append(name)
+        self.objects.pop(name, None)
+
+    async def delete_files(self, names):
+        for name in names:
+            await self.delete_file(name)
+        return []
+
+
+class _AsyncCursor:
+    def __init__(self, docs):
+        self._docs = iter(docs)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    async def distinct(self, key, query):
+        return self._collection.distinct(key, query)
+
+    def find(self, query, projection=None, **kwargs):
+        return _AsyncCursor(list(self._collection.find(query, projection)))
+
+    async def update_one(self, query, update):
+        return self._collection.update_one(query, update)
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()["test_db"]
+
+
+def test_content_object_name_is_stable_and_sharded():
+    name = content_object_name(b"audio")
+
+    assert name == content_object_name(b"audio")
+    assert name != content_object_name(b"other")
+    digest = name.rsplit("/", 1)[1].split(".")[0]
+    assert name.startswith(f"audio/sha256/{digest[:2]}/")
+    assert is_content_addressed(name)
+    assert not is_content_addressed("turn-0123456789abcdef01234567.mp3")
+
+
+@pytest.mark.asyncio
+async def test_store_audio_uploads_once_with_immutable_headers():
+    minio = FakeMinio()
+
+    first = await store_audio(minio, b"same bytes")
+    second = await store_audio(minio, b"same bytes")
+
+    assert first == second
+    assert minio.uploads == [(first, {"Cache-Control": IMMUTABLE_CACHE_CONTROL})]
+    # The dedupe hit refreshes the object so it gets a new GC grace period.
+    assert minio.touched == [first]
+
+
+@pytest.mark.asyncio
+async def test_dedupe_hit_keeps_the_content_type():
+    minio = FakeMinio()
+
+    name = await store_audio(minio, b"clip", "audio/webm", extension="webm")
+    await store_audio(minio, b"clip", "audio/webm", extension="webm")
+
+    assert minio.touched == [name]
+    assert minio.headers[name] == {
+        "Content-Type": "audio/webm",
+        "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+    }
+
+
+@pytest.mark.asyncio
+async def test_confirm_audio_restores_object_released_before_reference():
+    minio = FakeMinio()
+    name = await store_audio(minio, b"shared bytes")
+    # A concurrent session delete released the object before the turn was saved.
+    await minio.delete_file(name)
+
+    await confirm_audio(minio, name, b"shared bytes")
+    await confirm_audio(minio, name, b"shared bytes")
+
+    assert minio.objects[name] == b"shared bytes"
+    assert len(minio.uploads) == 2
+
+
+@pytest.mark.asyncio
+async def test_release_keeps_objects_still_referenced(db):
+    shared = content_object_name(b"shared")
+    orphan = content_object_name(b"orphan")
+    db["Turn"].insert_one({"sessionId": "other", "audioFileId": shared})
+    minio = FakeMinio({shared: b"shared", orphan: b"orphan", "turn-legacy.mp3": b"x"})
+
+    deleted = await release_audio(
+        minio, _Client(db), [shared, orphan, orphan, "turn-legacy.mp3", "pending"]
+    )
+
+    assert deleted == [orphan, "turn-legacy.mp3"]
+    assert shared in minio.objects
+
+
+@pytest.mark.asyncio
+async def test_migration_rewrites_legacy_turns_and_dedupes(db):
+    db["Turn"].insert_many(
+        [
+            {"audioFileId": "turn-a.mp3"},
+            {"audioFileId": "turn-b.mp3"},
+            {"audioFileId": "pending"},
+        ]
+    )
+    minio = FakeMinio({"turn-a.mp3": b"retry", "turn-b.mp3": b"retry"})
+
+    dry = await migrate_legacy_audio(_Client(db), minio, dry_run=True)
+    assert dry["scanned"] == 2 and dry["migrated"] == 0
+    assert minio.uploads == []
+
+    stats = await migrate_legacy_audio(_Client(db), minio, delete_legacy=True)
+
+    target = content_object_name(b"retry")
+    assert stats == {
+        "scanned": 2,
+        "migrated": 2,
+        "deduplicated": 1,
+        "deleted": 2,
+        "failed": 0,
+    }
+    assert len(minio.uploads) == 1
+    assert db["Turn"].count_documents({"audioFileId": target}) == 2
+    assert set(minio.objects) == {target}
@@ -0,0 +1,106 @@
+import json
+
+import pytest
+
+import benchmarks.hot_paths  # noqa: F401  (registers the cases)
+from benchmarks.suite import (
+    CASES,
+    Case,
+    SkipCase,
+    compare,
+    find_baseline,
+    load_history,
+    main,
+    measure,
+)
+
+HOST = {"host": "bench-1", "python": "3.11.7", "platform": "Linux"}
+
+
+def _entry(commit, host="bench-1", python="3.11.7", minimum=10.0):
+    return {
+        "commit": commit,
+        "recordedAt": "2025-01-01T00:00:00+00:00",
+        "machine": {"host": host, "python": python},
+        "results": {"case.a": {"medianUs": minimum, "minUs": minimum}},
+    }
+
+
+def test_every_case_runs_or_skips():
+    for case in CASES.values():
+        result = measure(case, min_time=0, repeat=1)
+        assert "skipped" in result or result["minUs"] > 0, case.name
+
+
+def test_parametrized_cases_are_registered_per_value():
+    assert {"turn_messages.10", "turn_messages.100", "turn_messages.500"} <= set(CASES)
+    assert CASES["socket.broadcast.10"].params == {"sockets": 10}
+    assert CASES["socket.broadcast.10"].is_async
+
+
+def test_measure_reports_skips_and_cleans_up():
+    cleaned = []
+
+    def skipped():
+        raise SkipCase("needs ffmpeg")
+        yield
+
+    async def timed():
+        async def call():
+            return None
+
+        try:
+            yield call
+        finally:
+            cleaned.append(True)
+
+    assert measure(Case("skipped", skipped, {})) == {"skipped": "needs ffmpeg"}
+    result = measure(Case("timed", timed, {}), min_time=0.001, repeat=3)
+    assert result["repeats"] == 3
+    assert result["loops"] >= 1
+    assert cleaned == [True]
+
+
+def test_baseline_is_newest_run_on_same_host_and_python():
+    history = [
+        _entry("aaa1111"),
+        _entry("bbb2222"),
+        _entry("ccc3333", host="laptop"),
+        _entry("ddd4444", python="3.12.1"),
+    ]
+
+    assert find_baseline(history, host=HOST)["commit"] == "bbb2222"
+    assert find_baseline(history, host=HOST, commit="aaa")["commit"] == "aaa1111"
+    assert find_baseline(history, host={**HOST, "host": "other"}) is None
+
+
+def test_compare_flags_regressions_beyond_threshold():
+    results = {
+        "case.a": {"medianUs": 13.0, "minUs": 12.6},
+        "case.b": {"medianUs": 5.0, "minUs": 5.0},
+        "case.c": {"skipped": "ffmpeg not on PATH"},
+    }
+    rows = compare(results, {"case.a": {"minUs": 10.0}, "case.c": {"minUs": 1.0}}, 0.25)
+
+    by_name = {row["name"]: row for row in rows}
+    assert by_name["case.a"]["regressed"] is True
+    assert by_name["case.a"]["change"] == pytest.approx(0.26)
+    assert "change" not in by_name["case.b"]
+    assert "change" not in by_name["case.c"]
+
+
+def test_main_saves_only_passing_runs(tmp_path, monkeypatch):
+    history = tmp_path / "history.jsonl"
+    monkeypatch.setattr("benchmarks.suite.machine", lambda: HOST)
+    monkeypatch.setattr("benchmarks.suite.current_commit", lambda: "abc1234")
+    arguments = ["--filter", "records.doc_from_payload", "--min-time", "0.001", "--repeat", "1"]
+
+    assert main([*arguments, "--history", str(history), "--save"]) == 0
+    saved = load_history(history)
+    assert [entry["commit"] for entry in saved] == ["abc1234"]
+    assert "records.doc_from_payload" in saved[0]["results"]
+
+    saved[0]["results"]["records.doc_from_payload"]["minUs"] = 1e-6
+    history.write_text(json.dumps(saved[0]) + "\n")
+    assert main([*arguments, "--history", str(history), "--save"]) == 1
+    assert len(load_history(history)) == 1
@@ -1,6 +1,6 @@
 import pytest
 
-from app.config import SettingsError, load_settings
+from app.config import SettingsError, load_settings, parse_sampling
 
 
 def _set_required_envs(monkeypatch):
@@ -64,3 +64,112 @@ def test_objective_check_base_defaults_to_evaluator_base(monkeypatch):
     settings = load_settings()
 
     assert settings.objective_check_api_base == settings.chatai_api_base
+
+
+def test_vad_thresholds_are_validated(monkeypatch):
+    _set_required_envs(monkeypatch)
+    monkeypatch.setenv("VAD_ENERGY_THRESHOLD_DB", "-50")
+    assert load_settings().vad_energy_threshold_db == -50.0
+
+    monkeypatch.setenv("VAD_ZCR_MAX", "1.5")
+    with pytest.raises(SettingsError) as exc:
+        load_settings()
+
+    assert "VAD_ZCR_MAX" in str(exc.value)
+
+
+def test_generated_transcripts_require_text_only_replies(monkeypatch):
+    _set_required_envs(monkeypatch)
+    monkeypatch.setenv("TRANSCRIPT_SOURCE", "generation")
+    monkeypatch.delenv("QWEN_VOICE_ID", raising=False)
+    assert load_settings().transcript_source == "generation"
+
+    monkeypatch.setenv("QWEN_VOICE_ID", "Cherry")
+    with pytest.raises(SettingsError) as exc:
+        load_settings()
+
+    assert "QWEN_VOICE_ID" in str(exc.value)
+
+
+def test_metrics_series_limit_must_be_positive(monkeypatch):
+    _set_required_envs(monkeypatch)
+    assert load_settings().metrics_max_series == 200
+
+    monkeypatch.setenv("METRICS_MAX_SERIES", "0")
+    with pytest.raises(SettingsError) as exc:
+        load_settings()
+
+    assert "METRICS_MAX_SERIES" in str(exc.value)
+
+
+def test_qwen_api_base_defaults_to_dashscope(monkeypatch):
+    _set_required_envs(monkeypatch)
+    monkeypatch.delenv("QWEN_API_BASE", raising=False)
+    assert load_settings().qwen_api_base.startswith("https://dashscope.aliyuncs.com/")
+
+    monkeypatch.setenv("QWEN_API_BASE", "http://127.0.0.1:8090")
+    assert load_settings().qwen_api_base == "http://127.0.0.1:8090"
+
+    monkeypatch.setenv("QWEN_API_BASE", "dashscope")
+    with pytest.raises(SettingsError):
+        load_settings()
+
+
+def test_llm_cassette_settings_are_validated(monkeypatch):
+    _set_required_envs(monkeypatch)
+    assert load_settings().llm_cassette_mode == "off"
+
+    monkeypatch.setenv("LLM_CASSETTE_MODE", "replay")
+    with pytest.raises(SettingsError) as exc:
+        load_settings()
+    assert "requires LLM_CASSETTE_PATH" in str(exc.value)
+
+    monkeypatch.setenv("LLM_CASSETTE_PATH", "cassettes/run.jsonl")
+    monkeypatch.setenv("LLM_CASSETTE_TIME_SCALE", "-1")
+    with pytest.raises(SettingsError):
+        load_settings()
+
+
+def test_loop_lag_monitor_settings_are_validated(monkeypatch):
+    _set_required_envs(monkeypatch)
+    settings = load_settings()
+    assert (settings.loop_lag_interval_ms, settings.loop_lag_threshold_ms) == (100, 200)
+
+    monkeypatch.setenv("LOOP_LAG_THRESHOLD_MS", "0")
+    with pytest.raises(SettingsError):
+        load_settings()
+
+
+def test_log_settings_are_validated(monkeypatch):
+    _set_required_envs(monkeypatch)
+    monkeypatch.setenv("LOG_SAMPLING", "app.telemetry=0.1")
+    settings = load_settings()
+    assert (settings.log_level, settings.log_format) == ("INFO", "json")
+    assert settings.log_sampling == {"app.telemetry": 0.1}
+
+    monkeypatch.setenv("LOG_SAMPLING", "app.telemetry=10")
+    with pytest.raises(SettingsError) as exc:
+        load_settings()
+    assert "Invalid LOG_SAMPLING" in str(exc.value)
+
+
+def test_parse_sampling_validates_rates():
+    assert parse_sampling("app.telemetry=0.1, app.clients.llm=1") == {
+        "app.telemetry": 0.1,
+        "app.clients.llm": 1.0,
+    }
+    assert parse_sampling(None) == {}
+    for spec in ("app.telemetry", "app.telemetry=2", "=0.5", "app=half"):
+        with pytest.raises(ValueError):
+            parse_sampling(spec)
+
+
+def test_rollup_recompute_settings_are_validated(monkeypatch):
+    _set_required_envs(monkeypatch)
+    settings = load_settings()
+    assert not settings.rollup_recompute_enabled
+    assert settings.rollup_recompute_days == 7
+
+    monkeypatch.setenv("ROLLUP_RECOMPUTE_DAYS", "0")
+    with pytest.raises(SettingsError):
+        load_settings()
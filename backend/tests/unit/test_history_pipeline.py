@@ -0,0 +1,154 @@
+from datetime import datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from bson import ObjectId
+
+from app.repositories.session_repository import (
+    SessionRepository,
+    _history_pipeline,
+    decode_history_cursor,
+    encode_history_cursor,
+)
+
+
+class _AsyncCursor:
+    def __init__(self, docs):
+        self._docs = docs
+
+    async def to_list(self, length=None):
+        return self._docs
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    async def aggregate(self, pipeline):
+        return _AsyncCursor(list(self._collection.aggregate(pipeline)))
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+@pytest.fixture
+def repo_with_sessions():
+    db = mongomock.MongoClient()["test_db"]
+    base = datetime(2025, 1, 1)
+    for index in range(7):
+        db["PracticeSession"].insert_one(
+            {
+                "scenarioId": "scenario-1",
+                "stubUserId": "pilot-user",
+                "status": "ended",
+                "startedAt": base + timedelta(days=index % 5),
+            }
+        )
+    db["PracticeSession"].insert_one(
+        {"scenarioId": "scenario-1", "stubUserId": "someone-else", "startedAt": base}
+    )
+    return SessionRepository(_Client(db))
+
+
+@pytest.mark.asyncio
+async def test_page_mode_returns_total_and_sorted_page(repo_with_sessions):
+    page = await repo_with_sessions.list_history(
+        stub_user_id="pilot-user", page=1, page_size=3
+    )
+
+    assert page.total == 7
+    started = [item.started_at for item in page.items]
+    assert started == sorted(started, reverse=True)
+    assert page.next_cursor is not None
+
+
+@pytest.mark.asyncio
+async def test_cursor_mode_walks_every_session_once(repo_with_sessions):
+    seen = []
+    cursor = None
+    while True:
+        page = await repo_with_sessions.list_history(
+            stub_user_id="pilot-user", page_size=2, cursor=cursor
+        )
+        seen.extend(item.id for item in page.items)
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == 7
+    assert len(set(seen)) == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("ascending", [False, True])
+async def test_cursor_mode_pages_across_started_at_types(ascending):
+    db = mongomock.MongoClient()["test_db"]
+    for started_at in (
+        datetime(2025, 1, 2),
+        datetime(2025, 1, 1),
+        "2024-12-31T10:00:00",
+        "not a date",
+        None,
+    ):
+        db["PracticeSession"].insert_one({"stubUserId": "pilot-user", "startedAt": started_at})
+    db["PracticeSession"].insert_one({"stubUserId": "pilot-user"})
+    repo = SessionRepository(_Client(db))
+
+    seen = []
+    cursor = None
+    while True:
+        page = await repo.list_history(
+            stub_user_id="pilot-user", page_size=1, cursor=cursor, ascending=ascending
+        )
+        seen.extend(item.id for item in page.items)
+        if not page.next_cursor:
+            break
+        cursor = page.next_cursor
+
+    assert len(seen) == 6
+    assert len(set(seen)) == 6
+
+
+def test_invalid_cursor_raises_value_error():
+    with pytest.raises(ValueError):
+        decode_history_cursor("not-a-cursor")
+
+
+def test_scenario_filters_use_projected_lookup():
+    pipeline = _history_pipeline(
+        stub_user_id="pilot-user", category="Feedback", search="a.b"
+    )
+
+    stages = [next(iter(stage)) for stage in pipeline]
+    assert stages == ["$match", "$sort", "$lookup", "$match", "$project", "$facet"]
+    lookup = pipeline[2]["$lookup"]
+    assert lookup["from"] == "Scenario"
+    assert lookup["pipeline"][-1]["$project"] == {
+        "_id": 0,
+        "category": 1,
+        "title": 1,
+        "objective": 1,
+    }
+    assert pipeline[3]["$match"]["scenario.category"] == "Feedback"
+    assert pipeline[3]["$match"]["$or"][0]["scenario.title"]["$regex"] == r"a\.b"
+
+
+def test_cursor_keeps_the_stored_type_of_started_at():
+    object_id = ObjectId()
+    stored = datetime(2025, 1, 2, 3, 4, 5)
+
+    started_at, _ = decode_history_cursor(
+        encode_history_cursor({"_id": object_id, "startedAt": stored})
+    )
+    assert started_at == stored.replace(tzinfo=timezone.utc)
+
+    legacy = "2025-01-02T03:04:05Z"
+    started_at, decoded_id = decode_history_cursor(
+        encode_history_cursor({"_id": object_id, "startedAt": legacy})
+    )
+    assert (started_at, decoded_id) == (legacy, object_id)
@@ -5,7 +5,7 @@ import pytest
 
 from app.api.routes import history as history_routes
 from app.main import app
-from app.repositories.session_repository import PracticeSessionRecord
+from app.repositories.session_repository import HistoryPage, PracticeSessionRecord
 
 
 @pytest.mark.asyncio
@@ -24,8 +24,8 @@ async def test_history_list_span_attributes(monkeypatch):
     monkeypatch.setattr(history_routes, "start_span", fake_start_span)
     monkeypatch.setattr(history_routes, "emit_metric", lambda *args, **kwargs: None)
 
-    async def _list_sessions(stub_user_id=None):
-        return [
+    async def _list_history(**kwargs):
+        items = [
             PracticeSessionRecord(
                 id="session-1",
                 scenario_id="scenario-1",
@@ -46,24 +46,12 @@ async def test_history_list_span_attributes(monkeypatch):
                 evaluation_id=None,
             )
         ]
+        return HistoryPage(items=items, total=len(items), next_cursor=None)
 
     class FakeRepo:
-        list_sessions = staticmethod(_list_sessions)
-
-    class FakeScenarioRepo:
-        async def get(self, scenario_id: str):
-            return type(
-                "Scenario",
-                (),
-                {
-                    "category": "Feedback",
-                    "title": "Growth",
-                    "objective": "Grow",
-                },
-            )()
+        list_history = staticmethod(_list_history)
 
     app.dependency_overrides[history_routes._session_repo] = lambda: FakeRepo()
-    app.dependency_overrides[history_routes._scenario_repo] = lambda: FakeScenarioRepo()
 
     monkeypatch.setenv("LEAN_APP_ID", "app")
     monkeypatch.setenv("LEAN_APP_KEY", "key")
@@ -102,4 +90,3 @@ async def test_history_list_span_attributes(monkeypatch):
     assert attrs["search"] == "growth"
 
     app.dependency_overrides.pop(history_routes._session_repo, None)
-    app.dependency_overrides.pop(history_routes._scenario_repo, None)
@@ -0,0 +1,122 @@
+import pytest
+
+from app.repositories import index_registry
+from app.repositories.indexes import (
+    HotQuery,
+    IndexSpec,
+    explain_hot_queries,
+    reconcile_indexes,
+    summarize_explain,
+)
+
+
+class FakeCursor:
+    def __init__(self, explain):
+        self._explain = explain
+        self.sort_spec = None
+
+    def sort(self, spec):
+        self.sort_spec = spec
+        return self
+
+    async def explain(self):
+        return self._explain
+
+
+class FakeCollection:
+    def __init__(self, indexes, explain=None):
+        self.indexes = indexes
+        self._explain = explain or {}
+
+    async def index_information(self):
+        return dict(self.indexes)
+
+    def find(self, query):
+        return FakeCursor(self._explain)
+
+
+class FakeClient:
+    def __init__(self, collections):
+        self.collections = collections
+        self.created = []
+
+    async def collection(self, name):
+        return self.collections.setdefault(name, FakeCollection({"_id_": {"key": [("_id", 1)]}}))
+
+    async def create_index(self, collection_name, keys, *, unique=False, name=None, **kwargs):
+        self.created.append((collection_name, keys, name))
+        return name
+
+
+@pytest.mark.asyncio
+async def test_reconcile_creates_missing_and_reports_drift_and_extra():
+    client = FakeClient(
+        {
+            "Turn": FakeCollection(
+                {
+                    "_id_": {"key": [("_id", 1)]},
+                    "sessionId": {"key": [("sessionId", 1)]},
+                    "legacy": {"key": [("speaker", 1)]},
+                }
+            )
+        }
+    )
+    specs = (
+        IndexSpec("Turn", (("sessionId", 1), ("sequence", 1)), "sessionId_sequence"),
+        IndexSpec("Turn", (("sessionId", -1),), "sessionId"),
+        IndexSpec("Evaluation", (("sessionId", 1),), "sessionId"),
+    )
+
+    report = await reconcile_indexes(client, specs)
+
+    assert report.created == ["Turn.sessionId_sequence", "Evaluation.sessionId"]
+    assert report.drifted and report.drifted[0][0] == "Turn.sessionId"
+    assert report.extra == ["Turn.legacy"]
+    assert ("Turn", [("sessionId", 1), ("sequence", 1)], "sessionId_sequence") in client.created
+
+
+@pytest.mark.asyncio
+async def test_reconcile_dry_run_creates_nothing():
+    client = FakeClient({})
+
+    report = await reconcile_indexes(client, index_registry.REGISTERED_INDEXES, dry_run=True)
+
+    assert client.created == []
+    assert len(report.created) == len(index_registry.REGISTERED_INDEXES)
+
+
+@pytest.mark.asyncio
+async def test_explain_detects_collection_scan():
+    ixscan = {
+        "queryPlanner": {
+            "winningPlan": {
+                "stage": "FETCH",
+                "inputStage": {"stage": "IXSCAN", "indexName": "sessionId_sequence"},
+            }
+        }
+    }
+    collscan = {"queryPlanner": {"winningPlan": {"stage": "COLLSCAN"}}}
+    client = FakeClient(
+        {"Turn": FakeCollection({}, ixscan), "AuditLog": FakeCollection({}, collscan)}
+    )
+    queries = (
+        HotQuery("turns", "Turn", {"sessionId": "s"}, (("sequence", 1),)),
+        HotQuery("audit", "AuditLog", {"adminId": "a"}),
+    )
+
+    plans = await explain_hot_queries(client, queries)
+
+    assert plans[0].uses_index and plans[0].index_names == ("sessionId_sequence",)
+    assert not plans[1].uses_index
+
+
+def test_summarize_explain_unwraps_sbe_query_plan():
+    explain = {
+        "queryPlanner": {
+            "winningPlan": {"queryPlan": {"stage": "IXSCAN", "indexName": "status"}}
+        }
+    }
+
+    plan = summarize_explain(HotQuery("skills", "Skill", {"status": "active"}), explain)
+
+    assert plan.uses_index
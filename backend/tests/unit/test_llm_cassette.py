@@ -0,0 +1,140 @@
+import json
+import time
+
+import httpx
+import pytest
+
+from app.clients.cassette import (
+    Cassette,
+    RecordingTransport,
+    ReplayTransport,
+    fingerprint,
+)
+from app.clients.llm import EvaluatorClient, LLMError, QwenClient
+from app.services.audio import AudioBuffer
+from app.telemetry.otel import start_span
+from loadtest.providers import REPLY_TEXT, ProviderConfig, create_app
+
+FAST = ProviderConfig(
+    first_chunk_ms=1,
+    chunk_interval_ms=0,
+    jitter=0,
+    reply_audio_seconds=0.5,
+    asr_ms=1,
+    tool_call_ms=1,
+    evaluation_ms=1,
+)
+GENERATION = {
+    "model": "qwen3-omni-flash",
+    "messages": [
+        {"role": "system", "content": "Stay in character."},
+        {
+            "role": "user",
+            "content": [
+                {"type": "input_audio", "input_audio": {"data": "data:audio/mp3;base64,AAAA"}}
+            ],
+        },
+    ],
+    "modalities": ["text", "audio"],
+    "audio": {"voice": "Cherry", "format": "wav"},
+    "stream": True,
+}
+
+
+def _with_audio(data_uri):
+    payload = json.loads(json.dumps(GENERATION))
+    payload["messages"][1]["content"][0]["input_audio"]["data"] = data_uri
+    return payload
+
+
+async def _generate(transport, payload=GENERATION):
+    client = QwenClient(base_url="http://providers", api_key="key", transport=transport)
+    try:
+        return await client.generate(payload)
+    finally:
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_recorded_stream_replays_without_provider(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    provider = httpx.ASGITransport(app=create_app(FAST, seed=0))
+    with start_span("turn.pipeline", {"sessionId": "session-1"}):
+        recorded = await _generate(RecordingTransport(Cassette(path), provider))
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [entry["sessionId"] for entry in entries] == ["session-1"]
+    assert entries[0]["status"] == 200
+    assert entries[0]["chunks"]
+
+    # Other audio in the same prompt still matches the recording.
+    replayed = await _generate(
+        ReplayTransport(Cassette.load(path, session_id="session-1"), time_scale=0),
+        _with_audio("data:audio/mp3;base64,BBBBBBBB"),
+    )
+
+    message = replayed["choices"][0]["message"]
+    assert message["content"] == REPLY_TEXT == recorded["choices"][0]["message"]["content"]
+    assert isinstance(message["audio"]["data"], AudioBuffer)
+    recorded_audio = recorded["choices"][0]["message"]["audio"]["data"]
+    assert message["audio"]["data"].to_bytes() == recorded_audio.to_bytes()
+
+
+def test_fingerprint_ignores_audio_but_not_prompt():
+    def key(payload):
+        return fingerprint("POST", "/chat/completions", json.dumps(payload).encode())
+
+    assert key(GENERATION) == key(_with_audio("data:audio/wav;base64,UklGRg=="))
+    changed = json.loads(json.dumps(GENERATION))
+    changed["messages"][0]["content"] = "Break character."
+    assert key(GENERATION) != key(changed)
+
+
+@pytest.mark.asyncio
+async def test_replay_scales_recorded_timing_and_repeats_in_order(tmp_path):
+    body = {"choices": [{"message": {"content": "first"}}]}
+    key = fingerprint("POST", "/chat/completions", json.dumps({"model": "m"}).encode())
+    entries = [
+        {
+            "fingerprint": key,
+            "status": 200,
+            "headers": {"content-type": "application/json"},
+            "headersMs": 100.0,
+            "chunks": [[300.0, json.dumps(body)]],
+        },
+        {
+            "fingerprint": key,
+            "status": 200,
+            "headers": {"content-type": "application/json"},
+            "headersMs": 0.0,
+            "chunks": [[0.0, json.dumps({"choices": [{"message": {"content": "second"}}]})]],
+        },
+    ]
+    transport = ReplayTransport(Cassette(tmp_path / "c.jsonl", entries), time_scale=0.25)
+    client = EvaluatorClient(base_url="http://providers", api_key="key", transport=transport)
+    try:
+        started = time.monotonic()
+        first = await client.evaluate({"model": "m"})
+        elapsed = time.monotonic() - started
+        second = await client.evaluate({"model": "m"})
+        third = await client.evaluate({"model": "m"})
+    finally:
+        await client.close()
+
+    assert 0.07 <= elapsed < 0.3
+    assert [
+        response["choices"][0]["message"]["content"] for response in (first, second, third)
+    ] == ["first", "second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_unrecorded_request_fails_the_call(tmp_path):
+    transport = ReplayTransport(Cassette(tmp_path / "empty.jsonl"), time_scale=0)
+    client = EvaluatorClient(base_url="http://providers", api_key="key", transport=transport)
+    try:
+        with pytest.raises(LLMError) as exc:
+            await client.evaluate({"model": "m"})
+    finally:
+        await client.close()
+
+    assert "No recorded exchange" in str(exc.value)
@@ -29,6 +29,7 @@ async def test_qwen_generate_retries_and_parses():
     result = await client.generate({"model": "qwen3-omni-flash"})
 
     assert result["choices"][0]["message"]["content"] == "ok"
+    assert result["timings"]["totalMs"] >= 0
     assert calls["count"] == 2
 
     await client.close()
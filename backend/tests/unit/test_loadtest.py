@@ -0,0 +1,193 @@
+import io
+import json
+import wave
+
+import httpx
+import pytest
+
+from app.clients.llm import EvaluatorClient, QwenClient
+from app.services.audio import AudioBuffer
+from app.services.evaluation_service import _parse_tool_call
+from app.services.objective_check import _parse_objective_response
+from app.telemetry.metrics import MetricsRegistry
+from loadtest.fixtures import speech_fixture
+from loadtest.providers import (
+    AUDIO_SAMPLE_RATE,
+    REPLY_TEXT,
+    TRAINEE_TRANSCRIPT,
+    ProviderConfig,
+    create_app,
+)
+from loadtest.report import (
+    LoadResults,
+    build_report,
+    histogram_quantile,
+    percentile,
+    server_summary,
+)
+
+FAST = ProviderConfig(
+    first_chunk_ms=1,
+    chunk_interval_ms=0,
+    jitter=0,
+    reply_audio_seconds=0.5,
+    asr_ms=1,
+    tool_call_ms=1,
+    evaluation_ms=1,
+)
+
+
+def _transport(config=FAST):
+    return httpx.ASGITransport(app=create_app(config, seed=0))
+
+
+@pytest.mark.asyncio
+async def test_fake_provider_streams_text_and_pcm_to_qwen_client():
+    client = QwenClient(base_url="http://providers", api_key="key", transport=_transport())
+    try:
+        response = await client.generate(
+            {
+                "model": "qwen3-omni-flash",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "modalities": ["text", "audio"],
+                "audio": {"voice": "Cherry", "format": "wav"},
+                "stream": True,
+                "stream_options": {"include_usage": True},
+            }
+        )
+    finally:
+        await client.close()
+
+    message = response["choices"][0]["message"]
+    assert message["content"] == REPLY_TEXT
+    assert isinstance(message["audio"]["data"], AudioBuffer)
+    assert len(message["audio"]["data"]) == int(0.5 * AUDIO_SAMPLE_RATE) * 2
+    assert "firstAudioMs" in response["timings"]
+
+
+@pytest.mark.asyncio
+async def test_fake_provider_answers_asr_and_transcript_requests():
+    client = QwenClient(base_url="http://providers", api_key="key", transport=_transport())
+    try:
+        asr = await client.asr({"model": "qwen3-asr", "input": "UklGRg==", "format": "wav"})
+        generated = await client.generate(
+            {
+                "model": "qwen3-omni-flash",
+                "messages": [
+                    {"role": "system", "content": "Repeat it inside <transcript></transcript>."}
+                ],
+                "stream": True,
+            }
+        )
+    finally:
+        await client.close()
+
+    assert asr == {"text": TRAINEE_TRANSCRIPT}
+    assert generated["choices"][0]["message"]["content"].startswith(
+        f"<transcript>{TRAINEE_TRANSCRIPT}</transcript>"
+    )
+    assert "audio" not in generated["choices"][0]["message"]
+
+
+@pytest.mark.asyncio
+async def test_fake_provider_returns_parseable_tool_calls():
+    client = EvaluatorClient(base_url="http://providers", api_key="key", transport=_transport())
+    try:
+        objective = await client.evaluate(
+            {
+                "model": "checker",
+                "messages": [{"role": "user", "content": "Objective: ship"}],
+                "tools": [{"type": "function", "function": {"name": "objective_check_result"}}],
+                "tool_choice": {
+                    "type": "function",
+                    "function": {"name": "objective_check_result"},
+                },
+            }
+        )
+        evaluation = await client.evaluate(
+            {
+                "model": "evaluator",
+                "messages": [
+                    {
+                        "role": "user",
+                        "content": "Skills:\nskill-1: Clarity — rubric\nskill-2: Empathy — rubric"
+                        "\nTranscript:\ntrainee: hi",
+                    }
+                ],
+                "tools": [{"type": "function", "function": {"name": "evaluation_result"}}],
+                "tool_choice": {"type": "function", "function": {"name": "evaluation_result"}},
+            }
+        )
+    finally:
+        await client.close()
+
+    assert _parse_objective_response(objective).status == "continue"
+    result = _parse_tool_call(evaluation)
+    assert [score.skill_id for score in result.scores] == ["skill-1", "skill-2"]
+
+
+@pytest.mark.asyncio
+async def test_fake_provider_injects_errors():
+    config = ProviderConfig(jitter=0, error_rate=1.0)
+    async with httpx.AsyncClient(transport=_transport(config), base_url="http://providers") as http:
+        response = await http.post("/chat/completions", json={"messages": []})
+        stats = await http.get("/stats")
+
+    assert response.status_code == 503
+    assert stats.json() == {"requests": {"error": 1}}
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(value) for value in range(1, 101)]
+
+    assert percentile(values, 0.5) == 50
+    assert percentile(values, 0.99) == 99
+    assert percentile([], 0.5) is None
+
+
+def test_histogram_quantile_interpolates_within_bucket():
+    buckets = [(1.0, 0.0), (2.0, 50.0), (4.0, 100.0), (float("inf"), 100.0)]
+
+    assert histogram_quantile(buckets, 0.5) == 2.0
+    assert histogram_quantile(buckets, 0.75) == 3.0
+    assert histogram_quantile([], 0.5) is None
+
+
+def test_server_summary_reads_lag_and_stage_means():
+    metrics = MetricsRegistry()
+    for value in (0.5, 0.5, 0.5, 30.0):
+        metrics.observe("event_loop.lag_ms", value)
+    metrics.observe("turn.stage_ms", 120.0, {"stage": "generation"})
+    metrics.observe("turn.stage_ms", 80.0, {"stage": "generation"})
+
+    summary = server_summary(metrics.render_prometheus())
+
+    assert summary["eventLoopLagMs"]["samples"] == 4
+    assert summary["eventLoopLagMs"]["p50"] <= 0.5
+    assert summary["eventLoopLagMs"]["p99"] > 16
+    assert summary["stageMeanMs"] == {"generation": 100.0}
+
+
+def test_build_report_counts_errors_and_rates():
+    results = LoadResults(turn_latency_ms=[800.0, 1200.0, 950.0], turns_attempted=4)
+    results.error("turn_timeout")
+    results.finish()
+
+    report = build_report(results, config={"trainees": 1})
+
+    assert report["turnLatencyMs"]["count"] == 3
+    assert report["turnLatencyMs"]["p50"] == 950.0
+    assert report["errors"] == {
+        "total": 1,
+        "byKind": {"turn_timeout": 1},
+        "turnErrorRate": 0.25,
+    }
+    assert report["server"] is None
+    json.dumps(report)
+
+
+def test_speech_fixture_is_padded_wav():
+    with wave.open(io.BytesIO(speech_fixture(1))) as wav:
+        assert wav.getframerate() == 16000
+        assert wav.getnframes() == int((0.3 + 1 + 0.6) * 16000)
+
@@ -0,0 +1,90 @@
+import io
+import json
+import logging
+
+import pytest
+
+from app.telemetry.logs import (
+    RedactingQueueHandler,
+    SamplingFilter,
+    configure_logging,
+    redact,
+)
+from app.telemetry.otel import start_span
+
+AUDIO = "UklGR" + "A" * 5000
+
+
+@pytest.fixture
+def log_output():
+    root = logging.getLogger()
+    level = root.level
+    stream = io.StringIO()
+    listener = configure_logging(max_chars=300, sampling={"app.noisy": 0.0}, stream=stream)
+    stopped = []
+
+    def read_lines():
+        listener.stop()
+        stopped.append(True)
+        return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+    try:
+        yield read_lines
+    finally:
+        if not stopped:
+            listener.stop()
+        for handler in list(root.handlers):
+            if isinstance(handler, RedactingQueueHandler):
+                root.removeHandler(handler)
+        root.setLevel(level)
+
+
+def test_redact_replaces_base64_and_truncates():
+    assert redact(f"url=data:audio/mp3;base64,{AUDIO[:40]} end") == (
+        "url=<base64 62 chars> end"
+    )
+    assert redact(f"response={{'data': '{AUDIO}'}}", 6000) == (
+        "response={'data': '<base64 5005 chars>'}"
+    )
+    assert redact("x" * 150, 100) == "x" * 100 + "... [50 more chars]"
+    assert redact("a short line") == "a short line"
+
+
+def test_sampling_uses_most_specific_logger_and_keeps_warnings():
+    sampler = SamplingFilter({"app": 0.0, "app.services.turn_pipeline": 1.0})
+
+    def record(name, level=logging.INFO):
+        return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+    assert not sampler.filter(record("app.telemetry"))
+    assert sampler.filter(record("app.telemetry", logging.WARNING))
+    assert sampler.filter(record("app.services.turn_pipeline"))
+    assert sampler.filter(record("application"))
+
+
+def test_configured_logging_writes_redacted_json_lines(log_output):
+    logger = logging.getLogger("app.services.turn_pipeline")
+
+    with start_span("turn.initiation", {"sessionId": "session-1"}):
+        logger.info("Response structure: %s", {"audio": {"data": AUDIO}}, extra={"turnId": "t-1"})
+    logging.getLogger("app.noisy").info("dropped")
+    logging.getLogger("app.noisy").warning("kept")
+    try:
+        raise RuntimeError("boom")
+    except RuntimeError:
+        logger.exception("failed")
+
+    lines = log_output()
+    assert [line["message"] for line in lines] == [
+        # Truncated to 300 characters first, then the base64 left in them replaced.
+        "Response structure: {'audio': {'data': '<base64 260 chars>... [4748 more chars]",
+        "kept",
+        "failed",
+    ]
+    first = lines[0]
+    assert first["level"] == "INFO"
+    assert first["logger"] == "app.services.turn_pipeline"
+    assert first["sessionId"] == "session-1"
+    assert first["turnId"] == "t-1"
+    assert "traceId" in first
+    assert "RuntimeError: boom" in lines[2]["exception"]
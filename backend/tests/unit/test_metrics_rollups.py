@@ -0,0 +1,218 @@
+from datetime import date, datetime, timedelta, timezone
+
+import mongomock
+import pytest
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo import ReplaceOne
+
+from app.repositories.rollup_repository import RollupRepository
+from app.services.admin.metrics_service import AdminMetricsService
+from app.services.metrics_rollups import (
+    record_evaluation,
+    record_session_end,
+    recompute_rollups,
+)
+
+NOW = datetime(2025, 6, 10, 12, tzinfo=timezone.utc)
+YESTERDAY = NOW - timedelta(days=1)
+
+
+class _AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+        self._docs = None
+
+    def sort(self, key, direction):
+        self._cursor = self._cursor.sort(key, direction)
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._cursor)
+
+    def __aiter__(self):
+        self._docs = iter(self._cursor)
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._docs)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    def find(self, query, projection=None, **kwargs):
+        return _AsyncCursor(self._collection.find(query, projection))
+
+    async def find_one_and_update(self, query, update):
+        return self._collection.find_one_and_update(query, update)
+
+    async def update_one(self, query, update, upsert=False):
+        return self._collection.update_one(query, update, upsert=upsert)
+
+    async def update_many(self, query, update):
+        return self._collection.update_many(query, update)
+
+    async def bulk_write(self, requests, ordered=True):
+        # mongomock's bulk_write does not accept current pymongo operations.
+        for request in requests:
+            if isinstance(request, ReplaceOne):
+                self._collection.replace_one(request._filter, request._doc, upsert=request._upsert)
+            else:
+                self._collection.delete_many(request._filter)
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+def _session(db, *, ended_at, objective="succeeded", reason="objective_met"):
+    return str(
+        db["PracticeSession"].insert_one(
+            {
+                "scenarioId": "scenario-1",
+                "status": "ended",
+                "objectiveStatus": objective,
+                "terminationReason": reason,
+                "startedAt": ended_at - timedelta(minutes=5),
+                "endedAt": ended_at,
+            }
+        ).inserted_id
+    )
+
+
+def _evaluation(db, session_id, ratings):
+    db["Evaluation"].insert_one(
+        {
+            "sessionId": session_id,
+            "status": "completed",
+            "scores": [{"skillId": skill, "rating": rating} for skill, rating in ratings.items()],
+        }
+    )
+
+
+def _rollups(db):
+    return {doc["_id"]: doc for doc in db["MetricsRollup"].find()}
+
+
+@pytest.fixture
+def db():
+    return mongomock.MongoClient()["test_db"]
+
+
+@pytest.mark.asyncio
+async def test_session_end_and_evaluation_are_counted_once(db):
+    client = _Client(db)
+    session_id = _session(db, ended_at=YESTERDAY)
+    scores = [{"skillId": "skill-1", "rating": 4}, {"skillId": "skill-2", "rating": 2}]
+
+    assert await record_session_end(client, session_id)
+    assert not await record_session_end(client, session_id)
+    assert await record_evaluation(client, session_id, scores)
+    assert not await record_evaluation(client, session_id, scores)
+
+    rollups = _rollups(db)
+    scenario = rollups["scenario:2025-06-09:scenario-1"]
+    assert (scenario["sessions"], scenario["succeeded"], scenario["evaluations"]) == (1, 1, 1)
+    assert scenario["terminations"] == {"objective_met": 1}
+    assert scenario["durationSeconds"] == 300
+    assert (scenario["ratingSum"], scenario["ratingCount"]) == (6, 2)
+    assert rollups["skill:2025-06-09:skill-1"]["ratingSum"] == 4
+
+
+@pytest.mark.asyncio
+async def test_active_sessions_are_not_counted(db):
+    session_id = str(db["PracticeSession"].insert_one({"status": "active"}).inserted_id)
+
+    assert not await record_session_end(_Client(db), session_id)
+    assert not await record_session_end(_Client(db), str(ObjectId()))
+    assert _rollups(db) == {}
+
+
+@pytest.mark.asyncio
+async def test_recompute_rebuilds_complete_days_and_matches_incremental(db):
+    client = _Client(db)
+    counted = _session(db, ended_at=YESTERDAY)
+    _evaluation(db, counted, {"skill-1": 4})
+    await record_session_end(client, counted)
+    await record_evaluation(client, counted, [{"skillId": "skill-1", "rating": 4}])
+    incremental = _rollups(db)
+    # Ended without passing through a hook, e.g. a crash before the increment.
+    # Older sessions store the reason as a {"reason": ...} object.
+    missed = _session(db, ended_at=YESTERDAY, objective="unknown", reason={"reason": "manual"})
+    _evaluation(db, missed, {"skill-1": 2})
+    today = _session(db, ended_at=NOW)
+    await record_session_end(client, today)
+    db["MetricsRollup"].insert_one(
+        {"_id": "scenario:2024-01-01:old", "kind": "scenario", "day": "2024-01-01", "sessions": 9}
+    )
+    # Inside the window but no longer produced by any session.
+    db["MetricsRollup"].insert_one(
+        {"_id": "skill:2025-06-08:gone", "kind": "skill", "day": "2025-06-08", "ratingCount": 1}
+    )
+
+    report = await recompute_rollups(client, days=3, now=NOW, batch_size=1)
+
+    assert report.days == ["2025-06-07", "2025-06-08", "2025-06-09"]
+    assert (report.sessions, report.evaluations) == (2, 2)
+    rollups = _rollups(db)
+    scenario = rollups["scenario:2025-06-09:scenario-1"]
+    assert (scenario["sessions"], scenario["succeeded"], scenario["evaluations"]) == (2, 1, 2)
+    assert scenario["terminations"] == {"objective_met": 1, "manual": 1}
+    assert rollups["skill:2025-06-09:skill-1"]["ratingCount"] == 2
+    assert rollups["scenario:2025-06-10:scenario-1"]["sessions"] == 1
+    assert rollups["scenario:2024-01-01:old"]["sessions"] == 9
+    assert "skill:2025-06-08:gone" not in rollups
+    # The repaired session is flagged, so a late hook does not count it again.
+    assert not await record_session_end(client, missed)
+
+    for session_id in (missed, today):
+        db["PracticeSession"].delete_one({"_id": ObjectId(session_id)})
+    db["Evaluation"].delete_many({"sessionId": missed})
+    await recompute_rollups(client, days=3, now=NOW)
+    rebuilt = _rollups(db)
+    for key, doc in incremental.items():
+        assert {k: v for k, v in rebuilt[key].items() if k != "_id"} == {
+            k: v for k, v in doc.items() if k != "_id"
+        }
+
+
+@pytest.mark.asyncio
+async def test_admin_summary_reads_rollups(db):
+    client = _Client(db)
+    for ended_at, objective in ((YESTERDAY, "succeeded"), (NOW, "failed"), (NOW, "unknown")):
+        session_id = _session(db, ended_at=ended_at, objective=objective, reason="manual")
+        await record_session_end(client, session_id)
+        await record_evaluation(client, session_id, [{"skillId": "skill-1", "rating": 3}])
+
+    class FakeScenarioRepo:
+        async def get(self, scenario_id):
+            return type("Scenario", (), {"id": scenario_id, "title": "Pricing talk"})()
+
+    class FakeSkillRepo:
+        async def list_skills(self, include_deleted=False):
+            return [type("Skill", (), {"id": "skill-1", "name": "Listening"})()]
+
+    service = AdminMetricsService(RollupRepository(client), FakeScenarioRepo(), FakeSkillRepo())
+    summary = await service.summary(date(2025, 6, 1), date(2025, 6, 10))
+
+    [scenario] = summary["scenarios"]
+    assert scenario["scenarioTitle"] == "Pricing talk"
+    assert (scenario["sessions"], scenario["succeeded"], scenario["failed"]) == (3, 1, 1)
+    assert scenario["completionRate"] == pytest.approx(1 / 3, abs=1e-4)
+    assert scenario["averageDurationSeconds"] == 300
+    assert [day["day"] for day in scenario["days"]] == ["2025-06-09", "2025-06-10"]
+    [skill] = summary["skills"]
+    assert (skill["skillName"], skill["ratings"], skill["averageRating"]) == ("Listening", 3, 3)
+
+    with pytest.raises(HTTPException) as exc:
+        await service.summary(date(2025, 6, 10), date(2025, 6, 1))
+    assert exc.value.status_code == 422
@@ -0,0 +1,62 @@
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from app.telemetry.metrics import MetricsRegistry
+from app.telemetry.profiling import LoopLagMonitor, render_collapsed, sample_stacks
+
+
+def _block_loop(seconds):
+    time.sleep(seconds)
+
+
+def _busy_worker(stop):
+    while not stop.is_set():
+        sum(range(1000))
+
+
+@pytest.mark.asyncio
+async def test_monitor_records_lag_and_logs_blocking_stack(caplog):
+    metrics = MetricsRegistry()
+    monitor = LoopLagMonitor(interval_seconds=0.01, threshold_ms=30, metrics=metrics)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.03)
+    with caplog.at_level(logging.WARNING, logger="app.telemetry.profiling"):
+        _block_loop(0.15)
+        await asyncio.sleep(0.03)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    histogram = metrics.histogram("event_loop.lag_ms")
+    assert histogram is not None
+    assert histogram.max >= 100
+    stalls = [record for record in caplog.records if "Event loop blocked" in record.message]
+    assert len(stalls) == 1
+    assert "_block_loop" in stalls[0].message
+
+
+def test_sample_stacks_counts_collapsed_stacks_of_chosen_threads():
+    stop = threading.Event()
+    worker = threading.Thread(target=_busy_worker, args=(stop,), name="worker")
+    worker.start()
+    try:
+        counts = sample_stacks(0.05, 0.001, thread_ids={worker.ident})
+    finally:
+        stop.set()
+        worker.join()
+
+    assert counts
+    for stack in counts:
+        frames = stack.split(";")
+        assert frames[0] == "worker"
+        assert frames[1].startswith("_bootstrap (")
+        assert any(
+            frame.startswith("_busy_worker (tests/unit/test_profiling.py:") for frame in frames
+        )
+    line = render_collapsed(counts).splitlines()[0]
+    stack, count = line.rsplit(" ", 1)
+    assert counts[stack] == int(count)
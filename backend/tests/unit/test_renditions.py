@@ -0,0 +1,79 @@
+import io
+import wave
+
+import numpy as np
+import pytest
+
+from app.audio_profiles import DEFAULT_RENDITIONS, RenditionProfile, parse_renditions
+from app.services import renditions
+from app.services.renditions import encode_pcm, encode_renditions, pcm_sample_rate
+
+
+def test_parse_renditions_overlays_defaults():
+    profiles = parse_renditions("playback=mp3:24000:32k, asr=mp3:16000:16k")
+
+    assert profiles["playback"] == RenditionProfile("mp3", 24000, "32k")
+    assert profiles["asr"] == RenditionProfile("mp3", 16000, "16k")
+    assert profiles["archive"] == DEFAULT_RENDITIONS["archive"]
+    assert parse_renditions(None) == DEFAULT_RENDITIONS
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        "speaker=mp3:16000",
+        "asr=flac:16000",
+        "asr=mp3:fast",
+        "playback=webm:22050:24k",
+        "asr=wav:16000:16k",
+        "llm",
+    ],
+)
+def test_parse_renditions_rejects_invalid_specs(spec):
+    with pytest.raises(ValueError):
+        parse_renditions(spec)
+
+
+def test_profile_maps_to_ffmpeg_output():
+    profile = RenditionProfile("webm", 24000, "24k")
+
+    assert profile.content_type == "audio/webm"
+    assert profile.ffmpeg_output_args() == [
+        "-ac", "1", "-ar", "24000", "-c:a", "libopus", "-b:a", "24k", "-f", "webm", "pipe:1",
+    ]
+
+
+def test_wav_at_source_rate_is_written_without_ffmpeg(monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("ffmpeg should not run")
+
+    monkeypatch.setattr(renditions, "_run_ffmpeg", fail)
+    samples = np.arange(-100, 100, dtype=np.int16)
+
+    data = encode_pcm(samples, 16000, RenditionProfile("wav", 16000))
+
+    with wave.open(io.BytesIO(data)) as clip:
+        assert clip.getframerate() == 16000
+        assert clip.getnchannels() == 1
+        assert np.frombuffer(clip.readframes(clip.getnframes()), dtype="<i2").tolist() == (
+            samples.tolist()
+        )
+
+
+def test_encode_renditions_encodes_each_distinct_profile_once(monkeypatch):
+    calls = []
+
+    def fake_ffmpeg(input_args, data, profile):
+        calls.append(profile)
+        return profile.spec.encode()
+
+    monkeypatch.setattr(renditions, "_run_ffmpeg", fake_ffmpeg)
+    shared = RenditionProfile("mp3", 16000, "16k")
+    profiles = {"archive": shared, "llm": shared, "asr": RenditionProfile("wav", 16000)}
+
+    encoded = encode_renditions(np.zeros(160, dtype=np.int16), 16000, profiles)
+
+    assert calls == [shared]
+    assert encoded["archive"] is encoded["llm"]
+    assert encoded["asr"].startswith(b"RIFF")
+    assert pcm_sample_rate(DEFAULT_RENDITIONS) == 24000
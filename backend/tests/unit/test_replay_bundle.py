@@ -0,0 +1,119 @@
+import mongomock
+import numpy as np
+import pytest
+
+from app.services import replay_bundle
+from app.services.audio import concatenate_pcm
+from app.services.audio_storage import content_object_name
+
+
+class _AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args):
+        self._cursor = self._cursor.sort(*args)
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._cursor)
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    async def find_one(self, query):
+        return self._collection.find_one(query)
+
+    def find(self, query):
+        return _AsyncCursor(self._collection.find(query))
+
+    async def update_one(self, query, update):
+        return self._collection.update_one(query, update)
+
+    async def distinct(self, key, query):
+        return self._collection.distinct(key, query)
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+class FakeMinio:
+    def __init__(self, objects):
+        self.objects = dict(objects)
+        self.deleted = []
+
+    async def download_file(self, name):
+        return self.objects[name]
+
+    async def file_exists(self, name):
+        return name in self.objects
+
+    async def touch_file(self, name, *, metadata=None):
+        return name in self.objects
+
+    async def upload_file(self, name, data, content_type, *, metadata=None):
+        self.objects[name] = data
+        return name
+
+    async def delete_file(self, name):
+        self.deleted.append(name)
+        self.objects.pop(name, None)
+
+
+def test_concatenate_pcm_inserts_gaps_and_reports_offsets():
+    joined, offsets = concatenate_pcm(
+        [np.full(3, 1, dtype=np.int16), np.full(2, 2, dtype=np.int16)], gap_samples=4
+    )
+
+    assert offsets == [0, 7]
+    assert joined.tolist() == [1, 1, 1, 0, 0, 0, 0, 2, 2]
+
+
+@pytest.mark.asyncio
+async def test_build_replay_bundle_encodes_once_and_indexes_turns(monkeypatch):
+    db = mongomock.MongoClient()["test_db"]
+    session_id = str(
+        db["PracticeSession"].insert_one({"status": "ended", "stubUserId": "u"}).inserted_id
+    )
+    db["Turn"].insert_many(
+        [
+            {"sessionId": session_id, "sequence": 1, "speaker": "trainee", "audioFileId": "b"},
+            {"sessionId": session_id, "sequence": 0, "speaker": "ai", "audioFileId": "a"},
+            {"sessionId": session_id, "sequence": 2, "speaker": "ai", "audioFileId": "pending"},
+        ]
+    )
+    lengths = {b"clip-a": 24000, b"clip-b": 12000}
+    encoded = []
+    monkeypatch.setattr(
+        replay_bundle,
+        "decode_audio_to_pcm",
+        lambda data, rate: np.ones(lengths[data], dtype=np.int16),
+    )
+
+    def fake_encode(samples, sample_rate, profile):
+        encoded.append((len(samples), profile.format))
+        return b"bundle"
+
+    monkeypatch.setattr(replay_bundle, "encode_pcm", fake_encode)
+    minio = FakeMinio({"a": b"clip-a", "b": b"clip-b"})
+
+    replay = await replay_bundle.build_replay_bundle(
+        _Client(db), minio, session_id, gap_ms=500
+    )
+
+    assert encoded == [(24000 + 12000 + 12000, "webm")]
+    assert replay["audioFileId"] == content_object_name(b"bundle", "webm")
+    assert replay["durationMs"] == 2000
+    assert [
+        (segment["sequence"], segment["startMs"], segment["durationMs"])
+        for segment in replay["segments"]
+    ] == [(0, 0, 1000), (1, 1500, 500)]
+    stored = db["PracticeSession"].find_one()
+    assert stored["replay"]["audioFileId"] == replay["audioFileId"]
@@ -0,0 +1,104 @@
+import asyncio
+
+import mongomock
+import pytest
+
+from app.services import session_cleanup
+from app.services.audio_storage import content_object_name
+from app.services.session_cleanup import CleanupJobs, delete_sessions
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    async def find_one(self, query, projection=None):
+        return self._collection.find_one(query, projection)
+
+    async def distinct(self, key, query):
+        return self._collection.distinct(key, query)
+
+    async def delete_many(self, query):
+        return self._collection.delete_many(query)
+
+    async def delete_one(self, query):
+        return self._collection.delete_one(query)
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+    async def close(self):
+        return None
+
+
+class FakeMinio:
+    def __init__(self):
+        self.batches = []
+
+    async def delete_files(self, names):
+        self.batches.append(sorted(names))
+        return []
+
+
+def _seed(db, audio_ids, replay=None):
+    doc = {"status": "ended"}
+    if replay:
+        doc["replay"] = {"audioFileId": replay}
+    session_id = str(db["PracticeSession"].insert_one(doc).inserted_id)
+    db["Turn"].insert_many(
+        [
+            {"sessionId": session_id, "sequence": index, "audioFileId": audio_id}
+            for index, audio_id in enumerate(audio_ids)
+        ]
+    )
+    db["Evaluation"].insert_one({"sessionId": session_id})
+    return session_id
+
+
+@pytest.mark.asyncio
+async def test_delete_sessions_bulk_deletes_and_keeps_shared_audio():
+    db = mongomock.MongoClient()["test_db"]
+    shared = content_object_name(b"shared")
+    own = content_object_name(b"own")
+    bundle = content_object_name(b"bundle")
+    first = _seed(db, [shared, own, "pending"], replay=bundle)
+    second = _seed(db, [own])
+    _seed(db, [shared])
+    minio = FakeMinio()
+
+    progress = await delete_sessions(_Client(db), minio, [first, second, "not-an-id"])
+
+    assert progress.status == "failed"
+    assert progress.sessions_done == 3
+    assert progress.turns_deleted == 4
+    assert len(progress.errors) == 1 and progress.errors[0].startswith("not-an-id")
+    assert minio.batches == [sorted([own, bundle])]
+    assert db["PracticeSession"].count_documents({}) == 1
+    assert db["Evaluation"].count_documents({}) == 1
+    assert db["Turn"].count_documents({"audioFileId": shared}) == 1
+
+
+@pytest.mark.asyncio
+async def test_cleanup_jobs_report_progress(monkeypatch):
+    db = mongomock.MongoClient()["test_db"]
+    session_id = _seed(db, [content_object_name(b"a")])
+    monkeypatch.setattr(session_cleanup, "_clients", lambda: (_Client(db), FakeMinio()))
+    jobs = CleanupJobs()
+
+    progress = jobs.start([session_id, session_id])
+    assert jobs.get(progress.job_id).as_dict()["sessionsTotal"] == 1
+    for _ in range(20):
+        if progress.status == "completed":
+            break
+        await asyncio.sleep(0)
+
+    summary = jobs.get(progress.job_id).as_dict()
+    assert summary["status"] == "completed"
+    assert summary["sessionsDone"] == 1
+    assert summary["objectsDeleted"] == 1
+    assert db["PracticeSession"].count_documents({}) == 0
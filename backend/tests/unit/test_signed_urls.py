@@ -0,0 +1,58 @@
+import pytest
+
+from app.services.signed_urls import SignedUrlService
+
+
+class FakeSigner:
+    def __init__(self):
+        self.calls = []
+
+    def presign_get_url(self, name, expires=900):
+        self.calls.append((name, expires))
+        return f"https://minio/{name}?v={len(self.calls)}"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_sign_reuses_url_until_refresh_margin():
+    signer = FakeSigner()
+    clock = Clock()
+    service = SignedUrlService(signer, refresh_margin_seconds=60, clock=clock)
+
+    first = service.sign("a.mp3")
+    clock.now += 800
+    assert service.sign("a.mp3") == first
+    clock.now += 50
+    refreshed = service.sign("a.mp3")
+
+    assert refreshed.url != first.url
+    assert len(signer.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_create_signed_urls_signs_each_object_once():
+    signer = FakeSigner()
+    service = SignedUrlService(signer)
+
+    urls = await service.create_signed_urls(["a.mp3", "b.mp3", "a.mp3"])
+
+    assert set(urls) == {"a.mp3", "b.mp3"}
+    assert [name for name, _ in signer.calls] == ["a.mp3", "b.mp3"]
+    assert await service.get_signed_url("b.mp3") == urls["b.mp3"]
+    assert len(signer.calls) == 2
+
+
+def test_cache_is_bounded():
+    service = SignedUrlService(FakeSigner(), max_entries=2)
+
+    service.sign("a.mp3")
+    service.sign("b.mp3")
+    service.sign("c.mp3")
+
+    assert [key[0] for key in service._cache] == ["b.mp3", "c.mp3"]
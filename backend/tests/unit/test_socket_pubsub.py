@@ -0,0 +1,145 @@
+import asyncio
+import json
+from collections import OrderedDict
+
+import pytest
+from bson import ObjectId
+
+from app.api.routes.session_socket import SessionSocketHub
+from app.services.pubsub import MongoPubSub
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        return None
+
+    async def close(self, code=1000):
+        return None
+
+    async def send_text(self, message):
+        self.sent.append(json.loads(message))
+
+
+class SharedBroker:
+    """Stands in for Mongo/Redis: fans each publish out to every worker."""
+
+    def __init__(self):
+        self.subscribers = []
+        self.published = 0
+
+    def backend(self):
+        broker = self
+
+        class _Backend:
+            async def start(self, deliver):
+                broker.subscribers.append(deliver)
+
+            async def publish(self, channel, message):
+                broker.published += 1
+                for deliver in broker.subscribers:
+                    await deliver(channel, message)
+
+            async def close(self):
+                return None
+
+        return _Backend()
+
+
+@pytest.mark.asyncio
+async def test_in_memory_hub_delivers_to_local_sockets():
+    hub = SessionSocketHub()
+    socket = FakeSocket()
+    await hub.connect("session-1", socket)
+
+    await hub.broadcast("session-1", {"type": "ai_turn"})
+    await hub.broadcast("session-2", {"type": "ignored"})
+    await hub.drain()
+
+    assert socket.sent == [{"type": "ai_turn"}]
+
+
+@pytest.mark.asyncio
+async def test_message_published_once_is_delivered_by_owning_worker():
+    broker = SharedBroker()
+    pipeline_worker = SessionSocketHub()
+    socket_worker = SessionSocketHub()
+    await pipeline_worker.start(broker.backend())
+    await socket_worker.start(broker.backend())
+    socket = FakeSocket()
+    await socket_worker.connect("session-1", socket)
+
+    await pipeline_worker.broadcast("session-1", {"type": "evaluation_ready"})
+    await socket_worker.drain()
+
+    assert broker.published == 1
+    assert socket.sent == [{"type": "evaluation_ready"}]
+
+
+class _FakeCursor:
+    def __init__(self, docs):
+        self._docs = list(docs)
+        self.alive = True
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if not self._docs:
+            self.alive = False
+            raise StopAsyncIteration
+        return self._docs.pop(0)
+
+    async def close(self):
+        return None
+
+
+class _FakeCollection:
+    """Hands every tail the whole collection in insertion order."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.queries = []
+
+    def find(self, query, **kwargs):
+        self.queries.append(query)
+        return _FakeCursor(self.docs)
+
+
+@pytest.mark.asyncio
+async def test_mongo_tail_resumes_in_natural_order_without_redelivering(monkeypatch):
+    monkeypatch.setattr("app.services.pubsub._RETRY_SECONDS", 0)
+    # Another worker's id can sort below an earlier insert; the tail follows
+    # insertion order, not _id order.
+    low_id, high_id = ObjectId(), ObjectId()
+    collection = _FakeCollection(
+        [
+            {"_id": high_id, "channel": "session-1", "message": "a"},
+            {"_id": low_id, "channel": "session-2", "message": "b"},
+        ]
+    )
+    delivered = []
+
+    async def deliver(channel, message):
+        delivered.append((channel, message))
+
+    pubsub = MongoPubSub(client=None)
+    task = asyncio.create_task(pubsub._tail(collection, deliver, OrderedDict()))
+    while len(collection.queries) < 2:
+        await asyncio.sleep(0)
+    lowest_id = ObjectId.from_datetime(low_id.generation_time)
+    collection.docs = collection.docs + [
+        {"_id": lowest_id, "channel": "session-1", "message": "c"}
+    ]
+    while len(collection.queries) < 3:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert delivered == [("session-1", "a"), ("session-2", "b"), ("session-1", "c")]
+    assert collection.queries[0] == {}
+    resume_from = collection.queries[1]["_id"]["$gte"]
+    assert resume_from <= lowest_id
@@ -0,0 +1,110 @@
+import asyncio
+import json
+
+import pytest
+
+from app.api.routes.session_socket import SessionSocketHub
+
+
+class FakeSocket:
+    def __init__(self, gate=None, fail=False):
+        self.sent = []
+        self.closed_with = None
+        self._gate = gate
+        self._fail = fail
+
+    async def accept(self):
+        return None
+
+    async def send_text(self, message):
+        if self._fail:
+            raise RuntimeError("connection reset")
+        if self._gate is not None:
+            await self._gate.wait()
+        self.sent.append(json.loads(message))
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def _settle():
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_slow_socket_does_not_block_broadcast_or_other_sockets():
+    hub = SessionSocketHub(heartbeat_seconds=0)
+    slow = FakeSocket(gate=asyncio.Event())
+    fast = FakeSocket()
+    await hub.connect("session-1", slow)
+    await hub.connect("session-1", fast)
+
+    await asyncio.wait_for(hub.broadcast("session-1", {"type": "ai_turn"}), 0.5)
+    await _settle()
+
+    assert fast.sent == [{"type": "ai_turn"}]
+    assert slow.sent == []
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_keeps_latest_messages():
+    hub = SessionSocketHub(queue_size=2, heartbeat_seconds=0)
+    gate = asyncio.Event()
+    socket = FakeSocket(gate=gate)
+    await hub.connect("session-1", socket)
+
+    await hub.broadcast("session-1", {"seq": 0})
+    await _settle()  # writer holds seq 0 while blocked on the network
+    for seq in range(1, 5):
+        await hub.broadcast("session-1", {"seq": seq})
+    gate.set()
+    await hub.drain()
+
+    assert [message["seq"] for message in socket.sent] == [0, 3, 4]
+    assert socket.closed_with is None
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_closes_slow_consumer():
+    hub = SessionSocketHub(queue_size=1, overflow_policy="disconnect", heartbeat_seconds=0)
+    socket = FakeSocket(gate=asyncio.Event())
+    await hub.connect("session-1", socket)
+
+    for seq in range(3):
+        await hub.broadcast("session-1", {"seq": seq})
+        await _settle()
+
+    assert socket.closed_with == 1013
+    assert "session-1" not in hub._connections
+
+
+@pytest.mark.asyncio
+async def test_send_failure_prunes_socket_without_raising():
+    hub = SessionSocketHub(heartbeat_seconds=0)
+    socket = FakeSocket(fail=True)
+    await hub.connect("session-1", socket)
+
+    await hub.broadcast("session-1", {"type": "ai_turn"})
+    await _settle()
+
+    assert socket.closed_with == 1011
+    assert "session-1" not in hub._connections
+
+
+@pytest.mark.asyncio
+async def test_heartbeat_pings_live_sockets_and_prunes_silent_ones():
+    hub = SessionSocketHub(heartbeat_seconds=10)
+    live = FakeSocket()
+    silent = FakeSocket()
+    live_connection = await hub.connect("session-1", live)
+    silent_connection = await hub.connect("session-1", silent)
+    silent_connection.last_seen -= 30
+
+    hub.heartbeat()
+    await hub.drain()
+    await _settle()
+
+    assert live.sent == [{"type": "ping"}]
+    assert silent.closed_with == 1001
+    assert list(hub._connections["session-1"].values()) == [live_connection]
@@ -0,0 +1,213 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from app.telemetry import otel
+from app.telemetry.metrics import (
+    MetricsRegistry,
+    bucket_index,
+    bucket_upper_bound,
+    registry,
+    run_flush_forever,
+)
+from app.telemetry.otel import OtlpSpanExporter, SpanRecorder, start_span
+from app.telemetry.tracing import emit_event, emit_metric
+
+
+@pytest.fixture(autouse=True)
+def _clean_telemetry():
+    registry.reset()
+    otel.recorder.clear()
+    yield
+    registry.reset()
+    otel.recorder.clear()
+
+
+def test_registry_renders_histograms_and_counters():
+    metrics = MetricsRegistry()
+    metrics.observe("turn.asr_latency", 5, {"sessionId": "s-1", "model": "qwen"})
+    metrics.observe("turn.asr_latency", 50, {"sessionId": "s-2", "model": "qwen"})
+    metrics.increment("events_total", {"event": "session.completed"})
+
+    text = metrics.render_prometheus()
+
+    assert "# TYPE events_total counter" in text
+    assert 'events_total{event="session.completed"} 1' in text
+    assert "# TYPE turn_asr_latency histogram" in text
+    assert 'turn_asr_latency_bucket{model="qwen",le="4"} 0' in text
+    assert 'turn_asr_latency_bucket{model="qwen",le="8"} 1' in text
+    assert 'turn_asr_latency_bucket{model="qwen",le="64"} 2' in text
+    assert 'turn_asr_latency_bucket{model="qwen",le="+Inf"} 2' in text
+    assert 'turn_asr_latency_sum{model="qwen"} 55' in text
+    assert 'turn_asr_latency_count{model="qwen"} 2' in text
+    assert "s-1" not in text
+
+
+@pytest.mark.parametrize("value", [0.01, 0.9, 1, 2, 3.3, 250, 1234.5, 65536, 9_000_000])
+def test_bucket_bounds_stay_within_relative_error(value):
+    index = bucket_index(value)
+    upper = bucket_upper_bound(index)
+    lower = bucket_upper_bound(index - 1)
+
+    assert lower < value <= upper
+    assert upper / lower <= 1 + 1 / 16
+
+
+def test_quantiles_come_from_bucket_edges():
+    metrics = MetricsRegistry()
+    for value in range(1, 1001):
+        metrics.observe("turn.latency", value)
+
+    histogram = metrics.histogram("turn.latency")
+    assert histogram.quantile(0.5) == pytest.approx(500, rel=0.04)
+    assert histogram.quantile(0.99) == pytest.approx(990, rel=0.04)
+    assert histogram.quantile(1.0) == 1000
+
+
+def test_series_beyond_limit_fold_into_overflow():
+    metrics = MetricsRegistry(max_series=2)
+    for consumer in ("archive", "llm", "asr", "playback"):
+        metrics.observe("audio.rendition_bytes", 100, {"consumer": consumer})
+
+    assert metrics.histogram("audio.rendition_bytes", {"consumer": "llm"}).count == 1
+    assert metrics.histogram("audio.rendition_bytes", {"consumer": "asr"}) is None
+    assert metrics.histogram("audio.rendition_bytes", {"overflow": "true"}).count == 2
+
+
+def test_non_finite_values_are_counted_not_observed():
+    metrics = MetricsRegistry()
+    for value in (float("nan"), float("inf"), float("-inf")):
+        metrics.observe("turn.speech_ms", value)
+
+    assert metrics.histogram("turn.speech_ms") is None
+    assert metrics.counter("metrics.non_finite", {"metric": "turn.speech_ms"}) == 3
+
+
+def test_label_cache_ignores_values_that_are_not_labels():
+    metrics = MetricsRegistry()
+    for size in range(100):
+        metrics.observe(
+            "turn.speech_ms",
+            5,
+            {"bytes": size * 1024, "durationMs": size, "sessionId": f"s{size}", "final": True},
+        )
+
+    assert len(metrics._label_cache) == 1
+    assert metrics.histogram("turn.speech_ms", {"final": True}).count == 100
+
+
+def test_flush_summaries_cover_values_since_last_flush():
+    metrics = MetricsRegistry()
+    for value in (100, 200, 300):
+        metrics.observe("turn.asr_latency", value, {"source": "asr"})
+
+    [summary] = metrics.flush_summaries()
+    assert summary["name"] == "turn.asr_latency"
+    assert summary["labels"] == {"source": "asr"}
+    assert summary["count"] == 3
+    assert summary["sum"] == 600
+    assert summary["p50"] == pytest.approx(200, rel=0.04)
+    assert metrics.flush_summaries() == []
+
+    metrics.observe("turn.asr_latency", 50, {"source": "asr"})
+    [summary] = metrics.flush_summaries()
+    assert summary["count"] == 1
+    assert summary["p99"] == pytest.approx(50, rel=0.04)
+
+
+@pytest.mark.asyncio
+async def test_flush_task_logs_summaries(caplog):
+    caplog.set_level("INFO", logger="app.telemetry")
+    metrics = MetricsRegistry()
+    metrics.observe("turn.speech_ms", 1200)
+
+    task = asyncio.create_task(run_flush_forever(0.01, metrics))
+    await asyncio.sleep(0.05)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    payloads = [json.loads(record.message) for record in caplog.records]
+    assert payloads == [
+        {
+            "count": 1,
+            "labels": {},
+            "name": "turn.speech_ms",
+            "p50": 1200,
+            "p95": 1200,
+            "p99": 1200,
+            "sum": 1200,
+            "type": "metric_summary",
+        }
+    ]
+
+
+def test_emit_helpers_feed_registry():
+    emit_metric("turn.speech_ms", 1200, session_id="s-1", attributes={"sc_id": "SC-001"})
+    emit_event("session.completed", session_id="s-1")
+
+    assert registry.histogram("turn.speech_ms").count == 1
+    assert registry.counter("events_total", {"event": "session.completed"}) == 1
+
+
+def test_nested_spans_share_trace_and_record_status():
+    with start_span("turns.pipeline", {"sessionId": "s-1"}) as outer:
+        with start_span("turns.asr") as inner:
+            inner.set_attribute("model", "qwen")
+    with pytest.raises(RuntimeError):
+        with start_span("turns.generate"):
+            raise RuntimeError("upstream down")
+
+    generate, pipeline, asr_span = otel.recorder.recent()
+    assert pipeline is outer and asr_span is inner
+    assert inner.trace_id == outer.trace_id
+    assert inner.parent_id == outer.span_id
+    assert outer.parent_id is None
+    assert generate.trace_id != outer.trace_id
+    assert generate.status == "error"
+    assert generate.error == "RuntimeError: upstream down"
+    assert pipeline.duration_ms >= asr_span.duration_ms
+    assert otel.current_span() is None
+    assert registry.histogram(
+        "span.duration_ms", {"span": "turns.generate", "status": "error"}
+    ).count == 1
+
+
+@pytest.mark.asyncio
+async def test_exporter_posts_otlp_json():
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200)
+
+    span_recorder = SpanRecorder()
+    span_recorder.exporting = True
+    exporter = OtlpSpanExporter(
+        "http://collector:4318/",
+        service_name="coach-test",
+        span_recorder=span_recorder,
+        transport=httpx.MockTransport(handler),
+    )
+    original = otel.recorder
+    otel.recorder = span_recorder
+    try:
+        with start_span("turns.asr", {"attempt": 2, "cached": False}):
+            pass
+    finally:
+        otel.recorder = original
+
+    assert await exporter.export_pending() == 1
+    assert str(requests[0].url) == "http://collector:4318/v1/traces"
+    body = json.loads(requests[0].content)
+    resource = body["resourceSpans"][0]
+    assert resource["resource"]["attributes"][0]["value"] == {"stringValue": "coach-test"}
+    span = resource["scopeSpans"][0]["spans"][0]
+    assert span["name"] == "turns.asr"
+    assert len(span["traceId"]) == 32 and len(span["spanId"]) == 16
+    assert span["status"] == {"code": 1}
+    assert {"key": "attempt", "value": {"intValue": "2"}} in span["attributes"]
+    assert {"key": "cached", "value": {"boolValue": False}} in span["attributes"]
+    assert await exporter.export_pending() == 0
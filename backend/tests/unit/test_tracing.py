@@ -26,8 +26,8 @@ def test_emit_event_includes_session_turn_and_sc_attributes(caplog):
     assert payload["attributes"]["sc_id"] == "SC-001"
 
 
-def test_emit_metric_includes_value_and_ids(caplog):
-    caplog.set_level("INFO")
+def test_emit_metric_logs_value_and_ids_at_debug(caplog):
+    caplog.set_level("DEBUG", logger="app.telemetry")
     attributes = build_sc_attributes("SC-002")
 
     emit_metric(
@@ -44,3 +44,11 @@ def test_emit_metric_includes_value_and_ids(caplog):
     assert payload["sessionId"] == "session-1"
     assert payload["turnId"] == "turn-9"
     assert payload["attributes"]["sc_id"] == "SC-002"
+
+
+def test_emit_metric_does_not_log_at_info(caplog):
+    caplog.set_level("INFO")
+
+    emit_metric("termination.latency", 1.5, session_id="session-1")
+
+    assert not caplog.records
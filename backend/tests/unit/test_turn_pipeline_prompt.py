@@ -1,6 +1,7 @@
 from types import SimpleNamespace
 
 from app.services import turn_pipeline
+from app.services.audio import AudioBuffer
 
 
 def test_auto_prompt_used_when_prompt_missing():
@@ -18,3 +19,22 @@ def test_auto_prompt_used_when_prompt_missing():
     assert "Start as Alex (PM)" in messages[1]["content"]
     assert "Context: Difficult feedback A peer missed deadlines" in messages[1]["content"]
     assert "invites a response" in messages[1]["content"]
+
+
+def test_turn_messages_ask_for_transcript_when_transcribing():
+    turn = SimpleNamespace(id="t1", sequence=1, speaker="trainee", context="", transcript=None)
+
+    plain = turn_pipeline._build_turn_messages(
+        scenario=None, turns=[turn], current_turn_id="t1", audio=AudioBuffer(b"mp3")
+    )
+    transcribing = turn_pipeline._build_turn_messages(
+        scenario=None,
+        turns=[turn],
+        current_turn_id="t1",
+        audio=AudioBuffer(b"mp3"),
+        transcribe=True,
+    )
+
+    assert "<transcript>" not in plain[0]["content"]
+    assert transcribing[0]["content"].endswith(turn_pipeline.TRANSCRIPT_INSTRUCTION)
+    assert transcribing[1:] == plain[1:]
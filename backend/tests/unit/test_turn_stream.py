@@ -0,0 +1,93 @@
+import asyncio
+
+import numpy as np
+import pytest
+from fastapi import HTTPException
+
+from app.services import turn_stream
+from app.services.audio import StreamingPcmDecoder
+from app.services.turn_stream import TurnStream
+
+
+def _stream(**kwargs):
+    # ``cat`` stands in for ffmpeg: the "PCM" is the bytes fed in.
+    return TurnStream(
+        "session-1", 0, decoder=StreamingPcmDecoder(16000, ["cat"]), **kwargs
+    )
+
+
+async def _wait_for(condition):
+    for _ in range(100):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_chunks_are_decoded_while_recording_and_finish_flushes_the_tail(monkeypatch):
+    metrics = []
+    monkeypatch.setattr(
+        turn_stream, "emit_metric", lambda name, value, **kwargs: metrics.append((name, kwargs))
+    )
+    decoder = StreamingPcmDecoder(16000, ["cat"])
+    stream = TurnStream("session-1", 0, decoder=decoder)
+    await stream.start()
+    await stream.append(0, b"abcd")
+    await stream.append(1, b"efgh")
+    await _wait_for(lambda: len(decoder.decoded()) == 4)
+
+    assert decoder.decoded().tobytes() == b"abcdefgh"
+
+    samples = await stream.finish(b"ij")
+
+    assert samples.dtype == np.int16
+    assert samples.tobytes() == b"abcdefghij"
+    assert stream.received_bytes == 10
+    assert metrics == [
+        (
+            "turn.stream_flush_latency",
+            {"session_id": "session-1", "attributes": {"bytes": 10, "chunks": 2}},
+        )
+    ]
+
+
+@pytest.mark.asyncio
+async def test_partial_transcripts_cover_audio_decoded_so_far():
+    partials = []
+    transcribed = []
+
+    async def transcribe(samples, sample_rate):
+        transcribed.append((samples.tobytes(), sample_rate))
+        return f"heard {len(samples)} samples"
+
+    stream = _stream(
+        transcribe=transcribe, on_partial=partials.append, partial_interval_seconds=0
+    )
+    await stream.start()
+    await stream.append(0, b"hello!")
+    # The decoder lags its input; the next chunk picks up what it has produced.
+    await asyncio.sleep(0.2)
+    await stream.append(1, b" world")
+    await _wait_for(lambda: partials)
+    await stream.finish()
+
+    audio, sample_rate = transcribed[0]
+    assert audio.startswith(b"hello!")
+    assert sample_rate == 16000
+    assert partials[0] == f"heard {len(audio) // 2} samples"
+
+
+@pytest.mark.asyncio
+async def test_stream_rejects_gaps_and_oversized_turns():
+    stream = _stream(max_bytes=4)
+    await stream.start()
+    with pytest.raises(HTTPException) as gap:
+        await stream.append(1, b"ab")
+    await stream.append(0, b"abc")
+    with pytest.raises(HTTPException) as oversized:
+        await stream.append(1, b"de")
+    await stream.abort()
+
+    assert gap.value.status_code == 422
+    assert "resend" in gap.value.detail
+    assert oversized.value.status_code == 413
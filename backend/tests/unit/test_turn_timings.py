@@ -0,0 +1,106 @@
+import mongomock
+import pytest
+from bson import ObjectId
+
+from app.repositories.session_repository import SessionRepository
+from app.services import turn_timings
+from app.services.admin.scenarios_service import summarize_turn_timings
+from app.services.turn_timings import TurnTimings
+
+
+class _AsyncCursor:
+    def __init__(self, cursor):
+        self._cursor = cursor
+
+    def sort(self, *args):
+        self._cursor = self._cursor.sort(*args)
+        return self
+
+    def limit(self, count):
+        self._cursor = self._cursor.limit(count)
+        return self
+
+    async def to_list(self, length=None):
+        return list(self._cursor)
+
+
+class _AsyncCollection:
+    def __init__(self, collection):
+        self._collection = collection
+
+    def find(self, query, projection=None):
+        return _AsyncCursor(self._collection.find(query, projection))
+
+
+class _Client:
+    def __init__(self, db):
+        self._db = db
+
+    async def collection(self, name):
+        return _AsyncCollection(self._db[name])
+
+
+def test_waterfall_orders_stages_and_adds_trailing_silence(monkeypatch):
+    metrics = []
+    monkeypatch.setattr(
+        turn_timings,
+        "emit_metric",
+        lambda name, value, **kwargs: metrics.append((name, kwargs["attributes"])),
+    )
+    clock = iter([100.0, 100.5, 100.75, 101.0])
+    monkeypatch.setattr(turn_timings.time, "monotonic", lambda: next(clock))
+
+    timings = TurnTimings(session_id="session-1", turn_id="turn-1")
+    with timings.stage("decode"):
+        pass
+    timings.record("trailingSilence", 400)
+    assert timings.latency_ms is None
+    timings.mark_replied()
+
+    assert timings.as_doc() == {"trailingSilenceMs": 400, "decodeMs": 250.0}
+    assert timings.latency_ms == 1400
+    assert ("turn.stage_ms", {"stage": "decode"}) in metrics
+
+
+def test_summary_reports_percentiles_per_stage():
+    rows = [
+        {"latencyMs": latency, "timings": {"generationMs": latency - 100}}
+        for latency in range(1000, 2000, 10)
+    ]
+    rows.append({"latencyMs": -1, "timings": {"decodeMs": 5}})
+
+    summary = summarize_turn_timings(rows)
+
+    assert summary["turns"] == 101
+    assert summary["latencyMs"] == {
+        "count": 100,
+        "p50": 1490,
+        "p95": 1940,
+        "p99": 1980,
+        "max": 1990,
+    }
+    assert summary["stages"]["generationMs"]["p50"] == 1390
+    assert summary["stages"]["decodeMs"]["count"] == 1
+    assert summarize_turn_timings([])["latencyMs"] is None
+
+
+@pytest.mark.asyncio
+async def test_repository_lists_timed_turns_of_scenario():
+    db = mongomock.MongoClient()["test_db"]
+    db["Turn"].insert_many(
+        [
+            {"scenarioId": "scenario-1", "speaker": "ai", "latencyMs": 900, "timings": {"a": 1}},
+            {"speaker": "trainee", "latencyMs": -1},
+            {"scenarioId": "scenario-1", "speaker": "ai", "latencyMs": 1200, "timings": {"a": 2}},
+            {"scenarioId": "scenario-2", "speaker": "ai", "latencyMs": 50, "timings": {"a": 3}},
+        ]
+    )
+    repo = SessionRepository(_Client(db))
+
+    rows = await repo.list_turn_timings("scenario-1")
+
+    assert rows == [
+        {"latencyMs": 1200, "timings": {"a": 2}},
+        {"latencyMs": 900, "timings": {"a": 1}},
+    ]
+    assert await repo.list_turn_timings(str(ObjectId())) == []
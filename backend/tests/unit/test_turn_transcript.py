@@ -0,0 +1,97 @@
+import asyncio
+
+import pytest
+
+from app.services import turn_pipeline
+from app.services.audio import AudioBuffer
+
+
+class FakeRepo:
+    def __init__(self):
+        self.updates = []
+
+    async def update_turn(self, turn_id, payload):
+        self.updates.append((turn_id, payload))
+
+
+@pytest.fixture
+def captured(monkeypatch):
+    calls = {"metrics": [], "asr": []}
+
+    def fake_emit_metric(name, value, **kwargs):
+        calls["metrics"].append((name, value, kwargs.get("attributes")))
+
+    async def fake_run_asr_update(**kwargs):
+        calls["asr"].append(kwargs)
+
+    monkeypatch.setattr(turn_pipeline, "emit_metric", fake_emit_metric)
+    monkeypatch.setattr(turn_pipeline, "_run_asr_update", fake_run_asr_update)
+    return calls
+
+
+def test_split_trainee_transcript_separates_reply():
+    text = "<transcript> I think we should ship Friday. </transcript>\nWhy Friday?"
+
+    assert turn_pipeline._split_trainee_transcript(text) == (
+        "I think we should ship Friday.",
+        "Why Friday?",
+    )
+    assert turn_pipeline._split_trainee_transcript("Why Friday?") == (None, "Why Friday?")
+    assert turn_pipeline._split_trainee_transcript("<transcript> </transcript>Hi") == (
+        None,
+        "Hi",
+    )
+
+
+def test_transcript_agreement_ignores_case_and_punctuation():
+    assert turn_pipeline._transcript_agreement("Ship it, Friday!", "ship it friday") == 1.0
+    assert turn_pipeline._transcript_agreement("ship it friday", "hold until monday") < 0.5
+
+
+async def _record(repo, transcript, shadow_percent=0):
+    await turn_pipeline._record_generated_transcript(
+        repo,
+        session_id="session-1",
+        turn_id="turn-1",
+        transcript=transcript,
+        latency_ms=850.0,
+        asr_audio=AudioBuffer(b"wav"),
+        asr_format="wav",
+        shadow_percent=shadow_percent,
+    )
+    await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_generated_transcript_is_stored_without_asr(captured):
+    repo = FakeRepo()
+
+    await _record(repo, "Ship it Friday.")
+
+    assert repo.updates == [
+        ("turn-1", {"asrStatus": "completed", "transcript": "Ship it Friday."})
+    ]
+    assert captured["asr"] == []
+    assert ("turn.transcript_source", 1, {"source": "generation"}) in captured["metrics"]
+    assert ("turn.transcript_latency", 850.0, {"source": "generation"}) in captured["metrics"]
+
+
+@pytest.mark.asyncio
+async def test_missing_transcript_falls_back_to_asr(captured):
+    repo = FakeRepo()
+
+    await _record(repo, None)
+
+    assert repo.updates == []
+    assert len(captured["asr"]) == 1
+    assert "compare_with" not in captured["asr"][0]
+    assert ("turn.transcript_source", 1, {"source": "asr_fallback"}) in captured["metrics"]
+
+
+@pytest.mark.asyncio
+async def test_shadow_asr_compares_without_overwriting(captured):
+    repo = FakeRepo()
+
+    await _record(repo, "Ship it Friday.", shadow_percent=100)
+
+    assert captured["asr"][0]["compare_with"] == "Ship it Friday."
@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from app.services import turn_pipeline
+from app.services.audio import VadConfig, detect_speech
+
+RATE = 16000
+
+
+def _tone(seconds, amplitude=8000, frequency=220, rate=RATE):
+    t = np.arange(int(rate * seconds)) / rate
+    return (amplitude * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def _silence(seconds):
+    return np.zeros(int(RATE * seconds), dtype=np.int16)
+
+
+def test_detect_speech_trims_leading_and_trailing_silence():
+    samples = np.concatenate([_silence(1.0), _tone(0.6), _silence(1.0)])
+    config = VadConfig(padding_ms=100)
+
+    activity = detect_speech(samples, config)
+
+    assert activity.has_speech
+    assert activity.duration_ms == 2600
+    assert 540 <= activity.speech_ms <= 660
+    # Speech starts at 1.0 s; the span keeps 100 ms of padding either side.
+    assert abs(activity.start_sample - int(0.9 * RATE)) <= 480
+    assert abs(activity.end_sample - int(1.7 * RATE)) <= 480
+
+
+def test_detect_speech_rejects_silence_and_quiet_noise():
+    rng = np.random.default_rng(0)
+    hiss = rng.normal(0, 2000, RATE * 2).astype(np.int16)
+
+    assert not detect_speech(_silence(2.0)).has_speech
+    assert not detect_speech((_silence(2.0) + 20).astype(np.int16)).has_speech
+    # Loud enough to pass the energy gate, but crosses zero like noise.
+    assert not detect_speech(hiss).has_speech
+
+
+def test_zero_crossing_threshold_is_scaled_to_the_sample_rate():
+    # 3.6 kHz crosses zero 0.45 times per sample at 16 kHz but only 0.3 at
+    # 24 kHz; it must be rejected at both rates, while voice is kept.
+    for rate in (16000, 24000):
+        config = VadConfig(sample_rate=rate)
+        assert not detect_speech(_tone(1.0, frequency=3600, rate=rate), config).has_speech
+        assert detect_speech(_tone(1.0, rate=rate), config).has_speech
+
+
+def test_detect_speech_requires_minimum_speech_duration():
+    samples = np.concatenate([_silence(0.5), _tone(0.1), _silence(0.5)])
+
+    activity = detect_speech(samples, VadConfig(min_speech_ms=250))
+
+    assert not activity.has_speech
+    assert activity.speech_ms < 250
+
+
+def test_detect_speech_handles_clips_shorter_than_a_frame():
+    activity = detect_speech(_tone(0.01))
+
+    assert not activity.has_speech
+    assert activity.duration_ms == 10
+
+
+@pytest.mark.asyncio
+async def test_silent_turn_is_deleted_and_reported_over_socket(monkeypatch):
+    deleted = []
+    broadcasts = []
+
+    class FakeRepo:
+        async def get_turn(self, turn_id):
+            return type("Turn", (), {"sequence": 3})()
+
+        async def delete_turn(self, turn_id):
+            deleted.append(turn_id)
+
+    async def fake_broadcast(self, session_id, payload):
+        broadcasts.append((session_id, payload))
+
+    monkeypatch.setattr(turn_pipeline, "emit_metric", lambda *args, **kwargs: None)
+    monkeypatch.setattr(turn_pipeline, "hub", type("Hub", (), {"broadcast": fake_broadcast})())
+
+    await turn_pipeline._reject_silent_turn(FakeRepo(), "session-1", "turn-1")
+
+    assert deleted == ["turn-1"]
+    assert broadcasts[0][0] == "session-1"
+    assert broadcasts[0][1]["type"] == "turn_error"
+    assert broadcasts[0][1]["code"] == "no_speech"
+    assert broadcasts[0][1]["sequence"] == 3
@@ -1,9 +1,10 @@
 "use client";
 
-import { useEffect, useMemo, useState } from "react";
+import { useEffect, useMemo, useRef, useState } from "react";
 
 import EvaluationPanel from "@/components/session/EvaluationPanel";
 import PracticeAgainButton from "@/components/history/PracticeAgainButton";
+import { getApiBase } from "@/services/api/base";
 import { fetchHistoryDetail } from "@/services/api/history";
 import { requeueEvaluation } from "@/services/api/evaluationClient";
 import { useUser } from "@/hooks/useUser";
@@ -20,6 +21,8 @@ export default function HistoryDetail({ sessionId, initialDetail }: HistoryDetai
   const [refreshing, setRefreshing] = useState(false);
   const [requeueing, setRequeueing] = useState(false);
   const [expiredTurns, setExpiredTurns] = useState<Set<string>>(new Set());
+  const [replayExpired, setReplayExpired] = useState(false);
+  const replayRef = useRef<HTMLAudioElement | null>(null);
 
   useEffect(() => {
     setDetail(initialDetail);
@@ -36,6 +39,27 @@ export default function HistoryDetail({ sessionId, initialDetail }: HistoryDetai
     );
   }, [detail]);
 
+  const replay = detail?.replay ?? null;
+  const replayOffsets = useMemo(() => {
+    const segments = replay?.segments ?? [];
+    return segments.reduce((acc: Record<string, number>, segment: any) => {
+      acc[segment.turnId] = segment.startMs;
+      return acc;
+    }, {} as Record<string, number>);
+  }, [replay]);
+
+  const resolveAudioUrl = (url: string) =>
+    url.startsWith("/") ? `${getApiBase()}${url}` : url;
+
+  const playFrom = (startMs: number) => {
+    const player = replayRef.current;
+    if (!player) {
+      return;
+    }
+    player.currentTime = startMs / 1000;
+    void player.play();
+  };
+
   const refreshDetail = async () => {
     if (refreshing) {
       return;
@@ -46,6 +70,7 @@ export default function HistoryDetail({ sessionId, initialDetail }: HistoryDetai
       const next = await fetchHistoryDetail(sessionId, 2, user?.id);
       setDetail(next);
       setExpiredTurns(new Set());
+      setReplayExpired(false);
     } catch (err) {
       setError((err as Error).message);
     } finally {
@@ -94,6 +119,23 @@ export default function HistoryDetail({ sessionId, initialDetail }: HistoryDetai
           }}
         >
           <h2 style={{ marginTop: 0 }}>Transcript</h2>
+          {replay ? (
+            <div style={{ marginBottom: 16 }}>
+              <audio
+                ref={replayRef}
+                controls
+                src={resolveAudioUrl(replay.audioUrl)}
+                onError={() => setReplayExpired(true)}
+                preload="metadata"
+                style={{ width: "100%" }}
+              />
+              {replayExpired ? (
+                <p style={{ margin: "6px 0 0", color: "#b24332" }}>
+                  Audio link expired. Refresh to get a new link.
+                </p>
+              ) : null}
+            </div>
+          ) : null}
           <div style={{ display: "grid", gap: 12 }}>
             {(detail?.turns ?? []).map((turn: any) => (
               <div
@@ -108,11 +150,27 @@ export default function HistoryDetail({ sessionId, initialDetail }: HistoryDetai
                 <p style={{ margin: "6px 0 0" }}>
                   {turn.transcript ?? "(transcript pending)"}
                 </p>
-                {turn.audioUrl ? (
+                {replay && turn.id in replayOffsets ? (
+                  <button
+                    type="button"
+                    onClick={() => playFrom(replayOffsets[turn.id])}
+                    style={{
+                      marginTop: 10,
+                      padding: "4px 10px",
+                      borderRadius: 999,
+                      border: "1px solid #2f2a24",
+                      background: "transparent",
+                      color: "#2f2a24",
+                      cursor: "pointer",
+                    }}
+                  >
+                    Play from here
+                  </button>
+                ) : !replay && turn.audioUrl ? (
                   <div style={{ marginTop: 10 }}>
                     <audio
                       controls
-                      src={turn.audioUrl}
+                      src={resolveAudioUrl(turn.audioUrl)}
                       onError={() => {
                         setExpiredTurns((prev) => {
                           const next = new Set(prev);
@@ -2,7 +2,16 @@
 
 import { useEffect, useMemo, useRef, useState } from "react";
 
-import { submitTurn, connectSessionSocket, manualStopSession } from "@/services/api/sessions";
+import {
+  submitTurn,
+  submitTurnOverSocket,
+  uploadTurn,
+  sendTurnChunk,
+  abortStreamedTurn,
+  finishStreamedTurn,
+  connectSessionSocket,
+  manualStopSession,
+} from "@/services/api/sessions";
 import EvaluationPanel from "@/components/session/EvaluationPanel";
 import {
   Evaluation,
@@ -31,7 +40,23 @@ type Termination = {
 type SessionEvent =
   | { type: "ai_turn"; turn: Turn }
   | { type: "termination"; termination: Termination; message?: string }
-  | { type: "evaluation_ready"; evaluation: Evaluation };
+  | { type: "evaluation_ready"; evaluation: Evaluation }
+  | { type: "ping" }
+  | { type: "partial_transcript"; sequence: number; transcript: string }
+  | {
+      type: "turn_error";
+      sequence: number | null;
+      status: number;
+      code?: string;
+      detail: unknown;
+    };
+
+type TurnStreamState = {
+  sequence: number;
+  nextIndex: number;
+  pending: Promise<unknown>;
+  failed: boolean;
+};
 
 type SkillSummary = {
   skillId: string;
@@ -58,6 +83,7 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
   const [sequence, setSequence] = useState(0);
   const [resendToken, setResendToken] = useState<string | null>(null);
   const [sending, setSending] = useState(false);
+  const [partialTranscript, setPartialTranscript] = useState<string | null>(null);
   const [evaluation, setEvaluation] = useState<Evaluation | null>(null);
   const [evaluationError, setEvaluationError] = useState<string | null>(null);
   const [requeueing, setRequeueing] = useState(false);
@@ -66,6 +92,8 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
   const audioRefs = useRef<Map<string, HTMLAudioElement>>(new Map());
   const lastAutoPlayId = useRef<string | null>(null);
   const wsUrl = useMemo(() => `${wsBase}/sessions/${sessionId}`, [sessionId]);
+  const socketRef = useRef<WebSocket | null>(null);
+  const streamRef = useRef<TurnStreamState | null>(null);
   const evaluationTimer = useRef<ReturnType<typeof setTimeout> | null>(null);
   const recorder = useAudioRecorder();
 
@@ -121,8 +149,28 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
 
   useEffect(() => {
     const socket = connectSessionSocket(sessionId);
+    socketRef.current = socket;
     socket.onmessage = (event) => {
       const payload = JSON.parse(event.data) as SessionEvent;
+      if (payload.type === "ping") {
+        socket.send(JSON.stringify({ type: "pong" }));
+        return;
+      }
+      if (payload.type === "partial_transcript") {
+        if (streamRef.current?.sequence === payload.sequence) {
+          setPartialTranscript(payload.transcript);
+        }
+        return;
+      }
+      if (payload.type === "turn_error" && payload.code === "no_speech") {
+        // The server dropped a silent turn; its sequence is free to record again.
+        setMessage(String(payload.detail));
+        return;
+      }
+      if (payload.type === "turn_error" && streamRef.current?.sequence === payload.sequence) {
+        // The streamed copy is unusable; the whole clip is sent on "Send turn".
+        streamRef.current.failed = true;
+      }
       if (payload.type === "ai_turn") {
         setTurns((prev) =>
           prev.some((turn) => turn.id === payload.turn.id) ? prev : [...prev, payload.turn]
@@ -138,7 +186,10 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
         setEvaluationError(null);
       }
     };
-    return () => socket.close();
+    return () => {
+      socketRef.current = null;
+      socket.close();
+    };
   }, [sessionId, wsUrl]);
 
   useEffect(() => {
@@ -246,9 +297,39 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
       if (blob) {
         setResendToken(null);
       }
-    } else {
+      return;
+    }
+    if (streamRef.current) {
+      abortStreamedTurn(socketRef.current, streamRef.current.sequence);
+      streamRef.current = null;
+    }
+    setPartialTranscript(null);
+    const socket = socketRef.current;
+    if (!socket || socket.readyState !== WebSocket.OPEN) {
       await recorder.start();
+      return;
     }
+    const stream: TurnStreamState = {
+      sequence,
+      nextIndex: 0,
+      pending: Promise.resolve(),
+      failed: false,
+    };
+    streamRef.current = stream;
+    await recorder.start({
+      onChunk: (chunk) => {
+        if (stream.failed) {
+          return;
+        }
+        const index = stream.nextIndex++;
+        // Chain sends so chunks reach the server in recording order.
+        stream.pending = stream.pending.then(async () => {
+          if (!(await sendTurnChunk(socketRef.current, stream.sequence, index, chunk))) {
+            stream.failed = true;
+          }
+        });
+      },
+    });
   };
 
   const handleSend = async () => {
@@ -256,17 +337,37 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
       return;
     }
     setSending(true);
-    const result = await submitTurn({
+    const input = {
       sessionId,
       sequence,
       audioBlob: recorder.lastBlob,
       audioBase64: resendToken ?? undefined,
       startedAt: new Date().toISOString(),
       endedAt: new Date().toISOString(),
-    });
+    };
+    const stream = streamRef.current;
+    streamRef.current = null;
+    let result: Awaited<ReturnType<typeof submitTurn>> | null = null;
+    if (stream && !resendToken) {
+      await stream.pending;
+      if (!stream.failed && stream.sequence === sequence) {
+        result = await finishStreamedTurn(socketRef.current, input);
+      }
+      if (!result || result.status !== 202) {
+        abortStreamedTurn(socketRef.current, stream.sequence);
+        result = null;
+      }
+    }
+    result =
+      result ??
+      (resendToken ? null : await submitTurnOverSocket(socketRef.current, input)) ??
+      (resendToken ? await submitTurn(input) : await uploadTurn(input));
+    setPartialTranscript(null);
     setSending(false);
-    if (result.shouldResend && result.audioBase64) {
-      setResendToken(result.audioBase64);
+    if (result.shouldResend) {
+      if (result.audioBase64) {
+        setResendToken(result.audioBase64);
+      }
       setMessage("Audio upload failed. Please resend your turn.");
       return;
     }
@@ -385,6 +486,10 @@ export default function PracticeRoom({ sessionId }: { sessionId: string }) {
           </div>
         )}
 
+        {partialTranscript ? (
+          <p style={{ fontStyle: "italic", marginTop: 0 }}>{partialTranscript}</p>
+        ) : null}
+
         {recorder.error ? (
           <p style={{ color: "#b24332", marginTop: 0 }}>{recorder.error}</p>
         ) : null}
@@ -32,3 +32,26 @@ export async function deleteSession(id: string) {
     throw new Error(detail || "Failed to delete session");
   }
 }
+
+export async function bulkDeleteSessions(sessionIds: string[]) {
+  const res = await fetch(`${apiBase}/api/admin/sessions/cleanup-jobs`, {
+    method: "POST",
+    headers: adminHeaders(),
+    body: JSON.stringify({ sessionIds }),
+  });
+  if (res.status !== 202) {
+    const detail = await res.text();
+    throw new Error(detail || "Failed to start cleanup");
+  }
+  return res.json();
+}
+
+export async function getCleanupJob(jobId: string) {
+  const res = await fetch(`${apiBase}/api/admin/sessions/cleanup-jobs/${jobId}`, {
+    headers: adminHeaders(),
+    cache: "no-store",
+  });
+  if (res.status === 404) throw new Error("Not found");
+  if (!res.ok) throw new Error("Failed to load cleanup job");
+  return res.json();
+}
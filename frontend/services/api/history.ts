@@ -5,6 +5,7 @@ const apiBase = getApiBase();
 export type HistoryListFilters = {
   page?: number;
   pageSize?: number;
+  cursor?: string;
   scenarioId?: string;
   category?: string;
   search?: string;
@@ -26,7 +27,8 @@ export type SessionPage = {
   items: SessionSummary[];
   page: number;
   pageSize: number;
-  total: number;
+  total: number | null;
+  nextCursor?: string | null;
 };
 
 export async function fetchHistoryList(filters: HistoryListFilters): Promise<SessionPage> {
@@ -35,6 +37,9 @@ export async function fetchHistoryList(filters: HistoryListFilters): Promise<Ses
     page: String(filters.page ?? 1),
     pageSize: String(filters.pageSize ?? 20),
   });
+  if (filters.cursor) {
+    query.set("cursor", filters.cursor);
+  }
   if (filters.scenarioId) {
     query.set("scenarioId", filters.scenarioId);
   }
@@ -72,6 +72,43 @@ export async function submitTurn(
   };
 }
 
+/**
+ * Upload a recorded turn as raw bytes (metadata in X-Turn-* headers), so the
+ * audio is neither base64-encoded here nor decoded on the server.
+ */
+export async function uploadTurn(input: TurnSubmitInput): Promise<TurnSubmitResult> {
+  if (!input.audioBlob || input.audioBase64) {
+    return submitTurn(input);
+  }
+  const headers: Record<string, string> = {
+    "Content-Type": "application/octet-stream",
+    "X-Turn-Sequence": String(input.sequence),
+    "X-Turn-Started-At": input.startedAt,
+    "X-Turn-Ended-At": input.endedAt,
+  };
+  if (input.context) {
+    headers["X-Turn-Context"] = input.context;
+  }
+  const response = await fetch(
+    `${apiBase}/api/sessions/${input.sessionId}/turns:upload`,
+    { method: "POST", headers, body: input.audioBlob }
+  );
+
+  const message = await response.text();
+  let data: any;
+  try {
+    data = JSON.parse(message);
+  } catch {
+    data = undefined;
+  }
+  return {
+    status: response.status,
+    data,
+    shouldResend: response.status === 422 && message.toLowerCase().includes("resend"),
+    message,
+  };
+}
+
 export async function manualStopSession(sessionId: string, reason = "manual") {
   await fetch(`${apiBase}/api/sessions/${sessionId}/manual-stop`, {
     method: "POST",
@@ -81,7 +118,130 @@ export async function manualStopSession(sessionId: string, reason = "manual") {
 }
 
 export function connectSessionSocket(sessionId: string): WebSocket {
-  return new WebSocket(`${wsBase}/sessions/${sessionId}`);
+  const socket = new WebSocket(`${wsBase}/sessions/${sessionId}`);
+  socket.binaryType = "arraybuffer";
+  return socket;
+}
+
+const TURN_ACK_TIMEOUT_MS = 10000;
+
+/**
+ * Binary turn frame: a 4-byte big-endian header length, the JSON header,
+ * then the raw audio.
+ */
+function encodeTurnFrame(header: Record<string, unknown>, audio?: Uint8Array): Uint8Array {
+  const encoded = new TextEncoder().encode(JSON.stringify(header));
+  const body = audio ?? new Uint8Array(0);
+  const frame = new Uint8Array(4 + encoded.length + body.length);
+  new DataView(frame.buffer).setUint32(0, encoded.length);
+  frame.set(encoded, 4);
+  frame.set(body, 4 + encoded.length);
+  return frame;
+}
+
+function turnHeader(input: TurnSubmitInput) {
+  return {
+    sequence: input.sequence,
+    context: input.context ?? null,
+    startedAt: input.startedAt,
+    endedAt: input.endedAt,
+  };
+}
+
+/**
+ * Wait for the turn_ack/turn_error for `sequence`, mapped onto the HTTP result
+ * shape; null when no reply arrives in time.
+ */
+function awaitTurnReply(
+  socket: WebSocket,
+  sequence: number
+): Promise<TurnSubmitResult | null> {
+  return new Promise((resolve) => {
+    const finish = (result: TurnSubmitResult | null) => {
+      clearTimeout(timer);
+      socket.removeEventListener("message", onMessage);
+      resolve(result);
+    };
+    const onMessage = (event: MessageEvent) => {
+      if (typeof event.data !== "string") {
+        return;
+      }
+      const payload = JSON.parse(event.data);
+      if (payload.sequence !== sequence) {
+        return;
+      }
+      if (payload.type === "turn_ack") {
+        finish({ status: 202, data: payload, shouldResend: false });
+      } else if (payload.type === "turn_error") {
+        const message =
+          typeof payload.detail === "string" ? payload.detail : JSON.stringify(payload.detail);
+        finish({
+          status: payload.status,
+          data: payload,
+          message,
+          shouldResend: payload.status === 422 && message.toLowerCase().includes("resend"),
+        });
+      }
+    };
+    const timer = setTimeout(() => finish(null), TURN_ACK_TIMEOUT_MS);
+    socket.addEventListener("message", onMessage);
+  });
+}
+
+function isOpen(socket: WebSocket | null): socket is WebSocket {
+  return Boolean(socket && socket.readyState === WebSocket.OPEN);
+}
+
+/**
+ * Send a recorded turn as one binary frame on the session socket. Resolves
+ * with the server's reply, or null when the socket is unavailable or no reply
+ * arrives in time (the caller then falls back to submitTurn).
+ */
+export async function submitTurnOverSocket(
+  socket: WebSocket | null,
+  input: TurnSubmitInput
+): Promise<TurnSubmitResult | null> {
+  if (!isOpen(socket) || !input.audioBlob) {
+    return null;
+  }
+  const audio = new Uint8Array(await input.audioBlob.arrayBuffer());
+  const reply = awaitTurnReply(socket, input.sequence);
+  socket.send(encodeTurnFrame(turnHeader(input), audio));
+  return reply;
+}
+
+/** Stream one recorded segment of a turn that is still being recorded. */
+export async function sendTurnChunk(
+  socket: WebSocket | null,
+  sequence: number,
+  index: number,
+  chunk: Blob
+): Promise<boolean> {
+  if (!isOpen(socket)) {
+    return false;
+  }
+  const audio = new Uint8Array(await chunk.arrayBuffer());
+  socket.send(encodeTurnFrame({ type: "chunk", sequence, index }, audio));
+  return true;
+}
+
+export function abortStreamedTurn(socket: WebSocket | null, sequence: number) {
+  if (isOpen(socket)) {
+    socket.send(encodeTurnFrame({ type: "abort", sequence }));
+  }
+}
+
+/** End a streamed turn; the server only has the encoder's tail left to flush. */
+export async function finishStreamedTurn(
+  socket: WebSocket | null,
+  input: TurnSubmitInput
+): Promise<TurnSubmitResult | null> {
+  if (!isOpen(socket)) {
+    return null;
+  }
+  const reply = awaitTurnReply(socket, input.sequence);
+  socket.send(encodeTurnFrame({ type: "end", ...turnHeader(input) }));
+  return reply;
 }
 
 export type PracticeSessionCreate = {
@@ -2,16 +2,25 @@ import { useCallback, useRef, useState } from "react";
 
 type RecorderState = "idle" | "recording" | "stopped";
 
+type StartOptions = {
+  /** Called with each recorded segment while recording (streamed turns). */
+  onChunk?: (chunk: Blob) => void;
+  timesliceMs?: number;
+};
+
 type UseAudioRecorder = {
   state: RecorderState;
   error: string | null;
   lastBlob: Blob | null;
-  start: () => Promise<void>;
+  start: (options?: StartOptions) => Promise<void>;
   stop: () => Promise<Blob | null>;
   reset: () => void;
 };
 
 const MAX_BYTES = 128 * 1024;
+// Streamed turns are encoded server-side as they arrive; see MAX_STREAMED_AUDIO_BYTES.
+const MAX_STREAMED_BYTES = 8 * 1024 * 1024;
+const DEFAULT_TIMESLICE_MS = 500;
 
 export function useAudioRecorder(): UseAudioRecorder {
   const [state, setState] = useState<RecorderState>("idle");
@@ -19,8 +28,9 @@ export function useAudioRecorder(): UseAudioRecorder {
   const [lastBlob, setLastBlob] = useState<Blob | null>(null);
   const mediaRecorderRef = useRef<MediaRecorder | null>(null);
   const chunksRef = useRef<Blob[]>([]);
+  const streamedRef = useRef(false);
 
-  const start = useCallback(async () => {
+  const start = useCallback(async (startOptions: StartOptions = {}) => {
     setError(null);
     const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
     const preferredType = "audio/webm;codecs=opus";
@@ -30,12 +40,18 @@ export function useAudioRecorder(): UseAudioRecorder {
     };
     const recorder = new MediaRecorder(stream, options);
     chunksRef.current = [];
+    streamedRef.current = Boolean(startOptions.onChunk);
     recorder.ondataavailable = (event) => {
       if (event.data.size > 0) {
         chunksRef.current.push(event.data);
+        startOptions.onChunk?.(event.data);
       }
     };
-    recorder.start();
+    if (startOptions.onChunk) {
+      recorder.start(startOptions.timesliceMs ?? DEFAULT_TIMESLICE_MS);
+    } else {
+      recorder.start();
+    }
     mediaRecorderRef.current = recorder;
     setState("recording");
   }, []);
@@ -48,8 +64,13 @@ export function useAudioRecorder(): UseAudioRecorder {
     return new Promise<Blob | null>((resolve) => {
       recorder.onstop = () => {
         const blob = new Blob(chunksRef.current, { type: recorder.mimeType });
-        if (blob.size > MAX_BYTES) {
-          setError("Audio exceeds 128 KB. Shorten or split the turn.");
+        const limit = streamedRef.current ? MAX_STREAMED_BYTES : MAX_BYTES;
+        if (blob.size > limit) {
+          setError(
+            streamedRef.current
+              ? "Audio exceeds 8 MB. Shorten or split the turn."
+              : "Audio exceeds 128 KB. Shorten or split the turn."
+          );
           resolve(null);
           return;
         }